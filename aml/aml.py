@@ -20,6 +20,8 @@ class AML(object):
         """
         Parses the source string and builds the object representing the scenario.
         """
+        # Resets the state left by previous parsings
+        reset()
         # Builds the lexer object
         lexer = lex.lex()
         # Parses the source file
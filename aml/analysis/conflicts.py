@@ -0,0 +1,111 @@
+# -----------------------------------------------------------------------------
+# conflicts.py
+#
+# Author: Francesco Racciatti (racciatti.francesco@gmail.com)
+#
+# This module contains the detection of the timeline conflicts between the
+# attacks of the AML scenarios.
+# -----------------------------------------------------------------------------
+
+import enum
+import collections
+
+import model.statements as statements
+import analysis.index as index
+import analysis.timeline as timeline
+
+
+@enum.unique
+class Kind(enum.Enum):
+    """
+    The kinds of finding.
+    """
+    # The attack acts on a node destroyed before it starts
+    DEAD = 'dead'
+    # The attack acts on a node destroyed while it is going on, or at the
+    # same time by another simple attack, in no defined order
+    CONFLICT = 'conflict'
+
+
+# A finding of the analysis. The time is the start of the attack, in
+# nanoseconds; the location refers the attack, the cause refers the
+# destroyNode primitive.
+Finding = collections.namedtuple('Finding', ['kind', 'node', 'time', 'location', 'cause'])
+
+# An attack acting on a node, as seen by the sweep
+_Event = collections.namedtuple('_Event', ['start', 'end', 'path', 'location'])
+
+
+def conflicts(scenario, nodeindex=None):
+    """
+    Finds the attacks acting on destroyed nodes. For each node, the attacks
+    acting on it are swept by start time up to the first destroyNode that
+    takes place for sure, i.e. outside a conditional attack. The attacks
+    starting later are dead, those going on or starting at the same time in
+    another simple attack are conflicting. The attacks acting on unknown nodes,
+    i.e. held by variables the primitives assign, are left out, since they
+    may act on any node. The analysis takes O(n log n) time in the number of
+    the attacks.
+
+    :param scenario: the scenario
+    :type scenario: model.statements.Scenario
+
+    :param nodeindex: the indexes over the scenario, built if None
+    :type nodeindex: analysis.index.Index
+
+    :return: the list of the findings, by node and time
+    """
+    if nodeindex is None:
+        nodeindex = index.Index.build(scenario)
+    compounds = scenario.codeblocktable.codeblocks
+    activities = {}
+    findings = []
+    for node, locations in nodeindex.node_locations_dict.items():
+        if node is None:
+            continue
+        events = []
+        for location in locations:
+            key = location.path[:2]
+            activity = activities.get(key, None)
+            if activity is None:
+                compound = compounds[key[0]]
+                activity = timeline.activity(compound, compound.codeblocktable.codeblocks[key[1]], key)
+                activities[key] = activity
+            events.append(_Event(activity.start, activity.end, location.path, location))
+        events.sort(key=lambda event: (event.start, event.path))
+        findings.extend(_sweep(node, events))
+    return findings
+
+
+def _destroys(event):
+    """
+    Checks if the event destroys its node for sure.
+    """
+    return (isinstance(event.location.primitive, statements.DestroyNode)
+            and not isinstance(event.location.codeblock, statements.Conditional))
+
+
+def _sweep(node, events):
+    """
+    Sweeps the events acting on a node, sorted by start time.
+
+    :return: the list of the findings
+    """
+    findings = []
+    first = next((position for position, event in enumerate(events) if _destroys(event)), None)
+    if first is None:
+        return findings
+    cause = events[first]
+    # The events going on when the node is destroyed are cut short
+    for event in events[:first]:
+        if event.path[:2] != cause.path[:2] and (event.end is None or event.end >= cause.start):
+            findings.append(Finding(Kind.CONFLICT, node, event.start, event.location, cause.location))
+    for event in events[first + 1:]:
+        if event.start > cause.start:
+            findings.append(Finding(Kind.DEAD, node, event.start, event.location, cause.location))
+        elif event.path[:2] != cause.path[:2]:
+            findings.append(Finding(Kind.CONFLICT, node, event.start, event.location, cause.location))
+        elif event.path > cause.path:
+            # Follows the destroyNode in the same simple attack
+            findings.append(Finding(Kind.DEAD, node, event.start, event.location, cause.location))
+    return findings
@@ -0,0 +1,197 @@
+# -----------------------------------------------------------------------------
+# cost.py
+#
+# Author: Francesco Racciatti (racciatti.francesco@gmail.com)
+#
+# This module contains the static estimation of the work of the AML scenarios
+# and the detection of the performance hazards.
+# -----------------------------------------------------------------------------
+
+import enum
+import json
+import math
+import collections
+
+import model.types as types
+import model.statements as statements
+import optimizer.horizon as horizon
+
+
+@enum.unique
+class Kind(enum.Enum):
+    """
+    The kinds of hazard.
+    """
+    # Too many primitives invoked
+    INVOCATIONS = 'invocations'
+    # Too many packets matched against the filters
+    EVALUATIONS = 'evaluations'
+    # Too many packets injected
+    INJECTIONS = 'injections'
+    # A periodic attack with a zero period, which never stops firing
+    UNBOUNDED = 'unbounded'
+
+
+# The estimate of a compound: the position in the scenario, the start in
+# nanoseconds and the numbers of the primitives invoked, of the filter
+# evaluations and of the packets injected up to the horizon. The invocations
+# and the injections are None if unbounded.
+CompoundEstimate = collections.namedtuple('CompoundEstimate',
+                                          ['position', 'start', 'invocations', 'evaluations', 'injections'])
+
+# A hazard: the position of the compound, the estimated value and the
+# threshold exceeded, None for the unbounded periodic attacks
+Hazard = collections.namedtuple('Hazard', ['kind', 'position', 'value', 'threshold'])
+
+# The estimate of a scenario
+Estimate = collections.namedtuple('Estimate', ['horizon', 'compounds', 'hazards'])
+
+# The thresholds of the hazards, per compound
+Thresholds = collections.namedtuple('Thresholds', ['invocations', 'evaluations', 'injections'])
+
+# The default thresholds
+default_thresholds = Thresholds(10 ** 7, 10 ** 8, 10 ** 6)
+
+# The default packet rate of the nodes, in packets per second
+packet_rate = 10.0
+
+# One second, in nanoseconds
+_second = 10 ** 9
+
+
+def estimate(scenario, limit, rates=None, rate=packet_rate, selectivity=1.0, thresholds=default_thresholds):
+    """
+    Estimates the work of the scenario up to the horizon of the simulation.
+    The once and the periodic attacks are counted exactly; the conditional
+    attacks match the packets of their target nodes, received at the given
+    rates from the start of their compound to the horizon, and run their
+    primitives on the given fraction of them. The selectivity defaults to 1,
+    i.e. the estimate is an upper bound.
+
+    :param scenario: the scenario
+    :type scenario: model.statements.Scenario
+
+    :param limit: the horizon of the simulation, in nanoseconds (included)
+    :type limit: int
+
+    :param rates: the dictionary binding the nodes with their packet rates, in
+                  packets per second
+    :type rates: dict
+
+    :param rate: the packet rate of the nodes missing from the rates
+    :type rate: float
+
+    :param selectivity: the fraction of the packets matching the filters
+    :type selectivity: float
+
+    :param thresholds: the thresholds of the hazards, per compound
+    :type thresholds: analysis.cost.Thresholds
+
+    :return: the estimate
+
+    :raise ValueError: the horizon is negative, or a time is not resolved
+    """
+    if type(limit) is not int or limit < 0:
+        raise ValueError("horizon " + str(limit) + " is not a non-negative integer")
+    if rates is None:
+        rates = {}
+    compounds = []
+    hazards = []
+    for position, compound in enumerate(scenario.codeblocktable.codeblocks):
+        start = compound.nanoseconds
+        if start is None:
+            raise ValueError("the time of the compound is not resolved")
+        invocations = evaluations = injections = 0
+        for codeblock in compound.codeblocktable.codeblocks if start <= limit else ():
+            primitives = codeblock.codeblocktable.codeblocks
+            injects = sum(1 for primitive in primitives if isinstance(primitive, statements.InjectPacket))
+            if isinstance(codeblock, statements.Conditional):
+                packets = _packets(scenario, compound, codeblock, rates, rate) * (limit - start) / _second
+                evaluations += math.ceil(packets)
+                times = math.ceil(packets * selectivity)
+            elif isinstance(codeblock, statements.Periodic):
+                if codeblock.nanoseconds is None:
+                    raise ValueError("the period of the periodic attack is not resolved")
+                times = horizon.firings(start, codeblock.nanoseconds, limit)
+                if times is None:
+                    hazards.append(Hazard(Kind.UNBOUNDED, position, None, None))
+            else:
+                times = 1
+            if times is None:
+                invocations = None
+                if injects:
+                    injections = None
+                continue
+            if invocations is not None:
+                invocations += times * len(primitives)
+            if injections is not None:
+                injections += times * injects
+        compounds.append(CompoundEstimate(position, start, invocations, evaluations, injections))
+        for kind, value, threshold in ((Kind.INVOCATIONS, invocations, thresholds.invocations),
+                                       (Kind.EVALUATIONS, evaluations, thresholds.evaluations),
+                                       (Kind.INJECTIONS, injections, thresholds.injections)):
+            if value is not None and value > threshold:
+                hazards.append(Hazard(kind, position, value, threshold))
+    return Estimate(limit, compounds, hazards)
+
+
+def _packets(scenario, compound, conditional, rates, rate):
+    """
+    Sums the packet rates of the target nodes of a conditional attack.
+    """
+    nodes = conditional.nodeset
+    if nodes is None:
+        # The list is resolved in the scope of the compound or of the scenario
+        for codeblock in (compound, scenario):
+            if codeblock.symboltable.exist(conditional.nodes):
+                obj = codeblock.symboltable.object(conditional.nodes)
+                if isinstance(obj.items, types.NumericItems):
+                    nodes = obj.items.values
+                else:
+                    nodes = [_node(codeblock.symboltable, item) for item in obj.items]
+                break
+        else:
+            return 0.0
+    return sum(rates.get(node, rate) for node in nodes)
+
+
+def _node(symboltable, identifier):
+    """
+    Gets the node referred by an item of a list, i.e. the value of its literal.
+    """
+    if symboltable.exist(identifier):
+        obj = symboltable.object(identifier)
+        if obj.symboltype == types.Symbol.Type.VARIABLE:
+            return obj.value
+    return identifier
+
+
+def document(estimate):
+    """
+    Builds the machine readable form of an estimate, made by dictionaries,
+    lists and numbers only.
+
+    :param estimate: the estimate
+    :type estimate: analysis.cost.Estimate
+
+    :return: the dictionary
+    """
+    compounds = [item._asdict() for item in estimate.compounds]
+    totals = {}
+    for field in ('invocations', 'evaluations', 'injections'):
+        values = [item[field] for item in compounds]
+        totals[field] = None if None in values else sum(values)
+    hazards = [dict(hazard._asdict(), kind=hazard.kind.value) for hazard in estimate.hazards]
+    return {'horizon': estimate.horizon, 'compounds': compounds, 'totals': totals, 'hazards': hazards}
+
+
+def dumps(estimate):
+    """
+    Dumps an estimate as JSON.
+
+    :param estimate: the estimate
+    :type estimate: analysis.cost.Estimate
+
+    :return: the JSON string
+    """
+    return json.dumps(document(estimate), indent=2, sort_keys=True)
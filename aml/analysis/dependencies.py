@@ -0,0 +1,329 @@
+# -----------------------------------------------------------------------------
+# dependencies.py
+#
+# Author: Francesco Racciatti (racciatti.francesco@gmail.com)
+#
+# This module contains the read/write dependency graph between the codeblocks
+# and the primitives of the AML scenarios.
+# -----------------------------------------------------------------------------
+
+import enum
+import itertools
+import collections
+
+import model.types as types
+import model.statements as statements
+
+
+@enum.unique
+class Kind(enum.Enum):
+    """
+    The kinds of resource.
+    """
+    VARIABLE = 'variable'
+    PACKET = 'packet'
+    # The state of a node, e.g. its components and its position
+    NODE = 'node'
+
+
+@enum.unique
+class Hazard(enum.Enum):
+    """
+    The kinds of dependency, from the earlier access to the later one.
+    """
+    # Read after write
+    RAW = 'raw'
+    # Write after read
+    WAR = 'war'
+    # Write after write
+    WAW = 'waw'
+
+
+# A resource. The scope is the path of the codeblock defining the variable or
+# the packet, i.e. () for the scenario, (compound) and (compound, simple
+# attack); it is None for the nodes, whose identifier is the node, None if it
+# is unknown, i.e. any node.
+Resource = collections.namedtuple('Resource', ['kind', 'scope', 'identifier'])
+
+# The accesses of a primitive or of a simple attack
+Access = collections.namedtuple('Access', ['reads', 'writes'])
+
+# A dependency between two units, given by their paths, on a resource
+Dependency = collections.namedtuple('Dependency', ['source', 'target', 'hazard', 'resource'])
+
+# The attributes of the primitives written, by class; the other attributes
+# are read
+_written_dict = {
+    statements.Expression: ('destination',),
+    statements.ReadField: ('destination',),
+    statements.WriteField: ('packet',),
+    statements.ForwardPacket: ('packet',),
+    statements.CreatePacket: ('packet',),
+    statements.ClonePacket: ('destination',),
+    statements.DropPacket: ('packet',),
+}
+
+# The reserved keyword standing for the packet captured by a conditional
+_captured = 'captured'
+
+
+class DependencyGraph(object):
+    """
+    The read/write dependency graph of a scenario. The units are the simple
+    attacks, ordered by start time and then as written, and the primitives
+    inside each of them, as written. Two units depend on each other if one
+    writes a resource the other reads or writes; the units of different
+    groups share nothing, hence they can run concurrently.
+    """
+
+    def __init__(self):
+        """
+        Initializes the DependencyGraph object.
+        """
+        # The dictionary binding the paths of the simple attacks, i.e. the
+        # (compound, simple attack) positions, with their accesses
+        self.block_access_dict = collections.OrderedDict()
+        # The dictionary binding the paths of the primitives, i.e. the
+        # (compound, simple attack, primitive) positions, with their accesses
+        self.primitive_access_dict = collections.OrderedDict()
+        # The dependencies between the simple attacks
+        self.dependencies = []
+
+    @classmethod
+    def build(cls, scenario):
+        """
+        Builds the dependency graph of the scenario.
+
+        :param scenario: the scenario
+        :type scenario: model.statements.Scenario
+
+        :return: the dependency graph
+
+        :raise ValueError: the time of a compound is not resolved
+        """
+        graph = cls()
+        compounds = scenario.codeblocktable.codeblocks
+        blocks = []
+        for position, compound in enumerate(compounds):
+            if compound.nanoseconds is None:
+                raise ValueError("the time of the compound is not resolved")
+            for index, codeblock in enumerate(compound.codeblocktable.codeblocks):
+                blocks.append((compound.nanoseconds, (position, index), compound, codeblock))
+        blocks.sort(key=lambda block: (block[0], block[1]))
+        # The accesses of the primitives, with the nodes still unresolved
+        accesses = []
+        for start, path, compound, codeblock in blocks:
+            scopes = ((scenario, ()), (compound, path[:1]), (codeblock, path))
+            for index, primitive in enumerate(codeblock.codeblocktable.codeblocks):
+                accesses.append((path + (index,), _access(primitive, scopes)))
+        written = set()
+        for path, (reads, writes, nodes) in accesses:
+            written.update(writes)
+        for path, (reads, writes, nodes) in accesses:
+            for variable, value in nodes:
+                # The nodes held by the variables no primitive writes are known
+                writes.add(Resource(Kind.NODE, None, None if variable in written else value))
+            graph.primitive_access_dict[path] = Access(frozenset(reads), frozenset(writes))
+        for start, path, compound, codeblock in blocks:
+            reads = set()
+            writes = set()
+            if isinstance(codeblock, statements.Conditional):
+                # The target nodes and the filter are read on every packet
+                scopes = ((scenario, ()), (compound, path[:1]), (codeblock, path))
+                for identifier in (codeblock.nodes, codeblock.filter):
+                    reads.update(_reads(identifier, scopes))
+            for primitive in range(len(codeblock.codeblocktable.codeblocks)):
+                access = graph.primitive_access_dict[path + (primitive,)]
+                reads.update(access.reads)
+                writes.update(access.writes)
+            graph.block_access_dict[path] = Access(frozenset(reads), frozenset(writes))
+        graph.dependencies = _dependencies(graph.block_access_dict)
+        return graph
+
+    def groups(self):
+        """
+        Partitions the simple attacks into the groups of the ones depending
+        on each other, transitively. The groups can run concurrently, the
+        simple attacks of a group must run in order.
+
+        :return: the list of the groups, i.e. the lists of the paths in order
+        """
+        parent_dict = {path: path for path in self.block_access_dict}
+
+        def find(path):
+            while parent_dict[path] != path:
+                parent_dict[path] = parent_dict[parent_dict[path]]
+                path = parent_dict[path]
+            return path
+
+        for dependency in self.dependencies:
+            source, target = find(dependency.source), find(dependency.target)
+            if source != target:
+                parent_dict[target] = source
+        root_group_dict = collections.OrderedDict()
+        for path in self.block_access_dict:
+            root_group_dict.setdefault(find(path), []).append(path)
+        return list(root_group_dict.values())
+
+    def primitive_dependencies(self, path):
+        """
+        Gets the dependencies between the primitives of a simple attack.
+
+        :param path: the path of the simple attack
+        :type path: tuple
+
+        :return: the list of the dependencies
+        """
+        access_dict = collections.OrderedDict(
+            (key, access) for key, access in self.primitive_access_dict.items() if key[:2] == path)
+        return _dependencies(access_dict)
+
+
+def _access(primitive, scopes):
+    """
+    Collects the accesses of a primitive.
+
+    :param primitive: the primitive
+    :type primitive: model.statements.Primitive
+
+    :param scopes: the (codeblock, path) pairs enclosing the primitive, from
+                   the outermost
+    :type scopes: tuple
+
+    :return: the sets of the resources read and written, and the list of the
+             (variable resource, value) pairs of the nodes written
+    """
+    reads = set()
+    writes = set()
+    nodes = []
+    written = _written_dict.get(primitive.__class__, ())
+    for attribute, value in primitive.__dict__.items():
+        if attribute.startswith('_'):
+            continue
+        identifiers = value if isinstance(value, (list, tuple)) else (value,)
+        for identifier in identifiers:
+            if not isinstance(identifier, str):
+                continue
+            resource, obj = _resolve(identifier, scopes)
+            if obj is not None and obj.symboltype in (types.Symbol.Type.LIST, types.Symbol.Type.FILTER):
+                # The items of the lists and of the filters are read
+                reads.update(_reads(identifier, scopes))
+            elif attribute == 'node':
+                if resource is None:
+                    # A literal node
+                    nodes.append((None, obj.value if obj is not None else None))
+                else:
+                    reads.add(resource)
+                    nodes.append((resource, obj.value))
+            elif resource is None:
+                continue
+            elif attribute in written:
+                writes.add(resource)
+            else:
+                reads.add(resource)
+    return reads, writes, nodes
+
+
+def _reads(identifier, scopes):
+    """
+    Collects the resources read through a list or a filter, i.e. the
+    variables and the packets among its items.
+
+    :return: the set of the resources
+    """
+    reads = set()
+    resource, obj = _resolve(identifier, scopes)
+    if obj is None or obj.symboltype not in (types.Symbol.Type.LIST, types.Symbol.Type.FILTER):
+        return reads
+    for item in obj.items:
+        resource, item = _resolve(item, scopes)
+        if resource is not None:
+            reads.add(resource)
+    return reads
+
+
+def _resolve(identifier, scopes):
+    """
+    Resolves an identifier into a resource.
+
+    :return: the tuple (resource, object); the resource is None for the
+             literals and for the reserved keywords but the captured packet
+    """
+    for codeblock, path in reversed(scopes):
+        symboltable = codeblock.symboltable
+        if not symboltable.exist(identifier):
+            continue
+        obj = symboltable.object(identifier)
+        symboltype = obj.symboltype
+        if symboltype == types.Symbol.Type.VARIABLE:
+            if types.Symbol.mangled(identifier):
+                return None, obj
+            return Resource(Kind.VARIABLE, path, identifier), obj
+        if symboltype == types.Symbol.Type.PACKET:
+            return Resource(Kind.PACKET, path, identifier), obj
+        if symboltype == types.Symbol.Type.RESERVED and obj.reserved == _captured:
+            return Resource(Kind.PACKET, path, identifier), obj
+        return None, obj
+    return None, None
+
+
+def _dependencies(access_dict):
+    """
+    Finds the dependencies between the units, from the earlier to the later.
+    Each access is linked only to the last unit writing the resource and to
+    the units reading it since then, the other orderings follow by
+    transitivity.
+
+    :param access_dict: the dictionary binding the paths of the units with
+                        their accesses, in order
+    :type access_dict: collections.OrderedDict
+
+    :return: the list of the dependencies
+    """
+    dependencies = []
+    position_dict = {path: position for position, path in enumerate(access_dict)}
+    hazard_order_dict = {hazard: order for order, hazard in enumerate(Hazard)}
+    unknown = Resource(Kind.NODE, None, None)
+    # The last unit writing each resource and the units reading it since then
+    resource_writer_dict = {}
+    resource_readers_dict = collections.defaultdict(list)
+    # The nodes accessed so far, which the unknown node may be
+    nodes = set()
+    for path, access in access_dict.items():
+        found = set()
+        for resource, write in itertools.chain(((resource, False) for resource in access.reads),
+                                               ((resource, True) for resource in access.writes)):
+            for key in _aliases(resource, unknown, nodes):
+                # The conflict is reported on the known node, if any
+                shared = key if resource == unknown else resource
+                writer = resource_writer_dict.get(key, None)
+                if writer is not None and writer != path:
+                    found.add((writer, Hazard.WAW if write else Hazard.RAW, shared))
+                if write:
+                    for reader in resource_readers_dict[key]:
+                        if reader != path:
+                            found.add((reader, Hazard.WAR, shared))
+        for resource in access.reads:
+            readers = resource_readers_dict[resource]
+            if not readers or readers[-1] != path:
+                readers.append(path)
+        for resource in access.writes:
+            resource_writer_dict[resource] = path
+            resource_readers_dict[resource] = []
+        nodes.update(resource for resource in access.reads | access.writes if resource.kind is Kind.NODE)
+        for source, hazard, resource in sorted(found, key=lambda dependency: (
+                position_dict[dependency[0]], hazard_order_dict[dependency[1]], repr(dependency[2]))):
+            dependencies.append(Dependency(source, path, hazard, resource))
+    return dependencies
+
+
+def _aliases(resource, unknown, nodes):
+    """
+    Gets the resources an access may touch: the unknown node may be any node,
+    and any node may be the unknown one.
+    """
+    if resource.kind is not Kind.NODE:
+        return (resource,)
+    if resource == unknown:
+        return nodes | {unknown}
+    return (resource, unknown)
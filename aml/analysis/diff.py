@@ -0,0 +1,187 @@
+# -----------------------------------------------------------------------------
+# diff.py
+#
+# Author: Francesco Racciatti (racciatti.francesco@gmail.com)
+#
+# This module contains the structural diff between AML scenarios.
+# -----------------------------------------------------------------------------
+
+import enum
+import hashlib
+import collections
+
+import model.types as types
+import model.statements as statements
+import model.visitor as visitor
+
+
+@enum.unique
+class Kind(enum.Enum):
+    """
+    The kinds of change.
+    """
+    ADDED = 'added'
+    REMOVED = 'removed'
+    CHANGED = 'changed'
+
+
+# A change between two scenarios. The paths hold the positions of the nested
+# codeblocks and primitives, followed by the identifier for the symbols; the
+# path and the item of the side missing the item are None.
+Change = collections.namedtuple('Change', ['kind', 'oldpath', 'newpath', 'old', 'new'])
+
+
+def diff(old, new):
+    """
+    Compares two scenarios. The compounds, the codeblocks and the primitives
+    are matched structurally: the items sharing the same subtree are matched
+    first, wherever they are, then the items sharing the same class and
+    attributes, then the items sharing the same class in order. The symbols
+    are matched by identifier. Each scenario is hashed once, hence the diff
+    runs in near linear time.
+
+    :param old: the baseline scenario
+    :type old: model.statements.Scenario
+
+    :param new: the variant scenario
+    :type new: model.statements.Scenario
+
+    :return: the list of the changes, empty if the scenarios are equal
+    """
+    hashes = _hash(old)
+    hashes.update(_hash(new))
+    changes = []
+    if hashes[id(old)] == hashes[id(new)]:
+        return changes
+    changes.append(Change(Kind.CHANGED, (), (), old, new))
+    pending = [(old, new, (), ())]
+    while pending:
+        oldcodeblock, newcodeblock, oldpath, newpath = pending.pop()
+        _diff_symbols(oldcodeblock, newcodeblock, oldpath, newpath, changes)
+        olditems = oldcodeblock.codeblocktable.codeblocks
+        newitems = newcodeblock.codeblocktable.codeblocks
+        for oldindex, newindex in _match(olditems, newitems, hashes, changes, oldpath, newpath):
+            olditem, newitem = olditems[oldindex], newitems[newindex]
+            oldchild, newchild = oldpath + (oldindex,), newpath + (newindex,)
+            changes.append(Change(Kind.CHANGED, oldchild, newchild, olditem, newitem))
+            if isinstance(olditem, statements.Codeblock):
+                pending.append((olditem, newitem, oldchild, newchild))
+    return changes
+
+
+def _match(olditems, newitems, hashes, changes, oldpath, newpath):
+    """
+    Matches the items of two codeblock tables. It records the added and the
+    removed items.
+
+    :return: the list of the (old index, new index) pairs of the changed items
+    """
+    # Matches the items sharing the same subtree
+    unmatched = collections.defaultdict(collections.deque)
+    for index, item in enumerate(olditems):
+        unmatched[hashes[id(item)]].append(index)
+    oldleft = set(range(len(olditems)))
+    newleft = []
+    for index, item in enumerate(newitems):
+        indexes = unmatched.get(hashes[id(item)], None)
+        if indexes:
+            oldleft.discard(indexes.popleft())
+        else:
+            newleft.append(index)
+    # Matches the remaining items by class and attributes, then by class
+    pairs = []
+    for key in (_shape, _class):
+        unmatched = collections.defaultdict(collections.deque)
+        for index in sorted(oldleft):
+            unmatched[key(olditems[index])].append(index)
+        remaining = []
+        for index in newleft:
+            indexes = unmatched.get(key(newitems[index]), None)
+            if indexes:
+                oldindex = indexes.popleft()
+                oldleft.discard(oldindex)
+                pairs.append((oldindex, index))
+            else:
+                remaining.append(index)
+        newleft = remaining
+    for index in sorted(oldleft):
+        changes.append(Change(Kind.REMOVED, oldpath + (index,), None, olditems[index], None))
+    for index in newleft:
+        changes.append(Change(Kind.ADDED, None, newpath + (index,), None, newitems[index]))
+    pairs.sort()
+    return pairs
+
+
+def _diff_symbols(oldcodeblock, newcodeblock, oldpath, newpath, changes):
+    """
+    Compares the symbols of two codeblocks by identifier.
+    """
+    oldsymbols = oldcodeblock.symboltable.identifier_object_dict
+    newsymbols = newcodeblock.symboltable.identifier_object_dict
+    for identifier, obj in oldsymbols.items():
+        other = newsymbols.get(identifier, None)
+        if other is None:
+            changes.append(Change(Kind.REMOVED, oldpath + (identifier,), None, obj, None))
+        elif _content(obj) != _content(other):
+            changes.append(Change(Kind.CHANGED, oldpath + (identifier,), newpath + (identifier,), obj, other))
+    for identifier, obj in newsymbols.items():
+        if identifier not in oldsymbols:
+            changes.append(Change(Kind.ADDED, None, newpath + (identifier,), None, obj))
+
+
+def _attributes(node):
+    """
+    Gets the public attributes of a node, except the tables.
+    """
+    return tuple((attribute, tuple(value) if isinstance(value, list) else value)
+                 for attribute, value in node.__dict__.items()
+                 if not attribute.startswith('_')
+                 and not isinstance(value, (types.SymbolTable, statements.CodeblockTable)))
+
+
+def _shape(node):
+    """
+    Gets the key matching the nodes by class and attributes.
+    """
+    return (node.__class__, _attributes(node))
+
+
+def _class(node):
+    """
+    Gets the key matching the nodes by class.
+    """
+    return node.__class__
+
+
+def _content(obj):
+    """
+    Gets the content of a symbol.
+    """
+    return (obj.__class__.__name__, _attributes(obj))
+
+
+def _digest(value):
+    """
+    Builds the digest of a value.
+    """
+    return hashlib.blake2b(repr(value).encode('utf-8'), digest_size=16).digest()
+
+
+def _hash(scenario):
+    """
+    Builds the subtree hashes of the codeblocks and of the primitives of the
+    scenario, without recursion.
+
+    :return: the dictionary binding the ids of the nodes with their hashes
+    """
+    hashes = {}
+    for event, node in visitor.walk(scenario):
+        if event is not visitor.Event.LEAVE:
+            continue
+        if isinstance(node, statements.Codeblock):
+            symbols = sorted(repr(_content(obj)) for obj in node.symboltable.identifier_object_dict.values())
+            children = tuple(hashes[id(item)] for item in node.codeblocktable.codeblocks)
+            hashes[id(node)] = _digest((_shape(node), symbols, children))
+        elif isinstance(node, statements.Primitive):
+            hashes[id(node)] = _digest(_shape(node))
+    return hashes
@@ -0,0 +1,262 @@
+# -----------------------------------------------------------------------------
+# index.py
+#
+# Author: Francesco Racciatti (racciatti.francesco@gmail.com)
+#
+# This module contains the inverted indexes over the AML scenarios.
+# -----------------------------------------------------------------------------
+
+import collections
+
+import model.types as types
+import model.statements as statements
+import model.visitor as visitor
+import optimizer.folding as folding
+
+
+# The location of a primitive or of a codeblock inside a scenario. The path
+# holds the positions of the nested codeblocks in their codeblock tables, the
+# primitive is None if the location refers the codeblock itself.
+Location = collections.namedtuple('Location', ['path', 'codeblock', 'primitive'])
+
+
+class Index(object):
+    """
+    Inverted indexes binding the nodes, the packets, the filters, the
+    variables and the kinds of primitive with their locations. The indexes
+    are built in one pass over the scenario and queried in constant time.
+
+    The nodes held by the variables the primitives assign are unknown, i.e.
+    they may be any node, hence their locations are bound with None.
+    """
+
+    def __init__(self):
+        """
+        Initializes the Index object.
+        """
+        self.node_locations_dict = {}
+        self.packet_locations_dict = {}
+        self.filter_locations_dict = {}
+        self.variable_locations_dict = {}
+        self.kind_locations_dict = {}
+
+    @classmethod
+    def build(cls, scenario):
+        """
+        Builds the indexes over the given scenario.
+
+        :param scenario: the scenario
+        :type scenario: model.statements.Scenario
+
+        :return: the indexes
+        """
+        index = cls()
+        _IndexBuilder(index, folding.assignments(scenario)).visit(scenario)
+        # The locations are read-only once the indexes are built
+        for locations_dict in (index.node_locations_dict, index.packet_locations_dict,
+                               index.filter_locations_dict, index.variable_locations_dict,
+                               index.kind_locations_dict):
+            for key, locations in locations_dict.items():
+                locations_dict[key] = tuple(locations)
+        return index
+
+    def node(self, node):
+        """
+        Gets the locations of the primitives and of the conditional attacks
+        targeting the given node.
+
+        :param node: the node (e.g. 42), None for the unknown nodes
+        :type node: int
+
+        :return: the tuple of the locations
+        """
+        return self.node_locations_dict.get(node, ())
+
+    def packet(self, identifier):
+        """
+        Gets the locations of the primitives using the given packet.
+
+        :param identifier: the identifier of the packet
+        :type identifier: str
+
+        :return: the tuple of the locations
+        """
+        return self.packet_locations_dict.get(identifier, ())
+
+    def filter(self, identifier):
+        """
+        Gets the locations of the conditional attacks using the given filter.
+
+        :param identifier: the identifier of the filter
+        :type identifier: str
+
+        :return: the tuple of the locations
+        """
+        return self.filter_locations_dict.get(identifier, ())
+
+    def variable(self, identifier):
+        """
+        Gets the locations of the primitives using the given variable.
+
+        :param identifier: the identifier of the variable
+        :type identifier: str
+
+        :return: the tuple of the locations
+        """
+        return self.variable_locations_dict.get(identifier, ())
+
+    def kind(self, kind):
+        """
+        Gets the locations of the primitives of the given kind.
+
+        :param kind: the class of the primitive (e.g. DestroyNode)
+        :type kind: type
+
+        :return: the tuple of the locations
+        """
+        return self.kind_locations_dict.get(kind, ())
+
+    def codeblocks(self, locations):
+        """
+        Gets the distinct codeblocks of the given locations, in order.
+
+        :param locations: the locations
+        :type locations: tuple
+
+        :return: the list of the codeblocks
+        """
+        codeblocks = {}
+        for location in locations:
+            codeblocks.setdefault(id(location.codeblock), location.codeblock)
+        return list(codeblocks.values())
+
+
+class _IndexBuilder(visitor.Visitor):
+    """
+    Fills the indexes while visiting the scenario.
+    """
+
+    # The attributes of the primitives referring nodes
+    node_attributes = ('node',)
+
+    def __init__(self, index, assigned):
+        """
+        Initializes the _IndexBuilder object.
+
+        :param index: the indexes to fill
+        :type index: analysis.index.Index
+
+        :param assigned: the variables assigned by the primitives, see
+                         optimizer.folding.assignments
+        :type assigned: set
+        """
+        self.index = index
+        self.assigned = assigned
+        self.positions = []
+        self.counters = []
+
+    def location(self, primitive=None):
+        """
+        Builds the location of the current codeblock or primitive.
+        """
+        return Location(tuple(self.positions), self.path[-1], primitive)
+
+    def advance(self):
+        """
+        Gets the position of the current item in its codeblock table.
+        """
+        if not self.counters:
+            return None
+        position = self.counters[-1]
+        self.counters[-1] += 1
+        return position
+
+    def enter_symboltable(self, symboltable):
+        return visitor.Visitor.PRUNE
+
+    def enter_codeblocktable(self, codeblocktable):
+        self.counters.append(0)
+
+    def leave_codeblocktable(self, codeblocktable):
+        self.counters.pop()
+
+    def enter_codeblock(self, codeblock):
+        position = self.advance()
+        if position is not None:
+            self.positions.append(position)
+
+    def leave_codeblock(self, codeblock):
+        if self.positions:
+            self.positions.pop()
+
+    def enter_conditional(self, conditional):
+        self.enter_codeblock(conditional)
+        # The conditional is not in its path yet, the location is built here
+        location = Location(tuple(self.positions), conditional, None)
+        self.index.filter_locations_dict.setdefault(conditional.filter, []).append(location)
+        nodes = self.resolve(conditional.nodes)
+        if nodes is not None and isinstance(nodes.items, types.NumericItems):
+            # The literals of the numeric items are not defined
+            for value in nodes.items.values:
+                self.add_value(value, location)
+        elif nodes is not None:
+            for item in nodes.items:
+                self.add_node(item, location)
+
+    def enter_primitive(self, primitive):
+        self.positions.append(self.advance())
+        location = self.location(primitive)
+        self.positions.pop()
+        self.index.kind_locations_dict.setdefault(primitive.__class__, []).append(location)
+        for attribute, value in primitive.__dict__.items():
+            if attribute.startswith('_'):
+                continue
+            if isinstance(value, (list, tuple)):
+                for item in value:
+                    self.add_identifier(item, location)
+            else:
+                self.add_identifier(value, location)
+                if attribute in self.node_attributes:
+                    self.add_node(value, location)
+        return visitor.Visitor.PRUNE
+
+    def add_identifier(self, identifier, location):
+        """
+        Indexes the packet or the variable referred by the identifier, if any.
+        """
+        obj = self.resolve(identifier)
+        if obj is None:
+            return
+        if obj.symboltype == types.Symbol.Type.VARIABLE:
+            locations_dict = self.index.variable_locations_dict
+        elif obj.symboltype == types.Symbol.Type.PACKET:
+            locations_dict = self.index.packet_locations_dict
+        elif obj.symboltype == types.Symbol.Type.RESERVED and obj.code == types.Reserved.Code.CAPTURED:
+            locations_dict = self.index.packet_locations_dict
+        else:
+            return
+        locations = locations_dict.setdefault(identifier, [])
+        # Indexes each location once, even if the identifier is used twice
+        if not locations or locations[-1] is not location:
+            locations.append(location)
+
+    def add_node(self, identifier, location):
+        """
+        Indexes the node referred by the identifier, if any. The node held by 
+        a variable the primitives assign is unknown.
+        """
+        symboltable, obj = self.owner(identifier)
+        if obj is None or obj.symboltype != types.Symbol.Type.VARIABLE:
+            return
+        if (id(symboltable), identifier) in self.assigned:
+            self.add_value(None, location)
+        elif obj.value is not None:
+            self.add_value(obj.value, location)
+
+    def add_value(self, value, location):
+        """
+        Indexes the given node.
+        """
+        locations = self.index.node_locations_dict.setdefault(value, [])
+        if not locations or locations[-1] is not location:
+            locations.append(location)
@@ -0,0 +1,554 @@
+# -----------------------------------------------------------------------------
+# overlap.py
+#
+# Author: Francesco Racciatti (racciatti.francesco@gmail.com)
+#
+# This module contains the overlap and satisfiability analysis of the filters
+# of the AML scenarios, over per-field interval and set domains.
+# -----------------------------------------------------------------------------
+
+import enum
+import collections
+
+import lexer.lexer as lexer
+import model.types as types
+import model.visitor as visitor
+import optimizer.folding as folding
+import optimizer.predicates as predicates
+import optimizer.normalization as normalization
+
+
+@enum.unique
+class Relation(enum.Enum):
+    """
+    The relations between two filters.
+    """
+    # No packet matches both
+    DISJOINT = 'disjoint'
+    # Some packets may match both
+    OVERLAP = 'overlap'
+    # The packets matching the first filter match the second one too
+    SUBSUMED = 'subsumed'
+    # The packets matching the second filter match the first one too
+    SUBSUMES = 'subsumes'
+    # The filters match the same packets
+    EQUIVALENT = 'equivalent'
+
+
+# The domain of a field: the values between the lower and the upper bounds,
+# None if unbounded, which are open or closed; the values are the finite set
+# of the admitted values, None if any, and the excluded ones are ruled out
+Domain = collections.namedtuple('Domain', ['lower', 'lower_open', 'upper', 'upper_open', 'values', 'excluded'])
+
+# The abstraction of a filter: the union of the boxes, i.e. the dictionaries
+# binding the fields with their domains. It is exact if it admits the very
+# packets of the filter, otherwise it admits more packets.
+Abstraction = collections.namedtuple('Abstraction', ['boxes', 'exact'])
+
+# The domain admitting any value
+universe = Domain(None, False, None, False, None, frozenset())
+
+# The abstraction admitting any packet, inexact
+_unknown = Abstraction(({},), False)
+
+_EQUALTO = lexer.BasicOperatorType.EQUALTO.value
+_NOTEQUALTO = lexer.BasicOperatorType.NOTEQUALTO.value
+_LSTHN = lexer.BasicOperatorType.LSTHN.value
+_LSEQTHN = lexer.BasicOperatorType.LSEQTHN.value
+_GRTHN = lexer.BasicOperatorType.GRTHN.value
+_GREQTHN = lexer.BasicOperatorType.GREQTHN.value
+
+# The comparisons rewritten by swapping their operands
+_mirror_dict = {
+    _EQUALTO: _EQUALTO, _NOTEQUALTO: _NOTEQUALTO,
+    _LSTHN: _GRTHN, _GRTHN: _LSTHN,
+    _LSEQTHN: _GREQTHN, _GREQTHN: _LSEQTHN,
+}
+
+
+def _below(value, bound, strict):
+    """
+    Checks if a value is below a bound; the values that cannot be compared
+    are not.
+    """
+    try:
+        return value < bound if strict else value <= bound
+    except TypeError:
+        return False
+
+
+def contains(domain, value):
+    """
+    Checks if a domain admits a value.
+
+    :param domain: the domain
+    :type domain: analysis.overlap.Domain
+
+    :param value: the value
+
+    :return: True if the value is admitted, False otherwise
+    """
+    if value in domain.excluded or (domain.values is not None and value not in domain.values):
+        return False
+    if domain.lower is not None and not _below(domain.lower, value, domain.lower_open):
+        return False
+    if domain.upper is not None and not _below(value, domain.upper, domain.upper_open):
+        return False
+    return True
+
+
+def _point(domain):
+    """
+    Gets the single value admitted by the bounds of a domain, if any.
+
+    :return: the set of the value, None if the bounds admit more values
+    """
+    if (domain.lower is not None and domain.upper is not None and not domain.lower_open
+            and not domain.upper_open and type(domain.lower) is type(domain.upper)
+            and domain.lower == domain.upper):
+        return frozenset((domain.lower,))
+    return None
+
+
+def empty(domain):
+    """
+    Checks if a domain admits no value.
+
+    :param domain: the domain
+    :type domain: analysis.overlap.Domain
+
+    :return: True if it is empty, False otherwise
+    """
+    values = domain.values if domain.values is not None else _point(domain)
+    if values is not None:
+        return not any(contains(domain, value) for value in values)
+    if domain.lower is None or domain.upper is None:
+        return False
+    try:
+        if domain.lower > domain.upper:
+            return True
+    except TypeError:
+        return True
+    return domain.lower == domain.upper and (domain.lower_open or domain.upper_open)
+
+
+def restrict(domain, operator, value):
+    """
+    Restricts a domain to the values matching a comparison against a value.
+
+    :param domain: the domain
+    :type domain: analysis.overlap.Domain
+
+    :param operator: the comparison operator
+    :type operator: str
+
+    :param value: the value
+
+    :return: the restricted domain
+    """
+    if operator == _EQUALTO:
+        values = frozenset((value,))
+        return domain._replace(values=values if domain.values is None else domain.values & values)
+    if operator == _NOTEQUALTO:
+        return domain._replace(excluded=domain.excluded | {value})
+    if operator in (_GRTHN, _GREQTHN):
+        strict = operator == _GRTHN
+        if domain.lower is None or _below(domain.lower, value, False) and (
+                value != domain.lower or strict):
+            return domain._replace(lower=value, lower_open=strict)
+        return domain
+    strict = operator == _LSTHN
+    if domain.upper is None or _below(value, domain.upper, False) and (value != domain.upper or strict):
+        return domain._replace(upper=value, upper_open=strict)
+    return domain
+
+
+def meet(first, second):
+    """
+    Intersects two domains.
+
+    :return: the domain admitting the values admitted by both
+    """
+    domain = first
+    if second.values is not None:
+        domain = domain._replace(values=second.values if domain.values is None else domain.values & second.values)
+    if second.excluded:
+        domain = domain._replace(excluded=domain.excluded | second.excluded)
+    if second.lower is not None:
+        domain = restrict(domain, _GRTHN if second.lower_open else _GREQTHN, second.lower)
+    if second.upper is not None:
+        domain = restrict(domain, _LSTHN if second.upper_open else _LSEQTHN, second.upper)
+    return domain
+
+
+def within(first, second):
+    """
+    Checks if a domain is included in another one.
+
+    :return: True if the values admitted by the first domain are admitted by
+             the second one, False if they are not or if it is unknown
+    """
+    values = first.values if first.values is not None else _point(first)
+    if values is not None:
+        return all(contains(second, value) for value in values if contains(first, value))
+    if second.values is not None:
+        return False
+    if second.lower is not None:
+        if first.lower is None or not _below(second.lower, first.lower, False):
+            return False
+        if first.lower == second.lower and second.lower_open and not first.lower_open:
+            return False
+    if second.upper is not None:
+        if first.upper is None or not _below(first.upper, second.upper, False):
+            return False
+        if first.upper == second.upper and second.upper_open and not first.upper_open:
+            return False
+    return not any(contains(first, value) for value in second.excluded)
+
+
+def _meet_boxes(first, second):
+    """
+    Intersects two boxes.
+
+    :return: the box, None if it is empty
+    """
+    box = dict(first)
+    for field, domain in second.items():
+        domain = meet(box[field], domain) if field in box else domain
+        if empty(domain):
+            return None
+        box[field] = domain
+    return box
+
+
+def _within_boxes(first, second):
+    """
+    Checks if a box is included in another one.
+    """
+    return all(within(first.get(field, universe), domain) for field, domain in second.items())
+
+
+def abstract(items, resolve, constant=None):
+    """
+    Abstracts a filter over the per-field domains. The filter is normalized
+    first, see optimizer.normalization. The operands are the literals and the
+    constant variables, i.e. the variables no primitive assigns, replaced by
+    their values; the strings on the left are the fields, e.g. the path
+    layer4.sourcePort, and the comparisons between two numbers are evaluated.
+    The comparisons against the other variables and the filters too large to
+    normalize admit any value, inexactly.
+
+    :param items: the identifiers of the filter, in reverse polish notation
+    :type items: tuple
+
+    :param resolve: the function giving the object bound to an identifier
+    :type resolve: function
+
+    :param constant: the function giving the variable bound to an identifier
+                     if it is constant, None otherwise; if None, only the
+                     literals have a value
+    :type constant: function
+
+    :return: the abstraction
+    """
+    def lookup(identifier):
+        obj = types.Variable.literal(resolve, identifier)
+        if obj is None and constant is not None and not types.Symbol.mangled(identifier):
+            obj = constant(identifier)
+        return obj
+
+    normal = normalization.normalize_items(items, resolve)
+    if normal is None:
+        return _unknown
+    if normal.outcome is normalization.Outcome.TRUE:
+        return Abstraction(({},), True)
+    if normal.outcome is normalization.Outcome.FALSE:
+        return Abstraction((), True)
+    exact = True
+    boxes = []
+    for member in normal.members:
+        field = lookup(member.subject)
+        values = [lookup(value) for value in member.values]
+        if field is None or type(field.value) is not str or None in values:
+            exact = False
+            boxes.append({})
+            continue
+        boxes.append({field.value: universe._replace(values=frozenset(value.value for value in values))})
+    for clause in normal.clauses:
+        box = {}
+        for atom in clause:
+            subject, value, operator = lookup(atom.subject), lookup(atom.value), atom.operator
+            if subject is None or value is None:
+                # Compared against a variable assigned by the primitives
+                exact = False
+                continue
+            subject, value = subject.value, value.value
+            if type(subject) is not str and type(value) is str:
+                # The field is written on the right, e.g. 80 == "layer4.sourcePort"
+                subject, operator, value = value, _mirror_dict[operator], subject
+            if type(subject) is not str:
+                # Compares two values
+                try:
+                    holds = predicates.comparison_function_dict[operator](subject, value)
+                except TypeError:
+                    holds = False
+                if not holds:
+                    box = None
+                    break
+                continue
+            box[subject] = restrict(box.get(subject, universe), operator, value)
+        if box is not None and all(not empty(domain) for domain in box.values()):
+            boxes.append(box)
+    return Abstraction(tuple(boxes), exact)
+
+
+def relation(first, second):
+    """
+    Decides the relation between two abstractions. The subsumption is
+    decided box by box, hence a box included only in the union of several
+    boxes is not recognized; it is never claimed on inexact abstractions.
+
+    :param first: the first abstraction
+    :type first: analysis.overlap.Abstraction
+
+    :param second: the second abstraction
+    :type second: analysis.overlap.Abstraction
+
+    :return: the relation
+    """
+    if not any(_meet_boxes(a, b) is not None for a in first.boxes for b in second.boxes):
+        return Relation.DISJOINT
+    subsumed = second.exact and first.exact and all(
+        any(_within_boxes(a, b) for b in second.boxes) for a in first.boxes)
+    subsumes = second.exact and first.exact and all(
+        any(_within_boxes(b, a) for a in first.boxes) for b in second.boxes)
+    if subsumed and subsumes:
+        return Relation.EQUIVALENT
+    if subsumed:
+        return Relation.SUBSUMED
+    if subsumes:
+        return Relation.SUBSUMES
+    return Relation.OVERLAP
+
+
+class Overlap(object):
+    """
+    The overlap analysis of the filters of a scenario. The filters are
+    indexed by the fields they pin to finite sets of values, e.g. by port,
+    so that the filters pinning a field to different values are ruled out
+    without comparing them.
+    """
+
+    def __init__(self):
+        """
+        Initializes the Overlap object.
+        """
+        # The (codeblock, identifier) pairs of the filters, by id
+        self.filters = []
+        # The abstractions of the filters, by id
+        self.abstractions = []
+        # The (conditional, id of the filter) pairs
+        self.conditionals = []
+        # The dictionary binding the fields with the dictionaries binding the
+        # values with the ids of the filters pinning the field to them
+        self.field_value_ids_dict = collections.defaultdict(lambda: collections.defaultdict(set))
+        # The dictionary binding the ids with the fields the filters pin
+        self.id_fields_dict = {}
+        # The ids of the filters matching some packets
+        self.nonempty = set()
+        # The number of the pairs compared
+        self.checks = 0
+
+    @classmethod
+    def build(cls, scenario):
+        """
+        Builds the overlap analysis of the filters of the scenario.
+
+        :param scenario: the scenario
+        :type scenario: model.statements.Scenario
+
+        :return: the analysis
+        """
+        analysis = cls()
+        _Abstractor(analysis, folding.assignments(scenario)).visit(scenario)
+        for identifier, abstraction in enumerate(analysis.abstractions):
+            analysis.index(identifier, abstraction)
+        return analysis
+
+    def add(self, codeblock, identifier, abstraction):
+        """
+        Adds a filter.
+
+        :return: the id of the filter
+        """
+        self.filters.append((codeblock, identifier))
+        self.abstractions.append(abstraction)
+        return len(self.filters) - 1
+
+    def index(self, identifier, abstraction):
+        """
+        Indexes a filter by the fields it pins, i.e. the fields every box
+        restricts to a finite set of values.
+        """
+        boxes = abstraction.boxes
+        if boxes:
+            self.nonempty.add(identifier)
+        fields = set.intersection(*(set(field for field, domain in box.items() if domain.values is not None)
+                                    for box in boxes)) if boxes else set()
+        self.id_fields_dict[identifier] = fields
+        for field in fields:
+            for box in boxes:
+                for value in box[field].values:
+                    if contains(box[field], value):
+                        self.field_value_ids_dict[field][value].add(identifier)
+
+    def empty(self):
+        """
+        Finds the filters matching no packet.
+
+        :return: the sorted list of their ids
+        """
+        return [identifier for identifier, abstraction in enumerate(self.abstractions) if not abstraction.boxes]
+
+    def relation(self, first, second):
+        """
+        Decides the relation between two filters.
+
+        :param first: the id of the first filter
+        :type first: int
+
+        :param second: the id of the second filter
+        :type second: int
+
+        :return: the relation
+        """
+        return relation(self.abstractions[first], self.abstractions[second])
+
+    def candidates(self, identifier):
+        """
+        Gets the filters that may overlap the given one, i.e. all the non
+        empty filters but those pinning one of its pinned fields to other
+        values.
+
+        :return: the set of the ids
+        """
+        fields = self.id_fields_dict[identifier]
+        if not fields:
+            return set(self.nonempty)
+        # The most selective field rules out the most filters
+        field = min(fields, key=lambda field: sum(len(ids) for ids in self.field_value_ids_dict[field].values()))
+        value_ids_dict = self.field_value_ids_dict[field]
+        pinned = set().union(*value_ids_dict.values())
+        candidates = self.nonempty - pinned
+        for box in self.abstractions[identifier].boxes:
+            for value in box[field].values:
+                candidates.update(value_ids_dict.get(value, ()))
+        return candidates
+
+    def overlaps(self):
+        """
+        Finds the pairs of the filters that some packets may match, with
+        their relations.
+
+        :return: the sorted list of the (first id, second id, relation)
+                 triples, where the first id is lower
+        """
+        found = []
+        for first in range(len(self.filters)):
+            if not self.abstractions[first].boxes:
+                continue
+            for second in sorted(self.candidates(first)):
+                if second <= first:
+                    continue
+                self.checks += 1
+                outcome = self.relation(first, second)
+                if outcome is not Relation.DISJOINT:
+                    found.append((first, second, outcome))
+        return found
+
+    def collisions(self):
+        """
+        Finds the pairs of the conditional attacks that may act on the same
+        packet, i.e. whose target nodes intersect and whose filters overlap.
+
+        :return: the list of the (conditional, conditional, relation) triples
+        """
+        relations = {}
+        for first, second, outcome in self.overlaps():
+            relations[(first, second)] = outcome
+        for identifier, abstraction in enumerate(self.abstractions):
+            if abstraction.boxes:
+                relations[(identifier, identifier)] = Relation.EQUIVALENT
+        found = []
+        for position, (conditional, identifier) in enumerate(self.conditionals):
+            for other, other_identifier in self.conditionals[position + 1:]:
+                key = (min(identifier, other_identifier), max(identifier, other_identifier))
+                outcome = relations.get(key, None)
+                if outcome is None:
+                    continue
+                if conditional.nodeset is not None and other.nodeset is not None \
+                        and conditional.nodeset.isdisjoint(other.nodeset):
+                    continue
+                if identifier > other_identifier:
+                    outcome = _reversed_dict.get(outcome, outcome)
+                found.append((conditional, other, outcome))
+        return found
+
+
+# The relations seen from the other filter
+_reversed_dict = {Relation.SUBSUMED: Relation.SUBSUMES, Relation.SUBSUMES: Relation.SUBSUMED}
+
+
+class _Abstractor(visitor.Visitor):
+    """
+    Abstracts the filters while visiting the scenario.
+    """
+
+    def __init__(self, analysis, assigned):
+        """
+        Initializes the _Abstractor object.
+
+        :param analysis: the analysis to fill
+        :type analysis: analysis.overlap.Overlap
+
+        :param assigned: the variables assigned by the primitives, see
+                         optimizer.folding.assignments
+        :type assigned: set
+        """
+        self.analysis = analysis
+        self.assigned = assigned
+        # The dictionary binding the (id of the symbol table, identifier)
+        # pairs of the filters with their ids
+        self.ids = {}
+
+    def constant(self, identifier):
+        """
+        Gets the variable bound to an identifier, if no primitive assigns it.
+
+        :return: the variable, None if it is not constant
+        """
+        symboltable, obj = self.owner(identifier)
+        if obj is None or obj.symboltype != types.Symbol.Type.VARIABLE or obj.value is None:
+            return None
+        if (id(symboltable), identifier) in self.assigned:
+            return None
+        return obj
+
+    def enter_symboltable(self, symboltable):
+        # The codeblock owning the table is the innermost one of the path
+        for identifier, obj in symboltable.identifier_object_dict.items():
+            if obj.symboltype != types.Symbol.Type.FILTER:
+                continue
+            abstraction = abstract(obj.items, self.resolve, self.constant)
+            self.ids[(id(symboltable), identifier)] = self.analysis.add(self.path[-1], identifier, abstraction)
+        return visitor.Visitor.PRUNE
+
+    def enter_conditional(self, conditional):
+        # The filter is resolved in the enclosing scope
+        symboltable, obj = self.owner(conditional.filter)
+        identifier = self.ids.get((id(symboltable), conditional.filter), None)
+        if identifier is not None:
+            self.analysis.conditionals.append((conditional, identifier))
+
+    def enter_primitive(self, primitive):
+        return visitor.Visitor.PRUNE
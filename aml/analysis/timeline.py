@@ -0,0 +1,255 @@
+# -----------------------------------------------------------------------------
+# timeline.py
+#
+# Author: Francesco Racciatti (racciatti.francesco@gmail.com)
+#
+# This module contains the interval index over the timeline of the AML
+# scenarios.
+# -----------------------------------------------------------------------------
+
+import bisect
+import collections
+
+import model.statements as statements
+
+
+# The activity of a simple attack over the timeline. The times are in
+# nanoseconds, the end is included and it is None if the activity never ends.
+# The path holds the positions of the compound and of the simple attack.
+Activity = collections.namedtuple('Activity', ['start', 'end', 'path', 'compound', 'codeblock'])
+
+
+def activity(compound, codeblock, path):
+    """
+    Builds the activity of a simple attack: the once attacks take place at
+    the start of their compound, the periodic and the conditional attacks
+    last from the start of their compound on. The periodic attacks bounded by
+    a horizon, see optimizer.horizon, end at their last firing.
+
+    :param compound: the compound owning the simple attack
+    :type compound: model.statements.Compound
+
+    :param codeblock: the simple attack
+    :type codeblock: model.statements.Codeblock
+
+    :param path: the positions of the compound and of the simple attack
+    :type path: tuple
+
+    :return: the activity
+    """
+    start = compound.nanoseconds
+    if start is None:
+        raise ValueError("the time of the compound is not resolved")
+    end = start if isinstance(codeblock, statements.Once) else None
+    if isinstance(codeblock, statements.Periodic) and codeblock.firings is not None:
+        end = start + max(codeblock.firings - 1, 0) * codeblock.nanoseconds
+    return Activity(start, end, path, compound, codeblock)
+
+
+class _IntervalTree(object):
+    """
+    A static interval tree over bounded intervals. The intervals are sorted
+    by start and laid out as an implicit balanced binary tree, whose nodes
+    store the maximum end of their subtrees, so that the tree takes three
+    arrays and no node objects.
+    """
+
+    # The height of the subtrees scanned linearly
+    _leaves = 3
+
+    def __init__(self, intervals):
+        """
+        Initializes the _IntervalTree object.
+
+        :param intervals: the (start, stop, item) triples, the stop being excluded
+        :type intervals: list
+        """
+        intervals = sorted(intervals, key=lambda interval: interval[0])
+        self.starts = [interval[0] for interval in intervals]
+        self.stops = [interval[1] for interval in intervals]
+        self.items = [interval[2] for interval in intervals]
+        self.maxstops = list(self.stops)
+        self.height = self._prepare()
+
+    def _prepare(self):
+        """
+        Computes the maximum stops of the inner nodes, bottom-up.
+
+        :return: the height of the tree
+        """
+        count = len(self.starts)
+        if not count:
+            return -1
+        maxstops = self.maxstops
+        last = lastmax = 0
+        for index in range(0, count, 2):
+            last, lastmax = index, maxstops[index]
+        level = 1
+        while 1 << level <= count:
+            half = 1 << (level - 1)
+            for index in range((half << 1) - 1, count, half << 2):
+                left = maxstops[index - half]
+                right = maxstops[index + half] if index + half < count else lastmax
+                maxstops[index] = max(self.stops[index], left, right)
+            # Moves the last node to its parent
+            last = last - half if last >> level & 1 else last + half
+            if last < count and maxstops[last] > lastmax:
+                lastmax = maxstops[last]
+            level += 1
+        return level - 1
+
+    def overlap(self, start, stop):
+        """
+        Gets the items of the intervals overlapping [start, stop).
+
+        :return: the list of the items, by start
+        """
+        found = []
+        if self.height < 0:
+            return found
+        starts, stops, maxstops = self.starts, self.stops, self.maxstops
+        count = len(starts)
+        # The stack of the (level, node, left visited) entries
+        stack = [(self.height, (1 << self.height) - 1, False)]
+        while stack:
+            level, node, visited = stack.pop()
+            if level <= _IntervalTree._leaves:
+                # Scans the small subtrees
+                first = node >> level << level
+                end = min(first + (1 << (level + 1)) - 1, count)
+                index = first
+                while index < end and starts[index] < stop:
+                    if start < stops[index]:
+                        found.append(index)
+                    index += 1
+            elif not visited:
+                stack.append((level, node, True))
+                child = node - (1 << (level - 1))
+                if child >= count or maxstops[child] > start:
+                    stack.append((level - 1, child, False))
+            elif node < count and starts[node] < stop:
+                if start < stops[node]:
+                    found.append(node)
+                stack.append((level - 1, node + (1 << (level - 1)), False))
+        found.sort()
+        return [self.items[index] for index in found]
+
+
+class Timeline(object):
+    """
+    Interval index over the timeline of a scenario. The activities of the
+    once attacks are kept in an interval tree, those of the periodic and of
+    the conditional attacks, which never end, are kept sorted by start. The
+    index is built once and answers the queries in logarithmic time plus the
+    number of the activities found.
+    """
+
+    def __init__(self, scenario):
+        """
+        Initializes the Timeline object.
+
+        :param scenario: the scenario
+        :type scenario: model.statements.Scenario
+        """
+        self.scenario = scenario
+        bounded = []
+        unbounded = []
+        for position, compound in enumerate(scenario.codeblocktable.codeblocks):
+            if not isinstance(compound, statements.Compound):
+                continue
+            for index, codeblock in enumerate(compound.codeblocktable.codeblocks):
+                if not isinstance(codeblock, statements.Codeblock):
+                    continue
+                item = activity(compound, codeblock, (position, index))
+                if item.end is None:
+                    unbounded.append(item)
+                else:
+                    bounded.append((item.start, item.end + 1, item))
+        unbounded.sort(key=lambda item: item.start)
+        self.unbounded = tuple(unbounded)
+        self.unbounded_starts = [item.start for item in unbounded]
+        self.tree = _IntervalTree(bounded)
+        # The sorted start times of the compounds
+        self.starts = sorted(compound.nanoseconds
+                             for compound in scenario.codeblocktable.codeblocks
+                             if isinstance(compound, statements.Compound))
+
+    @classmethod
+    def build(cls, scenario):
+        """
+        Builds the interval index over the given scenario.
+
+        :param scenario: the scenario
+        :type scenario: model.statements.Scenario
+
+        :return: the interval index
+        """
+        return cls(scenario)
+
+    def window(self, start, end):
+        """
+        Gets the activities overlapping the window [start, end].
+
+        :param start: the start of the window, in nanoseconds
+        :type start: int
+
+        :param end: the end of the window, in nanoseconds (included)
+        :type end: int
+
+        :return: the list of the activities, by path
+        """
+        if end < start:
+            raise ValueError("the window ends before its start")
+        found = self.tree.overlap(start, end + 1)
+        found.extend(self.unbounded[:bisect.bisect_right(self.unbounded_starts, end)])
+        found.sort(key=lambda item: item.path)
+        return found
+
+    def active(self, time):
+        """
+        Gets the activities going on at the given time.
+
+        :param time: the time, in nanoseconds
+        :type time: int
+
+        :return: the list of the activities, by path
+        """
+        return self.window(time, time)
+
+    def started(self, start, end):
+        """
+        Counts the compounds starting within the window [start, end].
+
+        :return: the number of the compounds
+        """
+        return bisect.bisect_right(self.starts, end) - bisect.bisect_left(self.starts, start)
+
+    def slice(self, start, end):
+        """
+        Extracts the sub-scenario made by the activities overlapping the window
+        [start, end]. It keeps the symbol tables of the scenario and of the
+        compounds, hence it is self-contained.
+
+        :param start: the start of the window, in nanoseconds
+        :type start: int
+
+        :param end: the end of the window, in nanoseconds (included)
+        :type end: int
+
+        :return: the sub-scenario, frozen if the scenario is frozen
+        """
+        selected = {}
+        for item in self.window(start, end):
+            selected.setdefault(item.path[0], set()).add(item.path[1])
+        scenario = self.scenario
+        table = statements.CodeblockTable(scenario.codeblocktable.scope)
+        sliced = statements.Scenario(scenario.symboltable, table)
+        for position, indexes in selected.items():
+            compound = scenario.codeblocktable.codeblocks[position].thaw()
+            codeblocks = compound.codeblocktable.codeblocks
+            compound.codeblocktable.codeblocks = [codeblock for index, codeblock in enumerate(codeblocks)
+                                                  if index in indexes]
+            sliced.codeblocktable.append(compound)
+        if scenario.frozen():
+            sliced.freeze()
+        return sliced
@@ -11,6 +11,7 @@ import enum
 
 import model.types as types
 import model.statements as statements
+import model.visitor as visitor
 
 
 class Interpreter(metaclass=abc.ABCMeta):
@@ -32,86 +33,237 @@ class Xml(Interpreter):
     """
 
     @classmethod
-    def interpret(cls, aml, type):
+    def interpret(cls, aml, type, shared=False):
+        """
+        Interprets the given scenario. If shared is set, the filters, the 
+        lists and the expressions that are structurally equal to an object 
+        already emitted are emitted as a reference to it.
+        """
+        references = {} if shared else None
         xml = ''
         xml += '<?xml version="1.0"?>'
-        xml += cls.codeblock(aml, type)
+        xml += cls.codeblock(aml, type, references)
         return xml
 
     @classmethod
-    def codeblock(cls, codeblock, indent):
+    def text(cls, value):
+        """
+        Provides the text of an attribute. Sequences are rendered as lists, 
+        regardless of being stored as lists or tuples.
+        """
+        if isinstance(value, tuple):
+            value = list(value)
+        return str(value)
+
+    @classmethod
+    def codeblock(cls, codeblock, indent, references=None):
         """
         Provides the XML representation of the AML codeblocks.
         """
-        xml = ''
-        # Gets the name of the codeblock's base class
-        codeblock_namebaseclass = codeblock.__class__.__bases__[0].__name__.lower()
-        xml += '\t' * indent + '<' + codeblock_namebaseclass + '>\n'
-        # Gets the name of the codeblock's class
-        codeblock_nameclass = codeblock.__class__.__name__.lower()
-        xml += '\t' * (indent + 1) + '<' + codeblock_nameclass + '>\n'
-        # Gets the codeblock's attributes
-        for attribute in codeblock.__dict__.keys():
-            value = codeblock.__dict__[attribute]
-            # Handles the symbol-table
-            if isinstance(value, types.SymbolTable):
-                xml += cls.symboltable(value, indent + 2)
-            # Handles the codeblock-table
-            elif isinstance(value, statements.CodeblockTable):
-                xml += cls.codeblocktable(value, indent + 2)
-            # Handles a simple attribute
-            else:
-                attribute_name = attribute.lower()
-                xml += '\t' * (indent + 2) + '<' + attribute_name + '>'
-                xml += str(value)
-                xml += '</' + attribute_name + '>\n'
-        xml += '\t' * (indent + 1) + '</' + codeblock_nameclass + '>\n'
-        xml += '\t' * indent + '</' + codeblock_namebaseclass + '>\n'
-        return xml
+        return XmlVisitor(indent, references).visit(codeblock).xml()
 
     @classmethod
-    def codeblocktable(cls, codeblocktable, indent):
+    def codeblocktable(cls, codeblocktable, indent, references=None):
         """
         Provides the XML representation of the AML codeblock-tables.
         """
-        xml = ''
-        # Gets the name of the codeblocktable's class
-        codeblocktable_nameclass = codeblocktable.__class__.__name__.lower()
-        xml += '\t' * indent + '<' + codeblocktable_nameclass + '>\n'
-        # Scans the codeblock-table codeblock by codeblock
-        for codeblock in codeblocktable.codeblocks:
-            # Calls recursively the method Xml.codeblock()
-            xml += Xml.codeblock(codeblock, indent + 1)
-        xml += '\t' * indent + '</' + codeblocktable_nameclass + '>\n'
-        return xml
+        return XmlVisitor(indent, references).visit(codeblocktable).xml()
 
     @classmethod
-    def symboltable(cls, symboltable, indent):
+    def symboltable(cls, symboltable, indent, references=None):
         """
         Provides the XML representation of the AML symbol-tables.
         """
-        xml = ''
-        # Gets the name of the symboltable's class
-        symboltable_nameclass = symboltable.__class__.__name__.lower()
-        xml += '\t' * indent + '<' + symboltable_nameclass + '>\n'
-        # Scans the symbol-table symbol by symbol
-        for symbol in symboltable.identifier_object_dict.values():
-            # Gets the name of the symbol's base class
-            symbol_namebaseclass = symbol.__class__.__bases__[0].__name__.lower()
-            xml += '\t' * (indent + 1) + '<' + symbol_namebaseclass + '>\n'
-            # Gets the name of the symbol's class
-            symbol_nameclass = symbol.__class__.__name__.lower()
-            xml += '\t' * (indent + 2) + '<' + symbol_nameclass + '>\n'
-            # Gets the attributes
-            for attribute in symbol.__dict__.keys():
-                attribute_name = attribute.lower()
-                xml += '\t' * (indent + 3) + '<' + attribute_name + '>'
-                xml += str(symbol.__dict__[attribute])
-                xml += '</' + attribute_name + '>\n'
-            xml += '\t' * (indent + 2) + '</' + symbol_nameclass + '>\n'
-            xml += '\t' * (indent + 1) + '</' + symbol_namebaseclass + '>\n'
-        xml += '\t' * indent + '</' + symboltable_nameclass + '>\n'
-        return xml
+        return XmlVisitor(indent, references).visit(symboltable).xml()
+
+
+class XmlVisitor(visitor.Visitor):
+    """
+    Emits the XML representation of the AML model. The tag names and the 
+    attributes are looked up once per class.
+    """
+
+    # The cache mapping the classes with their (base class tag, class tag)
+    _class_tags_dict = {}
+
+    # The cache mapping the classes with their emitted attributes
+    _class_attributes_dict = {}
+
+    # The attributes emitted per class. The attributes the parser and the 
+    # optimizers derive from them (e.g. the nanoseconds of the compounds, the 
+    # firings of the periodics and the nodeset of the conditionals) are not 
+    # part of the XML
+    _class_fields_dict = {
+        types.Reserved: ('identifier', 'reserved'),
+        types.Variable: ('identifier', 'variabletype', 'value'),
+        types.Packet: ('identifier',),
+        types.Filter: ('identifier', 'items'),
+        types.List: ('identifier', 'items'),
+        statements.Scenario: (),
+        statements.Compound: ('time', 'unit'),
+        statements.Once: (),
+        statements.Periodic: ('period', 'unit'),
+        statements.Conditional: ('nodes', 'filter'),
+        statements.DeceiveComponent: ('node', 'component', 'value'),
+        statements.DisableComponent: ('node', 'component'),
+        statements.DestroyComponent: ('node', 'component'),
+        statements.MisplaceNode: ('node', 'position'),
+        statements.DestroyNode: ('node',),
+        statements.CreatePacket: ('packet', 'protocol'),
+        statements.WriteField: ('packet', 'path', 'source'),
+        statements.ReadField: ('destination', 'packet', 'path'),
+        statements.ClonePacket: ('destination', 'source'),
+        statements.InjectPacket: ('packet', 'node', 'direction', 'delay', 'unit'),
+        statements.ForwardPacket: ('packet', 'delay', 'unit'),
+        statements.DropPacket: ('packet',),
+        statements.Expression: ('destination', 'expression'),
+    }
+
+    def __init__(self, indent, references=None):
+        """
+        Initializes the XmlVisitor object.
+
+        :param indent: the initial indentation
+        :type indent: int
+
+        :param references: the objects already emitted, None to disable sharing
+        :type references: dict
+        """
+        self.indent = indent
+        self.references = references
+        self.parts = []
+
+    def xml(self):
+        """
+        Provides the XML emitted so far.
+        """
+        return ''.join(self.parts)
+
+    @classmethod
+    def tags(cls, node):
+        """
+        Provides the tag names of the base class and of the class of a node.
+        """
+        nodeclass = node.__class__
+        tags = cls._class_tags_dict.get(nodeclass, None)
+        if tags is None:
+            tags = (nodeclass.__bases__[0].__name__.lower(), nodeclass.__name__.lower())
+            cls._class_tags_dict[nodeclass] = tags
+        return tags
+
+    @classmethod
+    def attributes(cls, node):
+        """
+        Provides the attributes of a node to emit, with their tag names.
+
+        :raise ValueError: the class of the node is not supported
+        """
+        nodeclass = node.__class__
+        attributes = cls._class_attributes_dict.get(nodeclass, None)
+        if attributes is None:
+            fields = cls._class_fields_dict.get(nodeclass, None)
+            if fields is None:
+                raise ValueError("class not supported - " + nodeclass.__name__)
+            attributes = tuple((attribute, attribute.lower()) for attribute in fields)
+            cls._class_attributes_dict[nodeclass] = attributes
+        return attributes
+
+    def emit(self, indent, text):
+        """
+        Emits a line of XML at the given indentation.
+        """
+        self.parts.append('\t' * indent + text + '\n')
+
+    def emit_attributes(self, node, indent):
+        """
+        Emits the attributes of a node.
+        """
+        values = node.__dict__
+        for attribute, name in self.attributes(node):
+            self.emit(indent, '<' + name + '>' + Xml.text(values[attribute]) + '</' + name + '>')
+
+    def reference(self, obj, indent):
+        """
+        Emits the reference to an object already emitted, if any. Otherwise 
+        it registers the object.
+
+        :return: True if the reference has been emitted, False otherwise
+        """
+        if self.references is None:
+            return False
+        index = self.references.get(obj, None)
+        if index is None:
+            self.references[obj] = len(self.references)
+            return False
+        self.emit(indent, '<reference>' + str(index) + '</reference>')
+        return True
+
+    def shared(self, obj, indent):
+        """
+        Emits the tag that binds an emitted object with its reference.
+        """
+        if self.references is not None:
+            self.emit(indent, '<shared>' + str(self.references[obj]) + '</shared>')
+
+    def enter_codeblock(self, codeblock):
+        namebaseclass, nameclass = self.tags(codeblock)
+        self.emit(self.indent, '<' + namebaseclass + '>')
+        self.emit(self.indent + 1, '<' + nameclass + '>')
+        self.indent += 2
+
+    def leave_codeblock(self, codeblock):
+        self.emit_attributes(codeblock, self.indent)
+        self.indent -= 2
+        namebaseclass, nameclass = self.tags(codeblock)
+        self.emit(self.indent + 1, '</' + nameclass + '>')
+        self.emit(self.indent, '</' + namebaseclass + '>')
+
+    def enter_primitive(self, primitive):
+        namebaseclass, nameclass = self.tags(primitive)
+        self.emit(self.indent, '<' + namebaseclass + '>')
+        self.emit(self.indent + 1, '<' + nameclass + '>')
+        self.emit_attributes(primitive, self.indent + 2)
+        self.emit(self.indent + 1, '</' + nameclass + '>')
+        self.emit(self.indent, '</' + namebaseclass + '>')
+        return visitor.Visitor.PRUNE
+
+    def enter_expression(self, expression):
+        # Emits a reference to the expressions already emitted
+        if self.reference(expression, self.indent):
+            return visitor.Visitor.PRUNE
+        namebaseclass, nameclass = self.tags(expression)
+        self.emit(self.indent, '<' + namebaseclass + '>')
+        self.emit(self.indent + 1, '<' + nameclass + '>')
+        self.emit_attributes(expression, self.indent + 2)
+        self.shared(expression, self.indent + 2)
+        self.emit(self.indent + 1, '</' + nameclass + '>')
+        self.emit(self.indent, '</' + namebaseclass + '>')
+        return visitor.Visitor.PRUNE
+
+    def enter_codeblocktable(self, table):
+        self.emit(self.indent, '<' + self.tags(table)[1] + '>')
+        self.indent += 1
+
+    def leave_codeblocktable(self, table):
+        self.indent -= 1
+        self.emit(self.indent, '</' + self.tags(table)[1] + '>')
+
+    enter_symboltable = enter_codeblocktable
+    leave_symboltable = leave_codeblocktable
+
+    def enter_symbol(self, symbol):
+        namebaseclass, nameclass = self.tags(symbol)
+        self.emit(self.indent, '<' + namebaseclass + '>')
+        # Emits a reference to the filters and lists already emitted
+        sharable = isinstance(symbol, (types.Filter, types.List))
+        if not (sharable and self.reference(symbol, self.indent + 1)):
+            self.emit(self.indent + 1, '<' + nameclass + '>')
+            self.emit_attributes(symbol, self.indent + 2)
+            if sharable:
+                self.shared(symbol, self.indent + 2)
+            self.emit(self.indent + 1, '</' + nameclass + '>')
+        self.emit(self.indent, '</' + namebaseclass + '>')
+        return visitor.Visitor.PRUNE
 
 
 class InterpreterService(object):
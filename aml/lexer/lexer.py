@@ -6,6 +6,7 @@
 # This module contains the lexer.
 # -----------------------------------------------------------------------------
 
+import sys
 import enum
 import lexer.keywords as keywords
 import ply.lex as lex
@@ -210,6 +211,9 @@ def t_IDENTIFIER(t):
     r'[a-zA-Z][a-zA-Z_0-9]*'
     # Checks if the identifier is a reserved keyword
     t.type = reserved.get(t.value, 'IDENTIFIER')
+    # Shares a single string among the occurrences of the same identifier
+    if t.type == 'IDENTIFIER':
+        t.value = sys.intern(t.value)
     return t
 
 
@@ -0,0 +1,270 @@
+# -----------------------------------------------------------------------------
+# canonical.py
+#
+# Author: Francesco Racciatti (racciatti.francesco@gmail.com)
+#
+# This module contains the canonical form and the fingerprint of the AML
+# scenarios.
+# -----------------------------------------------------------------------------
+
+import copy
+import hashlib
+
+import model.types as types
+import model.statements as statements
+import model.visitor as visitor
+import model.evaluation as evaluation
+
+
+# The prefixes of the canonical names, by symbol type
+_symboltype_prefix_dict = {
+    types.Symbol.Type.VARIABLE: 'v',
+    types.Symbol.Type.PACKET: 'p',
+    types.Symbol.Type.FILTER: 'f',
+    types.Symbol.Type.LIST: 'l',
+}
+
+
+def encode(scenario):
+    """
+    Builds the canonical encoding of the scenario. Two scenarios differing
+    only in whitespaces, comments, declaration order, names of the symbols
+    or spelling of the literal sub-expressions share the same encoding.
+
+    The encoding is made by nested tuples of strings, numbers and None:
+    the symbols are renamed in order of first use, the literals and the
+    literal sub-expressions are replaced by their values, and the symbols of
+    each symbol table are sorted by their canonical names.
+
+    :param scenario: the scenario
+    :type scenario: model.statements.Scenario
+
+    :return: the canonical encoding
+    """
+    return _Canonicalizer(False).visit(scenario).result
+
+
+def fingerprint(scenario):
+    """
+    Builds a stable fingerprint of the scenario, i.e. the BLAKE2 digest of
+    its canonical encoding. It can be used to deduplicate the scenarios and
+    to key the caches.
+
+    :param scenario: the scenario
+    :type scenario: model.statements.Scenario
+
+    :return: the hexadecimal digest
+    """
+    return digest(encode(scenario))
+
+
+def digest(encoding):
+    """
+    Builds the BLAKE2 digest of a canonical encoding.
+
+    :param encoding: the canonical encoding
+    :type encoding: tuple
+
+    :return: the hexadecimal digest
+    """
+    return hashlib.blake2b(repr(encoding).encode('utf-8'), digest_size=32).hexdigest()
+
+
+def canonicalize(scenario):
+    """
+    Builds the canonical copy of the scenario: the symbols are renamed in
+    order of first use and the symbol tables are sorted by name. The
+    expressions are left as they are, the literals are folded only in the
+    canonical encoding.
+
+    :param scenario: the scenario
+    :type scenario: model.statements.Scenario
+
+    :return: the canonical scenario, frozen if the given one is frozen
+    """
+    frozen = scenario.frozen()
+    scenario = scenario.thaw()
+    _Canonicalizer(True).visit(scenario)
+    if frozen:
+        scenario.freeze()
+    return scenario
+
+
+class _Canonicalizer(visitor.Visitor):
+    """
+    Builds the canonical encoding of a scenario and, on request, renames the
+    symbols in place.
+    """
+
+    def __init__(self, rename):
+        """
+        Initializes the _Canonicalizer object.
+
+        :param rename: True to rename the symbols of the visited scenario
+        :type rename: bool
+        """
+        self.rename = rename
+        # The dictionary binding (symbol table, identifier) with a canonical name
+        self.names = {}
+        self.counter = 0
+        # The frames of the codeblocks being visited
+        self.frames = []
+        self.result = None
+
+    def name(self, symboltable, obj):
+        """
+        Gets the canonical name of a symbol, assigning the next one on first use.
+        """
+        key = (id(symboltable), obj.identifier)
+        name = self.names.get(key, None)
+        if name is None:
+            name = _symboltype_prefix_dict[obj.symboltype] + str(self.counter)
+            self.counter += 1
+            self.names[key] = name
+        return name
+
+    def reference(self, identifier, assign=True):
+        """
+        Encodes a reference to a symbol. Literals are encoded by value.
+        """
+        symboltable, obj = self.owner(identifier)
+        if obj is None:
+            return ('unbound', identifier)
+        if types.Symbol.mangled(identifier):
+            return self.content(obj, assign)
+        if not assign:
+            return ('ref', self.names.get((id(symboltable), identifier), None))
+        return ('ref', self.name(symboltable, obj))
+
+    def identifier(self, identifier):
+        """
+        Gets the identifier a reference is renamed to.
+        """
+        if types.Symbol.mangled(identifier):
+            return identifier
+        symboltable, obj = self.owner(identifier)
+        if obj is None:
+            return identifier
+        return self.name(symboltable, obj)
+
+    def literal(self, identifier):
+        """
+        Gets the literal variable referred by an identifier, if any.
+        """
+        return types.Variable.literal(self.resolve, identifier)
+
+    def items(self, items, assign=True):
+        """
+        Encodes a sequence of identifiers, folding the literal sub-expressions.
+        """
+        encoded = []
+        for item in evaluation.fold(items, self.literal):
+            if isinstance(item, types.Variable):
+                encoded.append(self.content(item, assign))
+            else:
+                encoded.append(self.reference(item, assign))
+        return tuple(encoded)
+
+    def content(self, obj, assign=True):
+        """
+        Encodes the content of a symbol.
+        """
+        symboltype = obj.symboltype
+        if symboltype == types.Symbol.Type.VARIABLE:
+            return ('variable', obj.variabletype.name, obj.value)
+        if symboltype == types.Symbol.Type.PACKET:
+            return ('packet',)
+        if symboltype == types.Symbol.Type.FILTER:
+            return ('filter', self.items(obj.items, assign))
+        if symboltype == types.Symbol.Type.LIST:
+            if isinstance(obj.items, types.NumericItems):
+                # Encoded as the literals they would refer
+                variabletype = obj.items.variabletype.name
+                return ('list', tuple(('variable', variabletype, value) for value in obj.items.values))
+            return ('list', tuple(self.reference(item, assign) for item in obj.items))
+        return ('reserved', obj.reserved)
+
+    def attributes(self, node):
+        """
+        Encodes the public attributes of a node, except the tables, and renames
+        the references on request.
+        """
+        encoded = []
+        renamed = []
+        for attribute, value in node.__dict__.items():
+            if attribute.startswith('_'):
+                continue
+            if isinstance(value, (types.SymbolTable, statements.CodeblockTable)):
+                continue
+            if isinstance(value, str):
+                encoded.append(self.reference(value))
+                renamed.append((attribute, self.identifier(value)))
+            elif isinstance(value, (list, tuple)):
+                encoded.append(self.items(value))
+                renamed.append((attribute, value.__class__(self.identifier(item) for item in value)))
+            else:
+                encoded.append(value)
+        if self.rename:
+            for attribute, value in renamed:
+                setattr(node, attribute, value)
+        return tuple(encoded)
+
+    def enter_codeblock(self, codeblock):
+        # The attributes of the codeblock are resolved in the enclosing scope
+        self.frames.append({
+            'attributes': self.attributes(codeblock),
+            'symbols': (),
+            'codeblocks': [],
+        })
+
+    def enter_symboltable(self, symboltable):
+        # The symbols are encoded once the nested codeblocks are visited
+        return visitor.Visitor.PRUNE
+
+    def leave_codeblocktable(self, codeblocktable):
+        # The codeblock owning the table is still in the path
+        symboltable = self.path[-1].symboltable
+        objects = list(symboltable.identifier_object_dict.values())
+        named = [obj for obj in objects if not types.Symbol.mangled(obj.identifier)]
+        # Names the unused symbols in order of content
+        unnamed = [obj for obj in named if (id(symboltable), obj.identifier) not in self.names]
+        unnamed.sort(key=lambda obj: repr(self.content(obj, False)))
+        for obj in unnamed:
+            self.name(symboltable, obj)
+        symbols = sorted((self.name(symboltable, obj), self.content(obj)) for obj in named)
+        self.frames[-1]['symbols'] = tuple(symbols)
+        if self.rename:
+            self.rewrite(self.path[-1], objects)
+
+    def rewrite(self, codeblock, objects):
+        """
+        Replaces the symbol table of the codeblock with a renamed, sorted one.
+        """
+        symboltable = codeblock.symboltable
+        renamed = []
+        for obj in objects:
+            obj = copy.deepcopy(obj)
+            if not types.Symbol.mangled(obj.identifier):
+                obj.identifier = self.name(symboltable, obj)
+            if obj.symboltype in (types.Symbol.Type.FILTER, types.Symbol.Type.LIST) \
+                    and not isinstance(obj.items, types.NumericItems):
+                obj.items = tuple(self.identifier(item) for item in obj.items)
+            renamed.append(obj)
+        renamed.sort(key=lambda obj: (types.Symbol.mangled(obj.identifier), obj.identifier))
+        table = symboltable.renew()
+        for obj in renamed:
+            table.define(obj)
+        codeblock.symboltable = table
+
+    def leave_codeblock(self, codeblock):
+        frame = self.frames.pop()
+        encoded = (codeblock.__class__.__name__, frame['attributes'], frame['symbols'],
+                   tuple(frame['codeblocks']))
+        if self.frames:
+            self.frames[-1]['codeblocks'].append(encoded)
+        else:
+            self.result = encoded
+
+    def enter_primitive(self, primitive):
+        self.frames[-1]['codeblocks'].append((primitive.__class__.__name__, self.attributes(primitive)))
+        return visitor.Visitor.PRUNE
@@ -0,0 +1,171 @@
+# -----------------------------------------------------------------------------
+# evaluation.py
+#
+# Author: Francesco Racciatti (racciatti.francesco@gmail.com)
+#
+# This module contains the mechanism for evaluating the literal parts of the
+# AML expressions.
+# -----------------------------------------------------------------------------
+
+import model.types as types
+import lexer.lexer as lexer
+
+
+# The maximum number of bits of the folded integer powers
+_power_bits = 4096
+
+
+def _add(a, b):
+    return a + b
+
+
+def _sub(a, b):
+    return a - b
+
+
+def _mul(a, b):
+    return a * b
+
+
+def _div(a, b):
+    # Integer divisions are folded only when exact, so that the result does
+    # not depend on the rounding of the target
+    if isinstance(a, int):
+        if b == 0 or a % b != 0:
+            return None
+        return a // b
+    if b == 0:
+        return None
+    return a / b
+
+
+def _mod(a, b):
+    # Remainders are folded only for non-negative operands, since the sign
+    # of the result depends on the target
+    if a < 0 or b <= 0:
+        return None
+    return a % b
+
+
+def _exp(a, b):
+    if isinstance(a, int):
+        # Integer powers are folded only up to a bounded size, so that huge
+        # exponents do not stall the compilation
+        if b < 0 or (abs(a) > 1 and b * a.bit_length() > _power_bits):
+            return None
+    if isinstance(a, float) and a <= 0:
+        return None
+    try:
+        return a ** b
+    except OverflowError:
+        return None
+
+
+def _build_operators():
+    """
+    Builds the dictionary binding the mangled identifiers of the arithmetic
+    operators with their evaluating functions.
+    """
+    functions = (
+        (lexer.BasicOperatorType.ADD, _add),
+        (lexer.BasicOperatorType.SUB, _sub),
+        (lexer.BasicOperatorType.MUL, _mul),
+        (lexer.BasicOperatorType.DIV, _div),
+        (lexer.BasicOperatorType.MOD, _mod),
+        (lexer.BasicOperatorType.EXP, _exp))
+    return {types.Reserved(operator.value).identifier: function for operator, function in functions}
+
+
+# The dictionary binding the identifiers of the operators with their functions
+operator_function_dict = _build_operators()
+
+# The Python types of the values, by variable type
+_variabletype_class_dict = {
+    types.Variable.Type.INTEGER: int,
+    types.Variable.Type.REAL: float,
+    types.Variable.Type.STRING: str,
+}
+
+
+def operator(identifier):
+    """
+    Checks if the identifier refers an arithmetic operator.
+
+    :param identifier: the identifier
+    :type identifier: str
+
+    :return: True if the identifier refers an arithmetic operator, False otherwise
+    """
+    return identifier in operator_function_dict
+
+
+def apply(identifier, a, b):
+    """
+    Applies the operator to two literal variables of the same type.
+
+    :param identifier: the identifier of the operator
+    :type identifier: str
+
+    :param a: the first operand
+    :type a: model.types.Variable
+
+    :param b: the second operand
+    :type b: model.types.Variable
+
+    :return: the literal variable holding the result, or None if the operation
+             cannot be folded
+    """
+    function = operator_function_dict.get(identifier, None)
+    if function is None or a.variabletype != b.variabletype:
+        return None
+    variabletype = a.variabletype
+    valueclass = _variabletype_class_dict.get(variabletype, None)
+    if valueclass is None:
+        return None
+    if type(a.value) is not valueclass or type(b.value) is not valueclass:
+        return None
+    # Strings only support the concatenation
+    if valueclass is str and function is not _add:
+        return None
+    value = function(a.value, b.value)
+    if value is None or type(value) is not valueclass:
+        return None
+    return types.Variable(types.Variable.autoidentifier(value), variabletype, value)
+
+
+def fold(expression, literal):
+    """
+    Folds the literal sub-expressions of an expression in reverse polish
+    notation, e.g. ['x', '__1', '__1', '__+', '__*'] becomes ['x', <2>, '__*'].
+
+    :param expression: the identifiers of the expression
+    :type expression: list
+
+    :param literal: the function giving the literal variable referred by an
+                    identifier, or None if the identifier is not a literal
+    :type literal: function
+
+    :return: the list of the items of the folded expression, each one being
+             an identifier or the literal variable holding a folded value;
+             the expression as it is if it is badly formed
+    """
+    # Each entry holds the items of a sub-expression and its literal value
+    stack = []
+    for identifier in expression:
+        if operator(identifier):
+            if len(stack) < 2:
+                return list(expression)
+            b = stack.pop()
+            a = stack.pop()
+            result = None
+            if a[1] is not None and b[1] is not None:
+                result = apply(identifier, a[1], b[1])
+            if result is not None:
+                stack.append(([result], result))
+            else:
+                stack.append((a[0] + b[0] + [identifier], None))
+        else:
+            stack.append(([identifier], literal(identifier)))
+    if len(stack) != 1:
+        return list(expression)
+    return stack[0][0]
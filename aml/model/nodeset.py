@@ -0,0 +1,306 @@
+# -----------------------------------------------------------------------------
+# nodeset.py
+#
+# Author: Francesco Racciatti (racciatti.francesco@gmail.com)
+#
+# This module contains the compact sets of the nodes targeted by the AML
+# conditional attacks.
+# -----------------------------------------------------------------------------
+
+import enum
+import bisect
+import itertools
+
+
+@enum.unique
+class Kind(enum.Enum):
+    """
+    The representations of the node sets.
+    """
+    BITSET = 'bitset'
+    RANGES = 'ranges'
+    HASHSET = 'hashset'
+
+
+# The estimated size, in bytes, of a range (two integers in two tuples) and of
+# an item of a hash set (an integer and its slot)
+_range_size = 72
+_item_size = 44
+
+
+def _integer(value):
+    """
+    Checks if the value is an integer node id.
+    """
+    return type(value) is int
+
+
+def _runs(values):
+    """
+    Splits the sorted, distinct integers into runs of consecutive values.
+
+    :return: the list of the (start, stop) pairs, the stop being excluded
+    """
+    runs = []
+    start = previous = None
+    for value in values:
+        if previous is None or value != previous + 1:
+            if previous is not None:
+                runs.append((start, previous + 1))
+            start = value
+        previous = value
+    if previous is not None:
+        runs.append((start, previous + 1))
+    return runs
+
+
+class NodeSet(object):
+    """
+    An immutable set of node ids, built once at compile time. The nodes are
+    stored as a bitset if the ids are dense integers, as sorted ranges if the
+    ids are integers made by long runs, and as a hash set otherwise; the
+    representation taking the least memory is chosen.
+
+    The membership test takes constant time for the bitsets and the hash
+    sets, and logarithmic time in the number of runs for the ranges. The
+    union and the intersection of two bitsets or of two sets of ranges are
+    computed without expanding the nodes.
+    """
+
+    def __init__(self, nodes=()):
+        """
+        Initializes the NodeSet object.
+
+        :param nodes: the node ids
+        :type nodes: iterable
+        """
+        values = set(nodes)
+        if values and all(_integer(value) for value in values):
+            self._build(sorted(values))
+        else:
+            self._hashset(values)
+
+    @classmethod
+    def _make(cls, kind, *args):
+        """
+        Builds a node set from its representation, without checking it.
+        """
+        nodeset = cls.__new__(cls)
+        getattr(nodeset, '_' + kind.value)(*args)
+        return nodeset
+
+    def _build(self, values):
+        """
+        Chooses the representation of the sorted, distinct integers.
+        """
+        runs = _runs(values)
+        span = values[-1] - values[0] + 1
+        bitset = (span + 7) // 8
+        ranges = len(runs) * _range_size
+        hashset = len(values) * _item_size
+        if bitset <= ranges and bitset <= hashset:
+            bits = 0
+            for value in values:
+                bits |= 1 << (value - values[0])
+            self._bitset(values[0], bits)
+        elif ranges < hashset:
+            self._ranges(runs)
+        else:
+            self._hashset(values)
+
+    def _bitset(self, offset, bits):
+        """
+        Sets the bitset representation, i.e. the bitmap of the ids starting
+        from the offset.
+        """
+        if not bits:
+            self._hashset(())
+            return
+        # Trims the trailing zeros, so that equal sets share the same bitmap
+        shift = (bits & -bits).bit_length() - 1
+        bits >>= shift
+        self.kind = Kind.BITSET
+        self._offset = offset + shift
+        self._bitmap = bits.to_bytes((bits.bit_length() + 7) // 8, 'little')
+        self._length = bin(bits).count('1')
+
+    def _ranges(self, runs):
+        """
+        Sets the ranges representation, i.e. the sorted, disjoint and not
+        adjacent (start, stop) pairs.
+        """
+        if not runs:
+            self._hashset(())
+            return
+        self.kind = Kind.RANGES
+        self._starts = tuple(start for start, stop in runs)
+        self._stops = tuple(stop for start, stop in runs)
+        self._length = sum(stop - start for start, stop in runs)
+
+    def _hashset(self, values):
+        """
+        Sets the hash set representation.
+        """
+        self.kind = Kind.HASHSET
+        self._items = frozenset(values)
+        self._length = len(self._items)
+
+    def _bits(self):
+        """
+        Gets the bitmap of a bitset as an integer.
+        """
+        return int.from_bytes(self._bitmap, 'little')
+
+    def _end(self):
+        """
+        Gets the id following the last node of a bitset.
+        """
+        return self._offset + len(self._bitmap) * 8
+
+    def _pairs(self):
+        """
+        Gets the (start, stop) pairs of a set of ranges.
+        """
+        return zip(self._starts, self._stops)
+
+    def __contains__(self, node):
+        if self.kind is Kind.BITSET:
+            if not _integer(node):
+                return False
+            index = node - self._offset
+            if index < 0 or index >= len(self._bitmap) * 8:
+                return False
+            return bool(self._bitmap[index >> 3] >> (index & 7) & 1)
+        if self.kind is Kind.RANGES:
+            if not _integer(node):
+                return False
+            position = bisect.bisect_right(self._starts, node) - 1
+            return position >= 0 and node < self._stops[position]
+        return node in self._items
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        """
+        Iterates over the nodes: the integer ids in ascending order, then the
+        other ids sorted by type and value.
+        """
+        if self.kind is Kind.BITSET:
+            offset = self._offset
+            for index, byte in enumerate(self._bitmap):
+                while byte:
+                    low = byte & -byte
+                    yield offset + index * 8 + low.bit_length() - 1
+                    byte ^= low
+        elif self.kind is Kind.RANGES:
+            for start, stop in self._pairs():
+                yield from range(start, stop)
+        else:
+            yield from sorted(self._items, key=lambda node: (not _integer(node), type(node).__name__, node))
+
+    def union(self, other):
+        """
+        Builds the union of two node sets.
+
+        :param other: the other node set
+        :type other: model.nodeset.NodeSet
+
+        :return: the union
+        """
+        if not other:
+            return self
+        if not self:
+            return other
+        if self.kind is Kind.BITSET and other.kind is Kind.BITSET:
+            offset = min(self._offset, other._offset)
+            span = max(self._end(), other._end()) - offset
+            # The bitsets far apart are rebuilt, so that the gap between them
+            # is not allocated
+            if (span + 7) // 8 <= (len(self) + len(other)) * _item_size:
+                bits = self._bits() << (self._offset - offset) | other._bits() << (other._offset - offset)
+                return NodeSet._make(Kind.BITSET, offset, bits)
+        elif self.kind is Kind.RANGES and other.kind is Kind.RANGES:
+            runs = []
+            for start, stop in sorted(itertools.chain(self._pairs(), other._pairs())):
+                if runs and start <= runs[-1][1]:
+                    runs[-1] = (runs[-1][0], max(runs[-1][1], stop))
+                else:
+                    runs.append((start, stop))
+            return NodeSet._make(Kind.RANGES, runs)
+        return NodeSet(itertools.chain(self, other))
+
+    def intersection(self, other):
+        """
+        Builds the intersection of two node sets.
+
+        :param other: the other node set
+        :type other: model.nodeset.NodeSet
+
+        :return: the intersection
+        """
+        if self.kind is Kind.BITSET and other.kind is Kind.BITSET:
+            # The bitmaps are aligned on the greater offset, so that the
+            # result never spans more than the inputs
+            offset = max(self._offset, other._offset)
+            if offset >= min(self._end(), other._end()):
+                return NodeSet()
+            bits = self._bits() >> (offset - self._offset) & other._bits() >> (offset - other._offset)
+            return NodeSet._make(Kind.BITSET, offset, bits)
+        if self.kind is Kind.RANGES and other.kind is Kind.RANGES:
+            runs = []
+            a, b = list(self._pairs()), list(other._pairs())
+            i = j = 0
+            while i < len(a) and j < len(b):
+                start, stop = max(a[i][0], b[j][0]), min(a[i][1], b[j][1])
+                if start < stop:
+                    runs.append((start, stop))
+                if a[i][1] < b[j][1]:
+                    i += 1
+                else:
+                    j += 1
+            return NodeSet._make(Kind.RANGES, runs)
+        if len(other) < len(self):
+            self, other = other, self
+        return NodeSet(node for node in self if node in other)
+
+    def isdisjoint(self, other):
+        """
+        Checks if two node sets have no nodes in common.
+
+        :param other: the other node set
+        :type other: model.nodeset.NodeSet
+
+        :return: True if the node sets are disjoint, False otherwise
+        """
+        return not self.intersection(other)
+
+    __or__ = union
+    __and__ = intersection
+
+    def __eq__(self, other):
+        if not isinstance(other, NodeSet):
+            return NotImplemented
+        if len(self) != len(other):
+            return False
+        if self.kind is Kind.BITSET and other.kind is Kind.BITSET:
+            return self._offset == other._offset and self._bitmap == other._bitmap
+        if self.kind is Kind.RANGES and other.kind is Kind.RANGES:
+            return self._starts == other._starts and self._stops == other._stops
+        return all(node in other for node in self)
+
+    def __hash__(self):
+        return hash(frozenset(self))
+
+    def __copy__(self):
+        # The node sets are immutable, hence they can be shared
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __str__(self):
+        return str(list(self))
+
+    def __repr__(self):
+        return 'NodeSet(' + str(self) + ')'
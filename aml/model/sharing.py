@@ -0,0 +1,223 @@
+# -----------------------------------------------------------------------------
+# sharing.py
+#
+# Author: Francesco Racciatti (racciatti.francesco@gmail.com)
+#
+# This module contains the mechanism for sharing the AML scenarios among
+# processes through shared memory.
+# -----------------------------------------------------------------------------
+
+import pickle
+import struct
+import weakref
+from multiprocessing import shared_memory
+
+
+# The layout of the segment: a header, the table of the buffers, the pickle
+# stream and the buffers, each one aligned to 8 bytes
+#   header: magic, offset and length of the pickle stream, number of buffers
+#   table:  offset and length of each buffer
+_magic = b'AMLSHM01'
+_header = struct.Struct('<8sQQQ')
+_entry = struct.Struct('<QQ')
+_alignment = 8
+
+# The segments detached while some objects still viewed them, closed once
+# those objects are gone
+_lingering = set()
+
+
+def _align(offset):
+    """
+    Aligns the given offset.
+    """
+    return (offset + _alignment - 1) // _alignment * _alignment
+
+
+def _close(shm):
+    """
+    Closes an attached segment. If some objects still view it, the segment
+    stays mapped and it is closed by a later sweep.
+
+    :param shm: the segment
+    :type shm: multiprocessing.shared_memory.SharedMemory
+    """
+    try:
+        shm.close()
+    except BufferError:
+        _lingering.add(shm)
+    else:
+        _lingering.discard(shm)
+
+
+def _sweep():
+    """
+    Closes the lingering segments no object views anymore.
+    """
+    for shm in list(_lingering):
+        _close(shm)
+
+
+class Publication(object):
+    """
+    A scenario published into a shared memory segment. The publisher owns
+    the segment: it must keep the publication alive while the workers are
+    attached, and unlink it when they are done.
+    """
+
+    def __init__(self, scenario, name=None):
+        """
+        Serializes the scenario once into a new shared memory segment.
+
+        :param scenario: the frozen scenario
+        :type scenario: model.statements.Scenario
+
+        :param name: the name of the segment, None to get a random name
+        :type name: str
+
+        :raise ValueError: the scenario is not frozen
+        """
+        if not scenario.frozen():
+            raise ValueError("only frozen scenarios can be published")
+        buffers = []
+        stream = pickle.dumps(scenario, 5, buffer_callback=buffers.append)
+        views = [buffer.raw() for buffer in buffers]
+        # Lays out the segment
+        offset = _header.size + _entry.size * len(views)
+        streamoffset = offset
+        offset = _align(offset + len(stream))
+        entries = []
+        for view in views:
+            entries.append((offset, view.nbytes))
+            offset = _align(offset + view.nbytes)
+        # Fills the segment
+        self.shm = shared_memory.SharedMemory(name=name, create=True, size=max(offset, 1))
+        buf = self.shm.buf
+        _header.pack_into(buf, 0, _magic, streamoffset, len(stream), len(views))
+        for index, entry in enumerate(entries):
+            _entry.pack_into(buf, _header.size + _entry.size * index, *entry)
+        buf[streamoffset:streamoffset + len(stream)] = stream
+        for (start, length), view in zip(entries, views):
+            buf[start:start + length] = view
+        self.size = offset
+
+    @property
+    def name(self):
+        """
+        The name of the segment, to be passed to the workers.
+        """
+        return self.shm.name
+
+    def close(self):
+        """
+        Closes the segment in the publisher.
+        """
+        self.shm.close()
+
+    def unlink(self):
+        """
+        Destroys the segment, once all the workers have closed it.
+        """
+        self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+        self.unlink()
+
+
+class Attachment(object):
+    """
+    A scenario attached from a shared memory segment. The typed arrays of
+    the packed symbol tables and of the numeric lists are read-only views on
+    the segment, so that they are never copied: the segment lives as long as
+    the attached scenario, and it is closed once the scenario and the objects
+    got from it are gone.
+    """
+
+    def __init__(self, name):
+        """
+        Attaches to the segment and rebuilds the frozen scenario.
+
+        :param name: the name of the segment
+        :type name: str
+
+        :raise ValueError: the segment does not hold a published scenario
+        """
+        _sweep()
+        self.shm = shared_memory.SharedMemory(name=name)
+        buf = self.shm.buf.toreadonly()
+        try:
+            self.scenario = self._load(buf)
+        except Exception:
+            buf.release()
+            _close(self.shm)
+            raise
+        buf.release()
+        weakref.finalize(self.scenario, _close, self.shm)
+
+    @classmethod
+    def _load(cls, buf):
+        """
+        Loads the scenario from the segment.
+        """
+        if buf.nbytes < _header.size:
+            raise ValueError("segment too small")
+        magic, streamoffset, streamlength, count = _header.unpack_from(buf, 0)
+        if magic != _magic:
+            raise ValueError("segment does not hold a published scenario")
+        buffers = []
+        for index in range(count):
+            start, length = _entry.unpack_from(buf, _header.size + _entry.size * index)
+            buffers.append(buf[start:start + length])
+        stream = buf[streamoffset:streamoffset + streamlength]
+        try:
+            return pickle.loads(stream, buffers=buffers)
+        finally:
+            # The views kept by the scenario are derived from the buffers
+            stream.release()
+            for buffer in buffers:
+                buffer.release()
+
+    def close(self):
+        """
+        Detaches from the segment. The segment is closed as soon as the
+        scenario is no longer referenced, hence the caller can keep using it.
+        """
+        self.scenario = None
+        _sweep()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+
+def publish(scenario, name=None):
+    """
+    Publishes the given frozen scenario into a shared memory segment.
+
+    :param scenario: the frozen scenario
+    :type scenario: model.statements.Scenario
+
+    :param name: the name of the segment, None to get a random name
+    :type name: str
+
+    :return: the publication
+    """
+    return Publication(scenario, name)
+
+
+def attach(name):
+    """
+    Attaches to a scenario published into a shared memory segment.
+
+    :param name: the name of the segment
+    :type name: str
+
+    :return: the attachment, holding the frozen scenario
+    """
+    return Attachment(name)
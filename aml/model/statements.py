@@ -9,8 +9,10 @@
 import abc
 import copy
 
+import model.types as types
 
-class Primitive(metaclass=abc.ABCMeta):
+
+class Primitive(types.Freezable, metaclass=abc.ABCMeta):
     """
     Abstract base class for primitives.
     """
@@ -314,8 +316,46 @@ class Expression(Primitive):
         self.destination = destination
         self.expression = copy.deepcopy(expression)
 
+    def __eq__(self, other):
+        """
+        Two expressions are equal if they share the destination and the items.
+        """
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.destination == other.destination and self.expression == other.expression
+
+    def __hash__(self):
+        return hash((self.__class__.__name__, self.destination, tuple(self.expression)))
+
+    def _getstate(self, protocol):
+        """
+        Builds the compact state, i.e. the destination and the identifiers.
+        """
+        return (self.destination, tuple(self.expression))
+
+    def _setstate(self, state):
+        """
+        Restores the expression from its compact state.
+        """
+        self.destination, expression = state
+        self.expression = list(expression)
+
+    def _freeze(self):
+        """
+        Replaces the list of the identifiers with a tuple.
+        """
+        object.__setattr__(self, 'expression', tuple(self.expression))
 
-class Codeblock(metaclass=abc.ABCMeta):
+    def _thaw(self):
+        """
+        Replaces the tuple of the identifiers with a list.
+        """
+        self.expression = list(self.expression)
+
+
+class Codeblock(types.Freezable, metaclass=abc.ABCMeta):
     """
     Abstract model for codeblocks.
     """
@@ -334,10 +374,73 @@ class Codeblock(metaclass=abc.ABCMeta):
         self.symboltable = copy.deepcopy(symboltable)
         self.codeblocktable = copy.deepcopy(codeblocktable)
 
+    def hashcons(self, hashconstable):
+        """
+        Replaces the filters, the lists and the expressions owned by the 
+        codeblock and by its nested codeblocks with their canonical instances.
+        
+        :param hashconstable: the hash-consing table
+        :type hashconstable: model.types.HashConsTable
+        
+        :return: the hash-consing table
+        """
+        self._assert_mutable()
+        pending = [self]
+        while pending:
+            codeblock = pending.pop()
+            codeblock.symboltable.hashcons(hashconstable)
+            codeblocks = codeblock.codeblocktable.codeblocks
+            for index, item in enumerate(codeblocks):
+                if isinstance(item, Codeblock):
+                    pending.append(item)
+                elif isinstance(item, Expression):
+                    codeblocks[index] = hashconstable.intern(item)
+        return hashconstable
+
+    def pack(self):
+        """
+        Replaces the symbol tables of the codeblock and of its nested 
+        codeblocks with array symbol tables, which share a single identifier 
+        table.
+        
+        :return: the number of symbols packed
+        """
+        self._assert_mutable()
+        identifiertable = types.IdentifierTable()
+        symbols = 0
+        pending = [self]
+        while pending:
+            codeblock = pending.pop()
+            if not isinstance(codeblock.symboltable, types.ArraySymbolTable):
+                codeblock.symboltable = types.ArraySymbolTable.pack(codeblock.symboltable, identifiertable)
+            symbols += len(codeblock.symboltable)
+            for item in codeblock.codeblocktable.codeblocks:
+                if isinstance(item, Codeblock):
+                    pending.append(item)
+        return symbols
+
+    def _freeze(self):
+        """
+        Freezes the symbol table and the codeblock table.
+        """
+        self.symboltable.freeze()
+        self.codeblocktable.freeze()
+
+    def _thaw(self):
+        """
+        Replaces the symbol table and the codeblock table with mutable copies.
+        """
+        self.symboltable = self.symboltable.thaw()
+        self.codeblocktable = self.codeblocktable.thaw()
+
 
 class Scenario(Codeblock):
     """
     The scenario is made by a symbol table and a set of compound attacks.
+    
+    Once parsed, a scenario can be frozen through the method freeze(). The 
+    frozen scenario is an immutable view that can be shared by many threads 
+    without copies or locks.
     """
     
     def __init__(self, symboltable, codeblocktable):
@@ -356,10 +459,11 @@ class Scenario(Codeblock):
 class Compound(Codeblock):
     """
     The compound attack is made by a symbol table and a set of simple attacks.
-    It starts at the given time.
+    It starts at the given time. The time and the unit are kept for display, 
+    the scheduling relies on the integer nanoseconds.
     """
     
-    def __init__(self, symboltable, codeblocktable, time, unit):
+    def __init__(self, symboltable, codeblocktable, time, unit, nanoseconds=None):
         """
         Initializes the Compound object.
         
@@ -374,10 +478,14 @@ class Compound(Codeblock):
         
         :param unit: the identifier that refers the variable containing the measure unit
         :type unit: str
+        
+        :param nanoseconds: the starting time in nanoseconds, resolved at compile time
+        :type nanoseconds: int
         """
         super(Compound, self).__init__(symboltable, codeblocktable)
         self.time = time
         self.unit = unit
+        self.nanoseconds = nanoseconds
 
 
 class Once(Codeblock):
@@ -401,10 +509,11 @@ class Once(Codeblock):
 class Periodic(Codeblock):
     """
     The periodic attack is made by a symbol table and a set of primitives.
-    Is repeats itself periodically.
+    Is repeats itself periodically. The period and the unit are kept for 
+    display, the scheduling relies on the integer nanoseconds.
     """
 
-    def __init__(self, symboltable, codeblocktable, period, unit):
+    def __init__(self, symboltable, codeblocktable, period, unit, nanoseconds=None, firings=None):
         """
         Initializes the Periodic object.
         
@@ -419,10 +528,19 @@ class Periodic(Codeblock):
         
         :param unit: the identifier that refers the variable containing the measure unit
         :type unit: str
+        
+        :param nanoseconds: the period in nanoseconds, resolved at compile time
+        :type nanoseconds: int
+
+        :param firings: the number of the times it takes place within the
+                        horizon of the simulation, None if unbounded
+        :type firings: int
         """
         super(Periodic, self).__init__(symboltable, codeblocktable)
         self.period = period
         self.unit = unit
+        self.nanoseconds = nanoseconds
+        self.firings = firings
 
 
 class Conditional(Codeblock):
@@ -431,7 +549,7 @@ class Conditional(Codeblock):
     It takes place when a packet of a target node matches the filter.
     """
     
-    def __init__(self, symboltable, codeblocktable, nodes, filter):
+    def __init__(self, symboltable, codeblocktable, nodes, filter, nodeset=None):
         """
         Initializes the Periodic object.
         
@@ -446,13 +564,17 @@ class Conditional(Codeblock):
         
         :param filter: the identifier that refers the filter
         :type filter: str
+
+        :param nodeset: the target nodes, resolved at compile time
+        :type nodeset: model.nodeset.NodeSet
         """
         super(Conditional, self).__init__(symboltable, codeblocktable)
         self.nodes = nodes
         self.filter = filter
+        self.nodeset = nodeset
 
 
-class CodeblockTable(object):
+class CodeblockTable(types.Freezable):
     """
     A codeblock table that supports AML codelbocks.
     """
@@ -483,6 +605,7 @@ class CodeblockTable(object):
         :param self: the reference to the instance
         :type self: model.statements.CodeblockTable
         """
+        self._assert_mutable()
         del self.codeblocks[:]
 
     
@@ -499,8 +622,36 @@ class CodeblockTable(object):
         """
         if not codeblock:
             raise ValueError("None codeblock passed")
+        self._assert_mutable()
         self.codeblocks.append(codeblock)
 
+    def _getstate(self, protocol):
+        """
+        Builds the compact state, i.e. the scope and the tuple of the codeblocks.
+        """
+        return (self.scope, tuple(self.codeblocks))
+
+    def _setstate(self, state):
+        """
+        Restores the codeblock table from its compact state.
+        """
+        self.scope, codeblocks = state
+        self.codeblocks = list(codeblocks)
+
+    def _freeze(self):
+        """
+        Freezes the codeblocks and replaces their list with a tuple.
+        """
+        for codeblock in self.codeblocks:
+            codeblock.freeze()
+        object.__setattr__(self, 'codeblocks', tuple(self.codeblocks))
+
+    def _thaw(self):
+        """
+        Replaces the tuple of the codeblocks with a list of mutable copies.
+        """
+        self.codeblocks = [codeblock.thaw() for codeblock in self.codeblocks]
+
 
 class CodeblockHandler(object):
     """
@@ -7,8 +7,16 @@
 # -----------------------------------------------------------------------------
 
 import abc
+import sys
 import copy
 import enum
+import array
+import hashlib
+import decimal
+import pickle
+import inspect
+import collections.abc
+import types as builtintypes
 import lexer.lexer as lexer
 import lexer.keywords as keywords
 
@@ -23,7 +31,149 @@ def _tuples():
         return tuples
 
 
-class Symbol(metaclass=abc.ABCMeta):
+class Freezable(object):
+    """
+    Base class for the objects of the model that can be frozen. A frozen 
+    object is read-only: its attributes cannot be set or deleted, and its 
+    containers are replaced by read-only ones. Frozen objects can be shared 
+    among threads without copies and locks, hence deep copying a frozen 
+    object gives back the object itself.
+    """
+    
+    def freeze(self):
+        """
+        Freezes the object and the objects it owns.
+        
+        :return: the object itself
+        """
+        if not self.frozen():
+            self._freeze()
+            object.__setattr__(self, '_frozen', True)
+        return self
+    
+    def frozen(self):
+        """
+        Checks if the object is frozen.
+        
+        :return: True if the object is frozen, False otherwise
+        """
+        return self.__dict__.get('_frozen', False)
+    
+    def thaw(self):
+        """
+        Builds a mutable deep copy of a frozen object.
+        
+        :return: the mutable copy
+        """
+        if not self.frozen():
+            return copy.deepcopy(self)
+        obj = copy.copy(self)
+        del obj.__dict__['_frozen']
+        obj._thaw()
+        return obj
+    
+    def _freeze(self):
+        """
+        Freezes the objects owned by this object (hook for the subclasses).
+        """
+        pass
+    
+    def _thaw(self):
+        """
+        Replaces the objects owned by this copy with mutable copies (hook for 
+        the subclasses).
+        """
+        pass
+    
+    def _assert_mutable(self):
+        """
+        Raises an AttributeError if the object is frozen.
+        """
+        if self.frozen():
+            raise AttributeError("cannot modify a frozen " + self.__class__.__name__)
+    
+    def __setattr__(self, name, value):
+        self._assert_mutable()
+        object.__setattr__(self, name, value)
+    
+    def __delattr__(self, name):
+        self._assert_mutable()
+        object.__delattr__(self, name)
+    
+    def __copy__(self):
+        obj = self.__class__.__new__(self.__class__)
+        obj.__dict__.update(self.__dict__)
+        return obj
+    
+    def __deepcopy__(self, memo):
+        if self.frozen():
+            return self
+        obj = self.__class__.__new__(self.__class__)
+        memo[id(self)] = obj
+        obj.__dict__.update(copy.deepcopy(self.__dict__, memo))
+        return obj
+    
+    # The cache binding the classes with the names of the fields of their state
+    _class_fields_dict = {}
+    
+    @classmethod
+    def _fields(cls):
+        """
+        Gets the names of the attributes that make the state of the objects 
+        of the class. By default they are the parameters of the constructor.
+        """
+        fields = Freezable._class_fields_dict.get(cls, None)
+        if fields is None:
+            parameters = inspect.signature(cls.__init__).parameters
+            fields = tuple(name for name in parameters if name != 'self')
+            Freezable._class_fields_dict[cls] = fields
+        return fields
+    
+    def _getstate(self, protocol):
+        """
+        Builds the compact state of the object, i.e. the tuple of the values 
+        of its fields (hook for the subclasses).
+        
+        :param protocol: the pickle protocol
+        :type protocol: int
+        """
+        values = self.__dict__
+        return tuple(values[name] for name in self._fields())
+    
+    def _setstate(self, state):
+        """
+        Restores the object from its compact state (hook for the subclasses).
+        """
+        self.__dict__.update(zip(self._fields(), state))
+    
+    def __reduce_ex__(self, protocol):
+        return (_restore, (self.__class__, self._getstate(protocol), self.frozen()))
+
+
+def _restore(cls, state, frozen):
+    """
+    Rebuilds an object of the model from its compact state, without running 
+    the checks of its constructor.
+    
+    :param cls: the class of the object
+    :type cls: type
+    
+    :param state: the compact state
+    :type state: tuple
+    
+    :param frozen: True if the object was frozen
+    :type frozen: bool
+    
+    :return: the object
+    """
+    obj = cls.__new__(cls)
+    obj._setstate(state)
+    if frozen:
+        obj.freeze()
+    return obj
+
+
+class Symbol(Freezable, metaclass=abc.ABCMeta):
     """
     Abstract base class to build up symbols.
     
@@ -37,11 +187,44 @@ class Symbol(metaclass=abc.ABCMeta):
     # The prefix for name mangling
     __prefix = '__'
 
+    @classmethod
+    def mangled(cls, identifier):
+        """
+        Checks if an identifier is mangled, i.e. if it refers a literal, a 
+        reserved keyword or an anonymous list.
+        
+        :param identifier: the identifier
+        :type identifier: str
+        
+        :return: True if the identifier is mangled, False otherwise
+        """
+        return identifier.startswith(Symbol.__prefix)
+
     @abc.abstractmethod
     def __init__(self, *args):
         pass
 
 
+def _build_reserved_codes():
+    """
+    Builds the codes of the reserved keywords, i.e. the operators and the 
+    well known values.
+    """
+    tuples = [(e.name, e.value) for e in lexer.BasicOperatorType]
+    tuples += [(e.name, e.value) for e in keywords.WellKnown]
+    return tuples
+
+
+def _build_reserved_identifiers(codes):
+    """
+    Binds the mangled identifiers of the reserved keywords with their codes.
+    """
+    identifier_code_dict = {}
+    for name, value in _build_reserved_codes():
+        identifier_code_dict[sys.intern(Symbol._Symbol__prefix + value)] = codes[name]
+    return identifier_code_dict
+
+
 class Reserved(Symbol):
     """
     Container for reserved keywords.
@@ -52,6 +235,24 @@ class Reserved(Symbol):
     
     symboltype = Symbol.Type.RESERVED
     
+    # The small integer codes of the reserved keywords
+    Code = enum.IntEnum('Code', [name for name, value in _build_reserved_codes()], start=0)
+    
+    # The dictionary that binds the mangled identifiers with the codes
+    identifier_code_dict = _build_reserved_identifiers(Code)
+    
+    @classmethod
+    def codeof(cls, identifier):
+        """
+        Gets the code of the reserved keyword having the given identifier.
+        
+        :param identifier: the mangled identifier
+        :type identifier: str
+        
+        :return: the code, None if the identifier is not reserved
+        """
+        return cls.identifier_code_dict.get(identifier, None)
+    
     def __init__(self, reserved):
         """
         Initializes the object. It stores the reserved keyword and assigns to it 
@@ -67,9 +268,59 @@ class Reserved(Symbol):
         if not reserved:
             raise ValueError("Empty string passed as an argument")
         # TODO check if the reserved is recognized
-        self.identifier = Symbol._Symbol__prefix + reserved
+        self.identifier = sys.intern(Symbol._Symbol__prefix + reserved)
         self.reserved = reserved
 
+    @property
+    def code(self):
+        """
+        The code of the reserved keyword, None if it is not recognized.
+        """
+        return Reserved.codeof(self.identifier)
+
+    def _setstate(self, state):
+        """
+        Restores the reserved keyword and its mangled identifier.
+        """
+        self.reserved, = state
+        self.identifier = sys.intern(Symbol._Symbol__prefix + self.reserved)
+
+
+# The nanoseconds per time unit
+unit_nanoseconds_dict = {
+    keywords.WellKnown.US.value: 10 ** 3,
+    keywords.WellKnown.MS.value: 10 ** 6,
+    keywords.WellKnown.S.value: 10 ** 9,
+}
+
+
+def nanoseconds(value, unit):
+    """
+    Converts a time into integer nanoseconds. The conversion is decimal, so 
+    that e.g. 0.1 ms gives exactly 100000 ns; sub-nanosecond fractions are 
+    rounded half to even.
+    
+    :param value: the time
+    :type value: int, float
+    
+    :param unit: the time unit (us, ms or s)
+    :type unit: str
+    
+    :return: the nanoseconds
+    
+    :raise ValueError: the value is not a non-negative number, or the unit 
+                       is not recognized
+    """
+    factor = unit_nanoseconds_dict.get(unit, None)
+    if factor is None:
+        raise ValueError("time unit " + str(unit) + " not recognized")
+    if type(value) not in (int, float):
+        raise ValueError("time " + str(value) + " is not a number")
+    time = decimal.Decimal(repr(value)) * factor
+    if not time.is_finite() or time < 0:
+        raise ValueError("time " + str(value) + " is not a non-negative number")
+    return int(time.to_integral_value(rounding=decimal.ROUND_HALF_EVEN))
+
 
 # TODO embed into Variable
 # The entry for the undefined variables
@@ -111,7 +362,27 @@ class Variable(Symbol):
         """
         if value is None:
             raise ValueError("Cannot handle None")
-        return Symbol._Symbol__prefix + str(value)
+        return sys.intern(Symbol._Symbol__prefix + str(value))
+    
+    @classmethod
+    def literal(cls, resolve, identifier):
+        """
+        Resolves a mangled identifier into the literal holding its value.
+        
+        :param resolve: the function giving the object bound to an identifier
+        :type resolve: function
+        
+        :param identifier: the identifier
+        :type identifier: str
+        
+        :return: the variable, None if the identifier does not refer a literal
+        """
+        if not Symbol.mangled(identifier):
+            return None
+        obj = resolve(identifier)
+        if obj is None or obj.symboltype != Symbol.Type.VARIABLE or obj.value is None:
+            return None
+        return obj
         
     
     def __init__(self, identifier, variabletype, value):
@@ -133,7 +404,7 @@ class Variable(Symbol):
             raise ValueError("Empty string passed as an identifier")
         if variabletype is None:
             raise ValueError("None passed as a variable type")
-        if variabletype not in Variable.Type:
+        if not isinstance(variabletype, Variable.Type):
             raise ValueError("Variable type not recognized")
 
         # TODO checks the value against the type
@@ -142,6 +413,22 @@ class Variable(Symbol):
         self.variabletype = variabletype
         self.value = value
 
+    # The variable types, by code
+    _variabletypes = tuple(Type)
+
+    def _getstate(self, protocol):
+        """
+        Builds the compact state, the variable type is stored as its code.
+        """
+        return (self.identifier, Variable._variabletypes.index(self.variabletype), self.value)
+
+    def _setstate(self, state):
+        """
+        Restores the variable from its compact state.
+        """
+        self.identifier, code, self.value = state
+        self.variabletype = Variable._variabletypes[code]
+
 
 class Packet(Symbol):
     """
@@ -197,13 +484,182 @@ class Filter(Symbol):
         if not items: 
             raise ValueError("Empty tuple passed as items")
         self.identifier = identifier
-        self.items = copy.deepcopy(items)
+        self.items = tuple(items)
+
+    def __eq__(self, other):
+        """
+        Two filters are equal if they share the identifier and the items.
+        """
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.identifier == other.identifier and self.items == other.items
+
+    def __hash__(self):
+        return hash((self.__class__.__name__, self.identifier, self.items))
+
+
+class NumericItems(collections.abc.Sequence):
+    """
+    The items of a list made only by integer literals or only by real 
+    literals. The values are stored in a typed array instead of a tuple of 
+    identifiers, and the identifiers of the literals are built on access, 
+    so that the consumers of the list items keep working as they are.
+    
+    The items are immutable and compare equal to the tuple of their 
+    identifiers. Once frozen, the values are a read-only view.
+    """
+    
+    # The typecodes of the typed arrays, by variable type
+    variabletype_typecode_dict = {
+        Variable.Type.INTEGER: 'q',
+        Variable.Type.REAL: 'd',
+    }
+    
+    @classmethod
+    def build(cls, variabletype, values):
+        """
+        Builds the numeric items holding the given values.
+        
+        :param variabletype: the type of the values
+        :type variabletype: model.types.Variable.Type
+        
+        :param values: the values
+        :type values: iterable
+        
+        :return: the numeric items, None if the values do not fit a typed array
+        """
+        typecode = cls.variabletype_typecode_dict.get(variabletype, None)
+        if typecode is None:
+            return None
+        try:
+            return cls(array.array(typecode, values))
+        except (TypeError, OverflowError):
+            return None
+    
+    def __init__(self, values):
+        """
+        Initializes the NumericItems object.
+        
+        :param values: the values of the literals
+        :type values: array.array | memoryview
+        """
+        self.values = values
+        # The hash, computed on demand
+        self._hash = None
+    
+    @property
+    def typecode(self):
+        """
+        The typecode of the values.
+        """
+        values = self.values
+        return values.format if isinstance(values, memoryview) else values.typecode
+    
+    @property
+    def variabletype(self):
+        """
+        The type of the values.
+        """
+        if self.typecode == 'd':
+            return Variable.Type.REAL
+        return Variable.Type.INTEGER
+    
+    def frozen(self):
+        """
+        Checks if the values are read-only.
+        
+        :return: True if the values are read-only, False otherwise
+        """
+        return isinstance(self.values, memoryview)
+    
+    def freeze(self):
+        """
+        Replaces the typed array with a read-only view on a copy of its 
+        buffer, so that the values cannot be modified through the symbol 
+        tables sharing the items.
+        
+        :return: the items themselves
+        """
+        if not self.frozen():
+            self.values = memoryview(self.values.tobytes()).cast(self.values.typecode)
+        return self
+    
+    def __len__(self):
+        return len(self.values)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(map(Variable.autoidentifier, self.values[index]))
+        return Variable.autoidentifier(self.values[index])
+    
+    def __iter__(self):
+        return map(Variable.autoidentifier, self.values)
+    
+    def __eq__(self, other):
+        if isinstance(other, NumericItems):
+            return self.typecode == other.typecode and self.values == other.values
+        if isinstance(other, tuple):
+            # Stops at the first item differing
+            return len(other) == len(self.values) and all(map(str.__eq__, self, other))
+        return NotImplemented
+    
+    def __hash__(self):
+        # Consistent with the tuples of identifiers comparing equal, the items
+        # are immutable hence it is computed once
+        if self._hash is None:
+            self._hash = hash(tuple(self))
+        return self._hash
+    
+    def __reduce_ex__(self, protocol):
+        if not self.frozen():
+            return (self.__class__, (self.values,))
+        # The read-only values are handed out-of-band with the pickle protocol 5
+        if protocol >= 5:
+            buffer = pickle.PickleBuffer(self.values)
+        else:
+            buffer = self.values.tobytes()
+        return (_restore_numeric_items, (self.typecode, buffer))
+    
+    def __copy__(self):
+        return self
+    
+    def __deepcopy__(self, memo):
+        return self
+    
+    def __str__(self):
+        return str(list(self))
+    
+    def __repr__(self):
+        return repr(tuple(self))
+
+
+def _restore_numeric_items(typecode, buffer):
+    """
+    Rebuilds frozen numeric items. The items keep a read-only view on the 
+    given buffer instead of copying it, so that the items unpickled from 
+    shared memory stay there.
+    
+    :param typecode: the typecode of the values
+    :type typecode: str
+    
+    :param buffer: the buffer of the values
+    
+    :return: the numeric items
+    """
+    values = memoryview(buffer).cast('B')
+    if not values.readonly:
+        values = memoryview(values.tobytes())
+    return NumericItems(values.cast(typecode))
 
 
 class List(Symbol):
     """
     Container for lists. It stores the list of 
-    identifiers that refer the items owned by the list.
+    identifiers that refer the items owned by the list. The lists made only 
+    by integer literals or only by real literals store the values of their 
+    items, see NumericItems.
 
     :param symboltype: the type of the symbol
     :type symboltype: Symbol.Type
@@ -215,16 +671,16 @@ class List(Symbol):
     @classmethod
     def autoidentifier(cls, items):
         """
-        Builds an identifier form the items.
+        Builds an identifier form the items, i.e. the digest of the items 
+        separated by a NUL character, so that different lists never share the 
+        same identifier.
         """
-        if not items:
-            raise ValueError("Cannot handle empty lists")
         if items is None:
             raise ValueError("Cannot handle None")
-        identifier = Symbol._Symbol__prefix
-        for i in items:
-            identifier += i
-        return identifier
+        if not items:
+            raise ValueError("Cannot handle empty lists")
+        digest = hashlib.sha1('\0'.join(items).encode('utf-8')).hexdigest()
+        return Symbol._Symbol__prefix + digest
     
     
     def __init__(self, identifier, items):
@@ -234,8 +690,8 @@ class List(Symbol):
         :param identifier: The identifier of the list
         :type identifier: str
         
-        :param items: The tuple of the list's items
-        :type items: tuple
+        :param items: The tuple of the list's items, or the numeric items
+        :type items: tuple | model.types.NumericItems
         """
         if identifier is None:
             raise ValueError("None passed as an identifier")
@@ -244,10 +700,200 @@ class List(Symbol):
         if not items: 
             raise ValueError("Empty tuple passed as items")
         self.identifier = identifier
-        self.items = copy.deepcopy(items)
+        self.items = items if isinstance(items, NumericItems) else tuple(items)
+
+    def __eq__(self, other):
+        """
+        Two lists are equal if they share the identifier and the items.
+        """
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.identifier == other.identifier and self.items == other.items
+
+    def __hash__(self):
+        return hash((self.__class__.__name__, self.identifier, self.items))
+
+    def _freeze(self):
+        """
+        Freezes the numeric items.
+        """
+        if isinstance(self.items, NumericItems):
+            self.items.freeze()
+
+
+class HashConsTable(object):
+    """
+    A hash-consing table. It stores a single canonical instance for each 
+    group of structurally equal objects, so that identical filters, lists and 
+    expressions can be shared instead of being stored once per codeblock.
+    """
+    
+    def __init__(self):
+        """
+        Initializes the HashConsTable object.
+        
+        :param self: the reference to the instance
+        :type self: model.types.HashConsTable
+        
+        :param object_object_dict: the dictionary that binds an object with its canonical instance
+        :type object_object_dict: dict
+        
+        :param hits: the number of objects replaced by a canonical instance
+        :type hits: int
+        """
+        self.object_object_dict = {}
+        self.hits = 0
+    
+    def __len__(self):
+        return len(self.object_object_dict)
+    
+    def __contains__(self, obj):
+        return obj in self.object_object_dict
+    
+    def intern(self, obj):
+        """
+        Gets the canonical instance of the given object, storing the object 
+        if it is the first of its kind.
+        
+        :param self: the reference to the instance
+        :type self: model.types.HashConsTable
+        
+        :param obj: the object
+        :type obj: model.types.Filter
+                 | model.types.List
+                 | model.statements.Expression
+        
+        :return: the canonical instance
+        """
+        canonical = self.object_object_dict.setdefault(obj, obj)
+        if canonical is not obj:
+            self.hits += 1
+        return canonical
+
+
+class IdentifierTable(Freezable):
+    """
+    A table that binds identifiers to dense integer ids. The ids of the 
+    reserved keywords match their Reserved.Code, the other identifiers get 
+    the next free id when they are interned. The array symbol tables store 
+    the items of the filters and of the lists as arrays of ids.
+    """
+    
+    def __init__(self):
+        """
+        Initializes the IdentifierTable object.
+        
+        :param self: the reference to the instance
+        :type self: model.types.IdentifierTable
+        
+        :param identifiers: the identifiers, indexed by id
+        :type identifiers: list
+        
+        :param identifier_id_dict: the dictionary that binds an identifier with an id
+        :type identifier_id_dict: dict
+        """
+        self.identifiers = sorted(Reserved.identifier_code_dict, key=Reserved.identifier_code_dict.get)
+        self.identifier_id_dict = {identifier: id for id, identifier in enumerate(self.identifiers)}
+    
+    def __len__(self):
+        return len(self.identifiers)
+    
+    def __contains__(self, identifier):
+        return identifier in self.identifier_id_dict
+    
+    def intern(self, identifier):
+        """
+        Gets the id of the given identifier, binding the identifier with the 
+        next free id if it is the first time it is interned.
+        
+        :param self: the reference to the instance
+        :type self: model.types.IdentifierTable
+        
+        :param identifier: the identifier
+        :type identifier: str
+        
+        :return: the id
+        """
+        id = self.identifier_id_dict.get(identifier, None)
+        if id is None:
+            self._assert_mutable()
+            id = len(self.identifiers)
+            if type(identifier) is str:
+                identifier = sys.intern(identifier)
+            self.identifiers.append(identifier)
+            self.identifier_id_dict[identifier] = id
+        return id
+    
+    def id(self, identifier):
+        """
+        Gets the id of the given identifier, None if it is not interned.
+        """
+        return self.identifier_id_dict.get(identifier, None)
+    
+    def identifier(self, id):
+        """
+        Gets the identifier having the given id.
+        """
+        return self.identifiers[id]
+    
+    def encode(self, items):
+        """
+        Encodes the given identifiers into an array of ids.
+        
+        :param items: the identifiers
+        :type items: iterable
+        
+        :return: the array of ids
+        """
+        return array.array('q', [self.intern(item) for item in items])
+    
+    def decode(self, ids):
+        """
+        Decodes the given ids into a tuple of identifiers.
+        
+        :param ids: the ids
+        :type ids: iterable
+        
+        :return: the tuple of identifiers
+        """
+        identifiers = self.identifiers
+        return tuple(identifiers[id] for id in ids)
+    
+    def _getstate(self, protocol):
+        """
+        Builds the compact state, i.e. the identifiers that follow the 
+        reserved keywords.
+        """
+        return (tuple(self.identifiers[len(Reserved.Code):]), )
+    
+    def _setstate(self, state):
+        """
+        Restores the identifier table from its compact state.
+        """
+        identifiers, = state
+        self.__init__()
+        for identifier in identifiers:
+            self.intern(identifier)
+    
+    def _freeze(self):
+        """
+        Replaces the containers with read-only ones.
+        """
+        object.__setattr__(self, 'identifiers', tuple(self.identifiers))
+        object.__setattr__(self, 'identifier_id_dict', 
+                builtintypes.MappingProxyType(dict(self.identifier_id_dict)))
+    
+    def _thaw(self):
+        """
+        Replaces the read-only containers with mutable ones.
+        """
+        self.identifiers = list(self.identifiers)
+        self.identifier_id_dict = dict(self.identifier_id_dict)
 
 
-class SymbolTable(object):
+class SymbolTable(Freezable):
     """
     A symbol table that supports AML types.
     """
@@ -346,7 +992,7 @@ class SymbolTable(object):
             raise ValueError("identifier cannot be empty")
         if type is None:
             raise ValueError("type cannot be None")
-        if type not in Symbol.Type:
+        if not isinstance(type, Symbol.Type):
             raise ValueError("type " + str(type) + " not recognized")
         if type == Symbol.Type.FILTER:
             raise ValueError("filter cannot be declared (only defined)")
@@ -358,6 +1004,7 @@ class SymbolTable(object):
         # Checks if the identifier already exists
         if identifier in self.identifier_symboltype_dict:
             return False
+        self._assert_mutable()
             
         # Stores the type into the symbol table
         self.identifier_symboltype_dict[identifier] = type
@@ -390,18 +1037,45 @@ class SymbolTable(object):
             raise ValueError("object's identifier cannot be empty")
         if obj.symboltype is None:
             raise ValueError("object's type cannot be None")
-        if obj.symboltype not in Symbol.Type:
+        if not isinstance(obj.symboltype, Symbol.Type):
             raise ValueError("object's type not recognized")
         
         # Checks if the identifier already exists
         if obj.identifier in self.identifier_symboltype_dict:
             return False
+        self._assert_mutable()
         # Stores the type into the symbol table
         self.identifier_symboltype_dict[obj.identifier] = obj.symboltype
         # Stores the object into the symbol table
         self.identifier_object_dict[obj.identifier] = copy.deepcopy(obj)
         return True
 
+    def hashcons(self, hashconstable):
+        """
+        Replaces the filters and the lists with their canonical instances.
+        
+        :param self: the reference to the instance
+        :type self: model.types.SymbolTable
+        
+        :param hashconstable: the hash-consing table
+        :type hashconstable: model.types.HashConsTable
+        """
+        self._assert_mutable()
+        for identifier, obj in self.identifier_object_dict.items():
+            if obj.symboltype in (Symbol.Type.FILTER, Symbol.Type.LIST):
+                self.identifier_object_dict[identifier] = hashconstable.intern(obj)
+
+    def renew(self):
+        """
+        Builds an empty symbol table of the same kind and scope of the table.
+        
+        :param self: the reference to the instance
+        :type self: model.types.SymbolTable
+        
+        :return: the empty symbol table
+        """
+        return self.__class__(self.scope)
+
     def clear(self):
         """
         Clears the symbol table.
@@ -409,15 +1083,419 @@ class SymbolTable(object):
         :param self: the reference to the instance
         :type self: model.types.Symbol.Type
         """
+        self._assert_mutable()
         self.identifier_symboltype_dict.clear()
         self.identifier_object_dict.clear()
 
+    def _getstate(self, protocol):
+        """
+        Builds the compact state, i.e. the scope and the tuple of the symbols. 
+        The types are got back from the symbols.
+        """
+        return (self.scope, tuple(self.identifier_object_dict.values()))
+
+    def _setstate(self, state):
+        """
+        Restores the symbol table from its compact state.
+        """
+        self.scope, objects = state
+        self.identifier_symboltype_dict = {obj.identifier: obj.symboltype for obj in objects}
+        self.identifier_object_dict = {obj.identifier: obj for obj in objects}
+
+    def _freeze(self):
+        """
+        Freezes the symbols and replaces the dictionaries with read-only views.
+        """
+        for obj in self.identifier_object_dict.values():
+            obj.freeze()
+        object.__setattr__(self, 'identifier_symboltype_dict', 
+                builtintypes.MappingProxyType(dict(self.identifier_symboltype_dict)))
+        object.__setattr__(self, 'identifier_object_dict', 
+                builtintypes.MappingProxyType(dict(self.identifier_object_dict)))
+
+    def _thaw(self):
+        """
+        Replaces the read-only views with mutable dictionaries of mutable symbols.
+        """
+        self.identifier_symboltype_dict = dict(self.identifier_symboltype_dict)
+        self.identifier_object_dict = {identifier: obj.thaw() 
+                for identifier, obj in self.identifier_object_dict.items()}
+
+
+class ArraySymbolTable(SymbolTable):
+    """
+    A symbol table that stores the symbols as a struct of arrays. It provides 
+    the same interface of SymbolTable, but it does not keep a Python object 
+    per symbol: each symbol owns a slot in a name index and a few entries in 
+    compact typed arrays, while the values are packed by kind. It fits the 
+    scopes holding a huge number of symbols.
+    
+    The items of the filters and of the lists are stored as dense ids of an 
+    identifier table, which can be shared among the tables of a scenario: 
+    each of them is a run in the items array made by its length followed by 
+    the ids of its items.
+    
+    The objects are materialized on reading, so modifying an object got from 
+    the table does not modify the table.
+    """
+    
+    @enum.unique
+    class Kind(enum.IntEnum):
+        """
+        The kinds of the packed values.
+        """
+        NONE = 0
+        INTEGER = 1
+        REAL = 2
+        OBJECT = 3
+        ITEMS = 4
+    
+    # The codes of the symbol types and of the variable types
+    symboltypes = tuple(Symbol.Type)
+    variabletypes = tuple(Variable.Type)
+    
+    def __init__(self, scope, identifiertable=None):
+        """
+        Initializes the ArraySymbolTable object.
+        
+        :param self: the reference to the instance
+        :type self: model.types.ArraySymbolTable
+        
+        :param scope: the scope scope of the symbol table
+        :type scope: int
+        
+        :param identifiertable: the table of the ids of the items (a new one if None)
+        :type identifiertable: model.types.IdentifierTable
+        
+        :param identifier_slot_dict: the dictionary that binds an identifier with a slot
+        :type identifier_slot_dict: dict
+        
+        :param symboltypecodes: the code of the symbol type, per slot
+        :type symboltypecodes: array.array
+        
+        :param variabletypecodes: the code of the variable type, per slot (-1 if not a variable)
+        :type variabletypecodes: array.array
+        
+        :param kinds: the kind of the packed value, per slot
+        :type kinds: array.array
+        
+        :param offsets: the offset of the value inside the store of its kind, per slot
+        :type offsets: array.array
+        """
+        self.scope = scope
+        self.identifier_slot_dict = {}
+        self.symboltypecodes = array.array('b')
+        self.variabletypecodes = array.array('b')
+        self.kinds = array.array('b')
+        self.offsets = array.array('q')
+        # The packed values
+        self.integers = array.array('q')
+        self.reals = array.array('d')
+        self.items = array.array('q')
+        self.objects = []
+        self.identifiertable = IdentifierTable() if identifiertable is None else identifiertable
+    
+    @classmethod
+    def pack(cls, symboltable, identifiertable=None):
+        """
+        Builds an array symbol table holding the symbols of the given table.
+        
+        :param symboltable: the symbol table
+        :type symboltable: model.types.SymbolTable
+        
+        :param identifiertable: the table of the ids of the items (a new one if None)
+        :type identifiertable: model.types.IdentifierTable
+        
+        :return: the array symbol table
+        """
+        packed = cls(symboltable.scope, identifiertable)
+        for obj in symboltable.identifier_object_dict.values():
+            packed.define(obj)
+        return packed
+    
+    def unpack(self):
+        """
+        Builds a dictionary based symbol table holding the symbols of the table.
+        
+        :param self: the reference to the instance
+        :type self: model.types.ArraySymbolTable
+        
+        :return: the symbol table
+        """
+        symboltable = SymbolTable(self.scope)
+        for obj in self.identifier_object_dict.values():
+            symboltable.define(obj)
+        return symboltable
+    
+    def __len__(self):
+        return len(self.identifier_slot_dict)
+    
+    @property
+    def identifier_symboltype_dict(self):
+        """
+        The dictionary that binds an identifier with a type (built on reading).
+        """
+        return {identifier: self.symboltypes[self.symboltypecodes[slot]]
+                for identifier, slot in self.identifier_slot_dict.items()}
+    
+    @property
+    def identifier_object_dict(self):
+        """
+        The dictionary that binds an identifier with an object (built on reading).
+        """
+        return {identifier: self._object(identifier, slot)
+                for identifier, slot in self.identifier_slot_dict.items()}
+    
+    def empty(self):
+        """
+        Checks if the symbol table is empty.
+        """
+        return not self.identifier_slot_dict
+    
+    def exist(self, identifier):
+        """
+        Checks if the given identifier exists.
+        """
+        return identifier in self.identifier_slot_dict
+    
+    def type(self, identifier):
+        """
+        Gets the type of the given identifier, if it exists.
+        """
+        slot = self.identifier_slot_dict.get(identifier, None)
+        if slot is None:
+            return None
+        return self.symboltypes[self.symboltypecodes[slot]]
+    
+    def object(self, identifier):
+        """
+        Materializes the object having the given identifier, if it exists.
+        """
+        slot = self.identifier_slot_dict.get(identifier, None)
+        if slot is None:
+            return None
+        return self._object(identifier, slot)
+    
+    def declare(self, identifier, type):
+        """
+        Declares the given identifier having the given type.
+        """
+        # Checks the arguments and builds the empty object through the base class
+        symboltable = SymbolTable(self.scope)
+        symboltable.declare(identifier, type)
+        if identifier in self.identifier_slot_dict:
+            return False
+        self._assert_mutable()
+        self._store(symboltable.object(identifier))
+        return True
+    
+    def define(self, obj):
+        """
+        Defines the given obj.
+        """
+        if obj.identifier is None:
+            raise ValueError("object's identifier cannot be None")
+        if not obj.identifier: 
+            raise ValueError("object's identifier cannot be empty")
+        if obj.symboltype is None:
+            raise ValueError("object's type cannot be None")
+        if not isinstance(obj.symboltype, Symbol.Type):
+            raise ValueError("object's type not recognized")
+        if obj.identifier in self.identifier_slot_dict:
+            return False
+        self._assert_mutable()
+        self._store(obj)
+        return True
+    
+    def hashcons(self, hashconstable):
+        """
+        Replaces the items of the filters and of the lists with the items of 
+        their canonical instances. The filters and the lists having the same 
+        items share the same run of ids.
+        """
+        self._assert_mutable()
+        items_offset_dict = {}
+        for identifier, slot in self.identifier_slot_dict.items():
+            kind = self.kinds[slot]
+            if kind == ArraySymbolTable.Kind.ITEMS:
+                items = hashconstable.intern(self._object(identifier, slot)).items
+                self.offsets[slot] = items_offset_dict.setdefault(items, self.offsets[slot])
+            elif kind == ArraySymbolTable.Kind.OBJECT:
+                obj = self._object(identifier, slot)
+                if obj.symboltype in (Symbol.Type.FILTER, Symbol.Type.LIST):
+                    self.objects[self.offsets[slot]] = hashconstable.intern(obj).items
+    
+    def renew(self):
+        """
+        Builds an empty array symbol table of the same scope, sharing the 
+        identifier table of the table.
+        """
+        identifiertable = self.identifiertable
+        if identifiertable.frozen():
+            identifiertable = identifiertable.thaw()
+        return ArraySymbolTable(self.scope, identifiertable)
+    
+    def clear(self):
+        """
+        Clears the symbol table.
+        """
+        self._assert_mutable()
+        self.identifier_slot_dict.clear()
+        del self.symboltypecodes[:]
+        del self.variabletypecodes[:]
+        del self.kinds[:]
+        del self.offsets[:]
+        del self.integers[:]
+        del self.reals[:]
+        del self.items[:]
+        del self.objects[:]
+    
+    # The attributes holding typed arrays
+    _arrays = ('symboltypecodes', 'variabletypecodes', 'kinds', 'offsets', 'integers', 'reals', 'items')
+
+    # The typecodes of the typed arrays
+    _typecodes = ('b', 'b', 'b', 'q', 'q', 'd', 'q')
+
+    def _getstate(self, protocol):
+        """
+        Builds the compact state. The typed arrays are stored as raw buffers, 
+        which are handed out-of-band with the pickle protocol 5.
+        """
+        if protocol >= 5:
+            buffers = tuple(pickle.PickleBuffer(getattr(self, name)) for name in ArraySymbolTable._arrays)
+        else:
+            buffers = tuple(bytes(getattr(self, name)) for name in ArraySymbolTable._arrays)
+        return (self.scope, tuple(self.identifier_slot_dict), buffers, tuple(self.objects), 
+                self.identifiertable, self.frozen())
+
+    def _setstate(self, state):
+        """
+        Restores the array symbol table from its compact state. A frozen 
+        table keeps read-only views on the given buffers instead of copying 
+        them, so that a table unpickled from shared memory stays there.
+        """
+        self.scope, identifiers, buffers, objects, self.identifiertable, frozen = state
+        self.identifier_slot_dict = {identifier: slot for slot, identifier in enumerate(identifiers)}
+        for name, typecode, buffer in zip(ArraySymbolTable._arrays, ArraySymbolTable._typecodes, buffers):
+            buffer = memoryview(buffer).cast('B')
+            if frozen:
+                values = buffer.toreadonly().cast(typecode)
+            else:
+                values = array.array(typecode)
+                values.frombytes(buffer)
+            self.__dict__[name] = values
+        self.objects = list(objects)
+
+    def _freeze(self):
+        """
+        Replaces the typed arrays with read-only views on a copy of their 
+        buffers, and the other containers with read-only ones. The identifier 
+        table is frozen too, hence it cannot intern new identifiers anymore.
+        """
+        for name in ArraySymbolTable._arrays:
+            values = getattr(self, name)
+            if not isinstance(values, memoryview):
+                values = memoryview(values.tobytes()).cast(values.typecode)
+            object.__setattr__(self, name, values)
+        for obj in self.objects:
+            if isinstance(obj, NumericItems):
+                obj.freeze()
+        object.__setattr__(self, 'objects', tuple(self.objects))
+        object.__setattr__(self, 'identifier_slot_dict', 
+                builtintypes.MappingProxyType(dict(self.identifier_slot_dict)))
+        self.identifiertable.freeze()
+
+    def _thaw(self):
+        """
+        Replaces the read-only containers with mutable ones.
+        """
+        for name in ArraySymbolTable._arrays:
+            values = getattr(self, name)
+            setattr(self, name, array.array(values.format, values.tolist()))
+        self.objects = list(self.objects)
+        self.identifier_slot_dict = dict(self.identifier_slot_dict)
+        if self.identifiertable.frozen():
+            self.identifiertable = self.identifiertable.thaw()
+
+    def _store(self, obj):
+        """
+        Stores the given object in a new slot.
+        """
+        symboltype = obj.symboltype
+        variabletypecode = -1
+        kind = ArraySymbolTable.Kind.NONE
+        offset = -1
+        if symboltype == Symbol.Type.VARIABLE:
+            variabletypecode = self.variabletypes.index(obj.variabletype)
+            value = obj.value
+            if value is None:
+                pass
+            elif type(value) is int and -2 ** 63 <= value < 2 ** 63:
+                kind, offset = ArraySymbolTable.Kind.INTEGER, len(self.integers)
+                self.integers.append(value)
+            elif type(value) is float:
+                kind, offset = ArraySymbolTable.Kind.REAL, len(self.reals)
+                self.reals.append(value)
+            else:
+                kind, offset = ArraySymbolTable.Kind.OBJECT, len(self.objects)
+                self.objects.append(value)
+        elif symboltype == Symbol.Type.RESERVED:
+            kind, offset = ArraySymbolTable.Kind.OBJECT, len(self.objects)
+            self.objects.append(obj.reserved)
+        elif symboltype in (Symbol.Type.FILTER, Symbol.Type.LIST):
+            items = obj.items
+            if isinstance(items, NumericItems):
+                kind, offset = ArraySymbolTable.Kind.OBJECT, len(self.objects)
+                self.objects.append(items)
+            else:
+                kind, offset = ArraySymbolTable.Kind.ITEMS, len(self.items)
+                self.items.append(len(items))
+                self.items.extend(self.identifiertable.encode(items))
+        self.identifier_slot_dict[obj.identifier] = len(self.symboltypecodes)
+        self.symboltypecodes.append(self.symboltypes.index(symboltype))
+        self.variabletypecodes.append(variabletypecode)
+        self.kinds.append(kind)
+        self.offsets.append(offset)
+    
+    def _object(self, identifier, slot):
+        """
+        Materializes the object stored in the given slot.
+        """
+        symboltype = self.symboltypes[self.symboltypecodes[slot]]
+        kind = self.kinds[slot]
+        offset = self.offsets[slot]
+        if kind == ArraySymbolTable.Kind.INTEGER:
+            value = self.integers[offset]
+        elif kind == ArraySymbolTable.Kind.REAL:
+            value = self.reals[offset]
+        elif kind == ArraySymbolTable.Kind.OBJECT:
+            value = self.objects[offset]
+        elif kind == ArraySymbolTable.Kind.ITEMS:
+            value = self.identifiertable.decode(self.items[offset + 1:offset + 1 + self.items[offset]])
+        else:
+            value = None
+        if symboltype == Symbol.Type.VARIABLE:
+            return Variable(identifier, self.variabletypes[self.variabletypecodes[slot]], value)
+        if symboltype == Symbol.Type.PACKET:
+            return Packet(identifier)
+        if symboltype == Symbol.Type.FILTER:
+            return Filter(identifier, value)
+        if symboltype == Symbol.Type.LIST:
+            return List(identifier, value)
+        return Reserved(value)
+
 
 class SymbolHandler(object):
     """
     A multi-scope symbols handler. It provides an high level mechanism to 
-    handle the declaration and the definition of objects over a number of 
+    handle the declaration and the definition of objects over a chain of 
     nested scopes.
+    
+    The handler keeps a flattened resolution index that binds each identifier 
+    to the chain of its definitions, sorted from the outermost to the 
+    innermost scope. The index is updated on definition, clear, push and pop, 
+    so that resolving an identifier takes a single hash lookup and always 
+    honours the innermost definition.
     """
     
     
@@ -429,20 +1507,64 @@ class SymbolHandler(object):
         :param self: the reference to the instance
         :type self: model.types.SymbolHandler
 
-        :param scopes: the number of scopes
+        :param scopes: the initial number of scopes
         :type scopes: int        
         """
         if scopes < 0:
             raise ValueError("scopes cannot be negative")
         self.scope_symboltable_dict = {}
+        self.identifier_chain_dict = {}
         for scope in range(0, scopes):
-            self.scope_symboltable_dict[scope] = SymbolTable(scope)
+            self.push()
+    
+    def depth(self):
+        """
+        Gets the number of nested scopes.
+        
+        :param self: the reference to the instance
+        :type self: model.types.SymbolHandler
+        
+        :return: the number of scopes
+        """
+        return len(self.scope_symboltable_dict)
+    
+    def push(self):
+        """
+        Opens a new innermost scope.
+        
+        :param self: the reference to the instance
+        :type self: model.types.SymbolHandler
+        
+        :return: the new scope
+        """
+        scope = len(self.scope_symboltable_dict)
+        self.scope_symboltable_dict[scope] = SymbolTable(scope)
+        return scope
+    
+    def pop(self):
+        """
+        Closes the innermost scope and removes its symbols from the 
+        resolution index.
+        
+        :param self: the reference to the instance
+        :type self: model.types.SymbolHandler
+        
+        :return: the symbol table of the closed scope
+        """
+        if not self.scope_symboltable_dict:
+            raise ValueError("no scope to pop")
+        scope = len(self.scope_symboltable_dict) - 1
+        symboltable = self.scope_symboltable_dict[scope]
+        self._unindex(symboltable)
+        del self.scope_symboltable_dict[scope]
+        return symboltable
     
     def dump(self):
         """
         Dumps all the symbol tables
         """
         self.scope_symboltable_dict.clear()
+        self.identifier_chain_dict.clear()
 
     def declare(self, scope, identifier, type):
         """
@@ -468,7 +1590,11 @@ class SymbolHandler(object):
         if self.exist(scope, identifier):
             return False
         # Declares the identifier
-        return self.scope_symboltable_dict[scope].declare(identifier, type)
+        symboltable = self.scope_symboltable_dict[scope]
+        if not symboltable.declare(identifier, type):
+            return False
+        self._index(scope, symboltable.object(identifier))
+        return True
         
     def define(self, scope, obj):
         """
@@ -491,7 +1617,11 @@ class SymbolHandler(object):
         if scope not in self.scope_symboltable_dict:
             return False
         # Defines the object into the given scope
-        return self.scope_symboltable_dict[scope].define(obj)
+        symboltable = self.scope_symboltable_dict[scope]
+        if not symboltable.define(obj):
+            return False
+        self._index(scope, symboltable.object(obj.identifier))
+        return True
     
     def clear(self, scope):
         """
@@ -507,7 +1637,9 @@ class SymbolHandler(object):
         """
         if scope not in self.scope_symboltable_dict:
             return False
-        self.scope_symboltable_dict[scope].clear()
+        symboltable = self.scope_symboltable_dict[scope]
+        self._unindex(symboltable)
+        symboltable.clear()
         return True
    
     def exist(self, outer, identifier):
@@ -525,14 +1657,13 @@ class SymbolHandler(object):
         """
         if outer not in self.scope_symboltable_dict:
             raise ValueError("out of scope")
-        for scope in range(0, outer + 1):
-            if self.scope_symboltable_dict[scope].exist(identifier):
-                return True
-        return False
+        chain = self.identifier_chain_dict.get(identifier, None)
+        return chain is not None and chain[0][0] <= outer
 
     def object(self, identifier):
         """
-        Gets the object having the given identifier, if it exists.
+        Gets the object having the given identifier, if it exists. The 
+        innermost definition shadows the outer ones.
         
         :param self: the reference to the instance
         :type self: model.types.SymbolTable
@@ -542,9 +1673,31 @@ class SymbolHandler(object):
         
         :return: the object, None otherwise
         """
-        for symboltable in list(self.scope_symboltable_dict.values()):
-            obj = symboltable.object(identifier)
-            if obj is not None:
-                return obj
-        return None
-
+        chain = self.identifier_chain_dict.get(identifier, None)
+        if chain is None:
+            return None
+        return chain[-1][1]
+    
+    def _index(self, scope, obj):
+        """
+        Adds the given object to the resolution index, keeping the chain 
+        sorted from the outermost to the innermost scope.
+        """
+        chain = self.identifier_chain_dict.setdefault(obj.identifier, [])
+        position = len(chain)
+        while position > 0 and chain[position - 1][0] > scope:
+            position -= 1
+        chain.insert(position, (scope, obj))
+    
+    def _unindex(self, symboltable):
+        """
+        Removes the symbols of the given symbol table from the resolution index.
+        """
+        scope = symboltable.scope
+        for identifier in symboltable.identifier_object_dict:
+            chain = self.identifier_chain_dict.get(identifier, None)
+            if chain is None:
+                continue
+            chain[:] = [entry for entry in chain if entry[0] != scope]
+            if not chain:
+                del self.identifier_chain_dict[identifier]
@@ -0,0 +1,207 @@
+# -----------------------------------------------------------------------------
+# visitor.py
+#
+# Author: Francesco Racciatti (racciatti.francesco@gmail.com)
+#
+# This module contains the iterative visitor for the AML model.
+# -----------------------------------------------------------------------------
+
+import enum
+
+import model.types as types
+import model.statements as statements
+
+
+@enum.unique
+class Event(enum.Enum):
+    """
+    The events raised while walking the model.
+    """
+    ENTER = 'enter'
+    LEAVE = 'leave'
+
+
+# The accessors to the children of the nodes, by base class
+_accessors = (
+    (statements.Codeblock, lambda node: (node.symboltable, node.codeblocktable)),
+    (statements.CodeblockTable, lambda node: node.codeblocks),
+    (types.SymbolTable, lambda node: node.identifier_object_dict.values()),
+)
+
+# The cache mapping the classes of the nodes with the accessors to their children
+_class_accessor_dict = {}
+
+
+def children(node):
+    """
+    Provides the children of a node of the model. The accessor is looked up
+    once per class.
+
+    :param node: the node
+    :type node: object
+
+    :return: the iterable of the children
+    """
+    nodeclass = node.__class__
+    accessor = _class_accessor_dict.get(nodeclass, None)
+    if accessor is None:
+        accessor = _leaf
+        for baseclass, candidate in _accessors:
+            if issubclass(nodeclass, baseclass):
+                accessor = candidate
+                break
+        _class_accessor_dict[nodeclass] = accessor
+    return accessor(node)
+
+
+def _leaf(node):
+    """
+    Provides the children of a leaf, i.e. none.
+    """
+    return ()
+
+
+def walk(root):
+    """
+    Walks the model in depth-first order without recursion. Each node raises
+    an ENTER event before its children and a LEAVE event after them.
+
+    :param root: the root of the walk (e.g. the scenario)
+    :type root: object
+
+    :return: the generator of the (event, node) tuples
+    """
+    pending = [(Event.ENTER, root)]
+    while pending:
+        event, node = pending.pop()
+        yield event, node
+        if event is Event.ENTER:
+            pending.append((Event.LEAVE, node))
+            pending.extend((Event.ENTER, child) for child in reversed(tuple(children(node))))
+
+
+def nodes(root, nodeclass=object):
+    """
+    Provides the nodes of the model in depth-first pre-order without recursion.
+
+    :param root: the root of the walk (e.g. the scenario)
+    :type root: object
+
+    :param nodeclass: the class of the nodes to provide
+    :type nodeclass: type
+
+    :return: the generator of the nodes
+    """
+    pending = [root]
+    while pending:
+        node = pending.pop()
+        if isinstance(node, nodeclass):
+            yield node
+        pending.extend(reversed(tuple(children(node))))
+
+
+class Visitor(object):
+    """
+    Base class for visitors over the AML model.
+
+    The subclasses handle the nodes by defining the methods enter_<class> and
+    leave_<class>, where <class> is the lowercase name of the node's class or
+    of one of its base classes (e.g. enter_codeblock handles every codeblock,
+    unless a more specific enter_periodic is defined). The handlers are
+    looked up once per class of node. An enter handler returning PRUNE skips
+    the children of the node and its leave handler.
+
+    While visiting, the attribute path holds the codeblocks enclosing the
+    current node, from the outermost to the innermost.
+    """
+
+    # The value returned by an enter handler to skip the node's children
+    PRUNE = object()
+
+    # The cache mapping (visitor class, node class, event) with the handlers
+    _handlers = {}
+
+    def visit(self, root):
+        """
+        Visits the model without recursion.
+
+        :param root: the root of the visit (e.g. the scenario)
+        :type root: object
+
+        :return: the visitor itself
+        """
+        self.path = []
+        pending = [(Event.ENTER, root)]
+        while pending:
+            event, node = pending.pop()
+            handler = self.handler(node.__class__, event)
+            if event is Event.ENTER:
+                if handler is not None and handler(self, node) is Visitor.PRUNE:
+                    continue
+                if isinstance(node, statements.Codeblock):
+                    self.path.append(node)
+                pending.append((Event.LEAVE, node))
+                pending.extend((Event.ENTER, child) for child in reversed(tuple(children(node))))
+            else:
+                if isinstance(node, statements.Codeblock):
+                    self.path.pop()
+                if handler is not None:
+                    handler(self, node)
+        return self
+
+    @classmethod
+    def handler(cls, nodeclass, event):
+        """
+        Provides the handler of the given event for the given class of nodes.
+
+        :param nodeclass: the class of the node
+        :type nodeclass: type
+
+        :param event: the event
+        :type event: model.visitor.Event
+
+        :return: the handler, or None if the visitor does not handle the event
+        """
+        key = (cls, nodeclass, event)
+        try:
+            return cls._handlers[key]
+        except KeyError:
+            pass
+        handler = None
+        for baseclass in nodeclass.__mro__:
+            handler = getattr(cls, event.value + '_' + baseclass.__name__.lower(), None)
+            if handler is not None:
+                break
+        cls._handlers[key] = handler
+        return handler
+
+    def resolve(self, identifier):
+        """
+        Resolves an identifier through the symbol tables of the codeblocks
+        enclosing the current node, from the innermost to the outermost.
+
+        :param identifier: the identifier
+        :type identifier: str
+
+        :return: the object bound to the identifier, or None if it is unbound
+        """
+        for codeblock in reversed(self.path):
+            if codeblock.symboltable.exist(identifier):
+                return codeblock.symboltable.object(identifier)
+        return None
+
+    def owner(self, identifier):
+        """
+        Resolves an identifier like resolve, giving back the symbol table 
+        that binds it too.
+
+        :param identifier: the identifier
+        :type identifier: str
+
+        :return: the tuple (symbol table, object), (None, None) if it is unbound
+        """
+        for codeblock in reversed(self.path):
+            symboltable = codeblock.symboltable
+            if symboltable.exist(identifier):
+                return symboltable, symboltable.object(identifier)
+        return None, None
@@ -0,0 +1,145 @@
+# -----------------------------------------------------------------------------
+# elimination.py
+#
+# Author: Francesco Racciatti (racciatti.francesco@gmail.com)
+#
+# This module contains the dead symbol and dead block elimination pass over
+# the AML scenarios.
+# -----------------------------------------------------------------------------
+
+import collections
+
+import model.types as types
+import model.statements as statements
+import model.visitor as visitor
+
+
+# The outcome of the elimination: the numbers of the symbols and of the
+# codeblocks dropped
+Elimination = collections.namedtuple('Elimination', ['symbols', 'codeblocks'])
+
+
+def eliminate(scenario):
+    """
+    Drops the codeblocks with no effects and the symbols that nothing refers.
+    The simple attacks holding no primitives are dropped first, then the
+    compounds left with no simple attacks; then the symbols are kept only if
+    they are reachable from the attributes of the remaining codeblocks and
+    primitives, through the filters and the lists.
+
+    :param scenario: the scenario, rewritten in place
+    :type scenario: model.statements.Scenario
+
+    :return: the numbers of the symbols and of the codeblocks dropped
+    """
+    scenario._assert_mutable()
+    codeblocks = _BlockEliminator().visit(scenario).dropped
+    symbols = _SymbolEliminator().visit(scenario).dropped
+    return Elimination(symbols, codeblocks)
+
+
+class _BlockEliminator(visitor.Visitor):
+    """
+    Drops the codeblocks with no effects, from the innermost ones.
+    """
+
+    def __init__(self):
+        """
+        Initializes the _BlockEliminator object.
+        """
+        self.dropped = 0
+
+    def enter_symboltable(self, symboltable):
+        return visitor.Visitor.PRUNE
+
+    def enter_primitive(self, primitive):
+        return visitor.Visitor.PRUNE
+
+    def leave_codeblocktable(self, codeblocktable):
+        # The nested codeblocks have been visited already
+        codeblocks = codeblocktable.codeblocks
+        kept = [item for item in codeblocks
+                if not isinstance(item, statements.Codeblock) or item.codeblocktable.codeblocks]
+        if len(kept) != len(codeblocks):
+            self.dropped += len(codeblocks) - len(kept)
+            codeblocks[:] = kept
+
+
+class _SymbolEliminator(visitor.Visitor):
+    """
+    Marks the symbols reachable from the codeblocks and from the primitives,
+    then drops the other ones once their codeblock is left.
+    """
+
+    def __init__(self):
+        """
+        Initializes the _SymbolEliminator object.
+        """
+        # The (id of the symbol table, identifier) pairs of the marked symbols
+        self.marked = set()
+        self.dropped = 0
+
+    def mark(self, identifier, depth=None):
+        """
+        Marks the symbol bound to the identifier, resolving it from the
+        codeblock at the given depth of the path outwards, and the symbols
+        its items refer.
+        """
+        pending = [(identifier, len(self.path) - 1 if depth is None else depth)]
+        while pending:
+            identifier, depth = pending.pop()
+            while depth >= 0:
+                symboltable = self.path[depth].symboltable
+                if symboltable.exist(identifier):
+                    break
+                depth -= 1
+            if depth < 0:
+                continue
+            key = (id(symboltable), identifier)
+            if key in self.marked:
+                continue
+            self.marked.add(key)
+            if symboltable.type(identifier) in (types.Symbol.Type.FILTER, types.Symbol.Type.LIST):
+                # The items are resolved where the filter or the list is defined
+                for item in symboltable.object(identifier).items:
+                    pending.append((item, depth))
+
+    def attributes(self, node):
+        """
+        Marks the symbols referred by the public attributes of a node.
+        """
+        for attribute, value in node.__dict__.items():
+            if attribute.startswith('_'):
+                continue
+            if isinstance(value, str):
+                self.mark(value)
+            elif isinstance(value, (list, tuple)):
+                for item in value:
+                    if isinstance(item, str):
+                        self.mark(item)
+
+    def enter_symboltable(self, symboltable):
+        return visitor.Visitor.PRUNE
+
+    def enter_codeblock(self, codeblock):
+        # The attributes of the codeblock are resolved in the enclosing scope
+        self.attributes(codeblock)
+
+    def enter_primitive(self, primitive):
+        self.attributes(primitive)
+        return visitor.Visitor.PRUNE
+
+    def leave_codeblocktable(self, codeblocktable):
+        # The codeblock owning the table is still in the path, and nothing
+        # outside it can refer its symbols
+        codeblock = self.path[-1]
+        symboltable = codeblock.symboltable
+        objects = symboltable.identifier_object_dict
+        kept = [obj for identifier, obj in objects.items() if (id(symboltable), identifier) in self.marked]
+        if len(kept) == len(objects):
+            return
+        self.dropped += len(objects) - len(kept)
+        table = symboltable.renew()
+        for obj in kept:
+            table.define(obj)
+        codeblock.symboltable = table
@@ -0,0 +1,159 @@
+# -----------------------------------------------------------------------------
+# folding.py
+#
+# Author: Francesco Racciatti (racciatti.francesco@gmail.com)
+#
+# This module contains the constant folding pass over the AML scenarios.
+# -----------------------------------------------------------------------------
+
+import model.types as types
+import model.statements as statements
+import model.visitor as visitor
+import model.evaluation as evaluation
+
+
+# The attributes of the primitives assigning a variable
+_destination_attributes = ('destination',)
+
+
+def fold(scenario):
+    """
+    Rewrites the expressions of the scenario into their smallest form: the
+    constant variables, i.e. the variables holding a value that no primitive
+    assigns, are replaced by their literals, then the literal sub-expressions
+    are evaluated, e.g. x = 3 * 1000 + 5 becomes x = 3005. The literals
+    introduced are defined in the codeblocks owning the expressions. The
+    operations that cannot be evaluated exactly are left as they are, see
+    model.evaluation.
+
+    :param scenario: the scenario, rewritten in place
+    :type scenario: model.statements.Scenario
+
+    :return: the number of the expressions rewritten
+    """
+    scenario._assert_mutable()
+    return _Folder(assignments(scenario)).visit(scenario).rewritten
+
+
+def assignments(scenario):
+    """
+    Collects the variables assigned by the primitives of the scenario; the
+    other variables holding a value are constant.
+
+    :param scenario: the scenario
+    :type scenario: model.statements.Scenario
+
+    :return: the set of the (id of the symbol table, identifier) pairs of the
+             variables assigned
+    """
+    return _Assignments().visit(scenario).assigned
+
+
+class _Assignments(visitor.Visitor):
+    """
+    Collects the variables assigned by the primitives.
+    """
+
+    def __init__(self):
+        """
+        Initializes the _Assignments object.
+        """
+        # The (id of the symbol table, identifier) pairs of the variables
+        self.assigned = set()
+
+    def enter_symboltable(self, symboltable):
+        return visitor.Visitor.PRUNE
+
+    def enter_primitive(self, primitive):
+        for attribute in _destination_attributes:
+            identifier = primitive.__dict__.get(attribute, None)
+            if identifier is None:
+                continue
+            symboltable, obj = self.owner(identifier)
+            if symboltable is not None:
+                self.assigned.add((id(symboltable), identifier))
+        return visitor.Visitor.PRUNE
+
+
+class _Folder(visitor.Visitor):
+    """
+    Rewrites the expressions while visiting the scenario.
+    """
+
+    def __init__(self, assigned):
+        """
+        Initializes the _Folder object.
+
+        :param assigned: the variables assigned by the primitives
+        :type assigned: set
+        """
+        self.assigned = assigned
+        self.rewritten = 0
+
+    def literal(self, identifier):
+        """
+        Gets the value of a literal or of a constant variable.
+
+        :return: the variable holding the value, None if the value is unknown
+        """
+        symboltable, obj = self.owner(identifier)
+        if obj is None or obj.symboltype != types.Symbol.Type.VARIABLE or obj.value is None:
+            return None
+        if not types.Symbol.mangled(identifier) and (id(symboltable), identifier) in self.assigned:
+            return None
+        return obj
+
+    def define(self, variable):
+        """
+        Defines the literal holding the value of the variable, unless it is
+        already visible.
+
+        :return: the identifier of the literal, None if it is bound to another
+                 value
+        """
+        value = variable.value
+        identifier = types.Variable.autoidentifier(value)
+        symboltable, obj = self.owner(identifier)
+        if obj is None:
+            self.path[-1].symboltable.define(types.Variable(identifier, variable.variabletype, value))
+            return identifier
+        if (obj.symboltype == types.Symbol.Type.VARIABLE and obj.variabletype == variable.variabletype
+                and type(obj.value) is type(value) and obj.value == value):
+            return identifier
+        return None
+
+    def rewrite(self, expression):
+        """
+        Rewrites an expression.
+
+        :return: the identifiers of the rewritten expression
+        """
+        items = []
+        for item in evaluation.fold(expression, self.literal):
+            if not isinstance(item, types.Variable):
+                if types.Symbol.mangled(item) or self.literal(item) is None:
+                    items.append(item)
+                    continue
+                item = self.literal(item)
+            identifier = self.define(item)
+            if identifier is None:
+                return list(expression)
+            items.append(identifier)
+        return items
+
+    def enter_symboltable(self, symboltable):
+        return visitor.Visitor.PRUNE
+
+    def enter_codeblocktable(self, codeblocktable):
+        codeblocks = codeblocktable.codeblocks
+        for index, item in enumerate(codeblocks):
+            if not isinstance(item, statements.Expression):
+                continue
+            items = self.rewrite(item.expression)
+            if items != list(item.expression):
+                # The expressions may be shared, hence they are replaced
+                codeblocks[index] = statements.Expression(item.destination, items)
+                self.rewritten += 1
+
+    def enter_primitive(self, primitive):
+        return visitor.Visitor.PRUNE
@@ -0,0 +1,85 @@
+# -----------------------------------------------------------------------------
+# horizon.py
+#
+# Author: Francesco Racciatti (racciatti.francesco@gmail.com)
+#
+# This module contains the pruning of the AML scenarios to the horizon of the
+# simulation.
+# -----------------------------------------------------------------------------
+
+import collections
+
+import model.statements as statements
+
+
+# The outcome of the pruning: the numbers of the compounds dropped and of the
+# periodic attacks bounded
+Pruning = collections.namedtuple('Pruning', ['compounds', 'periodics'])
+
+
+def firings(start, period, horizon):
+    """
+    Counts the times a periodic attack takes place within the horizon, i.e.
+    at start, start + period, ... up to the horizon included.
+
+    :param start: the start of the periodic attack, in nanoseconds
+    :type start: int
+
+    :param period: the period, in nanoseconds
+    :type period: int
+
+    :param horizon: the horizon, in nanoseconds
+    :type horizon: int
+
+    :return: the number of the firings, None if the period is zero
+    """
+    if start > horizon:
+        return 0
+    if period == 0:
+        return None
+    return (horizon - start) // period + 1
+
+
+def prune(scenario, horizon):
+    """
+    Prunes the scenario to the horizon of the simulation: the compounds
+    starting after the horizon are dropped and each periodic attack is
+    annotated with the number of the times it takes place, so that it can be
+    scheduled as a bounded loop. The periodic attacks with a zero period are
+    left unbounded.
+
+    :param scenario: the scenario, rewritten in place
+    :type scenario: model.statements.Scenario
+
+    :param horizon: the length of the simulation, in nanoseconds (included)
+    :type horizon: int
+
+    :return: the numbers of the compounds dropped and of the periodic attacks
+             bounded
+
+    :raise ValueError: the horizon is negative, or a time is not resolved
+    """
+    scenario._assert_mutable()
+    if type(horizon) is not int or horizon < 0:
+        raise ValueError("horizon " + str(horizon) + " is not a non-negative integer")
+    compounds = scenario.codeblocktable.codeblocks
+    kept = []
+    bounded = 0
+    for compound in compounds:
+        if compound.nanoseconds is None:
+            raise ValueError("the time of the compound is not resolved")
+        if compound.nanoseconds > horizon:
+            continue
+        kept.append(compound)
+        for codeblock in compound.codeblocktable.codeblocks:
+            if not isinstance(codeblock, statements.Periodic):
+                continue
+            if codeblock.nanoseconds is None:
+                raise ValueError("the period of the periodic attack is not resolved")
+            codeblock.firings = firings(compound.nanoseconds, codeblock.nanoseconds, horizon)
+            if codeblock.firings is not None:
+                bounded += 1
+    dropped = len(compounds) - len(kept)
+    if dropped:
+        compounds[:] = kept
+    return Pruning(dropped, bounded)
@@ -0,0 +1,421 @@
+# -----------------------------------------------------------------------------
+# normalization.py
+#
+# Author: Francesco Racciatti (racciatti.francesco@gmail.com)
+#
+# This module contains the normalization of the filters of the AML scenarios
+# into a simplified disjunctive normal form.
+# -----------------------------------------------------------------------------
+
+import enum
+import collections
+
+import lexer.lexer as lexer
+import model.types as types
+import model.statements as statements
+import model.visitor as visitor
+import optimizer.predicates as predicates
+
+
+@enum.unique
+class Outcome(enum.Enum):
+    """
+    The outcomes of the normalization of a filter.
+    """
+    # The filter matches every packet
+    TRUE = 'true'
+    # The filter matches no packet
+    FALSE = 'false'
+    # The filter depends on the packet
+    FILTER = 'filter'
+
+
+# A comparison of a filter: the subject is the left operand as written (e.g.
+# the field path), the value is the right one; both are identifiers
+Atom = collections.namedtuple('Atom', ['subject', 'operator', 'value'])
+
+# The equality disjunctions on the same subject, merged: the subject matches
+# one of the values
+Member = collections.namedtuple('Member', ['subject', 'values'])
+
+# The normal form of a filter. The clauses are the conjunctions, made by
+# atoms, of the disjunctive normal form; the members are the merged equality
+# disjunctions, which take the place of their single atom clauses.
+Normal = collections.namedtuple('Normal', ['outcome', 'clauses', 'members'])
+
+# The outcome of the normalization of a scenario
+Normalization = collections.namedtuple('Normalization', ['rewritten', 'true', 'false', 'pruned'])
+
+# The largest number of clauses of a normal form; larger filters are left as
+# they are, since the disjunctive normal form may grow exponentially
+limit = 64
+
+_EQUALTO = lexer.BasicOperatorType.EQUALTO.value
+_NOTEQUALTO = lexer.BasicOperatorType.NOTEQUALTO.value
+_LSTHN = lexer.BasicOperatorType.LSTHN.value
+_LSEQTHN = lexer.BasicOperatorType.LSEQTHN.value
+_GRTHN = lexer.BasicOperatorType.GRTHN.value
+_GREQTHN = lexer.BasicOperatorType.GREQTHN.value
+
+# The complementary comparisons
+_complement_dict = {
+    _EQUALTO: _NOTEQUALTO, _NOTEQUALTO: _EQUALTO,
+    _LSTHN: _GREQTHN, _GREQTHN: _LSTHN,
+    _LSEQTHN: _GRTHN, _GRTHN: _LSEQTHN,
+}
+
+# The disjunctive normal forms of the constants
+_true = [frozenset()]
+_false = []
+
+
+def normalize_items(items, resolve):
+    """
+    Normalizes the items of a filter, in reverse polish notation.
+
+    :param items: the identifiers of the filter
+    :type items: tuple
+
+    :param resolve: the function giving the object bound to an identifier
+    :type resolve: function
+
+    :return: the normal form, None if the filter is badly formed or too large
+    """
+    literal = _literals(resolve)
+    stack = []
+    for item in items:
+        obj = resolve(item)
+        reserved = obj.reserved if obj is not None and obj.symboltype == types.Symbol.Type.RESERVED else None
+        if reserved in predicates.comparison_function_dict:
+            if len(stack) < 2 or not isinstance(stack[-1], str) or not isinstance(stack[-2], str):
+                return None
+            value = stack.pop()
+            subject = stack.pop()
+            stack.append(_atom(Atom(subject, reserved, value), literal))
+        elif reserved in predicates.logical_kind_dict:
+            if len(stack) < 2 or isinstance(stack[-1], str) or isinstance(stack[-2], str):
+                return None
+            second = stack.pop()
+            first = stack.pop()
+            if predicates.logical_kind_dict[reserved] is predicates.Kind.AND:
+                clauses = [a | b for a in first for b in second]
+            else:
+                clauses = first + second
+            clauses = [_simplify(clause, literal) for clause in clauses]
+            clauses = _absorb(clause for clause in clauses if clause is not None)
+            if len(clauses) > limit:
+                return None
+            stack.append(clauses)
+        else:
+            stack.append(item)
+    if len(stack) != 1 or isinstance(stack[0], str):
+        return None
+    clauses = stack[0]
+    if not clauses:
+        return Normal(Outcome.FALSE, (), ())
+    if frozenset() in clauses or _complementary(clauses):
+        return Normal(Outcome.TRUE, (), ())
+    return _merge(clauses)
+
+
+def _literals(resolve):
+    """
+    Builds the function giving the value of a literal identifier.
+    """
+    def literal(identifier):
+        return types.Variable.literal(resolve, identifier)
+    return literal
+
+
+def _numeric(variable):
+    """
+    Checks if a literal holds a number.
+    """
+    return variable is not None and type(variable.value) in (int, float)
+
+
+def _atom(atom, literal):
+    """
+    Builds the disjunctive normal form of an atom. The comparisons between
+    numbers are evaluated.
+    """
+    subject, value = literal(atom.subject), literal(atom.value)
+    if _numeric(subject) and _numeric(value):
+        function = predicates.comparison_function_dict[atom.operator]
+        return list(_true) if function(subject.value, value.value) else list(_false)
+    return [frozenset((atom,))]
+
+
+def _simplify(clause, literal):
+    """
+    Simplifies a conjunction: the atoms implied by the other atoms on the
+    same subject are dropped.
+
+    :return: the simplified clause, None if it is unsatisfiable
+    """
+    subject_atoms_dict = collections.defaultdict(list)
+    kept = set()
+    for atom in clause:
+        value = literal(atom.value)
+        if value is None:
+            kept.add(atom)
+        else:
+            subject_atoms_dict[atom.subject].append((atom, value.value))
+    for subject, atoms in subject_atoms_dict.items():
+        values = [value for atom, value in atoms]
+        if all(type(value) in (int, float) for value in values):
+            numeric = True
+        elif all(type(value) is str for value in values):
+            numeric = False
+        else:
+            # Mixed types are not compared
+            kept.update(atom for atom, value in atoms)
+            continue
+        reduced = _reduce(atoms, numeric)
+        if reduced is None:
+            return None
+        kept.update(reduced)
+    return frozenset(kept)
+
+
+def _reduce(atoms, numeric):
+    """
+    Reduces the atoms on the same subject, holding values of the same kind.
+
+    :return: the atoms left, None if they are unsatisfiable
+    """
+    equal = {}
+    different = {}
+    lower = upper = None
+    for atom, value in atoms:
+        operator = atom.operator
+        if operator == _EQUALTO:
+            equal[value] = atom
+        elif operator == _NOTEQUALTO:
+            different[value] = atom
+        elif not numeric:
+            return [atom for atom, value in atoms]
+        elif operator in (_GRTHN, _GREQTHN):
+            strict = operator == _GRTHN
+            if lower is None or value > lower[0] or (value == lower[0] and strict):
+                lower = (value, strict, atom)
+        else:
+            strict = operator == _LSTHN
+            if upper is None or value < upper[0] or (value == upper[0] and strict):
+                upper = (value, strict, atom)
+
+    def within(value):
+        if lower is not None and (value < lower[0] or (value == lower[0] and lower[1])):
+            return False
+        if upper is not None and (value > upper[0] or (value == upper[0] and upper[1])):
+            return False
+        return True
+
+    if len(equal) > 1:
+        return None
+    if equal:
+        value, atom = next(iter(equal.items()))
+        if value in different or not within(value):
+            return None
+        # The equality implies the other atoms
+        return [atom]
+    if lower is not None and upper is not None:
+        if lower[0] > upper[0] or (lower[0] == upper[0] and (lower[1] or upper[1])):
+            return None
+    reduced = [atom for value, atom in different.items() if within(value)]
+    reduced.extend(bound[2] for bound in (lower, upper) if bound is not None)
+    return reduced
+
+
+def _absorb(clauses):
+    """
+    Drops the duplicated clauses and the clauses including another clause,
+    e.g. a || (a && b) becomes a.
+    """
+    clauses = sorted(set(clauses), key=len)
+    kept = []
+    for clause in clauses:
+        if not any(other <= clause for other in kept):
+            kept.append(clause)
+    return kept
+
+
+def _complementary(clauses):
+    """
+    Checks if two single atom clauses complement each other, e.g. a == 1 and
+    a != 1, so that the disjunction is always true.
+    """
+    atoms = set(next(iter(clause)) for clause in clauses if len(clause) == 1)
+    return any(Atom(atom.subject, _complement_dict[atom.operator], atom.value) in atoms for atom in atoms)
+
+
+def _key(atom):
+    """
+    Gets the sorting key of an atom.
+    """
+    return (atom.subject, atom.operator, atom.value)
+
+
+def _merge(clauses):
+    """
+    Merges the single equality clauses on the same subject into members.
+
+    :return: the normal form
+    """
+    subject_values_dict = collections.defaultdict(list)
+    for clause in clauses:
+        if len(clause) == 1:
+            atom = next(iter(clause))
+            if atom.operator == _EQUALTO:
+                subject_values_dict[atom.subject].append(atom.value)
+    members = []
+    merged = set()
+    for subject, values in subject_values_dict.items():
+        if len(values) < 2:
+            continue
+        members.append(Member(subject, tuple(sorted(values))))
+        merged.update(frozenset((Atom(subject, _EQUALTO, value),)) for value in values)
+    rest = sorted((tuple(sorted(clause, key=_key)) for clause in clauses if clause not in merged))
+    members.sort()
+    return Normal(Outcome.FILTER, tuple(rest), tuple(members))
+
+
+def items(normal, operators):
+    """
+    Builds the items of a filter, in reverse polish notation, from its normal
+    form. The members are written back as disjunctions of equalities.
+
+    :param normal: the normal form, whose outcome is FILTER
+    :type normal: optimizer.normalization.Normal
+
+    :param operators: the dictionary binding the operators with their identifiers
+    :type operators: dict
+
+    :return: the list of the identifiers
+    """
+    terms = []
+    for member in normal.members:
+        for value in member.values:
+            terms.append([[member.subject, value, operators[_EQUALTO]]])
+    for clause in normal.clauses:
+        terms.append([[atom.subject, atom.value, operators[atom.operator]] for atom in clause])
+    result = []
+    for position, term in enumerate(terms):
+        for index, atom in enumerate(term):
+            result.extend(atom)
+            if index > 0:
+                result.append(operators[lexer.BasicOperatorType.LAND.value])
+        if position > 0:
+            result.append(operators[lexer.BasicOperatorType.LOR.value])
+    return result
+
+
+def normalize(scenario):
+    """
+    Rewrites the filters of the scenario into their normal forms and drops
+    the conditional attacks whose filters match no packet. The filters
+    matching every packet are left as they are, since AML cannot express
+    them without comparisons, and so are the filters whose normal forms
+    have more items or more comparisons than them.
+
+    :param scenario: the scenario, rewritten in place
+    :type scenario: model.statements.Scenario
+
+    :return: the numbers of the filters rewritten, always true and always
+             false, and of the conditional attacks dropped
+    """
+    scenario._assert_mutable()
+    normalizer = _Normalizer().visit(scenario)
+    return Normalization(normalizer.rewritten, normalizer.true, normalizer.false, normalizer.pruned)
+
+
+class _Normalizer(visitor.Visitor):
+    """
+    Rewrites the filters while visiting the scenario.
+    """
+
+    def __init__(self):
+        """
+        Initializes the _Normalizer object.
+        """
+        # The dictionary binding the (id of the symbol table, identifier)
+        # pairs of the filters with their outcomes
+        self.outcomes = {}
+        self.rewritten = 0
+        self.true = 0
+        self.false = 0
+        self.pruned = 0
+
+    def operators(self, items):
+        """
+        Gets the operators of a filter.
+
+        :return: the dictionary binding the operators with their identifiers
+        """
+        operators = {}
+        for item in items:
+            obj = self.resolve(item)
+            if obj is not None and obj.symboltype == types.Symbol.Type.RESERVED:
+                operators[obj.reserved] = item
+        return operators
+
+    def comparisons(self, items):
+        """
+        Counts the comparisons of a filter.
+        """
+        count = 0
+        for item in items:
+            obj = self.resolve(item)
+            if obj is not None and obj.symboltype == types.Symbol.Type.RESERVED \
+                    and obj.reserved in predicates.comparison_function_dict:
+                count += 1
+        return count
+
+    def enter_symboltable(self, symboltable):
+        # The codeblock owning the table is the innermost one of the path
+        rewritten = {}
+        outcomes = {}
+        for identifier, obj in symboltable.identifier_object_dict.items():
+            if obj.symboltype != types.Symbol.Type.FILTER:
+                continue
+            normal = normalize_items(obj.items, self.resolve)
+            if normal is None:
+                continue
+            outcomes[identifier] = normal.outcome
+            if normal.outcome is Outcome.TRUE:
+                self.true += 1
+            elif normal.outcome is Outcome.FALSE:
+                self.false += 1
+            else:
+                normalized = items(normal, self.operators(obj.items))
+                # The normal form is kept only if it is not larger, since the
+                # distribution of the conjunctions may blow the filter up
+                if tuple(normalized) != tuple(obj.items) and len(normalized) <= len(obj.items) \
+                        and self.comparisons(normalized) <= self.comparisons(obj.items):
+                    rewritten[identifier] = types.Filter(identifier, normalized)
+        if rewritten:
+            self.rewritten += len(rewritten)
+            table = symboltable.renew()
+            for identifier, obj in symboltable.identifier_object_dict.items():
+                table.define(rewritten.get(identifier, obj))
+            self.path[-1].symboltable = table
+            symboltable = table
+        for identifier, outcome in outcomes.items():
+            self.outcomes[(id(symboltable), identifier)] = outcome
+        return visitor.Visitor.PRUNE
+
+    def enter_codeblocktable(self, codeblocktable):
+        # The filters of the conditionals are resolved in the scope owning them
+        kept = []
+        for item in codeblocktable.codeblocks:
+            if isinstance(item, statements.Conditional):
+                symboltable, obj = self.owner(item.filter)
+                if self.outcomes.get((id(symboltable), item.filter), None) is Outcome.FALSE:
+                    self.pruned += 1
+                    continue
+            kept.append(item)
+        if len(kept) != len(codeblocktable.codeblocks):
+            codeblocktable.codeblocks[:] = kept
+
+    def enter_primitive(self, primitive):
+        return visitor.Visitor.PRUNE
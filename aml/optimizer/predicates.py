@@ -0,0 +1,299 @@
+# -----------------------------------------------------------------------------
+# predicates.py
+#
+# Author: Francesco Racciatti (racciatti.francesco@gmail.com)
+#
+# This module contains the shared predicate DAG of the filters of the AML
+# scenarios, i.e. the common subexpression elimination across filters.
+# -----------------------------------------------------------------------------
+
+import enum
+import operator
+
+import lexer.lexer as lexer
+import model.types as types
+import model.visitor as visitor
+
+
+@enum.unique
+class Kind(enum.Enum):
+    """
+    The kinds of the nodes of the predicate DAG.
+    """
+    COMPARE = 'compare'
+    AND = 'and'
+    OR = 'or'
+
+
+# The functions of the comparison operators, by operator
+comparison_function_dict = {
+    lexer.BasicOperatorType.EQUALTO.value: operator.eq,
+    lexer.BasicOperatorType.NOTEQUALTO.value: operator.ne,
+    lexer.BasicOperatorType.LSTHN.value: operator.lt,
+    lexer.BasicOperatorType.LSEQTHN.value: operator.le,
+    lexer.BasicOperatorType.GRTHN.value: operator.gt,
+    lexer.BasicOperatorType.GREQTHN.value: operator.ge,
+}
+
+# The logical operators, by operator
+logical_kind_dict = {
+    lexer.BasicOperatorType.LAND.value: Kind.AND,
+    lexer.BasicOperatorType.LOR.value: Kind.OR,
+}
+
+# The comparisons rewritten by swapping their operands
+_swapped_dict = {
+    lexer.BasicOperatorType.GRTHN.value: lexer.BasicOperatorType.LSTHN.value,
+    lexer.BasicOperatorType.GREQTHN.value: lexer.BasicOperatorType.LSEQTHN.value,
+}
+
+# The symmetric comparisons
+_symmetric = (lexer.BasicOperatorType.EQUALTO.value, lexer.BasicOperatorType.NOTEQUALTO.value)
+
+
+class PredicateDag(object):
+    """
+    The predicate DAG shared by the filters of a scenario. Each distinct
+    comparison and each distinct conjunction or disjunction is stored once
+    and gets a dense id; the ids of the children are lower than the ones of
+    their parents, hence iterating the nodes by id gives a topological order
+    that emitters can output as it is.
+
+    The nodes are tuples: (Kind.COMPARE, operator, left, right) for the
+    comparisons, where the operands are ('literal', type, value) or
+    ('variable', scope, identifier), where the scope is the id of the symbol
+    table binding the variable, and (kind, children) for the conjunctions and
+    the disjunctions, where the children are the sorted tuple of the ids of
+    the distinct operands. The comparisons are normalized, so that a == b and
+    b == a, or a > b and b < a, share the same node.
+    """
+
+    def __init__(self):
+        """
+        Initializes the PredicateDag object.
+        """
+        self.nodes = []
+        self.node_id_dict = {}
+        # The (codeblock, identifier, root) triples of the filters
+        self.filters = []
+        # The dictionary binding the ids of the conditionals with their roots
+        self.conditional_root_dict = {}
+        # The number of the nodes found already in the DAG
+        self.hits = 0
+
+    @classmethod
+    def build(cls, scenario):
+        """
+        Builds the predicate DAG of the filters of the scenario.
+
+        :param scenario: the scenario
+        :type scenario: model.statements.Scenario
+
+        :return: the predicate DAG
+        """
+        dag = cls()
+        _DagBuilder(dag).visit(scenario)
+        return dag
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def add(self, node):
+        """
+        Adds a node to the DAG, unless it is already there.
+
+        :param node: the node
+        :type node: tuple
+
+        :return: the id of the node
+        """
+        identifier = self.node_id_dict.get(node, None)
+        if identifier is not None:
+            self.hits += 1
+            return identifier
+        identifier = len(self.nodes)
+        self.nodes.append(node)
+        self.node_id_dict[node] = identifier
+        return identifier
+
+    def compare(self, comparison, left, right):
+        """
+        Adds a normalized comparison.
+
+        :return: the id of the node
+        """
+        if comparison in _swapped_dict:
+            comparison, left, right = _swapped_dict[comparison], right, left
+        elif comparison in _symmetric and repr(right) < repr(left):
+            left, right = right, left
+        return self.add((Kind.COMPARE, comparison, left, right))
+
+    def combine(self, kind, first, second):
+        """
+        Adds the conjunction or the disjunction of two nodes. The nested
+        nodes of the same kind are flattened and the duplicates are dropped.
+
+        :return: the id of the node
+        """
+        children = set()
+        for child in (first, second):
+            node = self.nodes[child]
+            if node[0] is kind:
+                children.update(node[1])
+            else:
+                children.add(child)
+        if len(children) == 1:
+            return children.pop()
+        return self.add((kind, tuple(sorted(children))))
+
+    def root(self, conditional):
+        """
+        Gets the root of the filter of a conditional attack.
+
+        :param conditional: the conditional attack
+        :type conditional: model.statements.Conditional
+
+        :return: the id of the root, None if the filter is not in the DAG
+        """
+        return self.conditional_root_dict.get(id(conditional), None)
+
+    def comparisons(self):
+        """
+        Counts the distinct comparisons.
+        """
+        return sum(1 for node in self.nodes if node[0] is Kind.COMPARE)
+
+    def evaluate(self, roots, operand):
+        """
+        Evaluates the given roots against a packet. Each node is evaluated at
+        most once, however many roots share it, and the conjunctions and the
+        disjunctions stop at the first operand deciding them.
+
+        :param roots: the ids of the roots
+        :type roots: iterable
+
+        :param operand: the function giving the value of an operand for the
+                        packet, e.g. the value of the field for a field path
+        :type operand: function
+
+        :return: the list of the outcomes, one per root
+        """
+        values = {}
+        outcomes = []
+        for root in roots:
+            pending = [root]
+            while pending:
+                identifier = pending[-1]
+                if identifier in values:
+                    pending.pop()
+                    continue
+                node = self.nodes[identifier]
+                if node[0] is Kind.COMPARE:
+                    function = comparison_function_dict[node[1]]
+                    values[identifier] = bool(function(operand(node[2]), operand(node[3])))
+                    pending.pop()
+                    continue
+                # The value deciding the node, i.e. False for the conjunctions
+                deciding = node[0] is Kind.OR
+                value = not deciding
+                for child in node[1]:
+                    if child not in values:
+                        pending.append(child)
+                        break
+                    if values[child] is deciding:
+                        value = deciding
+                        break
+                else:
+                    values[identifier] = value
+                    pending.pop()
+                    continue
+                if value is deciding:
+                    values[identifier] = value
+                    pending.pop()
+            outcomes.append(values[root])
+        return outcomes
+
+
+class _DagBuilder(visitor.Visitor):
+    """
+    Decomposes the filters into the predicate DAG while visiting the scenario.
+    """
+
+    def __init__(self, dag):
+        """
+        Initializes the _DagBuilder object.
+
+        :param dag: the DAG to fill
+        :type dag: optimizer.predicates.PredicateDag
+        """
+        self.dag = dag
+        # The dictionary binding the (id of the symbol table, identifier) pairs
+        # of the filters with their roots
+        self.roots = {}
+
+    def operand(self, identifier):
+        """
+        Builds the key of an operand: the literals are keyed by value, the
+        variables by the symbol table binding them and by identifier, since
+        the same identifier may be bound to different variables in different
+        scopes.
+        """
+        obj = types.Variable.literal(self.resolve, identifier)
+        if obj is not None:
+            return ('literal', obj.variabletype.name, obj.value)
+        symboltable, obj = self.owner(identifier)
+        return ('variable', id(symboltable) if symboltable is not None else None, identifier)
+
+    def decompose(self, items):
+        """
+        Decomposes the items of a filter, in reverse polish notation.
+
+        :return: the id of the root, None if the filter is badly formed
+        """
+        stack = []
+        for item in items:
+            symboltable, obj = self.owner(item)
+            reserved = obj.reserved if obj is not None and obj.symboltype == types.Symbol.Type.RESERVED else None
+            if reserved in comparison_function_dict:
+                if len(stack) < 2:
+                    return None
+                right = stack.pop()
+                left = stack.pop()
+                if isinstance(left, int) or isinstance(right, int):
+                    return None
+                stack.append(self.dag.compare(reserved, left, right))
+            elif reserved in logical_kind_dict:
+                if len(stack) < 2:
+                    return None
+                second = stack.pop()
+                first = stack.pop()
+                if not isinstance(first, int) or not isinstance(second, int):
+                    return None
+                stack.append(self.dag.combine(logical_kind_dict[reserved], first, second))
+            else:
+                stack.append(self.operand(item))
+        if len(stack) != 1 or not isinstance(stack[0], int):
+            return None
+        return stack[0]
+
+    def enter_symboltable(self, symboltable):
+        # The codeblock owning the table is the innermost one of the path
+        for identifier, obj in symboltable.identifier_object_dict.items():
+            if obj.symboltype != types.Symbol.Type.FILTER:
+                continue
+            root = self.decompose(obj.items)
+            if root is None:
+                continue
+            self.roots[(id(symboltable), identifier)] = root
+            self.dag.filters.append((self.path[-1], identifier, root))
+        return visitor.Visitor.PRUNE
+
+    def enter_conditional(self, conditional):
+        # The filter is resolved in the enclosing scope
+        symboltable, obj = self.owner(conditional.filter)
+        root = self.roots.get((id(symboltable), conditional.filter), None)
+        if root is not None:
+            self.dag.conditional_root_dict[id(conditional)] = root
+
+    def enter_primitive(self, primitive):
+        return visitor.Visitor.PRUNE
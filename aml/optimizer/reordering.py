@@ -0,0 +1,403 @@
+# -----------------------------------------------------------------------------
+# reordering.py
+#
+# Author: Francesco Racciatti (racciatti.francesco@gmail.com)
+#
+# This module contains the reordering of the predicates of the filters of the
+# AML scenarios by estimated cost and selectivity.
+# -----------------------------------------------------------------------------
+
+import json
+import collections
+
+import lexer.lexer as lexer
+import model.types as types
+import model.visitor as visitor
+import optimizer.predicates as predicates
+
+
+# The default selectivities, i.e. the fractions of the packets matching a
+# comparison, by operator
+selectivity_dict = {
+    lexer.BasicOperatorType.EQUALTO.value: 0.1,
+    lexer.BasicOperatorType.NOTEQUALTO.value: 0.9,
+    lexer.BasicOperatorType.LSTHN.value: 1 / 3,
+    lexer.BasicOperatorType.LSEQTHN.value: 1 / 3,
+    lexer.BasicOperatorType.GRTHN.value: 1 / 3,
+    lexer.BasicOperatorType.GREQTHN.value: 1 / 3,
+}
+
+# The costs of the comparisons between numbers and between strings
+integer_cost = 1.0
+string_cost = 4.0
+
+# The cost of each component of the field path, e.g. layer4.sourcePort has two
+depth_cost = 1.0
+
+# The version of the format of the statistics
+_version = 1
+
+# A term of a filter: a comparison, whose items are its identifiers in reverse
+# polish notation, or a conjunction or disjunction of its children
+_Term = collections.namedtuple('_Term', ['kind', 'operator', 'children', 'items', 'cost', 'probability'])
+
+
+def key(operator, left, right):
+    """
+    Builds the key of a comparison in the statistics, e.g.
+    'layer4.sourcePort' == 80.
+
+    :param operator: the comparison operator
+    :type operator: str
+
+    :param left: the value of the left operand, or the identifier of a variable
+    :param right: the value of the right operand, or the identifier of a variable
+
+    :return: the key
+    """
+    return '%r %s %r' % (left, operator, right)
+
+
+def field(packet, value):
+    """
+    Gets the value of an operand for a packet: the strings naming a field of
+    the packet give the value of the field, the other operands are literals.
+
+    :param packet: the dictionary binding the field paths with their values
+    :type packet: dict
+
+    :param value: the operand
+    """
+    if isinstance(value, str):
+        return packet.get(value, value)
+    return value
+
+
+class Statistics(object):
+    """
+    The selectivities of the comparisons, collected from a sample trace.
+    They can be saved and loaded as JSON, so that a trace is sampled once.
+    """
+
+    def __init__(self, packets=0, comparison_matched_dict=None):
+        """
+        Initializes the Statistics object.
+
+        :param packets: the number of the packets sampled
+        :type packets: int
+
+        :param comparison_matched_dict: the dictionary binding the keys of the
+                                        comparisons with the number of the
+                                        packets matching them
+        :type comparison_matched_dict: dict
+        """
+        if packets < 0:
+            raise ValueError("Negative number of packets")
+        self.packets = packets
+        self.comparison_matched_dict = dict(comparison_matched_dict or {})
+
+    @classmethod
+    def collect(cls, scenario, packets, operand=field):
+        """
+        Collects the statistics of the comparisons of the filters of the
+        scenario over a sample trace.
+
+        :param scenario: the scenario
+        :type scenario: model.statements.Scenario
+
+        :param packets: the packets of the trace
+        :type packets: iterable
+
+        :param operand: the function giving the value of an operand for a
+                        packet, see field
+        :type operand: function
+
+        :return: the statistics
+        """
+        statistics = cls()
+        statistics.observe(_Comparisons().visit(scenario).comparisons, packets, operand)
+        return statistics
+
+    def observe(self, comparisons, packets, operand=field):
+        """
+        Adds the outcomes of the comparisons over the packets. The comparisons
+        between values that cannot be compared, e.g. a missing field and a
+        number, do not match.
+
+        :param comparisons: the (operator, left, right) triples
+        :type comparisons: iterable
+
+        :param packets: the packets
+        :type packets: iterable
+
+        :param operand: the function giving the value of an operand for a packet
+        :type operand: function
+        """
+        comparisons = [(key(*comparison), predicates.comparison_function_dict[comparison[0]],
+                        comparison[1], comparison[2]) for comparison in set(comparisons)]
+        for comparison, function, left, right in comparisons:
+            self.comparison_matched_dict.setdefault(comparison, 0)
+        for packet in packets:
+            self.packets += 1
+            for comparison, function, left, right in comparisons:
+                try:
+                    matched = function(operand(packet, left), operand(packet, right))
+                except TypeError:
+                    matched = False
+                if matched:
+                    self.comparison_matched_dict[comparison] += 1
+
+    def selectivity(self, operator, left, right):
+        """
+        Estimates the fraction of the packets matching a comparison. The
+        sampled comparisons are smoothed, so that no estimate is exactly 0 or
+        1; the other ones get the default of their operator.
+
+        :return: the selectivity
+        """
+        matched = self.comparison_matched_dict.get(key(operator, left, right), None)
+        if matched is None:
+            return selectivity_dict[operator]
+        return (matched + 1) / (self.packets + 2)
+
+    def save(self, path):
+        """
+        Saves the statistics as JSON.
+
+        :param path: the path of the file
+        :type path: str
+        """
+        with open(path, 'w') as stream:
+            json.dump({'version': _version, 'packets': self.packets,
+                       'comparisons': self.comparison_matched_dict}, stream, indent=2, sort_keys=True)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Loads the statistics saved as JSON.
+
+        :param path: the path of the file
+        :type path: str
+
+        :return: the statistics
+        """
+        with open(path) as stream:
+            content = json.load(stream)
+        if content.get('version', None) != _version:
+            raise ValueError("Unsupported version of the statistics: " + str(content.get('version', None)))
+        return cls(content['packets'], content['comparisons'])
+
+
+def reorder(scenario, statistics=None):
+    """
+    Reorders the operands of the conjunctions and of the disjunctions of the
+    filters of the scenario, so that the short-circuit evaluation meets the
+    cheap and deciding comparisons first. The chains of the same operator are
+    sorted by ascending cost / (1 - selectivity) for the conjunctions and by
+    ascending cost / selectivity for the disjunctions, which minimizes the
+    expected cost of the evaluation; the ties keep the order as written.
+
+    :param scenario: the scenario, rewritten in place
+    :type scenario: model.statements.Scenario
+
+    :param statistics: the statistics of the comparisons, the defaults if None
+    :type statistics: optimizer.reordering.Statistics
+
+    :return: the number of the filters rewritten
+    """
+    scenario._assert_mutable()
+    if statistics is None:
+        statistics = Statistics()
+    return _Reorderer(statistics).visit(scenario).rewritten
+
+
+def _value(resolve, identifier):
+    """
+    Gets the value of a literal operand, or its identifier if it is a variable.
+    """
+    obj = types.Variable.literal(resolve, identifier)
+    return identifier if obj is None else obj.value
+
+
+def _decompose(items, resolve):
+    """
+    Decomposes the items of a filter, in reverse polish notation, into a
+    stack of operands and terms.
+
+    :return: the stack, None if the filter is badly formed
+    """
+    stack = []
+    for item in items:
+        obj = resolve(item)
+        reserved = obj.reserved if obj is not None and obj.symboltype == types.Symbol.Type.RESERVED else None
+        if reserved in predicates.comparison_function_dict or reserved in predicates.logical_kind_dict:
+            if len(stack) < 2:
+                return None
+            second = stack.pop()
+            first = stack.pop()
+            stack.append((reserved, item, first, second))
+        else:
+            stack.append(item)
+    if len(stack) != 1 or isinstance(stack[0], str):
+        return None
+    return stack
+
+
+class _Comparisons(visitor.Visitor):
+    """
+    Collects the comparisons of the filters.
+    """
+
+    def __init__(self):
+        """
+        Initializes the _Comparisons object.
+        """
+        # The (operator, left, right) triples
+        self.comparisons = set()
+
+    def enter_symboltable(self, symboltable):
+        for identifier, obj in symboltable.identifier_object_dict.items():
+            if obj.symboltype != types.Symbol.Type.FILTER:
+                continue
+            stack = _decompose(obj.items, self.resolve)
+            while stack:
+                node = stack.pop()
+                if isinstance(node, str):
+                    continue
+                reserved, item, first, second = node
+                if reserved in predicates.comparison_function_dict:
+                    if isinstance(first, str) and isinstance(second, str):
+                        self.comparisons.add((reserved, _value(self.resolve, first), _value(self.resolve, second)))
+                else:
+                    stack.extend((first, second))
+        return visitor.Visitor.PRUNE
+
+    def enter_primitive(self, primitive):
+        return visitor.Visitor.PRUNE
+
+
+class _Reorderer(visitor.Visitor):
+    """
+    Reorders the filters while visiting the scenario.
+    """
+
+    def __init__(self, statistics):
+        """
+        Initializes the _Reorderer object.
+
+        :param statistics: the statistics of the comparisons
+        :type statistics: optimizer.reordering.Statistics
+        """
+        self.statistics = statistics
+        self.rewritten = 0
+
+    def comparison(self, reserved, item, left, right):
+        """
+        Builds the term of a comparison. The left operand is the field, as
+        written in the filters.
+        """
+        left_value = _value(self.resolve, left)
+        right_value = _value(self.resolve, right)
+        cost = string_cost if isinstance(right_value, str) and right_value != right else integer_cost
+        if isinstance(left_value, str) and left_value != left:
+            cost += depth_cost * len(left_value.split('.'))
+        probability = self.statistics.selectivity(reserved, left_value, right_value)
+        return _Term(None, item, (), (left, right, item), cost, probability)
+
+    def combine(self, reserved, item, first, second):
+        """
+        Builds the term of a conjunction or of a disjunction, flattening the
+        nested terms of the same operator and sorting the operands.
+        """
+        kind = predicates.logical_kind_dict[reserved]
+        children = []
+        for child in (first, second):
+            if child.kind is kind and child.operator == item:
+                children.extend(child.children)
+            else:
+                children.append(child)
+        if kind is predicates.Kind.AND:
+            children.sort(key=lambda child: child.cost / (1 - child.probability)
+                          if child.probability < 1 else float('inf'))
+        else:
+            children.sort(key=lambda child: child.cost / child.probability
+                          if child.probability > 0 else float('inf'))
+        # The expected cost of the evaluation and the probability of the outcome
+        cost = 0.0
+        reached = 1.0
+        for child in children:
+            cost += reached * child.cost
+            reached *= child.probability if kind is predicates.Kind.AND else 1 - child.probability
+        probability = reached if kind is predicates.Kind.AND else 1 - reached
+        return _Term(kind, item, tuple(children), None, cost, probability)
+
+    def term(self, node):
+        """
+        Builds the term of a node of the decomposed filter.
+
+        :return: the term, None if the node is not made by comparisons
+        """
+        # The nodes are built bottom-up, without recursion
+        pending = [(node, False)]
+        terms = []
+        while pending:
+            node, ready = pending.pop()
+            if isinstance(node, str):
+                return None
+            reserved, item, first, second = node
+            if reserved in predicates.comparison_function_dict:
+                if not isinstance(first, str) or not isinstance(second, str):
+                    return None
+                terms.append(self.comparison(reserved, item, first, second))
+            elif ready:
+                second = terms.pop()
+                first = terms.pop()
+                terms.append(self.combine(reserved, item, first, second))
+            else:
+                pending.extend(((node, True), (second, False), (first, False)))
+        return terms[0]
+
+    def enter_symboltable(self, symboltable):
+        # The codeblock owning the table is the innermost one of the path
+        rewritten = {}
+        for identifier, obj in symboltable.identifier_object_dict.items():
+            if obj.symboltype != types.Symbol.Type.FILTER:
+                continue
+            stack = _decompose(obj.items, self.resolve)
+            term = self.term(stack[0]) if stack is not None else None
+            if term is None:
+                continue
+            items = _items(term)
+            if tuple(items) != tuple(obj.items):
+                rewritten[identifier] = types.Filter(identifier, items)
+        if rewritten:
+            self.rewritten += len(rewritten)
+            table = symboltable.renew()
+            for identifier, obj in symboltable.identifier_object_dict.items():
+                table.define(rewritten.get(identifier, obj))
+            self.path[-1].symboltable = table
+        return visitor.Visitor.PRUNE
+
+    def enter_primitive(self, primitive):
+        return visitor.Visitor.PRUNE
+
+
+def _items(term):
+    """
+    Builds the items of a term, in reverse polish notation.
+    """
+    items = []
+    pending = [term]
+    while pending:
+        term = pending.pop()
+        if isinstance(term, str):
+            items.append(term)
+        elif term.kind is None:
+            items.extend(term.items)
+        else:
+            # The operands are chained from the left
+            following = [term.children[0]]
+            for child in term.children[1:]:
+                following.extend((child, term.operator))
+            pending.extend(reversed(following))
+    return items
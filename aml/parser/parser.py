@@ -9,13 +9,14 @@
 import lexer.lexer as lexer
 import model.types as types
 import model.statements as statements
+import model.nodeset as nodeset
 
 
 # -----------------------------------------------------------------------------
 # Support structures used to store objects during the parsing.
 # -----------------------------------------------------------------------------
 
-# The number of scopes
+# The number of scopes defined by the grammar (scenario, compound, attack)
 scopes = 3
 
 # The symbol handler
@@ -59,8 +60,7 @@ def p_scenario(p):
     symboltable = symbolhandler.scope_symboltable_dict[0]
     codeblocktable = codeblockhandler.scope_codeblocktable_dict[0]
     scenario = statements.Scenario(symboltable, codeblocktable)
-    symbolhandler.dump()
-    codeblockhandler.dump()
+    reset()
     p[0] = scenario
 
 
@@ -142,8 +142,15 @@ def p_compound_identifier(p):
     if not symbolhandler.exist(scopes - 1, time_identifier):
         raise RuntimeError("identifier not defined - line " + str(p.lineno(1)))
     obj = symbolhandler.object(time_identifier)
-    if obj.variabletype not in (types.Variable.Type.INTEGER, types.Variable.Type.INTEGER):
+    if obj.symboltype != types.Symbol.Type.VARIABLE:
+        raise RuntimeError("identifier does not refer a variable - line " + str(p.lineno(1)))
+    if obj.variabletype not in (types.Variable.Type.INTEGER, types.Variable.Type.REAL):
         raise RuntimeError("identifier does not refer a number - line " + str(p.lineno(1)))
+    if obj.value is None:
+        raise RuntimeError("identifier refers an uninitialized variable - line " + str(p.lineno(1)))
+    if obj.value < 0:
+        raise RuntimeError("time cannot be negative - line " + str(p.lineno(1)))
+    nanoseconds = types.nanoseconds(obj.value, p[3])
     obj = types.Reserved(p[3])
     unit_identifier = obj.identifier
     if not symbolhandler.exist(scopes - 1, unit_identifier):
@@ -151,7 +158,7 @@ def p_compound_identifier(p):
     # Builds the compound and stores it inside the codeblockhandler
     symboltable = symbolhandler.scope_symboltable_dict[1]
     codeblocktable = codeblockhandler.scope_codeblocktable_dict[1]
-    compound = statements.Compound(symboltable, codeblocktable, time_identifier, unit_identifier)
+    compound = statements.Compound(symboltable, codeblocktable, time_identifier, unit_identifier, nanoseconds)
     codeblockhandler.append(0, compound)
     # Clears support structures
     symbolhandler.clear(1)
@@ -167,6 +174,7 @@ def p_compound_value(p):
     time_value = p[2]
     if time_value < 0:
         raise RuntimeError("time cannot be negative - line " + str(p.lineno(1)))
+    nanoseconds = types.nanoseconds(time_value, p[3])
     obj = types.Variable(types.Variable.autoidentifier(time_value), types.Variable.Type.REAL, float(time_value))
     time_identifier = obj.identifier
     if not symbolhandler.exist(scopes - 1, time_identifier):
@@ -179,7 +187,7 @@ def p_compound_value(p):
     # Builds the compound and stores it inside the codeblockhandler
     symboltable = symbolhandler.scope_symboltable_dict[1]
     codeblocktable = codeblockhandler.scope_codeblocktable_dict[1]
-    compound = statements.Compound(symboltable, codeblocktable, time_identifier, unit_identifier)
+    compound = statements.Compound(symboltable, codeblocktable, time_identifier, unit_identifier, nanoseconds)
     codeblockhandler.append(0, compound)
     # Clears support structures
     symbolhandler.clear(1)
@@ -364,8 +372,15 @@ def p_periodic_identifier(p):
     if not symbolhandler.exist(scopes - 1, time_identifier):
         raise RuntimeError("identifier not defined - line " + str(p.lineno(1)))
     obj = symbolhandler.object(time_identifier)
-    if obj.variabletype not in (types.Variable.Type.INTEGER, types.Variable.Type.INTEGER):
+    if obj.symboltype != types.Symbol.Type.VARIABLE:
+        raise RuntimeError("identifier does not refer a variable - line " + str(p.lineno(1)))
+    if obj.variabletype not in (types.Variable.Type.INTEGER, types.Variable.Type.REAL):
         raise RuntimeError("identifier does not refer a number - line " + str(p.lineno(1)))
+    if obj.value is None:
+        raise RuntimeError("identifier refers an uninitialized variable - line " + str(p.lineno(1)))
+    if obj.value < 0:
+        raise RuntimeError("time cannot be negative - line " + str(p.lineno(1)))
+    nanoseconds = types.nanoseconds(obj.value, p[3])
     obj = types.Reserved(p[3])
     unit_identifier = obj.identifier
     if not symbolhandler.exist(scopes - 1, unit_identifier):
@@ -373,7 +388,7 @@ def p_periodic_identifier(p):
     # Builds the periodic statement and stores it inside the codeblockhandler
     symboltable = symbolhandler.scope_symboltable_dict[2]
     codeblocktable = codeblockhandler.scope_codeblocktable_dict[2]
-    periodic = statements.Periodic(symboltable, codeblocktable, time_identifier, unit_identifier)
+    periodic = statements.Periodic(symboltable, codeblocktable, time_identifier, unit_identifier, nanoseconds)
     codeblockhandler.append(1, periodic)
     # Clears support structures
     symbolhandler.clear(2)
@@ -389,6 +404,7 @@ def p_periodic_value(p):
     time_value = p[2]
     if time_value < 0:
         raise RuntimeError("time cannot be negative - line " + str(p.lineno(1)))
+    nanoseconds = types.nanoseconds(time_value, p[3])
     obj = types.Variable(types.Variable.autoidentifier(time_value), types.Variable.Type.REAL, float(time_value))
     time_identifier = obj.identifier
     if not symbolhandler.exist(scopes - 1, time_identifier):
@@ -401,7 +417,7 @@ def p_periodic_value(p):
     # Builds the periodic statement and stores it inside the codeblockhandler
     symboltable = symbolhandler.scope_symboltable_dict[2]
     codeblocktable = codeblockhandler.scope_codeblocktable_dict[2]
-    periodic = statements.Periodic(symboltable, codeblocktable, time_identifier, unit_identifier)
+    periodic = statements.Periodic(symboltable, codeblocktable, time_identifier, unit_identifier, nanoseconds)
     codeblockhandler.append(1, periodic)
     # Clears support structures
     symbolhandler.clear(2)
@@ -505,6 +521,17 @@ def p_conditional_identifiers(p):
     nodes = symbolhandler.object(identifier_nodes)
     if nodes.symboltype != types.Symbol.Type.LIST:
         raise RuntimeError("identifier does not refer a list - line " + str(p.lineno(1)))
+    # Resolves the target nodes
+    if isinstance(nodes.items, types.NumericItems):
+        targets = nodeset.NodeSet(nodes.items.values)
+    else:
+        values = []
+        for item in nodes.items:
+            obj = symbolhandler.object(item)
+            if obj.symboltype != types.Symbol.Type.VARIABLE or obj.value is None:
+                raise RuntimeError("list item does not refer a node - line " + str(p.lineno(1)))
+            values.append(obj.value)
+        targets = nodeset.NodeSet(values)
     # Checks the identifier of the packet filter
     identifier_filter = p[9]
     if not symbolhandler.exist(scopes - 1, identifier_filter):
@@ -515,7 +542,7 @@ def p_conditional_identifiers(p):
     # Builds the conditional statement and stores it inside the codeblockhandler
     symboltable = symbolhandler.scope_symboltable_dict[2]
     codeblocktable = codeblockhandler.scope_codeblocktable_dict[2]
-    conditional = statements.Conditional(symboltable, codeblocktable, identifier_nodes, identifier_filter)
+    conditional = statements.Conditional(symboltable, codeblocktable, identifier_nodes, identifier_filter, targets)
     codeblockhandler.append(1, conditional)
     # Clears support structures
     symbolhandler.clear(2)
@@ -749,8 +776,8 @@ def p_expression_assign(p):
     # Evaluates the type of the expression
     expression = list(flatten(expression))
     if obj.variabletype == types.Variable.Type.NONE:
-        variabletype = get_expression_type(expression)
-        symbolhandler.scope_symboltable_dict[2].identifier_object_dict[p[1]].variabletype = variabletype 
+        # Types the innermost definition of the variable
+        obj.variabletype = get_expression_type(expression)
     else:
         if not check_expression_against_variabletype(expression, obj.variabletype):
             raise RuntimeError("cannot handle different types inside expressions - line "+ str(p.lineno(1)))
@@ -1392,7 +1419,7 @@ def p_list_definition(p):
     if symbolhandler.exist(scopes - 1, identifier):
         raise RuntimeError("identifier already defined - line " + str(p.lineno(1)))
     items = list(flatten(p[5]))
-    obj = types.List(identifier, items)
+    obj = types.List(identifier, numeric_items(items) or items)
     temp_symbols.append(obj)    
 
 
@@ -1491,6 +1518,44 @@ def flatten(iterable):
             yield elm
 
 
+def reset():
+    """
+    Resets the support structures, so that the parser can be reused.
+    """
+    for scope in reversed(range(0, scopes)):
+        symbolhandler.clear(scope)
+        codeblockhandler.clear(scope)
+    del temp_symbols[:]
+
+
+def numeric_items(items):
+    """
+    Packs the items of a list made only by integer literals or only by real 
+    literals.
+    
+    :param items: the identifiers of the items
+    :type items: list
+    
+    :return: the numeric items, None if the items cannot be packed
+    """
+    literals = {obj.identifier: obj for obj in temp_symbols}
+    variabletype = None
+    values = []
+    for item in items:
+        obj = literals.get(item, None) or symbolhandler.object(item)
+        if obj is None or obj.symboltype != types.Symbol.Type.VARIABLE:
+            return None
+        if variabletype is None:
+            variabletype = obj.variabletype
+        elif obj.variabletype != variabletype:
+            return None
+        # Named variables are kept as they are, since they can be assigned
+        if obj.value is None or types.Variable.autoidentifier(obj.value) != item:
+            return None
+        values.append(obj.value)
+    return types.NumericItems.build(variabletype, values)
+
+
 def store_temp_symbols(scope):
     """
     Stores the temporaries symbols inside the symbol handler
@@ -0,0 +1,253 @@
+
+# parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'entryleftADDSUBleftMULDIVleftEXPrightUMINUSASSIGNADD ADDASSIGN ASSIGN CAPTURED CLONEPACKET COMMA CREATEPACKET DECEIVECOMPONENT DESTROYCOMPONENT DESTROYNODE DISABLECOMPONENT DIV DIVASSIGN DROPPACKET EQUALTO EVERY EXP FILTER FOR FORWARDPACKET FROM GREQTHN GRTHN IDENTIFIER IN INJECTPACKET INTEGER LAND LBRACK LCURVY LIST LOR LROUND LSEQTHN LSTHN MATCHING MISPLACENODE MOD MODASSIGN MS MUL MULASSIGN NODES NOTEQUALTO ONCE PACKET PACKETS RBRACK RCURVY READFIELD REAL RROUND RX S SCENARIO SELF STRING SUB SUBASSIGN TX US VARIABLE WRITEFIELD\n    entry : scenario\n    \n    scenario : SCENARIO LCURVY scenario_content RCURVY\n    \n    scenario_content : scenario_variable_declaration\n                     | scenario_variable_definition\n                     | scenario_packet_declaration\n                     | scenario_filter_definition\n                     | scenario_list_definition\n                     | compounds\n                     | scenario_content scenario_content\n    \n    scenario_variable_declaration : VARIABLE IDENTIFIER\n    \n    scenario_variable_definition : variable_definition\n    \n    scenario_packet_declaration : PACKET IDENTIFIER\n    \n    scenario_filter_definition : filter_definition\n    \n    scenario_list_definition : list_definition\n    \n    compounds : compound\n              | compound compounds\n    \n    compound : FROM IDENTIFIER unit LCURVY compound_content RCURVY\n    \n    compound : FROM INTEGER unit LCURVY compound_content RCURVY\n             | FROM REAL unit LCURVY compound_content RCURVY\n    \n    compound_content : compound_variable_declaration\n                     | compound_variable_definition\n                     | compound_packet_declaration\n                     | compound_filter_definition\n                     | compound_list_definition\n                     | onces\n                     | periodics\n                     | conditionals\n                     | compound_content compound_content\n    \n    compound_variable_declaration : VARIABLE IDENTIFIER\n    \n    compound_variable_definition : variable_definition\n    \n    compound_packet_declaration : PACKET IDENTIFIER\n    \n    compound_filter_definition : filter_definition\n    \n    compound_list_definition : list_definition\n    \n    onces : once\n          | once onces\n    \n    once : ONCE LCURVY once_content RCURVY\n    \n    once_content : once_variable_declaration\n                 | once_variable_definition\n                 | once_packet_declaration\n                 | once_filter_definition\n                 | once_list_definition\n                 | once_primitives\n                 | once_content once_content\n    \n    once_variable_declaration : VARIABLE IDENTIFIER\n    \n    once_variable_definition : variable_definition\n    \n    once_packet_declaration : PACKET IDENTIFIER\n    \n    once_filter_definition : filter_definition\n    \n    once_list_definition : list_definition\n    \n    once_primitives : primitive_disable_component\n                    | primitive_deceive_component\n                    | primitive_destroy_component\n                    | primitive_misplace_node\n                    | primitive_destroy_node\n                    | primitive_write_field\n                    | primitive_create_packet\n                    | primitive_inject_packet\n                    | primitive_clone_packet\n                    | primitive_expression\n    \n    periodics : periodic\n              | periodics periodics\n    \n    periodic : EVERY IDENTIFIER unit LCURVY periodic_content RCURVY\n    \n    periodic : EVERY INTEGER unit LCURVY periodic_content RCURVY\n             | EVERY REAL unit LCURVY periodic_content RCURVY\n    \n    periodic_content : periodic_variable_declaration\n                     | periodic_variable_definition\n                     | periodic_packet_declaration\n                     | periodic_filter_definition\n                     | periodic_list_definition\n                     | periodic_primitives\n                     | periodic_content periodic_content\n    \n    periodic_variable_declaration : VARIABLE IDENTIFIER\n    \n    periodic_variable_definition : variable_definition\n    \n    periodic_packet_declaration : PACKET IDENTIFIER\n    \n    periodic_filter_definition : filter_definition\n    \n    periodic_list_definition : list_definition\n    \n    periodic_primitives : primitive_disable_component\n                        | primitive_deceive_component\n                        | primitive_destroy_component\n                        | primitive_misplace_node\n                        | primitive_destroy_node\n                        | primitive_write_field\n                        | primitive_create_packet\n                        | primitive_inject_packet\n                        | primitive_clone_packet\n                        | primitive_expression\n    \n    conditionals : conditional\n                 | conditionals conditionals\n    \n    conditional : FOR NODES IN IDENTIFIER LCURVY FOR PACKETS MATCHING IDENTIFIER LCURVY conditional_content RCURVY RCURVY\n    \n    conditional_content : conditional_variable_declaration\n                        | conditional_variable_definition\n                        | conditional_packet_declaration\n                        | conditional_filter_definition\n                        | conditional_list_definition\n                        | conditional_primitives\n                        | conditional_content conditional_content\n    \n    conditional_variable_declaration : VARIABLE IDENTIFIER\n    \n    conditional_variable_definition : variable_definition\n    \n    conditional_packet_declaration : PACKET IDENTIFIER\n    \n    conditional_filter_definition : filter_definition\n    \n    conditional_list_definition : list_definition\n    \n    conditional_primitives : primitive_disable_component\n                           | primitive_deceive_component\n                           | primitive_destroy_component\n                           | primitive_misplace_node\n                           | primitive_destroy_node\n                           | primitive_write_field\n                           | primitive_read_field\n                           | primitive_forward_packet\n                           | primitive_create_packet\n                           | primitive_inject_packet\n                           | primitive_clone_packet\n                           | primitive_drop_packet\n                           | primitive_expression\n    \n    primitive_disable_component : DISABLECOMPONENT LROUND node COMMA component RROUND\n    \n    primitive_deceive_component : DECEIVECOMPONENT LROUND node COMMA component COMMA value RROUND\n    \n    primitive_destroy_component : DESTROYCOMPONENT LROUND node COMMA component RROUND\n    \n    primitive_misplace_node : MISPLACENODE LROUND node COMMA position RROUND\n    \n    primitive_destroy_node : DESTROYNODE LROUND node RROUND\n    \n    primitive_write_field : WRITEFIELD LROUND packet COMMA path COMMA source RROUND\n                          | WRITEFIELD LROUND captured COMMA path COMMA source RROUND\n    \n    primitive_read_field : READFIELD LROUND destination COMMA packet COMMA path RROUND\n                         | READFIELD LROUND destination COMMA captured COMMA path RROUND\n    \n    primitive_forward_packet : FORWARDPACKET LROUND packet COMMA delay COMMA unit RROUND\n                             | FORWARDPACKET LROUND captured COMMA delay COMMA unit RROUND\n    \n    primitive_create_packet : CREATEPACKET LROUND packet COMMA protocol RROUND\n    \n    primitive_inject_packet : INJECTPACKET LROUND packet COMMA node COMMA direction COMMA delay COMMA unit RROUND\n    \n    primitive_clone_packet : CLONEPACKET LROUND packet COMMA packet RROUND\n                           | CLONEPACKET LROUND packet COMMA captured RROUND\n    \n    primitive_drop_packet : DROPPACKET LROUND packet RROUND\n                          | DROPPACKET LROUND captured RROUND\n    \n    primitive_expression : expression_assign\n    \n    expression_assign : IDENTIFIER ASSIGN expression\n    \n    expression_assign : IDENTIFIER ADDASSIGN expression\n                      | IDENTIFIER SUBASSIGN expression\n                      | IDENTIFIER MULASSIGN expression\n                      | IDENTIFIER DIVASSIGN expression\n                      | IDENTIFIER MODASSIGN expression\n    \n    expression : expression ADD expression\n               | expression SUB expression\n               | expression MUL expression\n               | expression DIV expression\n               | expression MOD expression\n               | expression EXP expression\n    \n    expression : SUB expression %prec UMINUS\n    \n    expression : LROUND expression RROUND\n    \n    expression : INTEGER\n    \n    expression : STRING\n    \n    expression : REAL\n    \n    expression : IDENTIFIER\n    \n    unit : US\n         | MS\n         | S\n    \n    node : identifier_variable_defined\n         | value_integer\n         | value_string\n         | value_real\n    \n    component : identifier_variable_defined\n              | value_integer\n              | value_string\n              | value_real\n    \n    value : identifier_variable_defined\n          | value_integer\n          | value_string\n          | value_real\n    \n    position : identifier_list_defined\n             | list_value\n    \n    packet : IDENTIFIER\n    \n    path : identifier_variable_defined\n         | value_integer\n         | value_string\n         | value_real\n    \n    source : identifier_variable_defined\n           | value_integer\n           | value_string\n           | value_real\n    \n    destination : IDENTIFIER\n    \n    delay : IDENTIFIER\n    \n    delay : value_integer\n          | value_real\n    \n    protocol : IDENTIFIER\n    \n    protocol : value_string\n    \n    direction : TX\n              | RX\n    \n    captured : CAPTURED\n    \n    identifier_variable_defined : IDENTIFIER\n    \n    value_integer : INTEGER\n    \n    value_string : STRING\n    \n    value_real : REAL\n    \n    identifier_list_defined : IDENTIFIER\n    \n    list_value : LBRACK list_sequence RBRACK\n    \n    variable_definition : variable_definition_integer\n                        | variable_definition_string\n                        | variable_definition_real\n    \n    variable_definition_integer : VARIABLE IDENTIFIER ASSIGN INTEGER\n    \n    variable_definition_string : VARIABLE IDENTIFIER ASSIGN STRING\n    \n    variable_definition_real : VARIABLE IDENTIFIER ASSIGN REAL\n    \n    filter_definition : FILTER IDENTIFIER ASSIGN filter_content\n    \n    filter_content : LROUND filter_content RROUND\n    \n    filter_content : filter_content filter_logical_operator filter_content\n    \n    filter_content : filter_basic_element filter_logical_operator filter_content\n    \n    filter_content : filter_content filter_logical_operator filter_basic_element\n    \n    filter_content : filter_basic_element filter_logical_operator filter_basic_element\n    \n    filter_content : filter_basic_element\n    \n    filter_basic_element : filter_operand filter_comparison_operator filter_operand\n    \n    filter_operand : INTEGER\n    \n    filter_operand : STRING\n    \n    filter_operand : REAL\n    \n    filter_operand : IDENTIFIER\n    \n    filter_comparison_operator : NOTEQUALTO\n                               | EQUALTO\n                               | LSEQTHN\n                               | GREQTHN\n                               | LSTHN\n                               | GRTHN\n    \n    filter_logical_operator : LAND\n                            | LOR\n    \n    list_definition : LIST IDENTIFIER ASSIGN LBRACK list_sequence RBRACK\n    \n    list_sequence : list_item COMMA list_sequence\n    \n    list_sequence : list_item\n    \n    list_item : INTEGER\n    \n    list_item : STRING\n    \n    list_item : REAL\n    \n    list_item : IDENTIFIER\n    '
+    
+_lr_action_items = {'SCENARIO':([0,],[3,]),'$end':([1,2,25,],[0,-1,-2,]),'LCURVY':([3,37,38,39,40,41,42,93,154,155,156,180,322,],[4,55,-150,-151,-152,56,57,113,177,178,179,237,327,]),'VARIABLE':([4,5,6,7,8,9,10,11,13,15,16,17,18,19,20,24,26,27,28,43,44,45,46,47,49,51,52,53,55,56,57,76,77,78,79,80,81,82,83,84,86,88,89,90,91,92,96,97,98,99,100,101,102,103,104,106,107,108,109,110,111,112,113,118,119,121,122,123,124,125,126,127,130,132,133,134,135,136,137,138,139,140,141,142,143,153,158,159,160,167,177,178,179,181,182,185,186,187,188,189,190,191,192,213,214,215,216,217,218,219,221,223,224,225,226,227,228,229,230,231,232,233,234,235,236,244,250,256,257,258,259,260,261,263,264,265,266,267,268,269,295,297,298,302,304,305,323,324,325,327,332,333,334,335,336,337,338,340,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,361,363,364,369,376,380,381,394,395,396,397,],[12,12,-3,-4,-5,-6,-7,-8,-11,-13,-14,-15,-191,-192,-193,12,-10,-12,-16,-194,-195,-196,-208,-197,-203,-205,-206,-207,85,85,85,85,-20,-21,-22,-23,-24,-25,-26,-27,-30,-32,-33,-34,-59,-86,85,85,-199,-201,-198,-202,-200,-204,-217,85,-17,-60,-87,-29,-31,-35,128,-18,-19,128,-37,-38,-39,-40,-41,-42,-45,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-131,128,-36,-44,-46,220,220,220,-149,-132,-146,-147,-148,-133,-134,-135,-136,-137,220,-64,-65,-66,-67,-68,-69,-72,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,220,220,-144,-118,220,-61,-71,-73,-62,-63,-138,-139,-140,-141,-142,-143,-145,-114,-116,-117,-125,-127,-128,-115,-119,-120,339,339,-89,-90,-91,-92,-93,-94,-97,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,339,-96,-98,-88,-126,-129,-130,-121,-122,-123,-124,]),'PACKET':([4,5,6,7,8,9,10,11,13,15,16,17,18,19,20,24,26,27,28,43,44,45,46,47,49,51,52,53,55,56,57,76,77,78,79,80,81,82,83,84,86,88,89,90,91,92,96,97,98,99,100,101,102,103,104,106,107,108,109,110,111,112,113,118,119,121,122,123,124,125,126,127,130,132,133,134,135,136,137,138,139,140,141,142,143,153,158,159,160,167,177,178,179,181,182,185,186,187,188,189,190,191,192,213,214,215,216,217,218,219,221,223,224,225,226,227,228,229,230,231,232,233,234,235,236,244,250,256,257,258,259,260,261,263,264,265,266,267,268,269,295,297,298,302,304,305,323,324,325,327,332,333,334,335,336,337,338,340,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,361,363,364,369,376,380,381,394,395,396,397,],[14,14,-3,-4,-5,-6,-7,-8,-11,-13,-14,-15,-191,-192,-193,14,-10,-12,-16,-194,-195,-196,-208,-197,-203,-205,-206,-207,87,87,87,87,-20,-21,-22,-23,-24,-25,-26,-27,-30,-32,-33,-34,-59,-86,87,87,-199,-201,-198,-202,-200,-204,-217,87,-17,-60,-87,-29,-31,-35,131,-18,-19,131,-37,-38,-39,-40,-41,-42,-45,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-131,131,-36,-44,-46,222,222,222,-149,-132,-146,-147,-148,-133,-134,-135,-136,-137,222,-64,-65,-66,-67,-68,-69,-72,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,222,222,-144,-118,222,-61,-71,-73,-62,-63,-138,-139,-140,-141,-142,-143,-145,-114,-116,-117,-125,-127,-128,-115,-119,-120,341,341,-89,-90,-91,-92,-93,-94,-97,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,341,-96,-98,-88,-126,-129,-130,-121,-122,-123,-124,]),'FILTER':([4,5,6,7,8,9,10,11,13,15,16,17,18,19,20,24,26,27,28,43,44,45,46,47,49,51,52,53,55,56,57,76,77,78,79,80,81,82,83,84,86,88,89,90,91,92,96,97,98,99,100,101,102,103,104,106,107,108,109,110,111,112,113,118,119,121,122,123,124,125,126,127,130,132,133,134,135,136,137,138,139,140,141,142,143,153,158,159,160,167,177,178,179,181,182,185,186,187,188,189,190,191,192,213,214,215,216,217,218,219,221,223,224,225,226,227,228,229,230,231,232,233,234,235,236,244,250,256,257,258,259,260,261,263,264,265,266,267,268,269,295,297,298,302,304,305,323,324,325,327,332,333,334,335,336,337,338,340,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,361,363,364,369,376,380,381,394,395,396,397,],[21,21,-3,-4,-5,-6,-7,-8,-11,-13,-14,-15,-191,-192,-193,21,-10,-12,-16,-194,-195,-196,-208,-197,-203,-205,-206,-207,21,21,21,21,-20,-21,-22,-23,-24,-25,-26,-27,-30,-32,-33,-34,-59,-86,21,21,-199,-201,-198,-202,-200,-204,-217,21,-17,-60,-87,-29,-31,-35,21,-18,-19,21,-37,-38,-39,-40,-41,-42,-45,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-131,21,-36,-44,-46,21,21,21,-149,-132,-146,-147,-148,-133,-134,-135,-136,-137,21,-64,-65,-66,-67,-68,-69,-72,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,21,21,-144,-118,21,-61,-71,-73,-62,-63,-138,-139,-140,-141,-142,-143,-145,-114,-116,-117,-125,-127,-128,-115,-119,-120,21,21,-89,-90,-91,-92,-93,-94,-97,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,21,-96,-98,-88,-126,-129,-130,-121,-122,-123,-124,]),'LIST':([4,5,6,7,8,9,10,11,13,15,16,17,18,19,20,24,26,27,28,43,44,45,46,47,49,51,52,53,55,56,57,76,77,78,79,80,81,82,83,84,86,88,89,90,91,92,96,97,98,99,100,101,102,103,104,106,107,108,109,110,111,112,113,118,119,121,122,123,124,125,126,127,130,132,133,134,135,136,137,138,139,140,141,142,143,153,158,159,160,167,177,178,179,181,182,185,186,187,188,189,190,191,192,213,214,215,216,217,218,219,221,223,224,225,226,227,228,229,230,231,232,233,234,235,236,244,250,256,257,258,259,260,261,263,264,265,266,267,268,269,295,297,298,302,304,305,323,324,325,327,332,333,334,335,336,337,338,340,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,361,363,364,369,376,380,381,394,395,396,397,],[22,22,-3,-4,-5,-6,-7,-8,-11,-13,-14,-15,-191,-192,-193,22,-10,-12,-16,-194,-195,-196,-208,-197,-203,-205,-206,-207,22,22,22,22,-20,-21,-22,-23,-24,-25,-26,-27,-30,-32,-33,-34,-59,-86,22,22,-199,-201,-198,-202,-200,-204,-217,22,-17,-60,-87,-29,-31,-35,22,-18,-19,22,-37,-38,-39,-40,-41,-42,-45,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-131,22,-36,-44,-46,22,22,22,-149,-132,-146,-147,-148,-133,-134,-135,-136,-137,22,-64,-65,-66,-67,-68,-69,-72,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,22,22,-144,-118,22,-61,-71,-73,-62,-63,-138,-139,-140,-141,-142,-143,-145,-114,-116,-117,-125,-127,-128,-115,-119,-120,22,22,-89,-90,-91,-92,-93,-94,-97,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,22,-96,-98,-88,-126,-129,-130,-121,-122,-123,-124,]),'FROM':([4,5,6,7,8,9,10,11,13,15,16,17,18,19,20,24,26,27,28,43,44,45,46,47,49,51,52,53,98,99,100,101,102,103,104,107,118,119,],[23,23,-3,-4,-5,-6,-7,-8,-11,-13,-14,23,-191,-192,-193,23,-10,-12,-16,-194,-195,-196,-208,-197,-203,-205,-206,-207,-199,-201,-198,-202,-200,-204,-217,-17,-18,-19,]),'RCURVY':([5,6,7,8,9,10,11,13,15,16,17,18,19,20,24,26,27,28,43,44,45,46,47,49,51,52,53,76,77,78,79,80,81,82,83,84,86,88,89,90,91,92,96,97,98,99,100,101,102,103,104,106,107,108,109,110,111,112,118,119,121,122,123,124,125,126,127,130,132,133,134,135,136,137,138,139,140,141,142,143,153,158,159,160,167,181,182,185,186,187,188,189,190,191,192,213,214,215,216,217,218,219,221,223,224,225,226,227,228,229,230,231,232,233,234,235,236,244,250,256,257,258,259,260,261,263,264,265,266,267,268,269,295,297,298,302,304,305,323,324,325,332,333,334,335,336,337,338,340,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,361,362,363,364,369,376,380,381,394,395,396,397,],[25,-3,-4,-5,-6,-7,-8,-11,-13,-14,-15,-191,-192,-193,-9,-10,-12,-16,-194,-195,-196,-208,-197,-203,-205,-206,-207,107,-20,-21,-22,-23,-24,-25,-26,-27,-30,-32,-33,-34,-59,-86,118,119,-199,-201,-198,-202,-200,-204,-217,-28,-17,-60,-87,-29,-31,-35,-18,-19,159,-37,-38,-39,-40,-41,-42,-45,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-131,-43,-36,-44,-46,-149,-132,-146,-147,-148,-133,-134,-135,-136,-137,257,-64,-65,-66,-67,-68,-69,-72,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,260,261,-144,-118,-70,-61,-71,-73,-62,-63,-138,-139,-140,-141,-142,-143,-145,-114,-116,-117,-125,-127,-128,-115,-119,-120,362,-89,-90,-91,-92,-93,-94,-97,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-95,369,-96,-98,-88,-126,-129,-130,-121,-122,-123,-124,]),'IDENTIFIER':([12,14,18,19,20,21,22,23,35,43,44,45,46,47,48,49,51,52,53,54,58,59,60,62,63,64,65,66,67,68,69,85,87,94,98,99,100,101,102,103,104,105,113,121,122,123,124,125,126,127,128,130,131,132,133,134,135,136,137,138,139,140,141,142,143,153,157,158,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,181,182,183,184,185,186,187,188,189,190,191,192,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,238,239,240,241,242,243,244,246,247,248,249,250,251,252,253,254,255,256,258,259,263,264,265,266,267,268,269,281,295,296,297,298,300,301,302,304,305,306,323,324,325,326,327,332,333,334,335,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,361,363,364,365,366,367,376,377,378,379,380,381,386,387,394,395,396,397,],[26,27,-191,-192,-193,29,30,31,46,-194,-195,-196,-208,-197,46,-203,-205,-206,-207,70,46,-215,-216,46,46,-209,-210,-211,-212,-213,-214,110,111,114,-199,-201,-198,-202,-200,-204,-217,70,129,129,-37,-38,-39,-40,-41,-42,160,-45,167,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-131,180,129,-44,181,181,181,181,181,181,-46,198,198,198,198,198,208,208,208,208,129,129,129,-149,-132,181,181,-146,-147,-148,-133,-134,-135,-136,-137,129,-64,-65,-66,-67,-68,-69,258,-72,259,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,129,129,181,181,181,181,181,181,-144,198,198,198,280,-118,198,198,289,198,208,129,-71,-73,-138,-139,-140,-141,-142,-143,-145,70,-114,198,-116,-117,198,198,-125,-127,-128,322,-115,-119,-120,329,129,129,-89,-90,-91,-92,-93,-94,363,-97,364,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,129,-96,-98,371,208,208,-126,208,329,329,-129,-130,198,198,-121,-122,-123,-124,]),'ONCE':([18,19,20,43,44,45,46,47,49,51,52,53,55,56,57,76,77,78,79,80,81,82,83,84,86,88,89,90,91,92,96,97,98,99,100,101,102,103,104,106,108,109,110,111,112,159,257,260,261,369,],[-191,-192,-193,-194,-195,-196,-208,-197,-203,-205,-206,-207,93,93,93,93,-20,-21,-22,-23,-24,-25,-26,-27,-30,-32,-33,93,-59,-86,93,93,-199,-201,-198,-202,-200,-204,-217,93,-60,-87,-29,-31,-35,-36,-61,-62,-63,-88,]),'EVERY':([18,19,20,43,44,45,46,47,49,51,52,53,55,56,57,76,77,78,79,80,81,82,83,84,86,88,89,90,91,92,96,97,98,99,100,101,102,103,104,106,108,109,110,111,112,159,257,260,261,369,],[-191,-192,-193,-194,-195,-196,-208,-197,-203,-205,-206,-207,94,94,94,94,-20,-21,-22,-23,-24,-25,94,-27,-30,-32,-33,-34,-59,-86,94,94,-199,-201,-198,-202,-200,-204,-217,94,94,-87,-29,-31,-35,-36,-61,-62,-63,-88,]),'FOR':([18,19,20,43,44,45,46,47,49,51,52,53,55,56,57,76,77,78,79,80,81,82,83,84,86,88,89,90,91,92,96,97,98,99,100,101,102,103,104,106,108,109,110,111,112,159,237,257,260,261,369,],[-191,-192,-193,-194,-195,-196,-208,-197,-203,-205,-206,-207,95,95,95,95,-20,-21,-22,-23,-24,-25,-26,95,-30,-32,-33,-34,-59,-86,95,95,-199,-201,-198,-202,-200,-204,-217,95,-60,95,-29,-31,-35,-36,262,-61,-62,-63,-88,]),'DISABLECOMPONENT':([18,19,20,43,44,45,46,47,49,51,52,53,98,99,100,101,102,103,104,113,121,122,123,124,125,126,127,130,132,133,134,135,136,137,138,139,140,141,142,143,153,158,160,167,177,178,179,181,182,185,186,187,188,189,190,191,192,213,214,215,216,217,218,219,221,223,224,225,226,227,228,229,230,231,232,233,234,235,236,244,250,256,258,259,263,264,265,266,267,268,269,295,297,298,302,304,305,323,324,325,327,332,333,334,335,336,337,338,340,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,361,363,364,376,380,381,394,395,396,397,],[-191,-192,-193,-194,-195,-196,-208,-197,-203,-205,-206,-207,-199,-201,-198,-202,-200,-204,-217,144,144,-37,-38,-39,-40,-41,-42,-45,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-131,144,-44,-46,144,144,144,-149,-132,-146,-147,-148,-133,-134,-135,-136,-137,144,-64,-65,-66,-67,-68,-69,-72,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,144,144,-144,-118,144,-71,-73,-138,-139,-140,-141,-142,-143,-145,-114,-116,-117,-125,-127,-128,-115,-119,-120,144,144,-89,-90,-91,-92,-93,-94,-97,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,144,-96,-98,-126,-129,-130,-121,-122,-123,-124,]),'DECEIVECOMPONENT':([18,19,20,43,44,45,46,47,49,51,52,53,98,99,100,101,102,103,104,113,121,122,123,124,125,126,127,130,132,133,134,135,136,137,138,139,140,141,142,143,153,158,160,167,177,178,179,181,182,185,186,187,188,189,190,191,192,213,214,215,216,217,218,219,221,223,224,225,226,227,228,229,230,231,232,233,234,235,236,244,250,256,258,259,263,264,265,266,267,268,269,295,297,298,302,304,305,323,324,325,327,332,333,334,335,336,337,338,340,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,361,363,364,376,380,381,394,395,396,397,],[-191,-192,-193,-194,-195,-196,-208,-197,-203,-205,-206,-207,-199,-201,-198,-202,-200,-204,-217,145,145,-37,-38,-39,-40,-41,-42,-45,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-131,145,-44,-46,145,145,145,-149,-132,-146,-147,-148,-133,-134,-135,-136,-137,145,-64,-65,-66,-67,-68,-69,-72,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,145,145,-144,-118,145,-71,-73,-138,-139,-140,-141,-142,-143,-145,-114,-116,-117,-125,-127,-128,-115,-119,-120,145,145,-89,-90,-91,-92,-93,-94,-97,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,145,-96,-98,-126,-129,-130,-121,-122,-123,-124,]),'DESTROYCOMPONENT':([18,19,20,43,44,45,46,47,49,51,52,53,98,99,100,101,102,103,104,113,121,122,123,124,125,126,127,130,132,133,134,135,136,137,138,139,140,141,142,143,153,158,160,167,177,178,179,181,182,185,186,187,188,189,190,191,192,213,214,215,216,217,218,219,221,223,224,225,226,227,228,229,230,231,232,233,234,235,236,244,250,256,258,259,263,264,265,266,267,268,269,295,297,298,302,304,305,323,324,325,327,332,333,334,335,336,337,338,340,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,361,363,364,376,380,381,394,395,396,397,],[-191,-192,-193,-194,-195,-196,-208,-197,-203,-205,-206,-207,-199,-201,-198,-202,-200,-204,-217,146,146,-37,-38,-39,-40,-41,-42,-45,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-131,146,-44,-46,146,146,146,-149,-132,-146,-147,-148,-133,-134,-135,-136,-137,146,-64,-65,-66,-67,-68,-69,-72,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,146,146,-144,-118,146,-71,-73,-138,-139,-140,-141,-142,-143,-145,-114,-116,-117,-125,-127,-128,-115,-119,-120,146,146,-89,-90,-91,-92,-93,-94,-97,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,146,-96,-98,-126,-129,-130,-121,-122,-123,-124,]),'MISPLACENODE':([18,19,20,43,44,45,46,47,49,51,52,53,98,99,100,101,102,103,104,113,121,122,123,124,125,126,127,130,132,133,134,135,136,137,138,139,140,141,142,143,153,158,160,167,177,178,179,181,182,185,186,187,188,189,190,191,192,213,214,215,216,217,218,219,221,223,224,225,226,227,228,229,230,231,232,233,234,235,236,244,250,256,258,259,263,264,265,266,267,268,269,295,297,298,302,304,305,323,324,325,327,332,333,334,335,336,337,338,340,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,361,363,364,376,380,381,394,395,396,397,],[-191,-192,-193,-194,-195,-196,-208,-197,-203,-205,-206,-207,-199,-201,-198,-202,-200,-204,-217,147,147,-37,-38,-39,-40,-41,-42,-45,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-131,147,-44,-46,147,147,147,-149,-132,-146,-147,-148,-133,-134,-135,-136,-137,147,-64,-65,-66,-67,-68,-69,-72,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,147,147,-144,-118,147,-71,-73,-138,-139,-140,-141,-142,-143,-145,-114,-116,-117,-125,-127,-128,-115,-119,-120,147,147,-89,-90,-91,-92,-93,-94,-97,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,147,-96,-98,-126,-129,-130,-121,-122,-123,-124,]),'DESTROYNODE':([18,19,20,43,44,45,46,47,49,51,52,53,98,99,100,101,102,103,104,113,121,122,123,124,125,126,127,130,132,133,134,135,136,137,138,139,140,141,142,143,153,158,160,167,177,178,179,181,182,185,186,187,188,189,190,191,192,213,214,215,216,217,218,219,221,223,224,225,226,227,228,229,230,231,232,233,234,235,236,244,250,256,258,259,263,264,265,266,267,268,269,295,297,298,302,304,305,323,324,325,327,332,333,334,335,336,337,338,340,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,361,363,364,376,380,381,394,395,396,397,],[-191,-192,-193,-194,-195,-196,-208,-197,-203,-205,-206,-207,-199,-201,-198,-202,-200,-204,-217,148,148,-37,-38,-39,-40,-41,-42,-45,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-131,148,-44,-46,148,148,148,-149,-132,-146,-147,-148,-133,-134,-135,-136,-137,148,-64,-65,-66,-67,-68,-69,-72,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,148,148,-144,-118,148,-71,-73,-138,-139,-140,-141,-142,-143,-145,-114,-116,-117,-125,-127,-128,-115,-119,-120,148,148,-89,-90,-91,-92,-93,-94,-97,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,148,-96,-98,-126,-129,-130,-121,-122,-123,-124,]),'WRITEFIELD':([18,19,20,43,44,45,46,47,49,51,52,53,98,99,100,101,102,103,104,113,121,122,123,124,125,126,127,130,132,133,134,135,136,137,138,139,140,141,142,143,153,158,160,167,177,178,179,181,182,185,186,187,188,189,190,191,192,213,214,215,216,217,218,219,221,223,224,225,226,227,228,229,230,231,232,233,234,235,236,244,250,256,258,259,263,264,265,266,267,268,269,295,297,298,302,304,305,323,324,325,327,332,333,334,335,336,337,338,340,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,361,363,364,376,380,381,394,395,396,397,],[-191,-192,-193,-194,-195,-196,-208,-197,-203,-205,-206,-207,-199,-201,-198,-202,-200,-204,-217,149,149,-37,-38,-39,-40,-41,-42,-45,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-131,149,-44,-46,149,149,149,-149,-132,-146,-147,-148,-133,-134,-135,-136,-137,149,-64,-65,-66,-67,-68,-69,-72,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,149,149,-144,-118,149,-71,-73,-138,-139,-140,-141,-142,-143,-145,-114,-116,-117,-125,-127,-128,-115,-119,-120,149,149,-89,-90,-91,-92,-93,-94,-97,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,149,-96,-98,-126,-129,-130,-121,-122,-123,-124,]),'CREATEPACKET':([18,19,20,43,44,45,46,47,49,51,52,53,98,99,100,101,102,103,104,113,121,122,123,124,125,126,127,130,132,133,134,135,136,137,138,139,140,141,142,143,153,158,160,167,177,178,179,181,182,185,186,187,188,189,190,191,192,213,214,215,216,217,218,219,221,223,224,225,226,227,228,229,230,231,232,233,234,235,236,244,250,256,258,259,263,264,265,266,267,268,269,295,297,298,302,304,305,323,324,325,327,332,333,334,335,336,337,338,340,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,361,363,364,376,380,381,394,395,396,397,],[-191,-192,-193,-194,-195,-196,-208,-197,-203,-205,-206,-207,-199,-201,-198,-202,-200,-204,-217,150,150,-37,-38,-39,-40,-41,-42,-45,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-131,150,-44,-46,150,150,150,-149,-132,-146,-147,-148,-133,-134,-135,-136,-137,150,-64,-65,-66,-67,-68,-69,-72,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,150,150,-144,-118,150,-71,-73,-138,-139,-140,-141,-142,-143,-145,-114,-116,-117,-125,-127,-128,-115,-119,-120,150,150,-89,-90,-91,-92,-93,-94,-97,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,150,-96,-98,-126,-129,-130,-121,-122,-123,-124,]),'INJECTPACKET':([18,19,20,43,44,45,46,47,49,51,52,53,98,99,100,101,102,103,104,113,121,122,123,124,125,126,127,130,132,133,134,135,136,137,138,139,140,141,142,143,153,158,160,167,177,178,179,181,182,185,186,187,188,189,190,191,192,213,214,215,216,217,218,219,221,223,224,225,226,227,228,229,230,231,232,233,234,235,236,244,250,256,258,259,263,264,265,266,267,268,269,295,297,298,302,304,305,323,324,325,327,332,333,334,335,336,337,338,340,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,361,363,364,376,380,381,394,395,396,397,],[-191,-192,-193,-194,-195,-196,-208,-197,-203,-205,-206,-207,-199,-201,-198,-202,-200,-204,-217,151,151,-37,-38,-39,-40,-41,-42,-45,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-131,151,-44,-46,151,151,151,-149,-132,-146,-147,-148,-133,-134,-135,-136,-137,151,-64,-65,-66,-67,-68,-69,-72,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,151,151,-144,-118,151,-71,-73,-138,-139,-140,-141,-142,-143,-145,-114,-116,-117,-125,-127,-128,-115,-119,-120,151,151,-89,-90,-91,-92,-93,-94,-97,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,151,-96,-98,-126,-129,-130,-121,-122,-123,-124,]),'CLONEPACKET':([18,19,20,43,44,45,46,47,49,51,52,53,98,99,100,101,102,103,104,113,121,122,123,124,125,126,127,130,132,133,134,135,136,137,138,139,140,141,142,143,153,158,160,167,177,178,179,181,182,185,186,187,188,189,190,191,192,213,214,215,216,217,218,219,221,223,224,225,226,227,228,229,230,231,232,233,234,235,236,244,250,256,258,259,263,264,265,266,267,268,269,295,297,298,302,304,305,323,324,325,327,332,333,334,335,336,337,338,340,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,361,363,364,376,380,381,394,395,396,397,],[-191,-192,-193,-194,-195,-196,-208,-197,-203,-205,-206,-207,-199,-201,-198,-202,-200,-204,-217,152,152,-37,-38,-39,-40,-41,-42,-45,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-131,152,-44,-46,152,152,152,-149,-132,-146,-147,-148,-133,-134,-135,-136,-137,152,-64,-65,-66,-67,-68,-69,-72,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,152,152,-144,-118,152,-71,-73,-138,-139,-140,-141,-142,-143,-145,-114,-116,-117,-125,-127,-128,-115,-119,-120,152,152,-89,-90,-91,-92,-93,-94,-97,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,152,-96,-98,-126,-129,-130,-121,-122,-123,-124,]),'READFIELD':([18,19,20,43,44,45,46,47,49,51,52,53,98,99,100,101,102,103,104,153,181,182,185,186,187,188,189,190,191,192,244,250,263,264,265,266,267,268,269,295,297,298,302,304,305,323,324,325,327,332,333,334,335,336,337,338,340,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,361,363,364,376,380,381,394,395,396,397,],[-191,-192,-193,-194,-195,-196,-208,-197,-203,-205,-206,-207,-199,-201,-198,-202,-200,-204,-217,-131,-149,-132,-146,-147,-148,-133,-134,-135,-136,-137,-144,-118,-138,-139,-140,-141,-142,-143,-145,-114,-116,-117,-125,-127,-128,-115,-119,-120,357,357,-89,-90,-91,-92,-93,-94,-97,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,357,-96,-98,-126,-129,-130,-121,-122,-123,-124,]),'FORWARDPACKET':([18,19,20,43,44,45,46,47,49,51,52,53,98,99,100,101,102,103,104,153,181,182,185,186,187,188,189,190,191,192,244,250,263,264,265,266,267,268,269,295,297,298,302,304,305,323,324,325,327,332,333,334,335,336,337,338,340,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,361,363,364,376,380,381,394,395,396,397,],[-191,-192,-193,-194,-195,-196,-208,-197,-203,-205,-206,-207,-199,-201,-198,-202,-200,-204,-217,-131,-149,-132,-146,-147,-148,-133,-134,-135,-136,-137,-144,-118,-138,-139,-140,-141,-142,-143,-145,-114,-116,-117,-125,-127,-128,-115,-119,-120,358,358,-89,-90,-91,-92,-93,-94,-97,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,358,-96,-98,-126,-129,-130,-121,-122,-123,-124,]),'DROPPACKET':([18,19,20,43,44,45,46,47,49,51,52,53,98,99,100,101,102,103,104,153,181,182,185,186,187,188,189,190,191,192,244,250,263,264,265,266,267,268,269,295,297,298,302,304,305,323,324,325,327,332,333,334,335,336,337,338,340,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,361,363,364,376,380,381,394,395,396,397,],[-191,-192,-193,-194,-195,-196,-208,-197,-203,-205,-206,-207,-199,-201,-198,-202,-200,-204,-217,-131,-149,-132,-146,-147,-148,-133,-134,-135,-136,-137,-144,-118,-138,-139,-140,-141,-142,-143,-145,-114,-116,-117,-125,-127,-128,-115,-119,-120,359,359,-89,-90,-91,-92,-93,-94,-97,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,359,-96,-98,-126,-129,-130,-121,-122,-123,-124,]),'INTEGER':([23,34,35,48,54,58,59,60,62,63,64,65,66,67,68,69,94,105,161,162,163,164,165,166,168,169,170,171,172,183,184,238,239,240,241,242,243,246,247,248,251,252,254,281,296,300,301,326,378,379,386,387,],[32,43,51,51,73,51,-215,-216,51,51,-209,-210,-211,-212,-213,-214,115,73,185,185,185,185,185,185,199,199,199,199,199,185,185,185,185,185,185,185,185,199,199,199,199,199,199,73,199,199,199,199,199,199,199,199,]),'REAL':([23,34,35,48,54,58,59,60,62,63,64,65,66,67,68,69,94,105,161,162,163,164,165,166,168,169,170,171,172,183,184,238,239,240,241,242,243,246,247,248,251,252,254,281,296,300,301,326,378,379,386,387,],[33,45,53,53,75,53,-215,-216,53,53,-209,-210,-211,-212,-213,-214,116,75,187,187,187,187,187,187,201,201,201,201,201,187,187,187,187,187,187,187,187,201,201,201,201,201,201,75,201,201,201,201,201,201,201,201,]),'ASSIGN':([26,29,30,110,129,160,258,363,],[34,35,36,34,161,34,34,34,]),'US':([31,32,33,114,115,116,360,388,389,],[38,38,38,38,38,38,38,38,38,]),'MS':([31,32,33,114,115,116,360,388,389,],[39,39,39,39,39,39,39,39,39,]),'S':([31,32,33,114,115,116,360,388,389,],[40,40,40,40,40,40,40,40,40,]),'STRING':([34,35,48,54,58,59,60,62,63,64,65,66,67,68,69,105,161,162,163,164,165,166,168,169,170,171,172,183,184,238,239,240,241,242,243,246,247,248,251,252,253,254,281,296,300,301,386,387,],[44,52,52,74,52,-215,-216,52,52,-209,-210,-211,-212,-213,-214,74,186,186,186,186,186,186,200,200,200,200,200,186,186,186,186,186,186,186,186,200,200,200,200,200,200,200,74,200,200,200,200,200,]),'LROUND':([35,48,58,59,60,62,144,145,146,147,148,149,150,151,152,161,162,163,164,165,166,183,184,238,239,240,241,242,243,357,358,359,],[48,48,48,-215,-216,48,168,169,170,171,172,173,174,175,176,184,184,184,184,184,184,184,184,184,184,184,184,184,184,365,366,367,]),'LBRACK':([36,249,],[54,281,]),'RROUND':([38,39,40,46,49,51,52,53,61,98,99,100,101,102,103,181,185,186,187,194,195,196,197,198,199,200,201,205,208,209,244,245,263,264,265,266,267,268,269,270,271,272,273,274,276,277,278,279,280,283,284,285,286,288,289,290,292,293,307,308,309,310,311,312,313,314,315,316,317,318,368,374,375,390,391,392,393,],[-150,-151,-152,-208,-203,-205,-206,-207,100,-199,-201,-198,-202,-200,-204,-149,-146,-147,-148,-153,-154,-155,-156,-185,-186,-187,-188,250,-167,-184,-144,269,-138,-139,-140,-141,-142,-143,-145,295,-157,-158,-159,-160,297,298,-165,-166,-189,-168,-169,-170,-171,302,-180,-181,304,305,323,-161,-162,-163,-164,-190,324,-172,-173,-174,-175,325,376,380,381,394,395,396,397,]),'NOTEQUALTO':([46,50,51,52,53,],[-208,64,-205,-206,-207,]),'EQUALTO':([46,50,51,52,53,],[-208,65,-205,-206,-207,]),'LSEQTHN':([46,50,51,52,53,],[-208,66,-205,-206,-207,]),'GREQTHN':([46,50,51,52,53,],[-208,67,-205,-206,-207,]),'LSTHN':([46,50,51,52,53,],[-208,68,-205,-206,-207,]),'GRTHN':([46,50,51,52,53,],[-208,69,-205,-206,-207,]),'LAND':([46,47,49,51,52,53,61,98,99,100,101,102,103,],[-208,59,59,-205,-206,-207,59,59,59,-198,59,59,-204,]),'LOR':([46,47,49,51,52,53,61,98,99,100,101,102,103,],[-208,60,60,-205,-206,-207,60,60,60,-198,60,60,-204,]),'COMMA':([70,72,73,74,75,193,194,195,196,197,198,199,200,201,202,203,204,206,207,208,209,210,211,212,271,272,273,274,275,282,283,284,285,286,287,291,319,320,321,328,329,330,331,370,371,372,373,382,383,384,385,],[-223,105,-220,-221,-222,246,-153,-154,-155,-156,-185,-186,-187,-188,247,248,249,251,252,-167,-184,253,254,255,-157,-158,-159,-160,296,300,-168,-169,-170,-171,301,303,326,-182,-183,360,-177,-178,-179,377,-176,378,379,386,387,388,389,]),'RBRACK':([70,71,72,73,74,75,120,299,],[-223,104,-219,-220,-221,-222,-218,312,]),'NODES':([95,],[117,]),'IN':([117,],[157,]),'ADDASSIGN':([129,],[162,]),'SUBASSIGN':([129,],[163,]),'MULASSIGN':([129,],[164,]),'DIVASSIGN':([129,],[165,]),'MODASSIGN':([129,],[166,]),'SUB':([161,162,163,164,165,166,181,182,183,184,185,186,187,188,189,190,191,192,238,239,240,241,242,243,244,245,263,264,265,266,267,268,269,],[183,183,183,183,183,183,-149,239,183,183,-146,-147,-148,239,239,239,239,239,183,183,183,183,183,183,-144,239,-138,-139,-140,-141,239,-143,-145,]),'CAPTURED':([173,255,366,367,377,],[209,209,209,209,209,]),'ADD':([181,182,185,186,187,188,189,190,191,192,244,245,263,264,265,266,267,268,269,],[-149,238,-146,-147,-148,238,238,238,238,238,-144,238,-138,-139,-140,-141,238,-143,-145,]),'MUL':([181,182,185,186,187,188,189,190,191,192,244,245,263,264,265,266,267,268,269,],[-149,240,-146,-147,-148,240,240,240,240,240,-144,240,240,240,-140,-141,240,-143,-145,]),'DIV':([181,182,185,186,187,188,189,190,191,192,244,245,263,264,265,266,267,268,269,],[-149,241,-146,-147,-148,241,241,241,241,241,-144,241,241,241,-140,-141,241,-143,-145,]),'MOD':([181,182,185,186,187,188,189,190,191,192,244,245,263,264,265,266,267,268,269,],[-149,242,-146,-147,-148,242,242,242,242,242,-144,242,-138,-139,-140,-141,242,-143,-145,]),'EXP':([181,182,185,186,187,188,189,190,191,192,244,245,263,264,265,266,267,268,269,],[-149,243,-146,-147,-148,243,243,243,243,243,-144,243,243,243,243,243,243,-143,-145,]),'PACKETS':([262,],[294,]),'MATCHING':([294,],[306,]),'TX':([303,],[320,]),'RX':([303,],[321,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'entry':([0,],[1,]),'scenario':([0,],[2,]),'scenario_content':([4,5,24,],[5,24,24,]),'scenario_variable_declaration':([4,5,24,],[6,6,6,]),'scenario_variable_definition':([4,5,24,],[7,7,7,]),'scenario_packet_declaration':([4,5,24,],[8,8,8,]),'scenario_filter_definition':([4,5,24,],[9,9,9,]),'scenario_list_definition':([4,5,24,],[10,10,10,]),'compounds':([4,5,17,24,],[11,11,28,11,]),'variable_definition':([4,5,24,55,56,57,76,96,97,106,113,121,158,177,178,179,213,235,236,256,327,332,361,],[13,13,13,86,86,86,86,86,86,86,130,130,130,221,221,221,221,221,221,221,340,340,340,]),'filter_definition':([4,5,24,55,56,57,76,96,97,106,113,121,158,177,178,179,213,235,236,256,327,332,361,],[15,15,15,88,88,88,88,88,88,88,132,132,132,223,223,223,223,223,223,223,342,342,342,]),'list_definition':([4,5,24,55,56,57,76,96,97,106,113,121,158,177,178,179,213,235,236,256,327,332,361,],[16,16,16,89,89,89,89,89,89,89,133,133,133,224,224,224,224,224,224,224,343,343,343,]),'compound':([4,5,17,24,],[17,17,17,17,]),'variable_definition_integer':([4,5,24,55,56,57,76,96,97,106,113,121,158,177,178,179,213,235,236,256,327,332,361,],[18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,]),'variable_definition_string':([4,5,24,55,56,57,76,96,97,106,113,121,158,177,178,179,213,235,236,256,327,332,361,],[19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,]),'variable_definition_real':([4,5,24,55,56,57,76,96,97,106,113,121,158,177,178,179,213,235,236,256,327,332,361,],[20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,]),'unit':([31,32,33,114,115,116,360,388,389,],[37,41,42,154,155,156,368,392,393,]),'filter_content':([35,48,58,62,],[47,61,98,102,]),'filter_basic_element':([35,48,58,62,],[49,49,99,101,]),'filter_operand':([35,48,58,62,63,],[50,50,50,50,103,]),'filter_logical_operator':([47,49,61,98,99,101,102,],[58,62,58,58,62,62,58,]),'filter_comparison_operator':([50,],[63,]),'list_sequence':([54,105,281,],[71,120,299,]),'list_item':([54,105,281,],[72,72,72,]),'compound_content':([55,56,57,76,96,97,106,],[76,96,97,106,106,106,106,]),'compound_variable_declaration':([55,56,57,76,96,97,106,],[77,77,77,77,77,77,77,]),'compound_variable_definition':([55,56,57,76,96,97,106,],[78,78,78,78,78,78,78,]),'compound_packet_declaration':([55,56,57,76,96,97,106,],[79,79,79,79,79,79,79,]),'compound_filter_definition':([55,56,57,76,96,97,106,],[80,80,80,80,80,80,80,]),'compound_list_definition':([55,56,57,76,96,97,106,],[81,81,81,81,81,81,81,]),'onces':([55,56,57,76,90,96,97,106,],[82,82,82,82,112,82,82,82,]),'periodics':([55,56,57,76,83,96,97,106,108,],[83,83,83,83,108,83,83,83,108,]),'conditionals':([55,56,57,76,84,96,97,106,109,],[84,84,84,84,109,84,84,84,109,]),'once':([55,56,57,76,90,96,97,106,],[90,90,90,90,90,90,90,90,]),'periodic':([55,56,57,76,83,96,97,106,108,],[91,91,91,91,91,91,91,91,91,]),'conditional':([55,56,57,76,84,96,97,106,109,],[92,92,92,92,92,92,92,92,92,]),'once_content':([113,121,158,],[121,158,158,]),'once_variable_declaration':([113,121,158,],[122,122,122,]),'once_variable_definition':([113,121,158,],[123,123,123,]),'once_packet_declaration':([113,121,158,],[124,124,124,]),'once_filter_definition':([113,121,158,],[125,125,125,]),'once_list_definition':([113,121,158,],[126,126,126,]),'once_primitives':([113,121,158,],[127,127,127,]),'primitive_disable_component':([113,121,158,177,178,179,213,235,236,256,327,332,361,],[134,134,134,225,225,225,225,225,225,225,344,344,344,]),'primitive_deceive_component':([113,121,158,177,178,179,213,235,236,256,327,332,361,],[135,135,135,226,226,226,226,226,226,226,345,345,345,]),'primitive_destroy_component':([113,121,158,177,178,179,213,235,236,256,327,332,361,],[136,136,136,227,227,227,227,227,227,227,346,346,346,]),'primitive_misplace_node':([113,121,158,177,178,179,213,235,236,256,327,332,361,],[137,137,137,228,228,228,228,228,228,228,347,347,347,]),'primitive_destroy_node':([113,121,158,177,178,179,213,235,236,256,327,332,361,],[138,138,138,229,229,229,229,229,229,229,348,348,348,]),'primitive_write_field':([113,121,158,177,178,179,213,235,236,256,327,332,361,],[139,139,139,230,230,230,230,230,230,230,349,349,349,]),'primitive_create_packet':([113,121,158,177,178,179,213,235,236,256,327,332,361,],[140,140,140,231,231,231,231,231,231,231,352,352,352,]),'primitive_inject_packet':([113,121,158,177,178,179,213,235,236,256,327,332,361,],[141,141,141,232,232,232,232,232,232,232,353,353,353,]),'primitive_clone_packet':([113,121,158,177,178,179,213,235,236,256,327,332,361,],[142,142,142,233,233,233,233,233,233,233,354,354,354,]),'primitive_expression':([113,121,158,177,178,179,213,235,236,256,327,332,361,],[143,143,143,234,234,234,234,234,234,234,356,356,356,]),'expression_assign':([113,121,158,177,178,179,213,235,236,256,327,332,361,],[153,153,153,153,153,153,153,153,153,153,153,153,153,]),'expression':([161,162,163,164,165,166,183,184,238,239,240,241,242,243,],[182,188,189,190,191,192,244,245,263,264,265,266,267,268,]),'node':([168,169,170,171,172,254,],[193,202,203,204,205,291,]),'identifier_variable_defined':([168,169,170,171,172,246,247,248,251,252,254,296,300,301,386,387,],[194,194,194,194,194,271,271,271,283,283,194,308,314,314,283,283,]),'value_integer':([168,169,170,171,172,246,247,248,251,252,254,296,300,301,326,378,379,386,387,],[195,195,195,195,195,272,272,272,284,284,195,309,315,315,330,330,330,284,284,]),'value_string':([168,169,170,171,172,246,247,248,251,252,253,254,296,300,301,386,387,],[196,196,196,196,196,273,273,273,285,285,290,196,310,316,316,285,285,]),'value_real':([168,169,170,171,172,246,247,248,251,252,254,296,300,301,326,378,379,386,387,],[197,197,197,197,197,274,274,274,286,286,197,311,317,317,331,331,331,286,286,]),'packet':([173,174,175,176,255,366,367,377,],[206,210,211,212,292,372,374,382,]),'captured':([173,255,366,367,377,],[207,293,373,375,383,]),'periodic_content':([177,178,179,213,235,236,256,],[213,235,236,256,256,256,256,]),'periodic_variable_declaration':([177,178,179,213,235,236,256,],[214,214,214,214,214,214,214,]),'periodic_variable_definition':([177,178,179,213,235,236,256,],[215,215,215,215,215,215,215,]),'periodic_packet_declaration':([177,178,179,213,235,236,256,],[216,216,216,216,216,216,216,]),'periodic_filter_definition':([177,178,179,213,235,236,256,],[217,217,217,217,217,217,217,]),'periodic_list_definition':([177,178,179,213,235,236,256,],[218,218,218,218,218,218,218,]),'periodic_primitives':([177,178,179,213,235,236,256,],[219,219,219,219,219,219,219,]),'component':([246,247,248,],[270,275,276,]),'position':([249,],[277,]),'identifier_list_defined':([249,],[278,]),'list_value':([249,],[279,]),'path':([251,252,386,387,],[282,287,390,391,]),'protocol':([253,],[288,]),'value':([296,],[307,]),'source':([300,301,],[313,318,]),'direction':([303,],[319,]),'delay':([326,378,379,],[328,384,385,]),'conditional_content':([327,332,361,],[332,361,361,]),'conditional_variable_declaration':([327,332,361,],[333,333,333,]),'conditional_variable_definition':([327,332,361,],[334,334,334,]),'conditional_packet_declaration':([327,332,361,],[335,335,335,]),'conditional_filter_definition':([327,332,361,],[336,336,336,]),'conditional_list_definition':([327,332,361,],[337,337,337,]),'conditional_primitives':([327,332,361,],[338,338,338,]),'primitive_read_field':([327,332,361,],[350,350,350,]),'primitive_forward_packet':([327,332,361,],[351,351,351,]),'primitive_drop_packet':([327,332,361,],[355,355,355,]),'destination':([365,],[370,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> entry","S'",1,None,None,None),
+  ('entry -> scenario','entry',1,'p_entry','parser.py',45),
+  ('scenario -> SCENARIO LCURVY scenario_content RCURVY','scenario',4,'p_scenario','parser.py',57),
+  ('scenario_content -> scenario_variable_declaration','scenario_content',1,'p_scenario_content','parser.py',70),
+  ('scenario_content -> scenario_variable_definition','scenario_content',1,'p_scenario_content','parser.py',71),
+  ('scenario_content -> scenario_packet_declaration','scenario_content',1,'p_scenario_content','parser.py',72),
+  ('scenario_content -> scenario_filter_definition','scenario_content',1,'p_scenario_content','parser.py',73),
+  ('scenario_content -> scenario_list_definition','scenario_content',1,'p_scenario_content','parser.py',74),
+  ('scenario_content -> compounds','scenario_content',1,'p_scenario_content','parser.py',75),
+  ('scenario_content -> scenario_content scenario_content','scenario_content',2,'p_scenario_content','parser.py',76),
+  ('scenario_variable_declaration -> VARIABLE IDENTIFIER','scenario_variable_declaration',2,'p_scenario_variable_declaration','parser.py',83),
+  ('scenario_variable_definition -> variable_definition','scenario_variable_definition',1,'p_scenario_variable_definition','parser.py',93),
+  ('scenario_packet_declaration -> PACKET IDENTIFIER','scenario_packet_declaration',2,'p_scenario_packet_declaration','parser.py',101),
+  ('scenario_filter_definition -> filter_definition','scenario_filter_definition',1,'p_scenario_filter_definition','parser.py',111),
+  ('scenario_list_definition -> list_definition','scenario_list_definition',1,'p_scenario_list_definition','parser.py',119),
+  ('compounds -> compound','compounds',1,'p_compounds','parser.py',131),
+  ('compounds -> compound compounds','compounds',2,'p_compounds','parser.py',132),
+  ('compound -> FROM IDENTIFIER unit LCURVY compound_content RCURVY','compound',6,'p_compound_identifier','parser.py',139),
+  ('compound -> FROM INTEGER unit LCURVY compound_content RCURVY','compound',6,'p_compound_value','parser.py',164),
+  ('compound -> FROM REAL unit LCURVY compound_content RCURVY','compound',6,'p_compound_value','parser.py',165),
+  ('compound_content -> compound_variable_declaration','compound_content',1,'p_compound_content','parser.py',192),
+  ('compound_content -> compound_variable_definition','compound_content',1,'p_compound_content','parser.py',193),
+  ('compound_content -> compound_packet_declaration','compound_content',1,'p_compound_content','parser.py',194),
+  ('compound_content -> compound_filter_definition','compound_content',1,'p_compound_content','parser.py',195),
+  ('compound_content -> compound_list_definition','compound_content',1,'p_compound_content','parser.py',196),
+  ('compound_content -> onces','compound_content',1,'p_compound_content','parser.py',197),
+  ('compound_content -> periodics','compound_content',1,'p_compound_content','parser.py',198),
+  ('compound_content -> conditionals','compound_content',1,'p_compound_content','parser.py',199),
+  ('compound_content -> compound_content compound_content','compound_content',2,'p_compound_content','parser.py',200),
+  ('compound_variable_declaration -> VARIABLE IDENTIFIER','compound_variable_declaration',2,'p_compound_variable_declaration','parser.py',207),
+  ('compound_variable_definition -> variable_definition','compound_variable_definition',1,'p_compound_variable_definition','parser.py',216),
+  ('compound_packet_declaration -> PACKET IDENTIFIER','compound_packet_declaration',2,'p_compound_packet_declaration','parser.py',224),
+  ('compound_filter_definition -> filter_definition','compound_filter_definition',1,'p_compound_filter_definition','parser.py',234),
+  ('compound_list_definition -> list_definition','compound_list_definition',1,'p_compound_list_definition','parser.py',242),
+  ('onces -> once','onces',1,'p_onces','parser.py',254),
+  ('onces -> once onces','onces',2,'p_onces','parser.py',255),
+  ('once -> ONCE LCURVY once_content RCURVY','once',4,'p_once','parser.py',262),
+  ('once_content -> once_variable_declaration','once_content',1,'p_once_content','parser.py',277),
+  ('once_content -> once_variable_definition','once_content',1,'p_once_content','parser.py',278),
+  ('once_content -> once_packet_declaration','once_content',1,'p_once_content','parser.py',279),
+  ('once_content -> once_filter_definition','once_content',1,'p_once_content','parser.py',280),
+  ('once_content -> once_list_definition','once_content',1,'p_once_content','parser.py',281),
+  ('once_content -> once_primitives','once_content',1,'p_once_content','parser.py',282),
+  ('once_content -> once_content once_content','once_content',2,'p_once_content','parser.py',283),
+  ('once_variable_declaration -> VARIABLE IDENTIFIER','once_variable_declaration',2,'p_once_variable_declaration','parser.py',290),
+  ('once_variable_definition -> variable_definition','once_variable_definition',1,'p_once_variable_definition','parser.py',299),
+  ('once_packet_declaration -> PACKET IDENTIFIER','once_packet_declaration',2,'p_once_packet_declaration','parser.py',307),
+  ('once_filter_definition -> filter_definition','once_filter_definition',1,'p_once_filter_definition','parser.py',317),
+  ('once_list_definition -> list_definition','once_list_definition',1,'p_once_list_definition','parser.py',325),
+  ('once_primitives -> primitive_disable_component','once_primitives',1,'p_once_primitives','parser.py',333),
+  ('once_primitives -> primitive_deceive_component','once_primitives',1,'p_once_primitives','parser.py',334),
+  ('once_primitives -> primitive_destroy_component','once_primitives',1,'p_once_primitives','parser.py',335),
+  ('once_primitives -> primitive_misplace_node','once_primitives',1,'p_once_primitives','parser.py',336),
+  ('once_primitives -> primitive_destroy_node','once_primitives',1,'p_once_primitives','parser.py',337),
+  ('once_primitives -> primitive_write_field','once_primitives',1,'p_once_primitives','parser.py',338),
+  ('once_primitives -> primitive_create_packet','once_primitives',1,'p_once_primitives','parser.py',339),
+  ('once_primitives -> primitive_inject_packet','once_primitives',1,'p_once_primitives','parser.py',340),
+  ('once_primitives -> primitive_clone_packet','once_primitives',1,'p_once_primitives','parser.py',341),
+  ('once_primitives -> primitive_expression','once_primitives',1,'p_once_primitives','parser.py',342),
+  ('periodics -> periodic','periodics',1,'p_periodics','parser.py',353),
+  ('periodics -> periodics periodics','periodics',2,'p_periodics','parser.py',354),
+  ('periodic -> EVERY IDENTIFIER unit LCURVY periodic_content RCURVY','periodic',6,'p_periodic_identifier','parser.py',361),
+  ('periodic -> EVERY INTEGER unit LCURVY periodic_content RCURVY','periodic',6,'p_periodic_value','parser.py',386),
+  ('periodic -> EVERY REAL unit LCURVY periodic_content RCURVY','periodic',6,'p_periodic_value','parser.py',387),
+  ('periodic_content -> periodic_variable_declaration','periodic_content',1,'p_periodic_content','parser.py',414),
+  ('periodic_content -> periodic_variable_definition','periodic_content',1,'p_periodic_content','parser.py',415),
+  ('periodic_content -> periodic_packet_declaration','periodic_content',1,'p_periodic_content','parser.py',416),
+  ('periodic_content -> periodic_filter_definition','periodic_content',1,'p_periodic_content','parser.py',417),
+  ('periodic_content -> periodic_list_definition','periodic_content',1,'p_periodic_content','parser.py',418),
+  ('periodic_content -> periodic_primitives','periodic_content',1,'p_periodic_content','parser.py',419),
+  ('periodic_content -> periodic_content periodic_content','periodic_content',2,'p_periodic_content','parser.py',420),
+  ('periodic_variable_declaration -> VARIABLE IDENTIFIER','periodic_variable_declaration',2,'p_periodic_variable_declaration','parser.py',427),
+  ('periodic_variable_definition -> variable_definition','periodic_variable_definition',1,'p_periodic_variable_definition','parser.py',436),
+  ('periodic_packet_declaration -> PACKET IDENTIFIER','periodic_packet_declaration',2,'p_periodic_packet_declaration','parser.py',444),
+  ('periodic_filter_definition -> filter_definition','periodic_filter_definition',1,'p_periodic_filter_definition','parser.py',454),
+  ('periodic_list_definition -> list_definition','periodic_list_definition',1,'p_periodic_list_definition','parser.py',462),
+  ('periodic_primitives -> primitive_disable_component','periodic_primitives',1,'p_periodic_primitives','parser.py',470),
+  ('periodic_primitives -> primitive_deceive_component','periodic_primitives',1,'p_periodic_primitives','parser.py',471),
+  ('periodic_primitives -> primitive_destroy_component','periodic_primitives',1,'p_periodic_primitives','parser.py',472),
+  ('periodic_primitives -> primitive_misplace_node','periodic_primitives',1,'p_periodic_primitives','parser.py',473),
+  ('periodic_primitives -> primitive_destroy_node','periodic_primitives',1,'p_periodic_primitives','parser.py',474),
+  ('periodic_primitives -> primitive_write_field','periodic_primitives',1,'p_periodic_primitives','parser.py',475),
+  ('periodic_primitives -> primitive_create_packet','periodic_primitives',1,'p_periodic_primitives','parser.py',476),
+  ('periodic_primitives -> primitive_inject_packet','periodic_primitives',1,'p_periodic_primitives','parser.py',477),
+  ('periodic_primitives -> primitive_clone_packet','periodic_primitives',1,'p_periodic_primitives','parser.py',478),
+  ('periodic_primitives -> primitive_expression','periodic_primitives',1,'p_periodic_primitives','parser.py',479),
+  ('conditionals -> conditional','conditionals',1,'p_conditionals','parser.py',490),
+  ('conditionals -> conditionals conditionals','conditionals',2,'p_conditionals','parser.py',491),
+  ('conditional -> FOR NODES IN IDENTIFIER LCURVY FOR PACKETS MATCHING IDENTIFIER LCURVY conditional_content RCURVY RCURVY','conditional',13,'p_conditional_identifiers','parser.py',499),
+  ('conditional_content -> conditional_variable_declaration','conditional_content',1,'p_conditional_content','parser.py',528),
+  ('conditional_content -> conditional_variable_definition','conditional_content',1,'p_conditional_content','parser.py',529),
+  ('conditional_content -> conditional_packet_declaration','conditional_content',1,'p_conditional_content','parser.py',530),
+  ('conditional_content -> conditional_filter_definition','conditional_content',1,'p_conditional_content','parser.py',531),
+  ('conditional_content -> conditional_list_definition','conditional_content',1,'p_conditional_content','parser.py',532),
+  ('conditional_content -> conditional_primitives','conditional_content',1,'p_conditional_content','parser.py',533),
+  ('conditional_content -> conditional_content conditional_content','conditional_content',2,'p_conditional_content','parser.py',534),
+  ('conditional_variable_declaration -> VARIABLE IDENTIFIER','conditional_variable_declaration',2,'p_conditional_variable_declaration','parser.py',541),
+  ('conditional_variable_definition -> variable_definition','conditional_variable_definition',1,'p_conditional_variable_definition','parser.py',550),
+  ('conditional_packet_declaration -> PACKET IDENTIFIER','conditional_packet_declaration',2,'p_conditional_packet_declaration','parser.py',558),
+  ('conditional_filter_definition -> filter_definition','conditional_filter_definition',1,'p_conditional_filter_definition','parser.py',568),
+  ('conditional_list_definition -> list_definition','conditional_list_definition',1,'p_conditional_list_definition','parser.py',576),
+  ('conditional_primitives -> primitive_disable_component','conditional_primitives',1,'p_conditional_primitives','parser.py',584),
+  ('conditional_primitives -> primitive_deceive_component','conditional_primitives',1,'p_conditional_primitives','parser.py',585),
+  ('conditional_primitives -> primitive_destroy_component','conditional_primitives',1,'p_conditional_primitives','parser.py',586),
+  ('conditional_primitives -> primitive_misplace_node','conditional_primitives',1,'p_conditional_primitives','parser.py',587),
+  ('conditional_primitives -> primitive_destroy_node','conditional_primitives',1,'p_conditional_primitives','parser.py',588),
+  ('conditional_primitives -> primitive_write_field','conditional_primitives',1,'p_conditional_primitives','parser.py',589),
+  ('conditional_primitives -> primitive_read_field','conditional_primitives',1,'p_conditional_primitives','parser.py',590),
+  ('conditional_primitives -> primitive_forward_packet','conditional_primitives',1,'p_conditional_primitives','parser.py',591),
+  ('conditional_primitives -> primitive_create_packet','conditional_primitives',1,'p_conditional_primitives','parser.py',592),
+  ('conditional_primitives -> primitive_inject_packet','conditional_primitives',1,'p_conditional_primitives','parser.py',593),
+  ('conditional_primitives -> primitive_clone_packet','conditional_primitives',1,'p_conditional_primitives','parser.py',594),
+  ('conditional_primitives -> primitive_drop_packet','conditional_primitives',1,'p_conditional_primitives','parser.py',595),
+  ('conditional_primitives -> primitive_expression','conditional_primitives',1,'p_conditional_primitives','parser.py',596),
+  ('primitive_disable_component -> DISABLECOMPONENT LROUND node COMMA component RROUND','primitive_disable_component',6,'p_primitive_disable_component','parser.py',607),
+  ('primitive_deceive_component -> DECEIVECOMPONENT LROUND node COMMA component COMMA value RROUND','primitive_deceive_component',8,'p_primitive_deceive_component','parser.py',616),
+  ('primitive_destroy_component -> DESTROYCOMPONENT LROUND node COMMA component RROUND','primitive_destroy_component',6,'p_primitive_destroy_component','parser.py',625),
+  ('primitive_misplace_node -> MISPLACENODE LROUND node COMMA position RROUND','primitive_misplace_node',6,'p_primitive_misplace_node','parser.py',634),
+  ('primitive_destroy_node -> DESTROYNODE LROUND node RROUND','primitive_destroy_node',4,'p_primitive_destroy_node','parser.py',643),
+  ('primitive_write_field -> WRITEFIELD LROUND packet COMMA path COMMA source RROUND','primitive_write_field',8,'p_primitive_write_field','parser.py',652),
+  ('primitive_write_field -> WRITEFIELD LROUND captured COMMA path COMMA source RROUND','primitive_write_field',8,'p_primitive_write_field','parser.py',653),
+  ('primitive_read_field -> READFIELD LROUND destination COMMA packet COMMA path RROUND','primitive_read_field',8,'p_primitive_read_field','parser.py',662),
+  ('primitive_read_field -> READFIELD LROUND destination COMMA captured COMMA path RROUND','primitive_read_field',8,'p_primitive_read_field','parser.py',663),
+  ('primitive_forward_packet -> FORWARDPACKET LROUND packet COMMA delay COMMA unit RROUND','primitive_forward_packet',8,'p_primitive_forward_packet','parser.py',671),
+  ('primitive_forward_packet -> FORWARDPACKET LROUND captured COMMA delay COMMA unit RROUND','primitive_forward_packet',8,'p_primitive_forward_packet','parser.py',672),
+  ('primitive_create_packet -> CREATEPACKET LROUND packet COMMA protocol RROUND','primitive_create_packet',6,'p_primitive_create_packet','parser.py',685),
+  ('primitive_inject_packet -> INJECTPACKET LROUND packet COMMA node COMMA direction COMMA delay COMMA unit RROUND','primitive_inject_packet',12,'p_primitive_inject_packet','parser.py',694),
+  ('primitive_clone_packet -> CLONEPACKET LROUND packet COMMA packet RROUND','primitive_clone_packet',6,'p_primitive_clone_packet','parser.py',707),
+  ('primitive_clone_packet -> CLONEPACKET LROUND packet COMMA captured RROUND','primitive_clone_packet',6,'p_primitive_clone_packet','parser.py',708),
+  ('primitive_drop_packet -> DROPPACKET LROUND packet RROUND','primitive_drop_packet',4,'p_primitive_drop_packet','parser.py',718),
+  ('primitive_drop_packet -> DROPPACKET LROUND captured RROUND','primitive_drop_packet',4,'p_primitive_drop_packet','parser.py',719),
+  ('primitive_expression -> expression_assign','primitive_expression',1,'p_primitive_expression','parser.py',727),
+  ('expression_assign -> IDENTIFIER ASSIGN expression','expression_assign',3,'p_expression_assign','parser.py',737),
+  ('expression_assign -> IDENTIFIER ADDASSIGN expression','expression_assign',3,'p_expression_operation_assign','parser.py',765),
+  ('expression_assign -> IDENTIFIER SUBASSIGN expression','expression_assign',3,'p_expression_operation_assign','parser.py',766),
+  ('expression_assign -> IDENTIFIER MULASSIGN expression','expression_assign',3,'p_expression_operation_assign','parser.py',767),
+  ('expression_assign -> IDENTIFIER DIVASSIGN expression','expression_assign',3,'p_expression_operation_assign','parser.py',768),
+  ('expression_assign -> IDENTIFIER MODASSIGN expression','expression_assign',3,'p_expression_operation_assign','parser.py',769),
+  ('expression -> expression ADD expression','expression',3,'p_expression_binop','parser.py',815),
+  ('expression -> expression SUB expression','expression',3,'p_expression_binop','parser.py',816),
+  ('expression -> expression MUL expression','expression',3,'p_expression_binop','parser.py',817),
+  ('expression -> expression DIV expression','expression',3,'p_expression_binop','parser.py',818),
+  ('expression -> expression MOD expression','expression',3,'p_expression_binop','parser.py',819),
+  ('expression -> expression EXP expression','expression',3,'p_expression_binop','parser.py',820),
+  ('expression -> SUB expression','expression',2,'p_expression_uminus','parser.py',838),
+  ('expression -> LROUND expression RROUND','expression',3,'p_expression_group','parser.py',858),
+  ('expression -> INTEGER','expression',1,'p_expression_integer','parser.py',866),
+  ('expression -> STRING','expression',1,'p_expression_string','parser.py',878),
+  ('expression -> REAL','expression',1,'p_expression_real','parser.py',890),
+  ('expression -> IDENTIFIER','expression',1,'p_expression_identifier','parser.py',902),
+  ('unit -> US','unit',1,'p_unit','parser.py',924),
+  ('unit -> MS','unit',1,'p_unit','parser.py',925),
+  ('unit -> S','unit',1,'p_unit','parser.py',926),
+  ('node -> identifier_variable_defined','node',1,'p_argument_node','parser.py',934),
+  ('node -> value_integer','node',1,'p_argument_node','parser.py',935),
+  ('node -> value_string','node',1,'p_argument_node','parser.py',936),
+  ('node -> value_real','node',1,'p_argument_node','parser.py',937),
+  ('component -> identifier_variable_defined','component',1,'p_argument_component','parser.py',945),
+  ('component -> value_integer','component',1,'p_argument_component','parser.py',946),
+  ('component -> value_string','component',1,'p_argument_component','parser.py',947),
+  ('component -> value_real','component',1,'p_argument_component','parser.py',948),
+  ('value -> identifier_variable_defined','value',1,'p_argument_value','parser.py',956),
+  ('value -> value_integer','value',1,'p_argument_value','parser.py',957),
+  ('value -> value_string','value',1,'p_argument_value','parser.py',958),
+  ('value -> value_real','value',1,'p_argument_value','parser.py',959),
+  ('position -> identifier_list_defined','position',1,'p_argument_position','parser.py',967),
+  ('position -> list_value','position',1,'p_argument_position','parser.py',968),
+  ('packet -> IDENTIFIER','packet',1,'p_argument_packet','parser.py',976),
+  ('path -> identifier_variable_defined','path',1,'p_argument_path','parser.py',990),
+  ('path -> value_integer','path',1,'p_argument_path','parser.py',991),
+  ('path -> value_string','path',1,'p_argument_path','parser.py',992),
+  ('path -> value_real','path',1,'p_argument_path','parser.py',993),
+  ('source -> identifier_variable_defined','source',1,'p_argument_source','parser.py',1001),
+  ('source -> value_integer','source',1,'p_argument_source','parser.py',1002),
+  ('source -> value_string','source',1,'p_argument_source','parser.py',1003),
+  ('source -> value_real','source',1,'p_argument_source','parser.py',1004),
+  ('destination -> IDENTIFIER','destination',1,'p_argument_destination','parser.py',1012),
+  ('delay -> IDENTIFIER','delay',1,'p_argument_delay_reference','parser.py',1026),
+  ('delay -> value_integer','delay',1,'p_argument_delay_value','parser.py',1041),
+  ('delay -> value_real','delay',1,'p_argument_delay_value','parser.py',1042),
+  ('protocol -> IDENTIFIER','protocol',1,'p_argument_protocol_reference','parser.py',1050),
+  ('protocol -> value_string','protocol',1,'p_argument_protocol_value','parser.py',1066),
+  ('direction -> TX','direction',1,'p_argument_direction','parser.py',1074),
+  ('direction -> RX','direction',1,'p_argument_direction','parser.py',1075),
+  ('captured -> CAPTURED','captured',1,'p_argument_captured','parser.py',1088),
+  ('identifier_variable_defined -> IDENTIFIER','identifier_variable_defined',1,'p_argument_identifier_variable_defined','parser.py',1101),
+  ('value_integer -> INTEGER','value_integer',1,'p_argument_value_integer','parser.py',1118),
+  ('value_string -> STRING','value_string',1,'p_argument_value_string','parser.py',1129),
+  ('value_real -> REAL','value_real',1,'p_argument_value_real','parser.py',1141),
+  ('identifier_list_defined -> IDENTIFIER','identifier_list_defined',1,'p_argument_identifier_list_defined','parser.py',1153),
+  ('list_value -> LBRACK list_sequence RBRACK','list_value',3,'p_argument_list_value','parser.py',1167),
+  ('variable_definition -> variable_definition_integer','variable_definition',1,'p_variable_definition','parser.py',1183),
+  ('variable_definition -> variable_definition_string','variable_definition',1,'p_variable_definition','parser.py',1184),
+  ('variable_definition -> variable_definition_real','variable_definition',1,'p_variable_definition','parser.py',1185),
+  ('variable_definition_integer -> VARIABLE IDENTIFIER ASSIGN INTEGER','variable_definition_integer',4,'p_variable_definition_integer','parser.py',1192),
+  ('variable_definition_string -> VARIABLE IDENTIFIER ASSIGN STRING','variable_definition_string',4,'p_variable_definition_string','parser.py',1205),
+  ('variable_definition_real -> VARIABLE IDENTIFIER ASSIGN REAL','variable_definition_real',4,'p_variable_definition_real','parser.py',1216),
+  ('filter_definition -> FILTER IDENTIFIER ASSIGN filter_content','filter_definition',4,'p_filter_definition','parser.py',1233),
+  ('filter_content -> LROUND filter_content RROUND','filter_content',3,'p_filter_content_rounds','parser.py',1246),
+  ('filter_content -> filter_content filter_logical_operator filter_content','filter_content',3,'p_filter_content_compound','parser.py',1254),
+  ('filter_content -> filter_basic_element filter_logical_operator filter_content','filter_content',3,'p_filter_content_compound_direct','parser.py',1262),
+  ('filter_content -> filter_content filter_logical_operator filter_basic_element','filter_content',3,'p_filter_content_compound_reverse','parser.py',1270),
+  ('filter_content -> filter_basic_element filter_logical_operator filter_basic_element','filter_content',3,'p_filter_content_couple','parser.py',1278),
+  ('filter_content -> filter_basic_element','filter_content',1,'p_filter_content_mono','parser.py',1286),
+  ('filter_basic_element -> filter_operand filter_comparison_operator filter_operand','filter_basic_element',3,'p_filter_basic_element','parser.py',1294),
+  ('filter_operand -> INTEGER','filter_operand',1,'p_filter_operand_value_integer','parser.py',1302),
+  ('filter_operand -> STRING','filter_operand',1,'p_filter_operand_value_string','parser.py',1313),
+  ('filter_operand -> REAL','filter_operand',1,'p_filter_operand_value_real','parser.py',1325),
+  ('filter_operand -> IDENTIFIER','filter_operand',1,'p_filter_operand_identifier','parser.py',1337),
+  ('filter_comparison_operator -> NOTEQUALTO','filter_comparison_operator',1,'p_filter_comparison_operator','parser.py',1353),
+  ('filter_comparison_operator -> EQUALTO','filter_comparison_operator',1,'p_filter_comparison_operator','parser.py',1354),
+  ('filter_comparison_operator -> LSEQTHN','filter_comparison_operator',1,'p_filter_comparison_operator','parser.py',1355),
+  ('filter_comparison_operator -> GREQTHN','filter_comparison_operator',1,'p_filter_comparison_operator','parser.py',1356),
+  ('filter_comparison_operator -> LSTHN','filter_comparison_operator',1,'p_filter_comparison_operator','parser.py',1357),
+  ('filter_comparison_operator -> GRTHN','filter_comparison_operator',1,'p_filter_comparison_operator','parser.py',1358),
+  ('filter_logical_operator -> LAND','filter_logical_operator',1,'p_filter_logical_operator','parser.py',1371),
+  ('filter_logical_operator -> LOR','filter_logical_operator',1,'p_filter_logical_operator','parser.py',1372),
+  ('list_definition -> LIST IDENTIFIER ASSIGN LBRACK list_sequence RBRACK','list_definition',6,'p_list_definition','parser.py',1389),
+  ('list_sequence -> list_item COMMA list_sequence','list_sequence',3,'p_list_sequence','parser.py',1402),
+  ('list_sequence -> list_item','list_sequence',1,'p_list_sequence_mono','parser.py',1410),
+  ('list_item -> INTEGER','list_item',1,'p_list_item_integer','parser.py',1418),
+  ('list_item -> STRING','list_item',1,'p_list_item_string','parser.py',1429),
+  ('list_item -> REAL','list_item',1,'p_list_item_real','parser.py',1441),
+  ('list_item -> IDENTIFIER','list_item',1,'p_list_item_identifier','parser.py',1453),
+]
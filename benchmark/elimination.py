@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+
+# -----------------------------------------------------------------------------
+# elimination.py
+#
+# Author: Francesco Racciatti (racciatti.francesco@gmail.com)
+#
+# This module benchmarks the bytes of XML saved by the dead symbol and dead
+# block elimination.
+#
+# Usage:
+# $ python3 elimination.py [copies]
+# -----------------------------------------------------------------------------
+
+import sys
+
+sys.path.insert(0,"../aml/")
+import aml as aml
+import interpreter.interpreter as interpreter
+import optimizer.elimination as elimination
+
+
+# A sweep point: the generated scenarios declare the whole set of symbols of
+# the sweep in each compound, while each point uses only a few of them
+template = """
+    from {time} s {{
+        variable node = {node}
+        variable delay = 10
+        variable power = 0.{node}
+        variable label = "point {node}"
+        packet probe
+        packet spare
+        list neighbours = [{node}, {next}, {after}]
+        filter tcp = ("layer4.protocol" == "tcp")
+        filter udp = (("layer4.protocol" == "udp") && ("layer4.sourcePort" == 2000))
+        once {{
+            destroyNode(node)
+        }}
+    }}
+"""
+
+
+def build(copies):
+    """
+    Builds a sweep made by the given number of points.
+    """
+    compounds = ''.join(template.format(time=point + 1, node=point, next=point + 1, after=point + 2)
+                        for point in range(copies))
+    return aml.AML.parse('scenario {\n    variable port = 2000\n' + compounds + '}\n')
+
+
+def size(scenario):
+    """
+    Gets the size of the XML of the scenario, in bytes.
+    """
+    return len(interpreter.Xml.interpret(scenario, 0).encode('utf-8'))
+
+
+if __name__ == '__main__':
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    sourcefile = open("../test/source.aml", 'r')
+    scenarios = (
+        ('test scenario', aml.AML.parse(sourcefile.read())),
+        ('sweep of ' + str(copies) + ' points', build(copies)))
+    sourcefile.close()
+    for label, scenario in scenarios:
+        before = size(scenario)
+        outcome = elimination.eliminate(scenario)
+        after = size(scenario)
+        print(label)
+        print('  {:<24} {:>10}'.format('symbols dropped', outcome.symbols))
+        print('  {:<24} {:>10}'.format('codeblocks dropped', outcome.codeblocks))
+        print('  {:<24} {:>10} bytes'.format('xml before', before))
+        print('  {:<24} {:>10} bytes ({:.1f}% saved)'.format('xml after', after, 100.0 * (before - after) / before))
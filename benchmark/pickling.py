@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+
+# -----------------------------------------------------------------------------
+# pickling.py
+#
+# Author: Francesco Racciatti (racciatti.francesco@gmail.com)
+#
+# This module benchmarks the round trip of the scenarios through pickle.
+#
+# Usage:
+# $ python3 pickling.py [copies]
+# -----------------------------------------------------------------------------
+
+import sys
+import copy
+import pickle
+import timeit
+
+sys.path.insert(0,"../aml/")
+import aml as aml
+import model.types as types
+
+
+def build(copies):
+    """
+    Builds a scenario holding the given number of copies of the compound
+    attacks of the test scenario.
+    """
+    sourcefile = open("../test/source.aml", 'r')
+    scenario = aml.AML.parse(sourcefile.read())
+    sourcefile.close()
+    compounds = list(scenario.codeblocktable.codeblocks)
+    for i in range(copies - 1):
+        for compound in compounds:
+            scenario.codeblocktable.append(copy.deepcopy(compound))
+    return scenario
+
+
+def roundtrip(scenario, protocol, outofband):
+    """
+    Pickles and unpickles the scenario.
+
+    :return: the size of the pickle, in bytes
+    """
+    if outofband:
+        buffers = []
+        data = pickle.dumps(scenario, protocol, buffer_callback=buffers.append)
+        pickle.loads(data, buffers=buffers)
+        return len(data) + sum(len(buffer.raw()) for buffer in buffers)
+    data = pickle.dumps(scenario, protocol)
+    pickle.loads(data)
+    return len(data)
+
+
+def measure(label, scenario, repeat):
+    """
+    Measures the round trips of the scenario and prints the results.
+    """
+    print(label)
+    for protocol, outofband in ((4, False), (5, False), (5, True)):
+        size = roundtrip(scenario, protocol, outofband)
+        seconds = min(timeit.repeat(lambda: roundtrip(scenario, protocol, outofband), number=1, repeat=repeat))
+        name = 'protocol ' + str(protocol) + (' out-of-band' if outofband else '')
+        print('  {:<24} {:>10} bytes {:>10.2f} ms'.format(name, size, seconds * 1000))
+    seconds = min(timeit.repeat(lambda: copy.deepcopy(scenario), number=1, repeat=repeat))
+    print('  {:<24} {:>10} bytes {:>10.2f} ms'.format('deepcopy', '-', seconds * 1000))
+
+
+if __name__ == '__main__':
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    repeat = 5
+    scenario = build(copies)
+    measure('plain scenario', scenario, repeat)
+    scenario.hashcons(types.HashConsTable())
+    measure('hash-consed scenario', scenario, repeat)
+    scenario.pack()
+    measure('packed scenario', scenario, repeat)
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+
+# -----------------------------------------------------------------------------
+# canonical_test.py
+#
+# Author: Francesco Racciatti (racciatti.francesco@gmail.com)
+#
+# This module tests the canonical form and the fingerprint of the scenarios.
+#
+# Usage:
+# $ python3 -m unittest -v canonical_test.py
+# -----------------------------------------------------------------------------
+
+import sys
+import unittest
+
+sys.path.insert(0,"../aml/")
+import aml as aml
+import model.types as types
+import model.canonical as canonical
+import model.evaluation as evaluation
+
+
+# The reference scenario
+source = """
+scenario {
+    variable port = 2000
+    from 10 s {
+        once {
+            variable node = 1
+            packet fake
+            createPacket(fake, "udp")
+            writeField(fake, "layer4.sourcePort", port)
+            variable value = 2
+            value = value * 2
+            destroyNode(node)
+        }
+    }
+}
+"""
+
+# The same scenario, renamed, reordered and with literal sub-expressions
+variant = """
+# A comment
+scenario {
+    variable sourceport = 2000
+    from 10 s {
+        once {
+            packet other
+            variable target = 1
+            createPacket(other, "udp")
+            writeField(other, "layer4.sourcePort", sourceport)
+            variable x = 2
+            x = x * ((1 + 3) / 2)
+            destroyNode(target)
+        }
+    }
+}
+"""
+
+# A scenario differing from the reference one
+different = """
+scenario {
+    variable port = 2000
+    from 10 s {
+        once {
+            variable node = 2
+            packet fake
+            createPacket(fake, "udp")
+            writeField(fake, "layer4.sourcePort", port)
+            variable value = 2
+            value = value * 2
+            destroyNode(node)
+        }
+    }
+}
+"""
+
+
+class TestCanonical(unittest.TestCase):
+    """
+    Tests for the canonical form.
+    """
+
+    def setUp(self):
+        """
+        Sets up the test.
+        """
+        pass
+
+    def tearDown(self):
+        """
+        Tears down the test.
+        """
+        pass
+
+    def test_fingerprint(self):
+        """
+        Tests the function fingerprint.
+        """
+        fingerprint = canonical.fingerprint(aml.AML.parse(source))
+        self.assertEqual(len(fingerprint), 64)
+        self.assertEqual(canonical.fingerprint(aml.AML.parse(source)), fingerprint)
+        self.assertEqual(canonical.fingerprint(aml.AML.parse(variant)), fingerprint)
+        self.assertNotEqual(canonical.fingerprint(aml.AML.parse(different)), fingerprint)
+
+    def test_encode(self):
+        """
+        Tests the function encode.
+        """
+        encoding = canonical.encode(aml.AML.parse(variant))
+        self.assertEqual(encoding[0], 'Scenario')
+        once = encoding[3][0][3][0]
+        self.assertEqual(once[0], 'Once')
+        # The symbols are named in order of first use
+        self.assertListEqual([name for name, content in once[2]], ['p0', 'v2', 'v3'])
+        # The literal sub-expressions are folded
+        self.assertIn(('variable', 'INTEGER', 2), once[3][2][1][1])
+
+    def test_canonicalize(self):
+        """
+        Tests the function canonicalize.
+        """
+        scenario = aml.AML.parse(source)
+        scenario.freeze()
+        canonicalized = canonical.canonicalize(scenario)
+        self.assertTrue(canonicalized.frozen())
+        self.assertEqual(canonical.fingerprint(canonicalized), canonical.fingerprint(scenario))
+        once = canonicalized.codeblocktable.codeblocks[0].codeblocktable.codeblocks[0]
+        self.assertEqual(once.codeblocktable.codeblocks[0].packet, 'p0')
+        self.assertEqual(once.codeblocktable.codeblocks[-1].node, 'v3')
+        self.assertEqual(once.symboltable.object('v3').value, 1)
+        self.assertFalse(once.symboltable.exist('node'))
+        # The original scenario is left as it is
+        once = scenario.codeblocktable.codeblocks[0].codeblocktable.codeblocks[0]
+        self.assertTrue(once.symboltable.exist('node'))
+
+
+class TestEvaluation(unittest.TestCase):
+    """
+    Tests for the evaluation of the literal sub-expressions.
+    """
+
+    def setUp(self):
+        """
+        Sets up the test.
+        """
+        self.literals = {}
+        for value in (1, 2, 3, -4, 0.5, 'a'):
+            variable = types.Variable(types.Variable.autoidentifier(value), types.Variable.Type.INTEGER, value)
+            if isinstance(value, float):
+                variable.variabletype = types.Variable.Type.REAL
+            elif isinstance(value, str):
+                variable.variabletype = types.Variable.Type.STRING
+            self.literals[variable.identifier] = variable
+
+    def tearDown(self):
+        """
+        Tears down the test.
+        """
+        pass
+
+    def fold(self, expression):
+        """
+        Folds the expression and gives back the values of the folded items.
+        """
+        folded = evaluation.fold(expression, self.literals.get)
+        return [item.value if isinstance(item, types.Variable) else item for item in folded]
+
+    def test_fold(self):
+        """
+        Tests the function fold.
+        """
+        self.assertListEqual(self.fold(['__1', '__2', '__+']), [3])
+        self.assertListEqual(self.fold(['x', '__1', '__2', '__+', '__*']), ['x', 3, '__*'])
+        self.assertListEqual(self.fold(['__1', 'x', '__+', '__2', '__*']), ['__1', 'x', '__+', '__2', '__*'])
+        self.assertListEqual(self.fold(['__a', '__a', '__+']), ['aa'])
+        # Inexact or target dependent operations are not folded
+        self.assertListEqual(self.fold(['__3', '__2', '__/']), ['__3', '__2', '__/'])
+        self.assertListEqual(self.fold(['__-4', '__3', '__%']), ['__-4', '__3', '__%'])
+        self.assertListEqual(self.fold(['__1', '__0.5', '__+']), ['__1', '__0.5', '__+'])
+        self.assertListEqual(self.fold(['__a', '__a', '__*']), ['__a', '__a', '__*'])
+        # Badly formed expressions are left as they are
+        self.assertListEqual(self.fold(['__1', '__+']), ['__1', '__+'])
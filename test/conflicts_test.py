@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+
+# -----------------------------------------------------------------------------
+# conflicts_test.py
+#
+# Author: Francesco Racciatti (racciatti.francesco@gmail.com)
+#
+# This module tests the detection of the timeline conflicts.
+#
+# Usage:
+# $ python3 -m unittest -v conflicts_test.py
+# -----------------------------------------------------------------------------
+
+import sys
+import unittest
+
+sys.path.insert(0,"../aml/")
+import aml as aml
+import model.statements as statements
+import analysis.conflicts as conflicts
+
+
+# The scenario: node 5 is destroyed at 100 s, while a periodic attack on it
+# is going on and before another one starts
+source = """
+scenario {
+    variable target = 5
+    list targets = [5, 6]
+    filter udp = ("layer4.sourcePort" == 2000)
+    from 50 s {
+        every 10 s {
+            misplaceNode(target, targets)
+        }
+    }
+    from 100 s {
+        once {
+            disableComponent(6, "radio")
+            destroyNode(target)
+            disableComponent(target, "radio")
+        }
+        once {
+            destroyNode(6)
+        }
+    }
+    from 100 s {
+        once {
+            destroyNode(7)
+        }
+    }
+    from 120 s {
+        every 1 s {
+            destroyNode(5)
+        }
+        for nodes in targets {
+            for packets matching udp {
+                dropPacket(captured)
+            }
+        }
+    }
+}
+"""
+
+# The scenario: the variable n holds the node 5 until it is assigned the
+# node 6, before the node 5 is destroyed
+reassigned = """
+scenario {
+    variable n = 5
+    from 1 s {
+        once {
+            n = 6
+        }
+    }
+    from 10 s {
+        once {
+            destroyNode(5)
+        }
+    }
+    from 20 s {
+        once {
+            destroyNode(n)
+            disableComponent(n, "radio")
+        }
+    }
+}
+"""
+
+
+class TestConflicts(unittest.TestCase):
+    """
+    Tests for the detection of the timeline conflicts.
+    """
+
+    def setUp(self):
+        """
+        Sets up the test.
+        """
+        self.findings = conflicts.conflicts(aml.AML.parse(source))
+
+    def tearDown(self):
+        """
+        Tears down the test.
+        """
+        pass
+
+    def summary(self, node):
+        """
+        Gets the kinds and the paths of the findings on the given node.
+        """
+        return [(finding.kind, finding.location.path) for finding in self.findings if finding.node == node]
+
+    def test_dead(self):
+        """
+        Tests the attacks acting on destroyed nodes.
+        """
+        self.assertListEqual(self.summary(5), [
+            (conflicts.Kind.CONFLICT, (0, 0, 0)),
+            (conflicts.Kind.DEAD, (1, 0, 2)),
+            (conflicts.Kind.DEAD, (3, 0, 0)),
+            (conflicts.Kind.DEAD, (3, 1))])
+        finding = self.findings[0]
+        self.assertEqual(finding.time, 50 * 10 ** 9)
+        self.assertIsInstance(finding.cause.primitive, statements.DestroyNode)
+        self.assertEqual(finding.cause.path, (1, 0, 1))
+
+    def test_conflict(self):
+        """
+        Tests the attacks acting at the same time on a destroyed node.
+        """
+        self.assertListEqual(self.summary(6), [
+            (conflicts.Kind.CONFLICT, (1, 0, 0)),
+            (conflicts.Kind.DEAD, (3, 1))])
+        self.assertListEqual(self.summary(7), [])
+
+    def test_reassigned(self):
+        """
+        Tests that the nodes held by the variables the primitives assign are 
+        not resolved to the initial values of the variables.
+        """
+        self.assertListEqual(conflicts.conflicts(aml.AML.parse(reassigned)), [])
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+
+# -----------------------------------------------------------------------------
+# cost_test.py
+#
+# Author: Francesco Racciatti (racciatti.francesco@gmail.com)
+#
+# This module tests the static estimation of the work of the scenarios.
+#
+# Usage:
+# $ python3 -m unittest -v cost_test.py
+# -----------------------------------------------------------------------------
+
+import sys
+import json
+import unittest
+
+sys.path.insert(0,"../aml/")
+import aml as aml
+import analysis.cost as cost
+
+
+# The scenario: the second compound holds a typo, every 1 us
+source = """
+scenario {
+    list targets = [1, 2]
+    filter udp = ("layer4.sourcePort" == 2000)
+    from 10 s {
+        once {
+            destroyNode(1)
+        }
+        every 5 s {
+            packet fake
+            createPacket(fake, "udp")
+            injectPacket(fake, 2, tx, 0, s)
+        }
+    }
+    from 20 s {
+        every 1 us {
+            destroyNode(3)
+        }
+        for nodes in targets {
+            for packets matching udp {
+                dropPacket(captured)
+            }
+        }
+    }
+    from 90 s {
+        once {
+            destroyNode(4)
+        }
+    }
+}
+"""
+
+# One second, in nanoseconds
+second = 10 ** 9
+
+
+class TestCost(unittest.TestCase):
+    """
+    Tests for the static estimation of the work.
+    """
+
+    def setUp(self):
+        """
+        Sets up the test.
+        """
+        self.scenario = aml.AML.parse(source)
+
+    def tearDown(self):
+        """
+        Tears down the test.
+        """
+        pass
+
+    def test_estimate(self):
+        """
+        Tests the function estimate.
+        """
+        estimate = cost.estimate(self.scenario, 60 * second, rates={1: 100.0})
+        # 10, 15, ..., 60 s
+        self.assertEqual(estimate.compounds[0], cost.CompoundEstimate(0, 10 * second, 1 + 11 * 2, 0, 11))
+        # 40 s of packets at 100 + 10 packets per second, 40 * 10 ** 6 + 1 firings
+        self.assertEqual(estimate.compounds[1], cost.CompoundEstimate(1, 20 * second, 40 * 10 ** 6 + 1 + 4400, 4400, 0))
+        # After the horizon
+        self.assertEqual(estimate.compounds[2], cost.CompoundEstimate(2, 90 * second, 0, 0, 0))
+        self.assertEqual(estimate.hazards,
+                         [cost.Hazard(cost.Kind.INVOCATIONS, 1, 40 * 10 ** 6 + 1 + 4400, 10 ** 7)])
+        # The selectivity scales the primitives of the conditional attacks
+        estimate = cost.estimate(self.scenario, 60 * second, rates={1: 100.0}, selectivity=0.5)
+        self.assertEqual(estimate.compounds[1].invocations, 40 * 10 ** 6 + 1 + 2200)
+        # The thresholds are configurable
+        thresholds = cost.Thresholds(10 ** 9, 500, 10)
+        kinds = [hazard.kind for hazard in cost.estimate(self.scenario, 60 * second, thresholds=thresholds).hazards]
+        self.assertEqual(kinds, [cost.Kind.INJECTIONS, cost.Kind.EVALUATIONS])
+        self.assertRaises(ValueError, cost.estimate, self.scenario, -1)
+
+    def test_dumps(self):
+        """
+        Tests the function dumps.
+        """
+        document = json.loads(cost.dumps(cost.estimate(self.scenario, 60 * second)))
+        self.assertEqual(document['horizon'], 60 * second)
+        self.assertEqual(len(document['compounds']), 3)
+        self.assertEqual(document['totals']['injections'], 11)
+        self.assertEqual(document['totals']['evaluations'], 800)
+        self.assertEqual(document['hazards'][0]['kind'], 'invocations')
+        self.assertEqual(document['hazards'][0]['position'], 1)
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+
+# -----------------------------------------------------------------------------
+# dependencies_test.py
+#
+# Author: Francesco Racciatti (racciatti.francesco@gmail.com)
+#
+# This module tests the read/write dependency graph of the scenarios.
+#
+# Usage:
+# $ python3 -m unittest -v dependencies_test.py
+# -----------------------------------------------------------------------------
+
+import sys
+import unittest
+
+sys.path.insert(0,"../aml/")
+import aml as aml
+import analysis.dependencies as dependencies
+
+
+# The scenario: the counter ties the periodic attacks together, the node 1 ties
+# the once attacks together, the conditional attack is on its own
+source = """
+scenario {
+    variable counter = 0
+    variable victim = 1
+    list targets = [1, 2]
+    filter udp = ("layer4.sourcePort" == 2000)
+    from 10 s {
+        once {
+            destroyNode(victim)
+        }
+        every 5 s {
+            counter = counter + 1
+        }
+    }
+    from 20 s {
+        every 1 s {
+            variable x = 0
+            x = counter * 2
+            x = x + 1
+        }
+        once {
+            misplaceNode(1, [1, 1, 0])
+        }
+        for nodes in targets {
+            for packets matching udp {
+                dropPacket(captured)
+            }
+        }
+    }
+}
+"""
+
+
+class TestDependencies(unittest.TestCase):
+    """
+    Tests for the read/write dependency graph.
+    """
+
+    def setUp(self):
+        """
+        Sets up the test.
+        """
+        self.graph = dependencies.DependencyGraph.build(aml.AML.parse(source))
+
+    def tearDown(self):
+        """
+        Tears down the test.
+        """
+        pass
+
+    def test_build(self):
+        """
+        Tests the method DependencyGraph::build.
+        """
+        counter = dependencies.Resource(dependencies.Kind.VARIABLE, (), 'counter')
+        victim = dependencies.Resource(dependencies.Kind.VARIABLE, (), 'victim')
+        node = dependencies.Resource(dependencies.Kind.NODE, None, 1)
+        # The victim is never assigned, hence it is known to be the node 1
+        self.assertEqual(self.graph.block_access_dict[(0, 0)],
+                         dependencies.Access(frozenset((victim,)), frozenset((node,))))
+        self.assertEqual(self.graph.block_access_dict[(0, 1)],
+                         dependencies.Access(frozenset((counter,)), frozenset((counter,))))
+        captured = self.graph.block_access_dict[(1, 2)].writes
+        self.assertEqual([resource.kind for resource in captured], [dependencies.Kind.PACKET])
+        self.assertEqual(set(self.graph.dependencies), {
+            dependencies.Dependency((0, 0), (1, 1), dependencies.Hazard.WAW, node),
+            dependencies.Dependency((0, 1), (1, 0), dependencies.Hazard.RAW, counter),
+        })
+
+    def test_groups(self):
+        """
+        Tests the method DependencyGraph::groups.
+        """
+        self.assertEqual(self.graph.groups(), [[(0, 0), (1, 1)], [(0, 1), (1, 0)], [(1, 2)]])
+
+    def test_primitive_dependencies(self):
+        """
+        Tests the method DependencyGraph::primitive_dependencies.
+        """
+        x = dependencies.Resource(dependencies.Kind.VARIABLE, (1, 0), 'x')
+        self.assertEqual(self.graph.primitive_dependencies((1, 0)), [
+            dependencies.Dependency((1, 0, 0), (1, 0, 1), dependencies.Hazard.RAW, x),
+            dependencies.Dependency((1, 0, 0), (1, 0, 1), dependencies.Hazard.WAW, x),
+        ])
+
+    def test_unknown_node(self):
+        """
+        Tests that the nodes held by assigned variables may be any node.
+        """
+        graph = dependencies.DependencyGraph.build(aml.AML.parse(source.replace(
+            'counter = counter + 1', 'victim = victim + 1')))
+        unknown = dependencies.Resource(dependencies.Kind.NODE, None, None)
+        self.assertIn(unknown, graph.block_access_dict[(0, 0)].writes)
+        self.assertEqual(graph.groups(), [[(0, 0), (0, 1), (1, 1)], [(1, 0)], [(1, 2)]])
+
+    def test_unresolved(self):
+        """
+        Tests that the compounds without a resolved time are refused.
+        """
+        scenario = aml.AML.parse(source)
+        scenario.codeblocktable.codeblocks[1].nanoseconds = None
+        self.assertRaises(ValueError, dependencies.DependencyGraph.build, scenario)
+
+    def test_indirect_reads(self):
+        """
+        Tests that the variables read through the lists, the filters and the
+        target lists of the conditionals are recorded.
+        """
+        source = """
+        scenario {
+            variable x = 0
+            variable port = 80
+            variable victim = 3
+            list victims = [victim]
+            from 1 s {
+                once {
+                    x = 1
+                    port = 81
+                    victim = 4
+                }
+            }
+            from 2 s {
+                once {
+                    list pos = [x, 1, 1]
+                    misplaceNode(1, pos)
+                }
+            }
+            from 3 s {
+                filter f = ("layer4.sourcePort" == port)
+                for nodes in victims {
+                    for packets matching f {
+                        dropPacket(captured)
+                    }
+                }
+            }
+        }
+        """
+        graph = dependencies.DependencyGraph.build(aml.AML.parse(source))
+        x = dependencies.Resource(dependencies.Kind.VARIABLE, (), 'x')
+        port = dependencies.Resource(dependencies.Kind.VARIABLE, (), 'port')
+        victim = dependencies.Resource(dependencies.Kind.VARIABLE, (), 'victim')
+        self.assertIn(x, graph.block_access_dict[(1, 0)].reads)
+        self.assertTrue({port, victim} <= graph.block_access_dict[(2, 0)].reads)
+        self.assertEqual(graph.groups(), [[(0, 0), (1, 0), (2, 0)]])
+
+    def test_last_writer(self):
+        """
+        Tests that the accesses are linked only to the last writer and to the
+        readers since then.
+        """
+        source = "scenario { variable counter = 0 " + " ".join(
+            "from %d s { once { counter = counter + 100 } }" % (second + 1) for second in range(50)) + " }"
+        graph = dependencies.DependencyGraph.build(aml.AML.parse(source))
+        counter = dependencies.Resource(dependencies.Kind.VARIABLE, (), 'counter')
+        self.assertEqual(set(graph.dependencies), set(
+            dependency for second in range(49) for dependency in (
+                dependencies.Dependency((second, 0), (second + 1, 0), dependencies.Hazard.RAW, counter),
+                dependencies.Dependency((second, 0), (second + 1, 0), dependencies.Hazard.WAW, counter))))
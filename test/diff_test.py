@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+
+# -----------------------------------------------------------------------------
+# diff_test.py
+#
+# Author: Francesco Racciatti (racciatti.francesco@gmail.com)
+#
+# This module tests the structural diff between the scenarios.
+#
+# Usage:
+# $ python3 -m unittest -v diff_test.py
+# -----------------------------------------------------------------------------
+
+import sys
+import unittest
+
+sys.path.insert(0,"../aml/")
+import aml as aml
+import model.types as types
+import model.statements as statements
+import analysis.diff as diff
+
+
+# The baseline scenario
+baseline = """
+scenario {
+    variable port = 2000
+    from 10 s {
+        once {
+            destroyNode(1)
+        }
+    }
+    from 20 s {
+        once {
+            variable node = 2
+            destroyNode(node)
+            destroyNode(3)
+        }
+    }
+}
+"""
+
+# The variant scenario: a new compound comes first, the last primitive of
+# the second compound is changed, and a symbol is added
+variant = """
+scenario {
+    variable port = 2000
+    variable other = 1
+    from 5 s {
+        once {
+            destroyNode(4)
+        }
+    }
+    from 10 s {
+        once {
+            destroyNode(1)
+        }
+    }
+    from 20 s {
+        once {
+            variable node = 2
+            destroyNode(node)
+            destroyNode(5)
+        }
+    }
+}
+"""
+
+
+class TestDiff(unittest.TestCase):
+    """
+    Tests for the structural diff.
+    """
+
+    filename = "source.aml"
+
+    def setUp(self):
+        """
+        Sets up the test.
+        """
+        pass
+
+    def tearDown(self):
+        """
+        Tears down the test.
+        """
+        pass
+
+    def test_equal(self):
+        """
+        Tests the diff between equal scenarios.
+        """
+        sourcefile = open(self.filename, 'r')
+        source = sourcefile.read()
+        sourcefile.close()
+        old = aml.AML.parse(source)
+        new = aml.AML.parse(source)
+        new.pack()
+        new.freeze()
+        self.assertListEqual(diff.diff(old, new), [])
+
+    def test_diff(self):
+        """
+        Tests the diff between different scenarios.
+        """
+        old = aml.AML.parse(baseline)
+        new = aml.AML.parse(variant)
+        changes = diff.diff(old, new)
+        added = [(change.newpath, change.new.__class__) for change in changes if change.kind == diff.Kind.ADDED]
+        removed = [change.oldpath for change in changes if change.kind == diff.Kind.REMOVED]
+        changed = [(change.oldpath, change.newpath) for change in changes if change.kind == diff.Kind.CHANGED]
+        # The new compound and the new symbols are added
+        self.assertIn(((0,), statements.Compound), added)
+        self.assertIn((('other',), types.Variable), added)
+        self.assertNotIn(((1,), statements.Compound), added)
+        # Only the literal of the changed primitive is removed
+        self.assertListEqual(removed, [(1, 0, '__3')])
+        # The unchanged compound is matched even if it moved
+        self.assertNotIn(((0,), (1,)), changed)
+        # The changed primitive is reported along with its ancestors
+        self.assertIn(((), ()), changed)
+        self.assertIn(((1,), (2,)), changed)
+        self.assertIn(((1, 0), (2, 0)), changed)
+        self.assertIn(((1, 0, 1), (2, 0, 1)), changed)
+        self.assertNotIn(((1, 0, 0), (2, 0, 0)), changed)
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+
+# -----------------------------------------------------------------------------
+# elimination_test.py
+#
+# Author: Francesco Racciatti (racciatti.francesco@gmail.com)
+#
+# This module tests the dead symbol and dead block elimination pass.
+#
+# Usage:
+# $ python3 -m unittest -v elimination_test.py
+# -----------------------------------------------------------------------------
+
+import sys
+import unittest
+
+sys.path.insert(0,"../aml/")
+import aml as aml
+import model.statements as statements
+import interpreter.interpreter as interpreter
+import optimizer.elimination as elimination
+
+
+# The scenario: the second compound holds only declarations
+source = """
+scenario {
+    variable port = 2000
+    variable unused = 1
+    list targets = [1, 2]
+    filter udp = ("layer4.sourcePort" == port)
+    filter tcp = ("layer4.protocol" == "tcp")
+    from 10 s {
+        packet spare
+        variable node = 3
+        for nodes in targets {
+            for packets matching udp {
+                variable value = 2
+                dropPacket(captured)
+            }
+        }
+        once {
+            destroyNode(node)
+        }
+    }
+    from 20 ms {
+        once {
+            variable value
+        }
+    }
+}
+"""
+
+
+class TestElimination(unittest.TestCase):
+    """
+    Tests for the dead symbol and dead block elimination pass.
+    """
+
+    def setUp(self):
+        """
+        Sets up the test.
+        """
+        self.scenario = aml.AML.parse(source)
+
+    def tearDown(self):
+        """
+        Tears down the test.
+        """
+        pass
+
+    def test_eliminate(self):
+        """
+        Tests the function eliminate.
+        """
+        before = interpreter.Xml.interpret(self.scenario, 0)
+        outcome = elimination.eliminate(self.scenario)
+        self.assertEqual(outcome.codeblocks, 2)
+        compounds = self.scenario.codeblocktable.codeblocks
+        self.assertEqual(len(compounds), 1)
+        # The symbols reachable through the filters and the lists are kept
+        symboltable = self.scenario.symboltable
+        for identifier in ('port', 'targets', 'udp', '__1', '__2', '__s', '__10'):
+            self.assertTrue(symboltable.exist(identifier), identifier)
+        for identifier in ('unused', 'tcp', '__ms', '__20', '__tcp'):
+            self.assertFalse(symboltable.exist(identifier), identifier)
+        self.assertListEqual(list(compounds[0].symboltable.identifier_object_dict), ['node'])
+        conditional = compounds[0].codeblocktable.codeblocks[0]
+        self.assertListEqual(list(conditional.symboltable.identifier_object_dict), ['__captured'])
+        self.assertLess(len(interpreter.Xml.interpret(self.scenario, 0)), len(before))
+        # Eliminating again does nothing
+        self.assertEqual(elimination.eliminate(self.scenario), (0, 0))
+
+    def test_packed(self):
+        """
+        Tests the elimination over the packed symbol tables.
+        """
+        self.scenario.pack()
+        dropped = elimination.eliminate(self.scenario).symbols
+        self.assertGreater(dropped, 0)
+        self.assertTrue(self.scenario.symboltable.exist('port'))
+        self.assertFalse(self.scenario.symboltable.exist('unused'))
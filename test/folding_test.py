@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+
+# -----------------------------------------------------------------------------
+# folding_test.py
+#
+# Author: Francesco Racciatti (racciatti.francesco@gmail.com)
+#
+# This module tests the constant folding pass.
+#
+# Usage:
+# $ python3 -m unittest -v folding_test.py
+# -----------------------------------------------------------------------------
+
+import sys
+import unittest
+
+sys.path.insert(0,"../aml/")
+import aml as aml
+import model.types as types
+import lexer.lexer as lexer
+import model.evaluation as evaluation
+import optimizer.folding as folding
+
+
+# The scenario: the scale is a constant, the counter is assigned
+source = """
+scenario {
+    variable scale = 1000
+    variable counter = 0
+    from 1 s {
+        every 1 s {
+            variable x = 0
+            variable ratio = 0.5
+            x = 3 * scale + 5
+            counter = counter + scale * 2
+            x = x * (2 - 1)
+            ratio = ratio * 2.0
+            x = 7 / 2
+        }
+    }
+}
+"""
+
+
+class TestFolding(unittest.TestCase):
+    """
+    Tests for the constant folding pass.
+    """
+
+    def setUp(self):
+        """
+        Sets up the test.
+        """
+        self.scenario = aml.AML.parse(source)
+        self.periodic = self.scenario.codeblocktable.codeblocks[0].codeblocktable.codeblocks[0]
+
+    def tearDown(self):
+        """
+        Tears down the test.
+        """
+        pass
+
+    def expressions(self):
+        """
+        Gets the identifiers of the expressions of the periodic attack.
+        """
+        return [list(item.expression) for item in self.periodic.codeblocktable.codeblocks]
+
+    def test_fold(self):
+        """
+        Tests the function fold.
+        """
+        before = self.expressions()
+        self.assertEqual(folding.fold(self.scenario), 3)
+        self.assertListEqual(self.expressions(), [
+            ['__3005'],
+            ['counter', '__2000', '__+'],
+            ['x', '__1', '__*'],
+            before[3],
+            before[4]])
+        # The new literals are defined in the owning codeblock
+        self.assertEqual(self.periodic.symboltable.object('__3005').value, 3005)
+        # Folding again does nothing
+        self.assertEqual(folding.fold(self.scenario), 0)
+
+    def test_power(self):
+        """
+        Tests that the integer powers are folded up to a bounded size.
+        """
+        def literal(value):
+            return types.Variable(types.Variable.autoidentifier(value), types.Variable.Type.INTEGER, value)
+        power = types.Reserved(lexer.BasicOperatorType.EXP.value).identifier
+        self.assertEqual(evaluation.apply(power, literal(2), literal(10)).value, 1024)
+        self.assertEqual(evaluation.apply(power, literal(2), literal(2000)).value, 2 ** 2000)
+        self.assertIsNone(evaluation.apply(power, literal(2), literal(100000000)))
+        self.assertIsNone(evaluation.apply(power, literal(2), literal(-1)))
+        # The powers of zero and one never grow
+        self.assertEqual(evaluation.apply(power, literal(1), literal(100000000)).value, 1)
+        self.assertEqual(evaluation.apply(power, literal(0), literal(100000000)).value, 0)
+
+    def test_frozen(self):
+        """
+        Tests that the frozen scenarios are refused.
+        """
+        self.scenario.freeze()
+        self.assertRaises(AttributeError, folding.fold, self.scenario)
+        thawed = self.scenario.thaw()
+        self.assertEqual(folding.fold(thawed), 3)
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+
+# -----------------------------------------------------------------------------
+# horizon_test.py
+#
+# Author: Francesco Racciatti (racciatti.francesco@gmail.com)
+#
+# This module tests the pruning of the scenarios to the horizon.
+#
+# Usage:
+# $ python3 -m unittest -v horizon_test.py
+# -----------------------------------------------------------------------------
+
+import sys
+import unittest
+
+sys.path.insert(0,"../aml/")
+import aml as aml
+import analysis.timeline as timeline
+import optimizer.horizon as horizon
+
+
+# The scenario: a periodic attack from 10 s and a compound after the horizon
+source = """
+scenario {
+    from 10 s {
+        once {
+            destroyNode(1)
+        }
+        every 3 s {
+            destroyNode(2)
+        }
+    }
+    from 20 s {
+        every 500 ms {
+            destroyNode(3)
+        }
+    }
+    from 90 s {
+        once {
+            destroyNode(4)
+        }
+    }
+}
+"""
+
+# One second, in nanoseconds
+second = 10 ** 9
+
+
+class TestHorizon(unittest.TestCase):
+    """
+    Tests for the pruning to the horizon.
+    """
+
+    def setUp(self):
+        """
+        Sets up the test.
+        """
+        self.scenario = aml.AML.parse(source)
+
+    def tearDown(self):
+        """
+        Tears down the test.
+        """
+        pass
+
+    def test_firings(self):
+        """
+        Tests the function firings.
+        """
+        self.assertEqual(horizon.firings(10, 3, 9), 0)
+        self.assertEqual(horizon.firings(10, 3, 10), 1)
+        self.assertEqual(horizon.firings(10, 3, 12), 1)
+        self.assertEqual(horizon.firings(10, 3, 13), 2)
+        self.assertEqual(horizon.firings(10, 0, 13), None)
+
+    def test_prune(self):
+        """
+        Tests the function prune.
+        """
+        compounds = self.scenario.codeblocktable.codeblocks
+        periodics = [compounds[0].codeblocktable.codeblocks[1], compounds[1].codeblocktable.codeblocks[0]]
+        self.assertEqual([periodic.firings for periodic in periodics], [None, None])
+        self.assertEqual(horizon.prune(self.scenario, 60 * second), horizon.Pruning(1, 2))
+        self.assertEqual([compound.nanoseconds for compound in compounds], [10 * second, 20 * second])
+        # 10, 13, ..., 58 s and 20, 20.5, ..., 60 s
+        self.assertEqual([periodic.firings for periodic in periodics], [17, 81])
+        # The periodic attacks end at their last firing
+        activity = timeline.activity(compounds[0], periodics[0], (0, 1))
+        self.assertEqual(activity.end, 58 * second)
+        self.assertEqual([item.path for item in timeline.Timeline(self.scenario).active(59 * second)], [(1, 0)])
+        self.assertRaises(ValueError, horizon.prune, self.scenario, -1)
+
+    def test_frozen(self):
+        """
+        Tests that the frozen scenarios are not rewritten.
+        """
+        self.scenario.freeze()
+        self.assertRaises(AttributeError, horizon.prune, self.scenario, second)
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+
+# -----------------------------------------------------------------------------
+# index_test.py
+#
+# Author: Francesco Racciatti (racciatti.francesco@gmail.com)
+#
+# This module tests the inverted indexes over the AML scenarios.
+#
+# Usage:
+# $ python3 -m unittest -v index_test.py
+# -----------------------------------------------------------------------------
+
+import sys
+import unittest
+
+sys.path.insert(0,"../aml/")
+import aml as aml
+import model.statements as statements
+import analysis.index as index
+
+
+class TestIndex(unittest.TestCase):
+    """
+    Tests for the inverted indexes.
+    """
+
+    filename = "source.aml"
+
+    def setUp(self):
+        """
+        Sets up the test.
+        """
+        sourcefile = open(self.filename, 'r')
+        self.scenario = aml.AML.parse(sourcefile.read())
+        sourcefile.close()
+        self.index = index.Index.build(self.scenario)
+
+    def tearDown(self):
+        """
+        Tears down the test.
+        """
+        pass
+
+    def locate(self, path):
+        """
+        Gets the item at the given path of the scenario.
+        """
+        item = self.scenario
+        for position in path:
+            item = item.codeblocktable.codeblocks[position]
+        return item
+
+    def test_kind(self):
+        """
+        Tests the method Index::kind.
+        """
+        locations = self.index.kind(statements.DropPacket)
+        self.assertEqual(len(locations), 1)
+        location = locations[0]
+        self.assertIsInstance(location.codeblock, statements.Conditional)
+        self.assertIs(self.locate(location.path), location.primitive)
+        self.assertIs(self.locate(location.path[:-1]), location.codeblock)
+        self.assertTupleEqual(self.index.kind(statements.Once), ())
+
+    def test_node(self):
+        """
+        Tests the method Index::node.
+        """
+        # The node 5 is only targeted by the conditional attacks
+        locations = self.index.node(5)
+        self.assertEqual(len(locations), 3)
+        for location in locations:
+            self.assertIsInstance(location.codeblock, statements.Conditional)
+            self.assertIsNone(location.primitive)
+        codeblocks = self.index.codeblocks(self.index.node(2))
+        self.assertListEqual([codeblock.__class__.__name__ for codeblock in codeblocks],
+                             ['Once', 'Periodic', 'Conditional', 'Conditional', 'Conditional'])
+        self.assertTupleEqual(self.index.node(42), ())
+
+    def test_unknown_node(self):
+        """
+        Tests that the nodes held by the variables the primitives assign are 
+        unknown.
+        """
+        scenario = aml.AML.parse("""
+            scenario {
+                variable n = 5
+                from 1 s {
+                    once {
+                        n = 6
+                        destroyNode(n)
+                        destroyNode(5)
+                    }
+                }
+            }""")
+        nodeindex = index.Index.build(scenario)
+        self.assertEqual(len(nodeindex.node(None)), 1)
+        self.assertEqual(nodeindex.node(None)[0].path, (0, 0, 1))
+        self.assertEqual(len(nodeindex.node(5)), 1)
+        self.assertTupleEqual(nodeindex.node(6), ())
+
+    def test_packet(self):
+        """
+        Tests the method Index::packet.
+        """
+        locations = self.index.packet('fakePacket')
+        kinds = [location.primitive.__class__ for location in locations]
+        self.assertListEqual(kinds, [statements.ClonePacket, statements.WriteField, statements.InjectPacket])
+        self.assertEqual(len(self.index.packet('__captured')), 5)
+        self.assertTupleEqual(self.index.packet('unknown'), ())
+
+    def test_filter(self):
+        """
+        Tests the method Index::filter.
+        """
+        self.assertEqual(len(self.index.filter('tcpfilter')), 1)
+        locations = self.index.filter('udpfilter')
+        self.assertEqual(len(locations), 2)
+        for location in locations:
+            self.assertEqual(location.codeblock.filter, 'udpfilter')
+            self.assertIs(self.locate(location.path), location.codeblock)
+
+    def test_variable(self):
+        """
+        Tests the method Index::variable.
+        """
+        locations = self.index.variable('integer')
+        self.assertTrue(locations)
+        for location in locations:
+            self.assertIsInstance(location.primitive, statements.Expression)
+        self.assertTupleEqual(self.index.variable('fakePacket'), ())
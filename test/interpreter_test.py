@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+
+# -----------------------------------------------------------------------------
+# interpreter_test.py
+#
+# Author: Francesco Racciatti (racciatti.francesco@gmail.com)
+#
+# This module tests the XML interpreter.
+#
+# Usage:
+# $ python3 -m unittest -v interpreter_test.py
+# -----------------------------------------------------------------------------
+
+import sys
+import unittest
+
+sys.path.insert(0,"../aml/")
+import aml as aml
+import model.statements as statements
+import interpreter.interpreter as interpreter
+
+
+class TestXml(unittest.TestCase):
+    """
+    Tests for the XML interpreter.
+    """
+
+    filename = "source.aml"
+
+    # The expected XML of the source
+    golden = "source.xml"
+
+    def setUp(self):
+        """
+        Sets up the test.
+        """
+        sourcefile = open(self.filename, 'r')
+        self.scenario = aml.AML.parse(sourcefile.read())
+        sourcefile.close()
+
+    def tearDown(self):
+        """
+        Tears down the test.
+        """
+        pass
+
+    def test_golden(self):
+        """
+        Tests that the XML of the source matches the expected one.
+        """
+        goldenfile = open(self.golden, 'r')
+        expected = goldenfile.read()
+        goldenfile.close()
+        self.assertEqual(interpreter.Xml.interpret(self.scenario, 0), expected)
+
+    def test_derived(self):
+        """
+        Tests that the attributes derived by the parser are not emitted.
+        """
+        xml = interpreter.Xml.interpret(self.scenario, 0)
+        for tag in ('nanoseconds', 'firings', 'nodeset'):
+            self.assertNotIn('<' + tag + '>', xml)
+
+    def test_unsupported(self):
+        """
+        Tests that the classes with no emitted attributes are refused.
+        """
+        class Custom(statements.DestroyNode):
+            pass
+        self.assertRaises(ValueError, interpreter.XmlVisitor.attributes, Custom('__1'))
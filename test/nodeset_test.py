@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+
+# -----------------------------------------------------------------------------
+# nodeset_test.py
+#
+# Author: Francesco Racciatti (racciatti.francesco@gmail.com)
+#
+# This module tests the compact sets of the target nodes.
+#
+# Usage:
+# $ python3 -m unittest -v nodeset_test.py
+# -----------------------------------------------------------------------------
+
+import sys
+import copy
+import pickle
+import unittest
+
+sys.path.insert(0,"../aml/")
+import model.nodeset as nodeset
+
+
+class TestNodeSet(unittest.TestCase):
+    """
+    Tests for the node sets.
+    """
+
+    def setUp(self):
+        """
+        Sets up the test.
+        """
+        self.dense = nodeset.NodeSet([1, 3, 4, 6, 7, 9, 10, 12])
+        self.runs = nodeset.NodeSet(list(range(0, 1000)) + list(range(5000, 6000)))
+        self.sparse = nodeset.NodeSet([1, 100000, 10**12])
+        self.named = nodeset.NodeSet(['gateway', 2, 'sink'])
+
+    def tearDown(self):
+        """
+        Tears down the test.
+        """
+        pass
+
+    def test_kind(self):
+        """
+        Tests the choice of the representation.
+        """
+        self.assertEqual(self.dense.kind, nodeset.Kind.BITSET)
+        self.assertEqual(self.runs.kind, nodeset.Kind.RANGES)
+        self.assertEqual(self.sparse.kind, nodeset.Kind.HASHSET)
+        self.assertEqual(self.named.kind, nodeset.Kind.HASHSET)
+        self.assertEqual(nodeset.NodeSet().kind, nodeset.Kind.HASHSET)
+
+    def test_contains(self):
+        """
+        Tests the membership.
+        """
+        for nodes, members, others in (
+                (self.dense, [1, 4, 12], [0, 2, 13, -1, 'a', 1.5]),
+                (self.runs, [0, 999, 5000, 5999], [-1, 1000, 4999, 6000, 'a']),
+                (self.sparse, [1, 10**12], [2, 'a']),
+                (self.named, ['gateway', 2], ['other', 3])):
+            for node in members:
+                self.assertIn(node, nodes)
+            for node in others:
+                self.assertNotIn(node, nodes)
+
+    def test_iter(self):
+        """
+        Tests the iteration and the length.
+        """
+        self.assertListEqual(list(self.dense), [1, 3, 4, 6, 7, 9, 10, 12])
+        self.assertEqual(len(self.dense), 8)
+        self.assertEqual(len(self.runs), 2000)
+        self.assertListEqual(list(self.runs)[998:1002], [998, 999, 5000, 5001])
+        self.assertListEqual(list(self.named), [2, 'gateway', 'sink'])
+        self.assertEqual(str(self.dense), '[1, 3, 4, 6, 7, 9, 10, 12]')
+
+    def test_union(self):
+        """
+        Tests the union.
+        """
+        other = nodeset.NodeSet([-2, 0, 2, 4])
+        union = self.dense | other
+        self.assertEqual(union.kind, nodeset.Kind.BITSET)
+        self.assertListEqual(list(union), [-2, 0, 1, 2, 3, 4, 6, 7, 9, 10, 12])
+        other = nodeset.NodeSet(range(1000, 5000))
+        union = self.runs | other
+        self.assertEqual(union.kind, nodeset.Kind.RANGES)
+        self.assertEqual(union, nodeset.NodeSet(range(0, 6000)))
+        union = self.named | self.dense
+        self.assertEqual(len(union), 11)
+        self.assertIn('sink', union)
+        self.assertIs(self.dense | nodeset.NodeSet(), self.dense)
+        # The bitsets far apart are not merged into a single bitmap
+        union = nodeset.NodeSet([0, 1, 2]) | nodeset.NodeSet([10 ** 9, 10 ** 9 + 1])
+        self.assertNotEqual(union.kind, nodeset.Kind.BITSET)
+        self.assertListEqual(list(union), [0, 1, 2, 10 ** 9, 10 ** 9 + 1])
+
+    def test_intersection(self):
+        """
+        Tests the intersection.
+        """
+        other = nodeset.NodeSet([4, 5, 6, 7, 8, 30])
+        self.assertListEqual(list(self.dense & other), [4, 6, 7])
+        other = nodeset.NodeSet(list(range(990, 1010)) + list(range(5990, 7000)))
+        intersection = self.runs & other
+        self.assertEqual(intersection.kind, nodeset.Kind.RANGES)
+        self.assertListEqual(list(intersection), list(range(990, 1000)) + list(range(5990, 6000)))
+        self.assertListEqual(list(self.named & self.dense), [])
+        self.assertTrue(self.named.isdisjoint(self.dense))
+        self.assertFalse(self.runs.isdisjoint(self.dense))
+        self.assertFalse(self.dense & nodeset.NodeSet([100]))
+        self.assertFalse(nodeset.NodeSet([0, 1, 2]) & nodeset.NodeSet([10 ** 9]))
+        intersection = nodeset.NodeSet(range(0, 100, 2)) & nodeset.NodeSet(range(50, 300, 2))
+        self.assertEqual(intersection, nodeset.NodeSet(range(50, 100, 2)))
+
+    def test_eq(self):
+        """
+        Tests the equality, regardless of the representation.
+        """
+        ranges = nodeset.NodeSet(range(0, 1000)) | nodeset.NodeSet(range(2000, 3000))
+        bitset = nodeset.NodeSet(range(0, 3000)) & nodeset.NodeSet(list(range(0, 1000)) + list(range(2000, 3000, 2)))
+        self.assertEqual(nodeset.NodeSet([3, 1, 2, 1]), nodeset.NodeSet([1, 2, 3]))
+        self.assertNotEqual(ranges, bitset)
+        self.assertEqual(ranges | bitset, ranges)
+        self.assertEqual(hash(self.dense), hash(nodeset.NodeSet(list(self.dense))))
+
+    def test_copy(self):
+        """
+        Tests the copies and the pickling.
+        """
+        self.assertIs(copy.deepcopy(self.dense), self.dense)
+        for nodes in (self.dense, self.runs, self.sparse, self.named):
+            restored = pickle.loads(pickle.dumps(nodes))
+            self.assertEqual(restored, nodes)
+            self.assertEqual(restored.kind, nodes.kind)
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+
+# -----------------------------------------------------------------------------
+# normalization_test.py
+#
+# Author: Francesco Racciatti (racciatti.francesco@gmail.com)
+#
+# This module tests the normalization of the filters.
+#
+# Usage:
+# $ python3 -m unittest -v normalization_test.py
+# -----------------------------------------------------------------------------
+
+import sys
+import unittest
+
+sys.path.insert(0,"../aml/")
+import aml as aml
+import model.types as types
+import model.visitor as visitor
+import optimizer.normalization as normalization
+
+
+# The scenario: the filters hold duplicated, subsumed and contradicting terms
+source = """
+scenario {
+    list targets = [1, 2]
+    filter subsumed = (("layer4.sourcePort" == 80) || (("layer4.sourcePort" == 80) && ("layer4.length" > 100)))
+    filter ports = ((("layer4.sourcePort" == 80) || ("layer4.sourcePort" == 443)) || ("layer4.sourcePort" == 80))
+    filter never = (("layer4.sourcePort" == 80) && ("layer4.sourcePort" == 443))
+    filter empty = (("layer4.length" > 100) && ("layer4.length" < 50))
+    filter always = (("layer4.sourcePort" == 80) || ("layer4.sourcePort" != 80))
+    filter bounds = (("layer4.length" > 100) && ("layer4.length" > 50))
+    filter plain = ("layer4.sourcePort" == 80)
+    from 1 s {
+        for nodes in targets {
+            for packets matching never {
+                dropPacket(captured)
+            }
+        }
+        for nodes in targets {
+            for packets matching ports {
+                dropPacket(captured)
+            }
+        }
+    }
+}
+"""
+
+
+class _Filters(visitor.Visitor):
+    """
+    Collects the normal forms of the filters of the scenario.
+    """
+
+    def __init__(self):
+        """
+        Initializes the _Filters object.
+        """
+        self.normal_dict = {}
+        self.items_dict = {}
+
+    def enter_symboltable(self, symboltable):
+        for identifier, obj in symboltable.identifier_object_dict.items():
+            if obj.symboltype == types.Symbol.Type.FILTER:
+                self.items_dict[identifier] = tuple(obj.items)
+                self.normal_dict[identifier] = normalization.normalize_items(obj.items, self.resolve)
+        return visitor.Visitor.PRUNE
+
+    def enter_primitive(self, primitive):
+        return visitor.Visitor.PRUNE
+
+
+class TestNormalization(unittest.TestCase):
+    """
+    Tests for the normalization of the filters.
+    """
+
+    def setUp(self):
+        """
+        Sets up the test.
+        """
+        self.scenario = aml.AML.parse(source)
+
+    def tearDown(self):
+        """
+        Tears down the test.
+        """
+        pass
+
+    def test_normalize_items(self):
+        """
+        Tests the function normalize_items.
+        """
+        normal_dict = _Filters().visit(self.scenario).normal_dict
+        port = normalization.Atom('__layer4.sourcePort', '==', '__80')
+        # The conjunction is absorbed
+        self.assertEqual(normal_dict['subsumed'], normalization.Normal(normalization.Outcome.FILTER, ((port,),), ()))
+        # The equalities are merged, once each
+        self.assertEqual(normal_dict['ports'].members,
+                         (normalization.Member('__layer4.sourcePort', ('__443', '__80')),))
+        self.assertEqual(normal_dict['ports'].clauses, ())
+        self.assertIs(normal_dict['never'].outcome, normalization.Outcome.FALSE)
+        self.assertIs(normal_dict['empty'].outcome, normalization.Outcome.FALSE)
+        self.assertIs(normal_dict['always'].outcome, normalization.Outcome.TRUE)
+        # The tighter bound is kept
+        self.assertEqual(normal_dict['bounds'].clauses,
+                         ((normalization.Atom('__layer4.length', '>', '__100'),),))
+
+    def test_normalize(self):
+        """
+        Tests the function normalize.
+        """
+        outcome = normalization.normalize(self.scenario)
+        self.assertEqual(outcome, normalization.Normalization(3, 1, 2, 1))
+        items_dict = _Filters().visit(self.scenario).items_dict
+        self.assertEqual(items_dict['subsumed'], ('__layer4.sourcePort', '__80', '__=='))
+        self.assertEqual(items_dict['ports'], ('__layer4.sourcePort', '__443', '__==',
+                                               '__layer4.sourcePort', '__80', '__==', '__||'))
+        self.assertEqual(items_dict['bounds'], ('__layer4.length', '__100', '__>'))
+        self.assertEqual(items_dict['plain'], ('__layer4.sourcePort', '__80', '__=='))
+        # The conditional attack matching no packet is dropped
+        conditionals = self.scenario.codeblocktable.codeblocks[0].codeblocktable.codeblocks
+        self.assertEqual([conditional.filter for conditional in conditionals], ['ports'])
+        # The normal forms are stable
+        self.assertEqual(normalization.normalize(self.scenario), normalization.Normalization(0, 1, 2, 0))
+
+    def test_blowup(self):
+        """
+        Tests that the filters whose normal forms are larger are kept.
+        """
+        source = """
+        scenario {
+            list targets = [1, 2]
+            filter product = ((("layer4.sourcePort" == 1) || ("layer4.destinationPort" == 2)) && 
+                              (("layer4.length" > 3) || ("layer4.checksum" == 4))) && 
+                             (("layer3.ttl" < 5) || ("layer3.version" == 6))
+            from 1 s {
+                for nodes in targets {
+                    for packets matching product {
+                        dropPacket(captured)
+                    }
+                }
+            }
+        }
+        """
+        scenario = aml.AML.parse(source)
+        before = _Filters().visit(scenario).items_dict['product']
+        self.assertEqual(len(before), 23)
+        # The normal form has 8 clauses of 3 comparisons
+        normal = _Filters().visit(scenario).normal_dict['product']
+        self.assertEqual(len(normal.clauses), 8)
+        self.assertEqual(normalization.normalize(scenario), normalization.Normalization(0, 0, 0, 0))
+        self.assertEqual(_Filters().visit(scenario).items_dict['product'], before)
+
+    def test_frozen(self):
+        """
+        Tests that the frozen scenarios are not rewritten.
+        """
+        self.scenario.freeze()
+        self.assertRaises(AttributeError, normalization.normalize, self.scenario)
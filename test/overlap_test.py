@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+
+# -----------------------------------------------------------------------------
+# overlap_test.py
+#
+# Author: Francesco Racciatti (racciatti.francesco@gmail.com)
+#
+# This module tests the overlap and satisfiability analysis of the filters.
+#
+# Usage:
+# $ python3 -m unittest -v overlap_test.py
+# -----------------------------------------------------------------------------
+
+import sys
+import unittest
+
+sys.path.insert(0,"../aml/")
+import aml as aml
+import analysis.overlap as overlap
+
+
+# The scenario: the web filters overlap on the port 80, the dns one is
+# disjoint from them and the last one matches nothing
+source = """
+scenario {
+    list targets = [1, 2]
+    list others = [3]
+    filter web = (("layer4.sourcePort" == 80) || ("layer4.sourcePort" == 443))
+    filter large = (("layer4.sourcePort" == 80) && ("layer4.length" > 100))
+    filter dns = (("layer4.sourcePort" == 53) && ("layer4.length" < 512))
+    filter short = (("layer4.length" >= 0) && ("layer4.length" <= 200))
+    filter never = (("layer4.length" > 100) && ("layer4.length" < 50))
+    from 1 s {
+        for nodes in targets {
+            for packets matching web {
+                dropPacket(captured)
+            }
+        }
+        for nodes in targets {
+            for packets matching large {
+                dropPacket(captured)
+            }
+        }
+        for nodes in others {
+            for packets matching web {
+                dropPacket(captured)
+            }
+        }
+    }
+}
+"""
+
+
+class TestOverlap(unittest.TestCase):
+    """
+    Tests for the overlap and satisfiability analysis.
+    """
+
+    def setUp(self):
+        """
+        Sets up the test.
+        """
+        self.analysis = overlap.Overlap.build(aml.AML.parse(source))
+        self.ids = {identifier: position for position, (codeblock, identifier) in enumerate(self.analysis.filters)}
+
+    def tearDown(self):
+        """
+        Tears down the test.
+        """
+        pass
+
+    def test_domains(self):
+        """
+        Tests the functions over the domains.
+        """
+        domain = overlap.restrict(overlap.universe, '>', 10)
+        self.assertTrue(overlap.contains(domain, 11))
+        self.assertFalse(overlap.contains(domain, 10))
+        self.assertTrue(overlap.empty(overlap.restrict(domain, '<=', 10)))
+        self.assertFalse(overlap.empty(overlap.restrict(domain, '<=', 11)))
+        point = overlap.restrict(overlap.restrict(overlap.universe, '>=', 5), '<=', 5)
+        self.assertTrue(overlap.empty(overlap.restrict(point, '!=', 5)))
+        self.assertTrue(overlap.within(overlap.restrict(domain, '<', 20), domain))
+        self.assertFalse(overlap.within(domain, overlap.restrict(domain, '<', 20)))
+        self.assertFalse(overlap.within(domain, overlap.restrict(domain, '!=', 15)))
+        self.assertTrue(overlap.within(point, overlap.restrict(overlap.universe, '==', 5)))
+        self.assertTrue(overlap.empty(overlap.meet(domain, overlap.restrict(overlap.universe, '==', 3))))
+
+    def test_relations(self):
+        """
+        Tests the relations between the filters.
+        """
+        self.assertEqual(self.analysis.empty(), [self.ids['never']])
+        self.assertIs(self.analysis.relation(self.ids['large'], self.ids['web']), overlap.Relation.SUBSUMED)
+        self.assertIs(self.analysis.relation(self.ids['web'], self.ids['large']), overlap.Relation.SUBSUMES)
+        self.assertIs(self.analysis.relation(self.ids['web'], self.ids['dns']), overlap.Relation.DISJOINT)
+        self.assertIs(self.analysis.relation(self.ids['dns'], self.ids['short']), overlap.Relation.OVERLAP)
+        self.assertIs(self.analysis.relation(self.ids['web'], self.ids['web']), overlap.Relation.EQUIVALENT)
+        pairs = set((self.analysis.filters[first][1], self.analysis.filters[second][1], outcome)
+                    for first, second, outcome in self.analysis.overlaps())
+        self.assertEqual(pairs, {('web', 'large', overlap.Relation.SUBSUMES),
+                                 ('web', 'short', overlap.Relation.OVERLAP),
+                                 ('large', 'short', overlap.Relation.OVERLAP),
+                                 ('dns', 'short', overlap.Relation.OVERLAP)})
+
+    def test_index(self):
+        """
+        Tests that the filters pinning the port to other values are not compared.
+        """
+        self.assertEqual(self.analysis.id_fields_dict[self.ids['web']], {'layer4.sourcePort'})
+        self.assertNotIn(self.ids['dns'], self.analysis.candidates(self.ids['web']))
+        self.assertIn(self.ids['short'], self.analysis.candidates(self.ids['web']))
+        self.analysis.overlaps()
+        # Out of the 6 pairs of non empty filters, web and large are never
+        # compared with dns
+        self.assertEqual(self.analysis.checks, 4)
+
+    def test_collisions(self):
+        """
+        Tests the method Overlap::collisions.
+        """
+        collisions = self.analysis.collisions()
+        # The third conditional targets other nodes
+        self.assertEqual(len(collisions), 1)
+        first, second, outcome = collisions[0]
+        self.assertEqual((first.filter, second.filter, outcome), ('web', 'large', overlap.Relation.SUBSUMES))
+
+    def test_scale(self):
+        """
+        Tests the index over many filters pinning the same field.
+        """
+        filters = '\n'.join('    filter f%d = (("layer4.sourcePort" == %d) && ("layer4.length" > 100))' % (port, port)
+                            for port in range(300))
+        analysis = overlap.Overlap.build(aml.AML.parse('scenario {\n' + filters + '\n}\n'))
+        self.assertEqual(analysis.overlaps(), [])
+        self.assertEqual(analysis.checks, 0)
+
+    def test_variables(self):
+        """
+        Tests the comparisons against variables.
+        """
+        scoped = """
+        scenario {
+            from 1 s {
+                variable x = 1
+                filter f = (x == 1)
+                once {
+                    destroyNode(1)
+                }
+            }
+            from 2 s {
+                variable x = 2
+                filter f = (x == 1)
+                once {
+                    destroyNode(1)
+                }
+            }
+            from 3 s {
+                variable x = 2
+                variable port = "layer4.sourcePort"
+                filter f = ((x == 1) && (port == 80))
+                filter g = (port == 80)
+                once {
+                    x = x + 1
+                }
+            }
+        }
+        """
+        analysis = overlap.Overlap.build(aml.AML.parse(scoped))
+        # The constant variables are replaced by their values
+        self.assertEqual(analysis.abstractions[0], overlap.Abstraction(({},), True))
+        self.assertEqual(analysis.empty(), [1])
+        self.assertEqual(analysis.abstractions[3].boxes,
+                         ({'layer4.sourcePort': overlap.restrict(overlap.universe, '==', 80)},))
+        # The assigned variables admit any value, inexactly
+        self.assertFalse(analysis.abstractions[2].exact)
+        self.assertEqual(analysis.abstractions[2].boxes, analysis.abstractions[3].boxes)
+        self.assertIs(analysis.relation(2, 3), overlap.Relation.OVERLAP)
+        self.assertEqual([(first, second) for first, second, outcome in analysis.overlaps()],
+                         [(0, 2), (0, 3), (2, 3)])
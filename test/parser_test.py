@@ -53,3 +53,86 @@ class TestParser(unittest.TestCase):
         except (ValueError, RuntimeError) as e:
             self.fail(e)
 
+    def test_parser_reuse(self):
+        """
+        Tests that the parser can be used more than once.
+        """
+        first = aml.AML.parse(self.source)
+        second = aml.AML.parse(self.source)
+        self.assertEqual(len(first.codeblocktable.codeblocks), len(second.codeblocktable.codeblocks))
+        self.assertEqual(list(first.symboltable.identifier_object_dict), 
+                list(second.symboltable.identifier_object_dict))
+
+    def test_nanoseconds(self):
+        """
+        Tests the normalization of the times into nanoseconds.
+        """
+        scenario = aml.AML.parse(self.source)
+        compounds = scenario.codeblocktable.codeblocks
+        # from scenarioVarInteger us, from 200 ms, from 100.5 s
+        self.assertListEqual([compound.nanoseconds for compound in compounds], 
+                [10000000, 200000000, 100500000000])
+        self.assertEqual(compounds[1].unit, '__ms')
+        periodics = [codeblock for codeblock in compounds[2].codeblocktable.codeblocks 
+                if codeblock.__class__.__name__ == 'Periodic']
+        self.assertTrue(periodics)
+        for periodic in periodics:
+            self.assertEqual(periodic.nanoseconds, 10000000000)
+        # The real variables can define a time
+        source = "scenario { variable start = 0.25 from start ms { once { destroyNode(1) } } }"
+        scenario = aml.AML.parse(source)
+        self.assertEqual(scenario.codeblocktable.codeblocks[0].nanoseconds, 250000)
+        # The negative times are refused
+        source = "scenario { variable start = -1 from start ms { once { destroyNode(1) } } }"
+        self.assertRaises(RuntimeError, aml.AML.parse, source)
+        # The variables typed by an assignment but holding no value are refused
+        source = "scenario { variable t from 1 s { once { t = 5 } } from t s { once { destroyNode(1) } } }"
+        self.assertRaisesRegex(RuntimeError, "uninitialized variable - line 1", aml.AML.parse, source)
+        source = "scenario { from 1 s { variable p once { p = 5 } every p s { destroyNode(1) } } }"
+        self.assertRaisesRegex(RuntimeError, "uninitialized variable - line 1", aml.AML.parse, source)
+
+    def test_nodeset(self):
+        """
+        Tests the resolution of the target nodes of the conditionals.
+        """
+        scenario = aml.AML.parse(self.source)
+        conditionals = [codeblock for compound in scenario.codeblocktable.codeblocks
+                for codeblock in compound.codeblocktable.codeblocks
+                if codeblock.__class__.__name__ == 'Conditional']
+        self.assertTrue(conditionals)
+        for conditional in conditionals:
+            self.assertListEqual(list(conditional.nodeset), [1, 2, 3, 4, 5])
+            self.assertIn(3, conditional.nodeset)
+            self.assertNotIn(6, conditional.nodeset)
+        # The lists of nodes cannot refer the variables declared without a value
+        source = """scenario {
+            variable node
+            list targets = [1, node]
+            filter tcpfilter = ("layer4.sourcePort" == 80)
+            from 1 s { for nodes in targets { for packets matching tcpfilter { dropPacket(captured) } } }
+        }"""
+        self.assertRaises(RuntimeError, aml.AML.parse, source)
+
+    def test_numericitems(self):
+        """
+        Tests the typed storage of the numeric lists.
+        """
+        source = """scenario { 
+            variable node = 4
+            list integers = [1, 2, 3]
+            list reals = [0.5, 1.5]
+            list mixed = [1, 2.5]
+            list named = [1, node]
+            from 1 s { once { destroyNode(1) } } 
+        }"""
+        scenario = aml.AML.parse(source)
+        symboltable = scenario.symboltable
+        items = symboltable.object('integers').items
+        self.assertEqual(items.values.typecode, 'q')
+        self.assertEqual(items, ('__1', '__2', '__3'))
+        self.assertEqual(symboltable.object('reals').items.values.typecode, 'd')
+        self.assertTupleEqual(symboltable.object('mixed').items, ('__1', '__2.5'))
+        self.assertTupleEqual(symboltable.object('named').items, ('__1', 'node'))
+        # The items still refer the literals, which the XML consumers resolve
+        for item in items:
+            self.assertTrue(symboltable.exist(item))
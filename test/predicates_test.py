@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+
+# -----------------------------------------------------------------------------
+# predicates_test.py
+#
+# Author: Francesco Racciatti (racciatti.francesco@gmail.com)
+#
+# This module tests the shared predicate DAG of the filters.
+#
+# Usage:
+# $ python3 -m unittest -v predicates_test.py
+# -----------------------------------------------------------------------------
+
+import sys
+import unittest
+
+sys.path.insert(0,"../aml/")
+import aml as aml
+import optimizer.predicates as predicates
+
+
+# The scenario: the filters share the check on the source port
+source = """
+scenario {
+    list targets = [1, 2]
+    filter web = (("layer4.sourcePort" == 80) && ("layer3.destination" == "10.0.0.1"))
+    filter other = ((80 == "layer4.sourcePort") && ("layer3.destination" == "10.0.0.2"))
+    filter same = (("layer3.destination" == "10.0.0.1") && ("layer4.sourcePort" == 80))
+    filter large = (("layer4.length" > 100) || ("layer4.sourcePort" == 80))
+    from 1 s {
+        for nodes in targets {
+            for packets matching web {
+                dropPacket(captured)
+            }
+        }
+        for nodes in targets {
+            for packets matching large {
+                dropPacket(captured)
+            }
+        }
+    }
+}
+"""
+
+
+class TestPredicates(unittest.TestCase):
+    """
+    Tests for the shared predicate DAG.
+    """
+
+    def setUp(self):
+        """
+        Sets up the test.
+        """
+        self.scenario = aml.AML.parse(source)
+        self.dag = predicates.PredicateDag.build(self.scenario)
+        self.roots = {identifier: root for codeblock, identifier, root in self.dag.filters}
+
+    def tearDown(self):
+        """
+        Tears down the test.
+        """
+        pass
+
+    def test_build(self):
+        """
+        Tests the method PredicateDag::build.
+        """
+        self.assertEqual(len(self.roots), 4)
+        # The port check, the two destination checks and the length check
+        self.assertEqual(self.dag.comparisons(), 4)
+        # The conjunctions are commutative
+        self.assertEqual(self.roots['web'], self.roots['same'])
+        self.assertNotEqual(self.roots['web'], self.roots['other'])
+        conditionals = self.scenario.codeblocktable.codeblocks[0].codeblocktable.codeblocks
+        self.assertEqual(self.dag.root(conditionals[0]), self.roots['web'])
+        self.assertEqual(self.dag.root(conditionals[1]), self.roots['large'])
+        # The children come before their parents
+        for identifier, node in enumerate(self.dag.nodes):
+            if node[0] is not predicates.Kind.COMPARE:
+                self.assertTrue(all(child < identifier for child in node[1]))
+
+    def test_evaluate(self):
+        """
+        Tests the method PredicateDag::evaluate.
+        """
+        packet = {'layer4.sourcePort': 80, 'layer3.destination': '10.0.0.2', 'layer4.length': 10}
+        reads = []
+
+        def operand(key):
+            if key[0] == 'literal' and key[2] in packet:
+                reads.append(key[2])
+                return packet[key[2]]
+            return key[2]
+
+        roots = [self.roots[identifier] for identifier in ('web', 'other', 'same', 'large')]
+        self.assertListEqual(self.dag.evaluate(roots, operand), [False, True, False, True])
+        # The port check is evaluated once
+        self.assertEqual(reads.count('layer4.sourcePort'), 1)
+
+    def test_scopes(self):
+        """
+        Tests that the variables bound in different scopes are not shared.
+        """
+        scoped = """
+        scenario {
+            from 1 s {
+                variable port = 80
+                filter f = ("layer4.sourcePort" == port)
+                once {
+                    destroyNode(1)
+                }
+            }
+            from 2 s {
+                variable port = 443
+                filter f = ("layer4.sourcePort" == port)
+                once {
+                    destroyNode(1)
+                }
+            }
+        }
+        """
+        dag = predicates.PredicateDag.build(aml.AML.parse(scoped))
+        roots = [root for codeblock, identifier, root in dag.filters]
+        self.assertEqual(len(roots), 2)
+        self.assertNotEqual(roots[0], roots[1])
+        self.assertEqual(dag.hits, 0)
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+
+# -----------------------------------------------------------------------------
+# reordering_test.py
+#
+# Author: Francesco Racciatti (racciatti.francesco@gmail.com)
+#
+# This module tests the reordering of the predicates of the filters.
+#
+# Usage:
+# $ python3 -m unittest -v reordering_test.py
+# -----------------------------------------------------------------------------
+
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0,"../aml/")
+import aml as aml
+import model.types as types
+import model.visitor as visitor
+import optimizer.reordering as reordering
+
+
+# The scenario: the cheap and selective comparisons are written last
+source = """
+scenario {
+    list targets = [1, 2]
+    filter web = ((("layer3.destination" != "10.0.0.1") && ("layer4.length" > 100)) && ("layer4.sourcePort" == 80))
+    filter any = (("layer3.destination" == "10.0.0.1") || ("layer4.sourcePort" != 80))
+    filter plain = ("layer4.sourcePort" == 80)
+    from 1 s {
+        for nodes in targets {
+            for packets matching web {
+                dropPacket(captured)
+            }
+        }
+    }
+}
+"""
+
+# The sample trace: most packets are large and come from the port 80
+trace = [{'layer3.destination': '10.0.0.2', 'layer4.length': 50 + packet, 'layer4.sourcePort': 80}
+         for packet in range(100)]
+
+
+class _Filters(visitor.Visitor):
+    """
+    Collects the items of the filters of the scenario.
+    """
+
+    def __init__(self):
+        """
+        Initializes the _Filters object.
+        """
+        self.items_dict = {}
+
+    def enter_symboltable(self, symboltable):
+        for identifier, obj in symboltable.identifier_object_dict.items():
+            if obj.symboltype == types.Symbol.Type.FILTER:
+                self.items_dict[identifier] = tuple(obj.items)
+        return visitor.Visitor.PRUNE
+
+    def enter_primitive(self, primitive):
+        return visitor.Visitor.PRUNE
+
+
+class TestReordering(unittest.TestCase):
+    """
+    Tests for the reordering of the predicates.
+    """
+
+    def setUp(self):
+        """
+        Sets up the test.
+        """
+        self.scenario = aml.AML.parse(source)
+        self.items_dict = _Filters().visit(self.scenario).items_dict
+
+    def tearDown(self):
+        """
+        Tears down the test.
+        """
+        pass
+
+    def comparisons(self, identifier):
+        """
+        Gets the fields of the comparisons of a filter, in order.
+        """
+        items = _Filters().visit(self.scenario).items_dict[identifier]
+        return [item for item in items if item.startswith('__layer')]
+
+    def test_reorder_defaults(self):
+        """
+        Tests the function reorder with the default statistics.
+        """
+        self.assertEqual(reordering.reorder(self.scenario), 2)
+        # The equality on the port is cheap and selective
+        self.assertEqual(self.comparisons('web'),
+                         ['__layer4.sourcePort', '__layer4.length', '__layer3.destination'])
+        # The inequality on the port is cheap and likely decides the disjunction
+        self.assertEqual(self.comparisons('any'), ['__layer4.sourcePort', '__layer3.destination'])
+        self.assertEqual(_Filters().visit(self.scenario).items_dict['plain'], self.items_dict['plain'])
+        # The items are the same, in another order
+        items_dict = _Filters().visit(self.scenario).items_dict
+        for identifier in self.items_dict:
+            self.assertEqual(sorted(items_dict[identifier]), sorted(self.items_dict[identifier]))
+        # The order is stable
+        self.assertEqual(reordering.reorder(self.scenario), 0)
+
+    def test_reorder_statistics(self):
+        """
+        Tests the function reorder with the statistics of a trace.
+        """
+        statistics = reordering.Statistics.collect(self.scenario, trace)
+        self.assertEqual(statistics.packets, 100)
+        self.assertEqual(statistics.comparison_matched_dict["'layer4.sourcePort' == 80"], 100)
+        self.assertEqual(statistics.comparison_matched_dict["'layer4.length' > 100"], 49)
+        self.assertAlmostEqual(statistics.selectivity('>', 'layer4.length', 100), 50 / 102)
+        self.assertEqual(statistics.selectivity('<', 'layer4.length', 7), 1 / 3)
+        reordering.reorder(self.scenario, statistics)
+        # The length rules out half of the packets, the other comparisons
+        # match them all and go by cost
+        self.assertEqual(self.comparisons('web'),
+                         ['__layer4.length', '__layer4.sourcePort', '__layer3.destination'])
+
+    def test_class_statistics(self):
+        """
+        Tests the persistence of the class Statistics.
+        """
+        statistics = reordering.Statistics.collect(self.scenario, trace)
+        descriptor, path = tempfile.mkstemp(suffix='.json')
+        os.close(descriptor)
+        try:
+            statistics.save(path)
+            loaded = reordering.Statistics.load(path)
+        finally:
+            os.remove(path)
+        self.assertEqual(loaded.packets, statistics.packets)
+        self.assertEqual(loaded.comparison_matched_dict, statistics.comparison_matched_dict)
+        self.assertRaises(ValueError, reordering.Statistics, -1)
+
+    def test_frozen(self):
+        """
+        Tests that the frozen scenarios are not rewritten.
+        """
+        self.scenario.freeze()
+        self.assertRaises(AttributeError, reordering.reorder, self.scenario)
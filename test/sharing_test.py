@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+
+# -----------------------------------------------------------------------------
+# sharing_test.py
+#
+# Author: Francesco Racciatti (racciatti.francesco@gmail.com)
+#
+# This module tests the sharing of the AML scenarios through shared memory.
+#
+# Usage:
+# $ python3 -m unittest -v sharing_test.py
+# -----------------------------------------------------------------------------
+
+import sys
+import mmap
+import unittest
+import multiprocessing
+
+sys.path.insert(0,"../aml/")
+import aml as aml
+import model.sharing as sharing
+import interpreter.interpreter as interpreter
+
+
+def work(name, queue):
+    """
+    Attaches to the published scenario and sends back its XML representation.
+    """
+    with sharing.attach(name) as attachment:
+        queue.put(interpreter.Xml.interpret(attachment.scenario, 0))
+
+
+class TestSharing(unittest.TestCase):
+    """
+    Tests for the sharing of the scenarios.
+    """
+
+    filename = "source.aml"
+
+    def setUp(self):
+        """
+        Sets up the test.
+        """
+        sourcefile = open(self.filename, 'r')
+        self.scenario = aml.AML.parse(sourcefile.read())
+        sourcefile.close()
+        self.scenario.pack()
+        self.scenario.freeze()
+        self.xml = interpreter.Xml.interpret(self.scenario, 0)
+
+    def tearDown(self):
+        """
+        Tears down the test.
+        """
+        pass
+
+    def test_publish(self):
+        """
+        Tests the function publish.
+        """
+        self.assertRaises(ValueError, sharing.publish, self.scenario.thaw())
+        with sharing.publish(self.scenario) as publication:
+            self.assertTrue(publication.name)
+            self.assertGreater(publication.size, 0)
+
+    def test_attach(self):
+        """
+        Tests the function attach.
+        """
+        with sharing.publish(self.scenario) as publication:
+            attachment = sharing.attach(publication.name)
+            scenario = attachment.scenario
+            self.assertTrue(scenario.frozen())
+            self.assertEqual(interpreter.Xml.interpret(scenario, 0), self.xml)
+            # The typed arrays are read-only views
+            symboltable = scenario.symboltable
+            self.assertIsInstance(symboltable.integers, memoryview)
+            self.assertTrue(symboltable.integers.readonly)
+            self.assertRaises(AttributeError, symboltable.define, None)
+            del scenario, symboltable
+            attachment.close()
+            self.assertIsNone(attachment.scenario)
+
+    def test_attach_references(self):
+        """
+        Tests that the scenario outlives the attachment.
+        """
+        with sharing.publish(self.scenario) as publication:
+            with sharing.attach(publication.name) as attachment:
+                scenario = attachment.scenario
+                compounds = attachment.scenario.codeblocktable.codeblocks
+                integers = scenario.symboltable.integers
+            self.assertIsNone(attachment.scenario)
+            # The typed arrays are not copied out of the segment, which stays
+            # mapped while they are referenced
+            self.assertIsNotNone(attachment.shm.buf)
+            self.assertIsInstance(integers.obj, mmap.mmap)
+            self.assertEqual(interpreter.Xml.interpret(scenario, 0), self.xml)
+            self.assertEqual(len(compounds), len(self.scenario.codeblocktable.codeblocks))
+            self.assertEqual(integers.tolist(), self.scenario.symboltable.integers.tolist())
+            # The segment is closed once the references are gone
+            del scenario, compounds, integers
+            sharing.attach(publication.name).close()
+            self.assertIsNone(attachment.shm.buf)
+
+    def test_attach_wrong_segment(self):
+        """
+        Tests the function attach against a segment not holding a scenario.
+        """
+        segment = sharing.shared_memory.SharedMemory(create=True, size=64)
+        try:
+            self.assertRaises(ValueError, sharing.attach, segment.name)
+        finally:
+            segment.close()
+            segment.unlink()
+
+    def test_workers(self):
+        """
+        Tests the attachment from worker processes.
+        """
+        context = multiprocessing.get_context('fork')
+        queue = context.Queue()
+        with sharing.publish(self.scenario) as publication:
+            workers = [context.Process(target=work, args=(publication.name, queue)) for i in range(2)]
+            for worker in workers:
+                worker.start()
+            results = [queue.get(timeout=30) for worker in workers]
+            for worker in workers:
+                worker.join()
+        for result in results:
+            self.assertEqual(result, self.xml)
@@ -12,11 +12,15 @@
 # -----------------------------------------------------------------------------
 
 import sys
+import copy
+import pickle
+import operator
 import enum
 import unittest
 from unittest.mock import patch
 
 sys.path.insert(0,"../aml/")
+import model.types as types
 import model.statements as statements
 
 class TestPrimitive(unittest.TestCase):
@@ -201,6 +205,142 @@ class TestPrimitive(unittest.TestCase):
         self.assertIsInstance(obj, statements.Primitive)
         self.assertEqual(obj.destination, destination)
         self.assertListEqual(obj.expression, expression)
+        # Tests the structural equality
+        self.assertEqual(obj, statements.Expression(destination, list(expression)))
+        self.assertEqual(hash(obj), hash(statements.Expression(destination, list(expression))))
+        self.assertNotEqual(obj, statements.Expression('other', expression))
+        self.assertNotEqual(obj, statements.DropPacket(destination))
+
+
+class TestCodeblock(unittest.TestCase):
+    """
+    Tests for the AML codeblocks.
+    """
+
+    def test_hashcons(self):
+        """
+        Tests the method Codeblock::hashcons.
+        """
+        # Builds two compounds owning the same filter and expression
+        compounds = statements.CodeblockTable(0)
+        for time in ('__10', '__20'):
+            symboltable = types.SymbolTable(2)
+            symboltable.define(types.Filter('flt', ['__1', '__2', '__==']))
+            codeblocktable = statements.CodeblockTable(2)
+            codeblocktable.append(statements.Expression('var', ['__1', '__2', '__+']))
+            once = statements.Once(symboltable, codeblocktable)
+            codeblocktable = statements.CodeblockTable(1)
+            codeblocktable.append(once)
+            compound = statements.Compound(types.SymbolTable(1), codeblocktable, time, '__s')
+            compounds.append(compound)
+        scenario = statements.Scenario(types.SymbolTable(0), compounds)
+        hashconstable = scenario.hashcons(types.HashConsTable())
+        self.assertEqual(len(hashconstable), 2)
+        self.assertEqual(hashconstable.hits, 2)
+        first, second = [compound.codeblocktable.codeblocks[0] for compound in scenario.codeblocktable.codeblocks]
+        self.assertIs(first.symboltable.object('flt'), second.symboltable.object('flt'))
+        self.assertIs(first.codeblocktable.codeblocks[0], second.codeblocktable.codeblocks[0])
+
+
+    def test_freeze(self):
+        """
+        Tests the methods Codeblock::freeze and Codeblock::thaw.
+        """
+        symboltable = types.SymbolTable(2)
+        symboltable.define(types.Variable('var', types.Variable.Type.INTEGER, 1))
+        codeblocktable = statements.CodeblockTable(2)
+        codeblocktable.append(statements.Expression('var', ['var', '__1', '__+']))
+        once = statements.Once(symboltable, codeblocktable)
+        codeblocktable = statements.CodeblockTable(1)
+        codeblocktable.append(once)
+        compound = statements.Compound(types.SymbolTable(1), codeblocktable, '__10', '__s')
+        codeblocktable = statements.CodeblockTable(0)
+        codeblocktable.append(compound)
+        scenario = statements.Scenario(types.SymbolTable(0), codeblocktable)
+        # Freezes the scenario in place
+        self.assertIs(scenario.freeze(), scenario)
+        self.assertTrue(scenario.frozen())
+        self.assertIs(copy.deepcopy(scenario), scenario)
+        compound = scenario.codeblocktable.codeblocks[0]
+        once = compound.codeblocktable.codeblocks[0]
+        expression = once.codeblocktable.codeblocks[0]
+        variable = once.symboltable.object('var')
+        self.assertTrue(expression.frozen())
+        self.assertTrue(variable.frozen())
+        # Checks the read-only semantics
+        self.assertRaises(AttributeError, setattr, compound, 'time', '__20')
+        self.assertRaises(AttributeError, setattr, variable, 'value', 2)
+        self.assertRaises(AttributeError, delattr, expression, 'destination')
+        self.assertRaises(AttributeError, once.codeblocktable.append, expression)
+        self.assertRaises(AttributeError, once.codeblocktable.clear)
+        self.assertRaises(AttributeError, once.symboltable.clear)
+        self.assertRaises(AttributeError, once.symboltable.define, types.Packet('pkt'))
+        self.assertRaises(AttributeError, scenario.hashcons, types.HashConsTable())
+        self.assertRaises(TypeError, operator.setitem, once.symboltable.identifier_object_dict, 'var', None)
+        self.assertRaises(TypeError, operator.setitem, expression.expression, 0, 'var')
+        # Thaws a mutable copy
+        thawed = scenario.thaw()
+        self.assertFalse(thawed.frozen())
+        once = thawed.codeblocktable.codeblocks[0].codeblocktable.codeblocks[0]
+        self.assertListEqual(once.codeblocktable.codeblocks[0].expression, ['var', '__1', '__+'])
+        once.symboltable.object('var').value = 2
+        self.assertEqual(variable.value, 1)
+
+    def test_pickle(self):
+        """
+        Tests the round trip of the codeblocks through pickle.
+        """
+        symboltable = types.SymbolTable(2)
+        symboltable.define(types.Variable('var', types.Variable.Type.INTEGER, 1))
+        symboltable.define(types.Filter('flt', ['__1', '__2', '__==']))
+        codeblocktable = statements.CodeblockTable(2)
+        codeblocktable.append(statements.Expression('var', ['var', '__1', '__+']))
+        codeblocktable.append(statements.Expression('var', ['var', '__1', '__+']))
+        codeblocktable.append(statements.DestroyNode('__1'))
+        periodic = statements.Periodic(symboltable, codeblocktable, '__10', '__ms')
+        codeblocktable = statements.CodeblockTable(1)
+        codeblocktable.append(periodic)
+        compound = statements.Compound(types.SymbolTable(1), codeblocktable, '__10', '__s')
+        codeblocktable = statements.CodeblockTable(0)
+        codeblocktable.append(compound)
+        scenario = statements.Scenario(types.SymbolTable(0), codeblocktable)
+        scenario.hashcons(types.HashConsTable())
+        for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1):
+            copied = pickle.loads(pickle.dumps(scenario, protocol))
+            compound = copied.codeblocktable.codeblocks[0]
+            self.assertEqual((compound.time, compound.unit), ('__10', '__s'))
+            periodic = compound.codeblocktable.codeblocks[0]
+            self.assertEqual(periodic.symboltable.object('var').variabletype, types.Variable.Type.INTEGER)
+            expressions = periodic.codeblocktable.codeblocks
+            self.assertListEqual(expressions[0].expression, ['var', '__1', '__+'])
+            # The shared objects stay shared
+            self.assertIs(expressions[0], expressions[1])
+            self.assertIsInstance(expressions[2], statements.DestroyNode)
+        # The frozen scenarios are unpickled frozen
+        scenario.pack()
+        copied = pickle.loads(pickle.dumps(scenario.freeze(), 5))
+        self.assertTrue(copied.frozen())
+        periodic = copied.codeblocktable.codeblocks[0].codeblocktable.codeblocks[0]
+        self.assertTrue(periodic.codeblocktable.frozen())
+        self.assertEqual(periodic.symboltable.object('flt').items, ('__1', '__2', '__=='))
+
+    def test_pack(self):
+        """
+        Tests the method Codeblock::pack.
+        """
+        symboltable = types.SymbolTable(2)
+        symboltable.define(types.Variable('var', types.Variable.Type.INTEGER, 1))
+        once = statements.Once(symboltable, statements.CodeblockTable(2))
+        codeblocktable = statements.CodeblockTable(1)
+        codeblocktable.append(once)
+        compound = statements.Compound(types.SymbolTable(1), codeblocktable, '__10', '__s')
+        self.assertEqual(compound.pack(), 1)
+        self.assertIsInstance(compound.symboltable, types.ArraySymbolTable)
+        once = compound.codeblocktable.codeblocks[0]
+        self.assertIsInstance(once.symboltable, types.ArraySymbolTable)
+        self.assertEqual(once.symboltable.object('var').value, 1)
+        # The packed tables share the identifier table
+        self.assertIs(once.symboltable.identifiertable, compound.symboltable.identifiertable)
 
 
 class TestCodeblockTable(unittest.TestCase):
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+
+# -----------------------------------------------------------------------------
+# timeline_test.py
+#
+# Author: Francesco Racciatti (racciatti.francesco@gmail.com)
+#
+# This module tests the interval index over the timeline of the scenarios.
+#
+# Usage:
+# $ python3 -m unittest -v timeline_test.py
+# -----------------------------------------------------------------------------
+
+import sys
+import random
+import unittest
+
+sys.path.insert(0,"../aml/")
+import aml as aml
+import model.statements as statements
+import analysis.timeline as timeline
+
+
+# The scenario: two once attacks, a periodic attack from 20 s and a
+# conditional attack from 30 s
+source = """
+scenario {
+    list targets = [1, 2]
+    filter udp = ("layer4.sourcePort" == 2000)
+    from 10 s {
+        once {
+            destroyNode(1)
+        }
+    }
+    from 20 s {
+        once {
+            destroyNode(2)
+        }
+        every 5 s {
+            destroyNode(3)
+        }
+    }
+    from 30 s {
+        for nodes in targets {
+            for packets matching udp {
+                dropPacket(captured)
+            }
+        }
+    }
+    from 40 s {
+        once {
+            destroyNode(4)
+        }
+    }
+}
+"""
+
+# One second, in nanoseconds
+second = 10 ** 9
+
+
+class TestTimeline(unittest.TestCase):
+    """
+    Tests for the interval index over the timeline.
+    """
+
+    def setUp(self):
+        """
+        Sets up the test.
+        """
+        self.scenario = aml.AML.parse(source)
+        self.timeline = timeline.Timeline.build(self.scenario)
+
+    def tearDown(self):
+        """
+        Tears down the test.
+        """
+        pass
+
+    def paths(self, activities):
+        """
+        Gets the paths of the activities.
+        """
+        return [activity.path for activity in activities]
+
+    def test_active(self):
+        """
+        Tests the method Timeline::active.
+        """
+        self.assertListEqual(self.paths(self.timeline.active(10 * second)), [(0, 0)])
+        self.assertListEqual(self.paths(self.timeline.active(15 * second)), [])
+        self.assertListEqual(self.paths(self.timeline.active(20 * second)), [(1, 0), (1, 1)])
+        self.assertListEqual(self.paths(self.timeline.active(40 * second)), [(1, 1), (2, 0), (3, 0)])
+        activity = self.timeline.active(35 * second)[0]
+        self.assertIsNone(activity.end)
+        self.assertIsInstance(activity.codeblock, statements.Periodic)
+
+    def test_window(self):
+        """
+        Tests the method Timeline::window.
+        """
+        self.assertListEqual(self.paths(self.timeline.window(0, 9 * second)), [])
+        self.assertListEqual(self.paths(self.timeline.window(5 * second, 25 * second)),
+                             [(0, 0), (1, 0), (1, 1)])
+        self.assertEqual(self.timeline.started(10 * second, 30 * second), 3)
+        self.assertRaises(ValueError, self.timeline.window, 2, 1)
+
+    def test_slice(self):
+        """
+        Tests the method Timeline::slice.
+        """
+        self.scenario.freeze()
+        sliced = self.timeline.slice(25 * second, 35 * second)
+        self.assertTrue(sliced.frozen())
+        compounds = sliced.codeblocktable.codeblocks
+        self.assertListEqual([compound.nanoseconds for compound in compounds], [20 * second, 30 * second])
+        self.assertEqual(len(compounds[0].codeblocktable.codeblocks), 1)
+        self.assertIsInstance(compounds[0].codeblocktable.codeblocks[0], statements.Periodic)
+        # The sub-scenario keeps the symbols it refers
+        self.assertTrue(sliced.symboltable.exist('targets'))
+        # The scenario is left as it is
+        self.assertEqual(len(self.scenario.codeblocktable.codeblocks[1].codeblocktable.codeblocks), 2)
+
+    def test_interval_tree(self):
+        """
+        Tests the interval tree against a linear scan.
+        """
+        generator = random.Random(0)
+        intervals = []
+        for index in range(500):
+            start = generator.randrange(1000)
+            intervals.append((start, start + generator.choice((1, 2, 10, 300)), index))
+        tree = timeline._IntervalTree(intervals)
+        for query in range(200):
+            start = generator.randrange(-10, 1400)
+            stop = start + generator.randrange(1, 100)
+            expected = sorted(index for first, last, index in intervals if first < stop and start < last)
+            self.assertListEqual(sorted(tree.overlap(start, stop)), expected)
@@ -13,6 +13,7 @@
 
 import sys
 import enum
+import pickle
 import unittest
 
 sys.path.insert(0,"../aml/")
@@ -47,6 +48,21 @@ class TestTypes(unittest.TestCase):
             self.assertIn((e.name, e.value), self.tuples)
         self.assertEqual(i + 1, len(self.tuples))
         
+    def test_nanoseconds(self):
+        """
+        Tests the function nanoseconds.
+        """
+        self.assertEqual(types.nanoseconds(1, 's'), 10 ** 9)
+        self.assertEqual(types.nanoseconds(200, 'ms'), 200 * 10 ** 6)
+        self.assertEqual(types.nanoseconds(0.1, 'ms'), 100000)
+        self.assertEqual(types.nanoseconds(100.5, 's'), 100500000000)
+        self.assertEqual(types.nanoseconds(0.0005, 'us'), 0)
+        self.assertEqual(types.nanoseconds(0.0015, 'us'), 2)
+        self.assertRaises(ValueError, types.nanoseconds, 1, 'h')
+        self.assertRaises(ValueError, types.nanoseconds, -1, 's')
+        self.assertRaises(ValueError, types.nanoseconds, 'one', 's')
+        self.assertRaises(ValueError, types.nanoseconds, float('inf'), 's')
+
     def test_class_reserved(self):
         """
         Tests the class types.Reserved.
@@ -64,6 +80,11 @@ class TestTypes(unittest.TestCase):
         identifier = types.Symbol._Symbol__prefix + reserved
         self.assertEqual(obj.identifier, identifier)
         self.assertEqual(obj.reserved, reserved)
+        # Tests the codes
+        self.assertEqual(obj.code, types.Reserved.Code.EQUALTO)
+        self.assertEqual(types.Reserved('ms').code, types.Reserved.Code.MS)
+        self.assertIsNone(types.Reserved('unknown').code)
+        self.assertEqual(len(set(types.Reserved.identifier_code_dict.values())), len(types.Reserved.Code))
          
     def test_class_variable(self):
         """
@@ -79,6 +100,18 @@ class TestTypes(unittest.TestCase):
         value = 'hello'
         autoidentifier = types.Symbol._Symbol__prefix + str(value)
         self.assertEqual(types.Variable.autoidentifier(value), autoidentifier)
+        # Tests the class methods mangled and literal
+        self.assertTrue(types.Symbol.mangled(autoidentifier))
+        self.assertTrue(types.Symbol.mangled(types.Reserved('==').identifier))
+        self.assertFalse(types.Symbol.mangled('var'))
+        symboltable = types.SymbolTable(0)
+        symboltable.define(types.Variable(autoidentifier, types.Variable.Type.STRING, value))
+        symboltable.define(types.Variable('var', types.Variable.Type.INTEGER, 10))
+        symboltable.define(types.Reserved('=='))
+        self.assertEqual(types.Variable.literal(symboltable.object, autoidentifier).value, value)
+        self.assertIsNone(types.Variable.literal(symboltable.object, 'var'))
+        self.assertIsNone(types.Variable.literal(symboltable.object, '__=='))
+        self.assertIsNone(types.Variable.literal(symboltable.object, '__unbound'))
         
         
         # Tests the type of the symbol
@@ -146,10 +179,14 @@ class TestTypes(unittest.TestCase):
         """
         # Tests the class method autoidentifier
         items = ('id1', 'id2', 'id3')
-        autoidentifier = types.Symbol._Symbol__prefix
-        for i in items:
-            autoidentifier += i
-        self.assertEqual(types.List.autoidentifier(items), autoidentifier)
+        autoidentifier = types.List.autoidentifier(items)
+        self.assertTrue(autoidentifier.startswith(types.Symbol._Symbol__prefix))
+        self.assertEqual(len(autoidentifier), len(types.Symbol._Symbol__prefix) + 40)
+        self.assertEqual(types.List.autoidentifier(list(items)), autoidentifier)
+        self.assertNotEqual(types.List.autoidentifier(('id1', 'id2')), autoidentifier)
+        self.assertNotEqual(types.List.autoidentifier(('__a', 'b')), types.List.autoidentifier(('__ab',)))
+        self.assertRaises(ValueError, types.List.autoidentifier, None)
+        self.assertRaises(ValueError, types.List.autoidentifier, ())
         # Tests the type of the symbol
         self.assertEqual(types.List.symboltype, types.Symbol.Type.LIST)
         # Tests the argument guards
@@ -166,8 +203,98 @@ class TestTypes(unittest.TestCase):
         obj = types.List(identifier, items)
         self.assertEqual(obj.identifier, identifier)
         self.assertTupleEqual(obj.items, items)
+
+    def test_class_numericitems(self):
+        """
+        Tests the class types.NumericItems.
+        """
+        items = types.NumericItems.build(types.Variable.Type.INTEGER, [1, 2, 3])
+        self.assertEqual(items.values.typecode, 'q')
+        self.assertEqual(items.variabletype, types.Variable.Type.INTEGER)
+        self.assertEqual(len(items), 3)
+        self.assertEqual(items[0], '__1')
+        self.assertTupleEqual(items[1:], ('__2', '__3'))
+        self.assertListEqual(list(items), ['__1', '__2', '__3'])
+        self.assertIn('__2', items)
+        # The items compare equal to the tuple of their identifiers
+        self.assertEqual(items, ('__1', '__2', '__3'))
+        self.assertEqual(hash(items), hash(('__1', '__2', '__3')))
+        self.assertEqual(str(items), str(['__1', '__2', '__3']))
+        items = types.NumericItems.build(types.Variable.Type.REAL, [0.5, 1.25])
+        self.assertEqual(items.variabletype, types.Variable.Type.REAL)
+        self.assertListEqual(list(items), ['__0.5', '__1.25'])
+        # The values that do not fit a typed array are not packed
+        self.assertIsNone(types.NumericItems.build(types.Variable.Type.STRING, ['a']))
+        self.assertIsNone(types.NumericItems.build(types.Variable.Type.INTEGER, [2 ** 64]))
+        # The lists keep the numeric items and can be pickled
+        obj = types.List('lst', items)
+        self.assertIs(obj.items, items)
+        self.assertEqual(obj, types.List('lst', ('__0.5', '__1.25')))
+        restored = pickle.loads(pickle.dumps(obj))
+        self.assertIsInstance(restored.items, types.NumericItems)
+        self.assertEqual(restored, obj)
+        # The frozen lists hold read-only values, which survive the pickling
+        obj.freeze()
+        self.assertTrue(items.frozen())
+        self.assertEqual(items.typecode, 'd')
+        self.assertRaises(TypeError, items.values.__setitem__, 0, 99.0)
+        self.assertEqual(hash(items), hash(('__0.5', '__1.25')))
+        for protocol in (4, 5):
+            restored = pickle.loads(pickle.dumps(obj, protocol))
+            self.assertTrue(restored.frozen())
+            self.assertTrue(restored.items.frozen())
+            self.assertEqual(restored, obj)
         
         
+class TestHashConsTable(unittest.TestCase):
+    """
+    Tests for the AML HashConsTable.
+    """
+    
+    def setUp(self):
+        """
+        Sets up a hash-consing table.
+        """
+        self.hashconstable = types.HashConsTable()
+
+    def test_equality(self):
+        """
+        Tests the structural equality of filters and lists.
+        """
+        items = ['__layer4.sourcePort', '__80', '__==']
+        self.assertEqual(types.Filter('flt', items), types.Filter('flt', tuple(items)))
+        self.assertEqual(hash(types.Filter('flt', items)), hash(types.Filter('flt', items)))
+        self.assertNotEqual(types.Filter('flt', items), types.Filter('other', items))
+        self.assertNotEqual(types.Filter('flt', items), types.List('flt', items))
+        self.assertNotEqual(types.List('lst', items), types.List('lst', items[:2]))
+
+    def test_intern(self):
+        """
+        Tests the method HashConsTable::intern.
+        """
+        items = ['__1', '__2']
+        first = types.List('lst', items)
+        second = types.List('lst', items)
+        self.assertIs(self.hashconstable.intern(first), first)
+        self.assertIs(self.hashconstable.intern(second), first)
+        self.assertEqual(len(self.hashconstable), 1)
+        self.assertEqual(self.hashconstable.hits, 1)
+        self.assertIn(second, self.hashconstable)
+
+    def test_symboltable(self):
+        """
+        Tests the method SymbolTable::hashcons.
+        """
+        symboltables = [types.SymbolTable(scope) for scope in range(0, 3)]
+        for symboltable in symboltables:
+            symboltable.define(types.Filter('flt', ['__1', '__2', '__==']))
+            symboltable.define(types.Variable('var', types.Variable.Type.INTEGER, 1))
+            symboltable.hashcons(self.hashconstable)
+        self.assertEqual(len(self.hashconstable), 1)
+        self.assertIs(symboltables[0].object('flt'), symboltables[2].object('flt'))
+        self.assertIsNot(symboltables[0].object('var'), symboltables[2].object('var'))
+
+
 class TestSymbolTable(unittest.TestCase):
     """
     Tests for the AML SymbolTable.
@@ -400,6 +527,223 @@ class TestSymbolTable(unittest.TestCase):
         self.symboltable.clear()
         # Checks if the symbol table is empty
         self.assertTrue(self.symboltable.empty())
+
+    def test_pickle(self):
+        """
+        Tests the round trip of the symbol table through pickle.
+        """
+        objects = [
+            types.Reserved('=='),
+            types.Variable('int', types.Variable.Type.INTEGER, 10),
+            types.Variable('real', types.Variable.Type.REAL, 0.5),
+            types.Variable('none', types.Variable.Type.NONE, None),
+            types.Packet('pkt'),
+            types.Filter('flt', ['__1', '__2', '__==']),
+            types.List('lst', ['__1', '__2'])]
+        for obj in objects:
+            self.assertTrue(self.symboltable.define(obj))
+        for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1):
+            symboltable = pickle.loads(pickle.dumps(self.symboltable, protocol))
+            self.assertIs(symboltable.__class__, self.symboltable.__class__)
+            self.assertFalse(symboltable.frozen())
+            self.assertEqual(symboltable.scope, self.symboltable.scope)
+            self.assertListEqual(list(symboltable.identifier_symboltype_dict.items()),
+                    list(self.symboltable.identifier_symboltype_dict.items()))
+            for obj in objects:
+                self.assertDictEqual(vars(symboltable.object(obj.identifier)), vars(obj))
+            self.assertTrue(symboltable.define(types.Packet('other')))
+        # The frozen symbol tables are unpickled frozen
+        frozen = pickle.loads(pickle.dumps(self.symboltable.thaw().freeze(), 5))
+        self.assertTrue(frozen.frozen())
+        self.assertEqual(frozen.object('int').value, 10)
+        self.assertRaises(AttributeError, frozen.define, types.Packet('other'))
+        
+
+class TestIdentifierTable(unittest.TestCase):
+    """
+    Tests for the AML IdentifierTable.
+    """
+    
+    def setUp(self):
+        """
+        Sets up an identifier table.
+        """
+        self.identifiertable = types.IdentifierTable()
+
+    def test_reserved(self):
+        """
+        Tests that the ids of the reserved keywords match their codes.
+        """
+        self.assertEqual(len(self.identifiertable), len(types.Reserved.Code))
+        for identifier, code in types.Reserved.identifier_code_dict.items():
+            self.assertEqual(self.identifiertable.id(identifier), code)
+            self.assertEqual(self.identifiertable.intern(identifier), code)
+        self.assertEqual(self.identifiertable.intern(types.Reserved('==').identifier), 
+                types.Reserved.Code.EQUALTO)
+
+    def test_intern(self):
+        """
+        Tests the methods IdentifierTable::intern and IdentifierTable::identifier.
+        """
+        self.assertIsNone(self.identifiertable.id('var'))
+        first = self.identifiertable.intern('var')
+        self.assertEqual(first, len(types.Reserved.Code))
+        self.assertEqual(self.identifiertable.intern('var'), first)
+        self.assertEqual(self.identifiertable.intern('other'), first + 1)
+        self.assertEqual(self.identifiertable.identifier(first), 'var')
+        self.assertIn('other', self.identifiertable)
+
+    def test_encode_decode(self):
+        """
+        Tests the methods IdentifierTable::encode and IdentifierTable::decode.
+        """
+        items = ('__layer4.sourcePort', '__80', '__==', '__80')
+        ids = self.identifiertable.encode(items)
+        self.assertEqual(ids.typecode, 'q')
+        self.assertEqual(ids[1], ids[3])
+        self.assertEqual(ids[2], types.Reserved.Code.EQUALTO)
+        self.assertTupleEqual(self.identifiertable.decode(ids), items)
+
+    def test_freeze_pickle(self):
+        """
+        Tests the freezing and the pickling of the identifier table.
+        """
+        ids = self.identifiertable.encode(['a', 'b', 'c'])
+        self.identifiertable.freeze()
+        self.assertEqual(self.identifiertable.intern('b'), ids[1])
+        self.assertRaises(AttributeError, self.identifiertable.intern, 'd')
+        for protocol in (4, 5):
+            identifiertable = pickle.loads(pickle.dumps(self.identifiertable, protocol))
+            self.assertTrue(identifiertable.frozen())
+            self.assertTupleEqual(identifiertable.decode(ids), ('a', 'b', 'c'))
+        thawed = self.identifiertable.thaw()
+        self.assertEqual(thawed.intern('d'), ids[2] + 1)
+
+
+class TestArraySymbolTable(TestSymbolTable):
+    """
+    Tests for the AML ArraySymbolTable. It runs the tests of the SymbolTable 
+    against the array backend.
+    """
+    
+    def setUp(self):
+        """
+        Sets up an array symbol table.
+        """        
+        self.symboltable = types.ArraySymbolTable(0)
+        self.assertTrue(self.symboltable.empty())
+
+    def test_pack_unpack(self):
+        """
+        Tests the methods ArraySymbolTable::pack and ArraySymbolTable::unpack.
+        """
+        symboltable = types.SymbolTable(0)
+        objects = [
+            types.Reserved('=='),
+            types.Variable('int', types.Variable.Type.INTEGER, -10),
+            types.Variable('big', types.Variable.Type.INTEGER, 2 ** 70),
+            types.Variable('real', types.Variable.Type.REAL, 0.5),
+            types.Variable('str', types.Variable.Type.STRING, 'hello'),
+            types.Variable('none', types.Variable.Type.NONE, None),
+            types.Packet('pkt'),
+            types.Filter('flt', ['__1', '__2', '__==']),
+            types.List('lst', ['__1', '__2'])]
+        for obj in objects:
+            self.assertTrue(symboltable.define(obj))
+        packed = types.ArraySymbolTable.pack(symboltable)
+        self.assertEqual(len(packed), len(objects))
+        self.assertListEqual(list(packed.identifier_symboltype_dict.items()), 
+                list(symboltable.identifier_symboltype_dict.items()))
+        unpacked = packed.unpack()
+        for obj in objects:
+            self.assertIsNot(packed.object(obj.identifier), obj)
+            self.assertDictEqual(vars(packed.object(obj.identifier)), vars(obj))
+            self.assertDictEqual(vars(unpacked.object(obj.identifier)), vars(obj))
+        # Reading does not alter the table
+        packed.object('int').value = 0
+        self.assertEqual(packed.object('int').value, -10)
+
+    def test_pickle_buffers(self):
+        """
+        Tests that the typed arrays are handed out-of-band with the pickle 
+        protocol 5.
+        """
+        for value in range(100):
+            self.symboltable.define(types.Variable('int' + str(value), types.Variable.Type.INTEGER, value))
+        buffers = []
+        data = pickle.dumps(self.symboltable, 5, buffer_callback=buffers.append)
+        self.assertEqual(len(buffers), len(types.ArraySymbolTable._arrays))
+        symboltable = pickle.loads(data, buffers=buffers)
+        self.assertListEqual(list(symboltable.integers), list(range(100)))
+        self.assertEqual(symboltable.object('int99').value, 99)
+
+    def test_items(self):
+        """
+        Tests that the items of the filters and of the lists are stored as 
+        ids of the shared identifier table.
+        """
+        identifiertable = types.IdentifierTable()
+        symboltable = types.ArraySymbolTable(0, identifiertable)
+        other = types.ArraySymbolTable(1, identifiertable)
+        symboltable.define(types.Filter('flt', ['__var', '__80', '__==']))
+        other.define(types.List('lst', ['__var', '__string']))
+        self.assertEqual(len(identifiertable), len(types.Reserved.Code) + 3)
+        self.assertListEqual(list(symboltable.items), 
+                [3, identifiertable.id('__var'), identifiertable.id('__80'), types.Reserved.Code.EQUALTO])
+        self.assertEqual(other.items[1], symboltable.items[1])
+        self.assertTupleEqual(symboltable.object('flt').items, ('__var', '__80', '__=='))
+        self.assertTupleEqual(other.object('lst').items, ('__var', '__string'))
+        self.assertIs(other.renew().identifiertable, identifiertable)
+        # The filters having the same items share their ids
+        symboltable.define(types.Filter('same', ['__var', '__80', '__==']))
+        symboltable.hashcons(types.HashConsTable())
+        self.assertEqual(symboltable.offsets[1], symboltable.offsets[0])
+        self.assertTupleEqual(symboltable.object('same').items, ('__var', '__80', '__=='))
+        # The frozen tables keep sharing the identifier table once unpickled
+        symboltable.freeze()
+        other.freeze()
+        self.assertTrue(identifiertable.frozen())
+        symboltable, other = pickle.loads(pickle.dumps((symboltable, other), 5))
+        self.assertIs(symboltable.identifiertable, other.identifiertable)
+        self.assertTupleEqual(other.object('lst').items, ('__var', '__string'))
+        thawed = other.thaw()
+        self.assertTrue(thawed.define(types.List('new', ['__new'])))
+        self.assertNotIn('__new', other.identifiertable)
+
+    def test_numericitems(self):
+        """
+        Tests that the numeric items of the lists are stored as they are.
+        """
+        items = types.NumericItems.build(types.Variable.Type.INTEGER, range(1000))
+        self.symboltable.define(types.List('lst', items))
+        self.assertIs(self.symboltable.object('lst').items, items)
+        frozen = self.symboltable.thaw().freeze()
+        # The frozen table cannot be modified through its numeric items
+        self.assertRaises(TypeError, frozen.object('lst').items.values.__setitem__, 0, 99)
+        self.assertEqual(frozen.object('lst').items[0], '__0')
+        symboltable = pickle.loads(pickle.dumps(frozen, 5))
+        self.assertListEqual(list(symboltable.object('lst').items.values), list(range(1000)))
+
+    def test_freeze(self):
+        """
+        Tests the methods ArraySymbolTable::freeze and ArraySymbolTable::thaw.
+        """
+        self.symboltable.define(types.Variable('var', types.Variable.Type.INTEGER, 10))
+        self.symboltable.freeze()
+        self.assertEqual(self.symboltable.object('var').value, 10)
+        self.assertRaises(AttributeError, self.symboltable.define, types.Packet('pkt'))
+        self.assertRaises(TypeError, self.symboltable.integers.__setitem__, 0, 1)
+        thawed = self.symboltable.thaw()
+        self.assertTrue(thawed.define(types.Packet('pkt')))
+        self.assertEqual(thawed.object('var').value, 10)
+        self.assertFalse(self.symboltable.exist('pkt'))
+        self.symboltable = thawed
+
+    def test_clear(self):
+        """
+        Tests the method SymbolTable::clear.
+        """
+        super(TestArraySymbolTable, self).test_clear()
         
 
 class TestSymbolHandler(unittest.TestCase):
@@ -613,3 +957,46 @@ class TestSymbolHandler(unittest.TestCase):
         self.assertEqual(len(self.symbolhandler.scope_symboltable_dict), scopes)
         self.assertTrue(self.symbolhandler.scope_symboltable_dict[scope_target].empty())
         
+
+    def test_shadowing(self):
+        """
+        Tests the innermost-first resolution of SymbolHandler::object.
+        """
+        scopes = 3
+        self.symbolhandler = types.SymbolHandler(scopes)
+        outer = types.Variable('var', types.Variable.Type.INTEGER, 1)
+        inner = types.Variable('var', types.Variable.Type.STRING, 'inner')
+        self.assertTrue(self.symbolhandler.define(0, outer))
+        self.assertTrue(self.symbolhandler.define(2, inner))
+        self.assertEqual(self.symbolhandler.object('var').value, 'inner')
+        self.assertTrue(self.symbolhandler.exist(0, 'var'))
+        # Clearing the inner scope uncovers the outer definition
+        self.assertTrue(self.symbolhandler.clear(2))
+        self.assertEqual(self.symbolhandler.object('var').value, 1)
+        # Defining in an outer scope does not hide the inner definition
+        self.assertTrue(self.symbolhandler.define(2, inner))
+        self.assertTrue(self.symbolhandler.define(1, outer))
+        self.assertEqual(self.symbolhandler.object('var').value, 'inner')
+        self.assertTrue(self.symbolhandler.clear(0))
+        self.assertTrue(self.symbolhandler.clear(2))
+        self.assertEqual(self.symbolhandler.object('var').value, 1)
+        self.assertFalse(self.symbolhandler.exist(0, 'var'))
+        self.assertTrue(self.symbolhandler.exist(1, 'var'))
+
+    def test_push_pop(self):
+        """
+        Tests the methods SymbolHandler::push and SymbolHandler::pop.
+        """
+        self.assertRaises(ValueError, self.symbolhandler.pop)
+        depth = 50
+        for scope in range(0, depth):
+            self.assertEqual(self.symbolhandler.push(), scope)
+            obj = types.Variable('var', types.Variable.Type.INTEGER, scope)
+            self.assertTrue(self.symbolhandler.define(scope, obj))
+        self.assertEqual(self.symbolhandler.depth(), depth)
+        for scope in reversed(range(0, depth)):
+            self.assertEqual(self.symbolhandler.object('var').value, scope)
+            symboltable = self.symbolhandler.pop()
+            self.assertEqual(symboltable.scope, scope)
+        self.assertEqual(self.symbolhandler.depth(), 0)
+        self.assertIsNone(self.symbolhandler.object('var'))
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+
+# -----------------------------------------------------------------------------
+# visitor_test.py
+#
+# Author: Francesco Racciatti (racciatti.francesco@gmail.com)
+#
+# This module tests the visitor for the AML model.
+#
+# Usage:
+# $ python3 -m unittest -v visitor_test.py
+# -----------------------------------------------------------------------------
+
+import sys
+import unittest
+
+sys.path.insert(0,"../aml/")
+import model.types as types
+import model.statements as statements
+import model.visitor as visitor
+
+
+def build():
+    """
+    Builds a scenario made by a compound attack running a periodic attack.
+    """
+    symboltable = types.SymbolTable(2)
+    symboltable.define(types.Variable('var', types.Variable.Type.INTEGER, 2))
+    codeblocktable = statements.CodeblockTable(2)
+    codeblocktable.append(statements.Expression('var', ['var', '__1', '__+']))
+    codeblocktable.append(statements.DestroyNode('__1'))
+    periodic = statements.Periodic(symboltable, codeblocktable, '__10', '__ms')
+    symboltable = types.SymbolTable(1)
+    symboltable.define(types.Variable('var', types.Variable.Type.INTEGER, 1))
+    symboltable.define(types.Packet('pkt'))
+    codeblocktable = statements.CodeblockTable(1)
+    codeblocktable.append(periodic)
+    compound = statements.Compound(symboltable, codeblocktable, '__10', '__s')
+    codeblocktable = statements.CodeblockTable(0)
+    codeblocktable.append(compound)
+    return statements.Scenario(types.SymbolTable(0), codeblocktable)
+
+
+class Recorder(visitor.Visitor):
+    """
+    Records the events raised while visiting.
+    """
+
+    def __init__(self):
+        self.events = []
+        self.resolved = []
+
+    def enter_codeblock(self, codeblock):
+        self.events.append(('enter', codeblock.__class__.__name__))
+
+    def leave_codeblock(self, codeblock):
+        self.events.append(('leave', codeblock.__class__.__name__))
+
+    def enter_primitive(self, primitive):
+        self.events.append(('enter', primitive.__class__.__name__))
+
+    def enter_expression(self, expression):
+        self.resolved.append(self.resolve('var').value)
+        self.resolved.append(self.resolve('pkt').identifier)
+        self.resolved.append(self.resolve('unbound'))
+        return visitor.Visitor.PRUNE
+
+
+class TestVisitor(unittest.TestCase):
+    """
+    Tests for the visitor.
+    """
+
+    def setUp(self):
+        """
+        Sets up the test.
+        """
+        self.scenario = build()
+
+    def tearDown(self):
+        """
+        Tears down the test.
+        """
+        pass
+
+    def test_walk(self):
+        """
+        Tests the function walk.
+        """
+        events = [(event, node.__class__.__name__) for event, node in visitor.walk(self.scenario)]
+        self.assertEqual(len(events) % 2, 0)
+        self.assertEqual(events[0], (visitor.Event.ENTER, 'Scenario'))
+        self.assertEqual(events[1], (visitor.Event.ENTER, 'SymbolTable'))
+        self.assertEqual(events[-1], (visitor.Event.LEAVE, 'Scenario'))
+        # Leaves get the LEAVE event right after the ENTER event
+        index = events.index((visitor.Event.ENTER, 'DestroyNode'))
+        self.assertEqual(events[index + 1], (visitor.Event.LEAVE, 'DestroyNode'))
+
+    def test_nodes(self):
+        """
+        Tests the function nodes.
+        """
+        codeblocks = [node.__class__.__name__ for node in visitor.nodes(self.scenario, statements.Codeblock)]
+        self.assertListEqual(codeblocks, ['Scenario', 'Compound', 'Periodic'])
+        primitives = list(visitor.nodes(self.scenario, statements.Primitive))
+        self.assertEqual(len(primitives), 2)
+        self.assertIsInstance(primitives[0], statements.Expression)
+        symbols = list(visitor.nodes(self.scenario, types.Variable))
+        self.assertListEqual([symbol.value for symbol in symbols], [1, 2])
+
+    def test_visit(self):
+        """
+        Tests the method Visitor::visit.
+        """
+        recorder = Recorder().visit(self.scenario)
+        self.assertListEqual(recorder.events, [
+            ('enter', 'Scenario'),
+            ('enter', 'Compound'),
+            ('enter', 'Periodic'),
+            ('enter', 'DestroyNode'),
+            ('leave', 'Periodic'),
+            ('leave', 'Compound'),
+            ('leave', 'Scenario'),
+        ])
+        # The innermost definition shadows the outer ones
+        self.assertListEqual(recorder.resolved, [2, 'pkt', None])
+        self.assertListEqual(recorder.path, [])
+
+    def test_handler(self):
+        """
+        Tests the method Visitor::handler.
+        """
+        handler = Recorder.handler(statements.Once, visitor.Event.ENTER)
+        self.assertIs(handler, Recorder.enter_codeblock)
+        self.assertIs(Recorder.handler(statements.Expression, visitor.Event.ENTER), Recorder.enter_expression)
+        self.assertIs(Recorder.handler(statements.DestroyNode, visitor.Event.ENTER), Recorder.enter_primitive)
+        self.assertIsNone(Recorder.handler(statements.DestroyNode, visitor.Event.LEAVE))
+        self.assertIsNone(Recorder.handler(types.Variable, visitor.Event.ENTER))
+        self.assertIn((Recorder, statements.Once, visitor.Event.ENTER), visitor.Visitor._handlers)